@@ -2,18 +2,20 @@
 FastAPI web service wrapper for SRI Testing harness
 (i.e. for reports to a Translator Runtime Status Dashboard)
 """
-from typing import Optional, Dict, List, Generator, Union
+from typing import Optional, Dict, List, Generator, Union, Tuple, Any
 
 from os.path import dirname, abspath
+from hashlib import sha1
 
-from pydantic import BaseModel
+from pydantic import BaseModel, StrictInt
 
 import uvicorn
 
 import logging
 
-from fastapi import FastAPI
-from fastapi.responses import FileResponse, StreamingResponse, JSONResponse
+from fastapi import FastAPI, Header
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import FileResponse, StreamingResponse, JSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
 
 from reasoner_validator.versioning import (
@@ -23,11 +25,16 @@ from reasoner_validator.versioning import (
     SemVerUnderspecified
 )
 
+from translator.sri.testing.report_db import TestReport, parse_projection, project_document
+from translator.sri.testing.edge_sampling import RESOURCE_ID_PATTERN, parse_edge_budgets
 from translator.sri.testing.onehops_test_runner import (
     OneHopTestHarness,
     DEFAULT_WORKER_TIMEOUT
 )
 
+# The OneHopTestHarness (i.e. its test report database) is only accessed with blocking calls - MongoDb
+# queries, file reads and JSON parsing - thus run in a thread pool, such that each endpoint handler
+# awaits them without stalling the event loop (i.e. the concurrent requests)
 app = FastAPI()
 
 origins = [
@@ -52,7 +59,7 @@ app.add_middleware(
 async def startup_event():
     # TODO: need to perhaps do some initialization here of the
     #       OneHopTesting class level cache of test_runs?
-    OneHopTestHarness.initialize()
+    await run_in_threadpool(OneHopTestHarness.initialize)
 
 
 favicon_path = f"{abspath(dirname(__file__))}/img/favicon.ico"
@@ -103,6 +110,32 @@ class TestRunParameters(BaseModel):
     # specified Biolink Model version (Default: None)..
     biolink_version: Optional[str] = None
 
+    # Optional maximum number of test edges sampled from
+    # each KP test data file (Default: None, implying the
+    # DEFAULT_EDGE_BUDGET of the test harness; 0 means no limit).
+    edge_budget: Optional[int] = None
+
+    # Optional KP-specific edge budgets, indexed by KP
+    # InfoRes object identifier, overriding the 'edge_budget'
+    # (strict integers, i.e. not silently truncated floats)
+    kp_edge_budgets: Optional[Dict[str, StrictInt]] = None
+
+    # Optional number of (pytest-xdist) processes across which
+    # the unit tests are distributed (Default: None, single process)
+    workers: Optional[int] = None
+
+    # Optional maximum number of (pytest-xdist) processes concurrently testing
+    # a given endpoint, indexed by endpoint url (Default: None, one per endpoint)
+    endpoint_concurrency: Optional[Dict[str, int]] = None
+
+    # If True, the test run is split into one shard per KP and ARA, enqueued in the
+    # (MongoDb) test report database for running by any number of worker hosts
+    distributed: bool = False
+
+    # If True, only the resources whose test inputs changed, or which had
+    # failing unit tests, since the last completed test run are tested
+    incremental: bool = False
+
     # Worker Process data access timeout; defaults to DEFAULT_WORKER_TIMEOUT
     # which implies caller blocking until the data is available
     timeout: Optional[int] = DEFAULT_WORKER_TIMEOUT
@@ -153,6 +186,12 @@ async def run_tests(test_parameters: Optional[TestRunParameters] = None) -> Test
 
     - **trapi_version**: Optional[str]
     - **biolink_version**: Optional[str]
+    - **edge_budget**: Optional[int]
+    - **kp_edge_budgets**: Optional[Dict[str, int]]
+    - **workers**: Optional[int]
+    - **endpoint_concurrency**: Optional[Dict[str, int]]
+    - **distributed**: bool
+    - **incremental**: bool
     - **timeout**: Optional[int]
     - **log**: Optional[str]
     \f
@@ -164,6 +203,12 @@ async def run_tests(test_parameters: Optional[TestRunParameters] = None) -> Test
     biolink_version: Optional[str] = None
     log: Optional[str] = None
     timeout: int = DEFAULT_WORKER_TIMEOUT
+    edge_budget: Optional[int] = None
+    kp_edge_budgets: Optional[Dict[str, int]] = None
+    workers: Optional[int] = None
+    endpoint_concurrency: Optional[Dict[str, int]] = None
+    distributed: bool = False
+    incremental: bool = False
 
     errors: List[str] = list()
     if test_parameters:
@@ -189,18 +234,55 @@ async def run_tests(test_parameters: Optional[TestRunParameters] = None) -> Test
 
         timeout = test_parameters.timeout if test_parameters.timeout else DEFAULT_WORKER_TIMEOUT
 
+        edge_budget = test_parameters.edge_budget
+
+        if test_parameters.kp_edge_budgets:
+            kp_edge_budgets = test_parameters.kp_edge_budgets
+            # KP identifiers are passed on the (shell) command line of the tests, thus need to be InfoRes-style
+            if any([not RESOURCE_ID_PATTERN.fullmatch(kp_id) for kp_id in kp_edge_budgets.keys()]):
+                errors.append(f"'kp_edge_budgets' parameter '{str(kp_edge_budgets)}' has invalid KP identifiers!")
+            else:
+                # validated as the equivalent '--kp_edge_budget' command line options
+                try:
+                    parse_edge_budgets([f"{kp_id}={budget}" for kp_id, budget in kp_edge_budgets.items()])
+                except ValueError as exc:
+                    errors.append(f"'kp_edge_budgets' parameter: {str(exc)}!")
+
+        if test_parameters.workers is not None:
+            workers = test_parameters.workers
+            if workers < 1:
+                errors.append(f"'workers' parameter '{workers}' should be a positive integer!")
+
+        if test_parameters.endpoint_concurrency:
+            endpoint_concurrency = test_parameters.endpoint_concurrency
+            if any([not url or concurrency < 1 for url, concurrency in endpoint_concurrency.items()]):
+                errors.append(
+                    f"'endpoint_concurrency' parameter '{str(endpoint_concurrency)}' " +
+                    "should map endpoint urls to positive integers!"
+                )
+
+        distributed = test_parameters.distributed
+        incremental = test_parameters.incremental
+
     if errors:
         return TestRunSession(test_run_id="Invalid Parameters - test run not started...", errors=errors)
 
     # Constructor initializes a fresh
     # test run with a new identifier
-    test_harness = OneHopTestHarness()
+    test_harness: OneHopTestHarness = await run_in_threadpool(OneHopTestHarness)
 
-    test_harness.run(
+    await run_in_threadpool(
+        test_harness.run,
         trapi_version=trapi_version,
         biolink_version=biolink_version,
         log=log,
-        timeout=timeout
+        timeout=timeout,
+        edge_budget=edge_budget,
+        kp_edge_budgets=kp_edge_budgets,
+        workers=workers,
+        endpoint_concurrency=endpoint_concurrency,
+        distributed=distributed,
+        incremental=incremental
     )
 
     return TestRunSession(test_run_id=test_harness.get_test_run_id())
@@ -228,7 +310,8 @@ async def get_status(test_run_id: str) -> TestRunStatus:
                              an integer 0..100 indicating the percentage completion of the test run.
     """
 
-    percent_complete: int = OneHopTestHarness(test_run_id=test_run_id).get_status()
+    test_run: OneHopTestHarness = await run_in_threadpool(OneHopTestHarness, test_run_id=test_run_id)
+    percent_complete: int = await run_in_threadpool(test_run.get_status)
 
     return TestRunStatus(test_run_id=test_run_id, percent_complete=percent_complete)
 
@@ -256,10 +339,51 @@ async def delete(test_run_id: str) -> TestRunDeletion:
     :return: TestRunDeletion, with fields 'test_run_id' and 'status', the latter
              being a simple text message confirming the outcome of the operation.
     """
-    outcome: str = OneHopTestHarness(test_run_id=test_run_id).delete()
+    test_run: OneHopTestHarness = await run_in_threadpool(OneHopTestHarness, test_run_id=test_run_id)
+    outcome: str = await run_in_threadpool(test_run.delete)
     return TestRunDeletion(test_run_id=test_run_id, outcome=outcome)
 
 
+class TestRunBulkDeletionParameters(BaseModel):
+    # Identifiers of specific test runs to delete
+    test_run_ids: Optional[List[str]] = None
+
+    # Retention policy of completed test runs: test runs older than 'max_age_days'
+    # are deleted, except for the 'keep_latest' most recent completed test runs
+    max_age_days: Optional[int] = None
+    keep_latest: Optional[int] = None
+
+
+class TestRunBulkDeletion(BaseModel):
+    deleted: List[str]
+
+
+@app.post(
+    "/delete_test_runs",
+    tags=['report'],
+    response_model=TestRunBulkDeletion,
+    summary="Delete several SRI Testing runs, by identifier and/or by retention policy."
+)
+async def delete_test_runs(parameters: TestRunBulkDeletionParameters) -> TestRunBulkDeletion:
+    """
+    Deletes the given OneHopTestHarness test runs (cancelling them first, if still in process), then the completed
+    test runs beyond the given retention policy. The deleted test runs are immediately unavailable, but their
+    documents are only physically removed later from the TestRunDatabase, in the background.
+
+    \f
+    :param parameters: TestRunBulkDeletionParameters, with fields 'test_run_ids', 'max_age_days' and 'keep_latest'.
+
+    :return: TestRunBulkDeletion, with the 'deleted' list of test run identifiers.
+    """
+    deleted: List[str] = await run_in_threadpool(
+        OneHopTestHarness.delete_test_runs,
+        test_run_ids=parameters.test_run_ids,
+        max_age_days=parameters.max_age_days,
+        keep_latest=parameters.keep_latest
+    )
+    return TestRunBulkDeletion(deleted=deleted)
+
+
 class TestRunList(BaseModel):
     test_runs: List[str]
 
@@ -277,18 +401,112 @@ async def get_test_run_list() -> TestRunList:
     \f
     :return: TestRunList, list of timestamp identifiers of completed OneHopTestHarness test runs.
     """
-    test_runs: List[str] = OneHopTestHarness.get_completed_test_runs()
+    test_runs: List[str] = await run_in_threadpool(OneHopTestHarness.get_completed_test_runs)
 
     return TestRunList(test_runs=test_runs)
 
 
+class HistoryPoint(BaseModel):
+    test_run_id: str
+    completed: str
+    passed: int
+    failed: int
+    skipped: int
+    latency_count: int
+    latency_mean_ms: Optional[float]
+    latency_min_ms: Optional[int]
+    latency_max_ms: Optional[int]
+
+
+class UnitTestHistory(BaseModel):
+    component: str
+    ara_id: Optional[str]
+    kp_id: str
+    unit_test: str
+    points: List[HistoryPoint]
+
+
+class TestRunHistory(BaseModel):
+    history: List[UnitTestHistory]
+
+
+@app.get(
+    "/history",
+    tags=['report'],
+    response_model=TestRunHistory,
+    summary="Retrieve the history of the unit test outcomes and latencies of resources, across completed test runs."
+)
+async def get_history(
+        component: Optional[str] = None,
+        ara_id: Optional[str] = None,
+        kp_id: Optional[str] = None,
+        unit_test: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None
+) -> TestRunHistory:
+    """
+    Returns the time series of the unit test outcome counts (passed, failed and skipped) and latency
+    statistics (milliseconds) of the resources across the completed test runs, retrieved in one query
+    from the rollups precomputed when each test run is completed:
+    - **component**: Translator component of the resources, 'ARA' or 'KP' (default: any)
+    - **ara_id**: identifier of the ARA whose embedded KPs are tested (default: any)
+    - **kp_id**: identifier of the (direct, or ARA embedded) KP (default: any)
+    - **unit_test**: unit test category, e.g. 'by_subject' (default: any)
+    - **since**: earliest completion time (ISO format timestamp) of the test runs (default: none)
+    - **until**: latest completion time (ISO format timestamp) of the test runs (default: none)
+
+    \f
+    :param component: Optional[str], Translator component of the resources: 'ARA' or 'KP'
+    :param ara_id: Optional[str], identifier of the ARA
+    :param kp_id: Optional[str], identifier of the (direct, or ARA embedded) KP
+    :param unit_test: Optional[str], unit test category
+    :param since: Optional[str], earliest completion time (ISO format timestamp) of the test runs
+    :param until: Optional[str], latest completion time (ISO format timestamp) of the test runs
+
+    :return: TestRunHistory, one time series - sorted by test run completion time - per resource unit test.
+    """
+    history: List[Dict] = await run_in_threadpool(
+        OneHopTestHarness.get_history,
+        component=component, ara_id=ara_id, kp_id=kp_id, unit_test=unit_test, since=since, until=until
+    )
+    return TestRunHistory(history=history)
+
+
+class DocumentCacheMetrics(BaseModel):
+    documents: int
+    size: int
+    max_size: int
+    hits: int
+    misses: int
+    evictions: int
+    hit_rate: float
+
+
+@app.get(
+    "/document_cache",
+    tags=['report'],
+    response_model=DocumentCacheMetrics,
+    summary="Retrieve the metrics of the cache of the documents of completed test runs."
+)
+async def get_document_cache_metrics() -> DocumentCacheMetrics:
+    """
+    Returns the metrics of the (read-through, least recently used) cache of the documents
+    - summaries, resource summaries and edge details - of the completed test runs.
+
+    \f
+    :return: DocumentCacheMetrics, number and total size (bytes) of the cached documents, maximum size (bytes),
+                                   number of cache hits, misses and evictions, and cache hit rate.
+    """
+    return DocumentCacheMetrics(**OneHopTestHarness.document_cache().get_metrics())
+
+
 class Message(BaseModel):
     message: str
 
 
 class TestRunSummary(BaseModel):
     test_run_id: str
-    summary: Dict
+    summary: Any
 
 
 @app.get(
@@ -298,19 +516,22 @@ class TestRunSummary(BaseModel):
     summary="Retrieve the index - KP and ARA resource tags - of a completed specified OneHopTestHarness test run.",
     responses={404: {"model": Message}}
 )
-async def get_index(test_run_id: str) -> Union[TestRunSummary, JSONResponse]:
+async def get_index(test_run_id: str, projection: Optional[str] = None) -> Union[TestRunSummary, JSONResponse]:
     """
     Returns a JSON index  - KP and ARA resource tags - for a completed OneHopTestHarness test run.
+    An optional (dotted path) projection - e.g. 'KP' or 'ARA.<ara_id>' - only returns that part of the index.
 
     \f
     :param test_run_id: test_run_id: test run identifier (as returned by /run_tests endpoint).
+    :param projection: Optional[str], dotted path of the part of the index returned (default: the whole index)
 
     :return: TestRunSummary, with fields 'test_run_id' and 'summary', the latter being a
                              JSON document summary of available unit test results.
     :raises: HTTPException(404) if the summary is not (yet?) available.
     """
 
-    index: Optional[Dict] = OneHopTestHarness(test_run_id=test_run_id).get_index()
+    test_run: OneHopTestHarness = await run_in_threadpool(OneHopTestHarness, test_run_id=test_run_id)
+    index: Optional[Any] = await run_in_threadpool(test_run.get_index, projection=parse_projection(projection))
 
     if index is not None:
         return TestRunSummary(test_run_id=test_run_id, summary=index)
@@ -330,19 +551,28 @@ async def get_index(test_run_id: str) -> Union[TestRunSummary, JSONResponse]:
     summary="Retrieve the summary of a completed specified OneHopTestHarness test run.",
     responses={404: {"model": Message}}
 )
-async def get_summary(test_run_id: str) -> Union[TestRunSummary, JSONResponse]:
+async def get_summary(test_run_id: str, projection: Optional[str] = None) -> Union[TestRunSummary, JSONResponse]:
     """
-    Returns a JSON summary report of results for a completed OneHopTestHarness test run.
+    Returns a JSON summary report of results for a completed OneHopTestHarness test run. While the test run
+    is still in progress, its live (partial) summary - flagged 'in_progress', with the number of unit tests
+    done (so far) and the latest failing unit tests - is returned instead. An optional (dotted path)
+    projection - e.g. 'KP.<kp_id>' or 'ARA.<ara_id>.kps' - only returns (and reads) that part of the summary.
 
     \f
     :param test_run_id: test_run_id: test run identifier (as returned by /run_tests endpoint).
+    :param projection: Optional[str], dotted path of the part of the summary returned (default: the whole summary)
 
     :return: TestRunSummary, with fields 'test_run_id' and 'summary', the latter being a
                              JSON document summary of available unit test results.
     :raises: HTTPException(404) if the summary is not (yet?) available.
     """
 
-    summary: Optional[Dict] = OneHopTestHarness(test_run_id=test_run_id).get_summary()
+    test_run: OneHopTestHarness = await run_in_threadpool(OneHopTestHarness, test_run_id=test_run_id)
+    path: List[str] = parse_projection(projection)
+    summary: Optional[Any] = await run_in_threadpool(test_run.get_summary, projection=path)
+    if summary is None:
+        # test run still in progress? Its live (partial) summary is flagged as 'in_progress'
+        summary = project_document(await run_in_threadpool(test_run.get_live_summary), path)
 
     if summary is not None:
         return TestRunSummary(test_run_id=test_run_id, summary=summary)
@@ -355,6 +585,58 @@ async def get_summary(test_run_id: str) -> Union[TestRunSummary, JSONResponse]:
         )
 
 
+class TestRunLog(BaseModel):
+    test_run_id: str
+    offset: int
+    total: int
+    lines: List[str]
+
+
+@app.get(
+    "/log",
+    tags=['report'],
+    response_model=TestRunLog,
+    summary="Retrieve a page of the lines of the process log of a specified OneHopTestHarness test run.",
+    responses={404: {"model": Message}}
+)
+async def get_log(
+        test_run_id: str,
+        offset: int = 0,
+        limit: Optional[int] = 1000,
+        tail: Optional[int] = None
+) -> Union[TestRunLog, JSONResponse]:
+    """
+    Returns a page of the lines of the process (i.e. Pytest) log of a OneHopTestHarness test run,
+    i.e. the lines saved so far while the test run is still in progress. The last lines of the
+    log are returned, rather than the page starting at 'offset', if a 'tail' is given.
+
+    \f
+    :param test_run_id: test_run_id: test run identifier (as returned by /run_tests endpoint).
+    :param offset: int, (zero based) number of the first line returned (default: 0)
+    :param limit: Optional[int], maximum number of lines returned (default: 1000)
+    :param tail: Optional[int], if given, number of the last lines of the log returned instead
+
+    :return: TestRunLog, with fields 'test_run_id', 'offset' (of the first line returned),
+                         'total' (number of lines of the log so far) and 'lines'.
+    :raises: HTTPException(404) if the log is not (yet?) available.
+    """
+    test_run: OneHopTestHarness = await run_in_threadpool(OneHopTestHarness, test_run_id=test_run_id)
+    log: Optional[Dict] = await run_in_threadpool(
+        test_run.get_log,
+        offset=offset, limit=limit, tail=min(tail, limit) if tail is not None and limit is not None else tail
+    )
+
+    if log is not None:
+        return TestRunLog(test_run_id=test_run_id, **log)
+    else:
+        return JSONResponse(
+            status_code=404,
+            content={
+                "message": f"Log of test run '{test_run_id}' is not (yet) available?"
+            }
+        )
+
+
 @app.get(
     "/resource",
     tags=['report'],
@@ -365,7 +647,8 @@ async def get_summary(test_run_id: str) -> Union[TestRunSummary, JSONResponse]:
 async def get_kp_resource_summary(
         test_run_id: str,
         ara_id: Optional[str] = None,
-        kp_id: Optional[str] = None
+        kp_id: Optional[str] = None,
+        projection: Optional[str] = None
 ) -> Union[TestRunSummary, JSONResponse]:
     """
     Return result summary for a specific KP resource in an
@@ -379,6 +662,10 @@ async def get_kp_resource_summary(
         - Case 4 - empty ara_id and kp_id == error ...at least one of 'ara_id' and 'kp_id' needs to be provided.
 
     - **kp_id**: identifier of the KP resource being tested.
+    - **projection**: optional dotted path of the only part of the resource summary returned (and read).
+
+    While the resource is still being tested, its live (partial) summary - flagged 'in_progress', with its
+    unit test counts so far and its latest failing unit tests - is returned instead.
 
     \f
     :param test_run_id: test run identifier (as returned by /run_tests endpoint).
@@ -388,6 +675,7 @@ async def get_kp_resource_summary(
         - Case 2 - non-empty ara_id, non-empty kp_id == return the one specific KP tested via the specified ARA
         - Case 3 - non-empty ara_id, empty kp_id == return all the KPs being tested under the specified ARA
         - Case 4 - empty ara_id and kp_id == error ...at least one of 'ara_id' and 'kp_id' needs to be provided.
+    :param projection: Optional[str], dotted path of the part of the resource summary returned (default: all of it)
 
     :return: TestRunResourceSummary, echoing input parameters alongside the requested 'details', the latter which is a
                                  details JSON document for the specified unit test.
@@ -395,32 +683,52 @@ async def get_kp_resource_summary(
     :raises: HTTPException(404) if the requested edge unit test details are not (yet?) available.
     """
     # TODO: maybe we can validate the ara_id and kp_id against the /index catalog?
-    summary: Optional[Dict]
+    summary: Optional[Any]
+    path: List[str] = parse_projection(projection)
+    if not (ara_id or kp_id):
+        # Case 4: error...at least one of 'ara_id' and 'kp_id' needs to be provided.
+        return JSONResponse(
+            status_code=400,
+            content={"message": "The 'ara_id' and 'kp_id' cannot both be empty parameters!"}
+        )
+    test_run: OneHopTestHarness = await run_in_threadpool(OneHopTestHarness, test_run_id=test_run_id)
     if ara_id:
         if kp_id:
             # Case 2: return the one specific KP tested via the specified ARA
-            summary = OneHopTestHarness(test_run_id=test_run_id).get_resource_summary(
+            summary = await run_in_threadpool(
+                test_run.get_resource_summary,
                 component="ARA",
                 ara_id=ara_id,
-                kp_id=kp_id
+                kp_id=kp_id,
+                projection=path
             )
         else:
-            # Case 3: return all the KPs being tested under the specified ARA
-            # TODO: Merged ARA implementation without a specific kp_id, needs a bit more thought.
-            return JSONResponse(status_code=400, content={"message": "Null kp_id parameter is not yet supported?"})
+            # Case 3: return all the KPs being tested under the specified ARA,
+            # i.e. the ['ARA', <ara_id>, 'kps'] projection of the test run summary
+            summary = await run_in_threadpool(test_run.get_summary, projection=["ARA", ara_id, "kps"] + path)
+            if summary is None:
+                summary = project_document(
+                    await run_in_threadpool(test_run.get_live_summary), ["ARA", ara_id, "kps"] + path
+                )
     else:  # empty 'ara_id'
-        if kp_id:
-            # Case 1: just return the summary of the one directly tested KP resource
-            summary: Optional[Dict] = OneHopTestHarness(test_run_id=test_run_id).get_resource_summary(
-                component="KP",
+        # Case 1: just return the summary of the one directly tested KP resource
+        summary = await run_in_threadpool(
+            test_run.get_resource_summary,
+            component="KP",
+            kp_id=kp_id,
+            projection=path
+        )
+    if summary is None and kp_id:
+        # test run still in progress? Returns the live (partial) summary of the resource, flagged as 'in_progress'
+        summary = project_document(
+            await run_in_threadpool(
+                test_run.get_live_resource_summary,
+                component="ARA" if ara_id else "KP",
+                ara_id=ara_id,
                 kp_id=kp_id
-            )
-        else:
-            # Case 4: error...at least one of 'ara_id' and 'kp_id' needs to be provided.
-            return JSONResponse(
-                status_code=400,
-                content={"message": "The 'ara_id' and 'kp_id' cannot both be empty parameters!"}
-            )
+            ),
+            path
+        )
     if summary is not None:
         return TestRunSummary(test_run_id=test_run_id, summary=summary)
     else:
@@ -484,7 +792,9 @@ async def get_details(
     if ara_id:
         if kp_id:
             # Case 2: return the one specific KP tested via the specified ARA
-            details = OneHopTestHarness(test_run_id=test_run_id).get_details(
+            test_run: OneHopTestHarness = await run_in_threadpool(OneHopTestHarness, test_run_id=test_run_id)
+            details = await run_in_threadpool(
+                test_run.get_details,
                 component="ARA",
                 ara_id=ara_id,
                 kp_id=kp_id,
@@ -497,7 +807,9 @@ async def get_details(
     else:  # empty 'ara_id'
         if kp_id:
             # Case 1: just return the summary of the one directly tested KP resource
-            details: Optional[Dict] = OneHopTestHarness(test_run_id=test_run_id).get_details(
+            test_run: OneHopTestHarness = await run_in_threadpool(OneHopTestHarness, test_run_id=test_run_id)
+            details = await run_in_threadpool(
+                test_run.get_details,
                 component="KP",
                 kp_id=kp_id,
                 edge_num=edge_num
@@ -518,6 +830,53 @@ async def get_details(
         )
 
 
+def _parse_byte_range(range_header: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    """
+    Parses the HTTP Range request header of a single byte range (multiple byte ranges are not supported).
+
+    :param range_header: Optional[str], Range request header, e.g. 'bytes=1000-', 'bytes=0-499' or 'bytes=-500'
+    :param size: int, size (in bytes) of the requested document
+    :return: Optional[Tuple[int, int]], first and last (inclusive) byte offsets of the requested byte range;
+                                        None if the whole document is to be returned.
+    :raises ValueError: if the requested byte range is not satisfiable
+    """
+    if not range_header:
+        return None
+    unit, _, byte_ranges = range_header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in byte_ranges:
+        # Range headers which are not understood are ignored (RFC 9110, section 14.2)
+        return None
+    first, _, last = byte_ranges.strip().partition("-")
+    if not (first or last) or not all([not offset or offset.isdigit() for offset in (first, last)]):
+        return None
+    if not first:
+        # suffix byte range, i.e. the last bytes of the document
+        if int(last) == 0 or size == 0:
+            raise ValueError(f"Unsatisfiable byte range '{range_header}'")
+        return max(0, size - int(last)), size - 1
+    start: int = int(first)
+    end: int = min(int(last), size - 1) if last else size - 1
+    if start >= size or start > end:
+        raise ValueError(f"Unsatisfiable byte range '{range_header}'")
+    return start, end
+
+
+def _accepts_encoding(accept_encoding: Optional[str], encoding: str) -> bool:
+    """
+    :param accept_encoding: Optional[str], HTTP Accept-Encoding request header, e.g. 'gzip, deflate, br'
+    :param encoding: str, content coding, e.g. 'gzip'
+    :return: bool, True if the content coding is accepted (with a non-zero quality value)
+    """
+    if not accept_encoding:
+        return False
+    for coding in accept_encoding.split(","):
+        name, _, parameters = coding.partition(";")
+        if name.strip().lower() in (encoding, "*"):
+            quality: str = parameters.strip().lower()
+            return not quality.startswith("q=") or quality[2:].strip() not in ("0", "0.0", "0.00", "0.000")
+    return False
+
+
 @app.get(
     "/response",
     tags=['report'],
@@ -530,8 +889,11 @@ async def get_response(
         edge_num: str,
         test_id: str,
         ara_id: Optional[str] = None,
-        kp_id: Optional[str] = None
-) -> Union[StreamingResponse, JSONResponse]:
+        kp_id: Optional[str] = None,
+        range: Optional[str] = Header(default=None),
+        if_range: Optional[str] = Header(default=None),
+        accept_encoding: Optional[str] = Header(default=None)
+) -> Union[StreamingResponse, JSONResponse, Response]:
     """
     Return full TRAPI response message as a streamed downloadable text file, if available, for a specified unit test
     of an edge, as identified test run defined by the following query path parameters:
@@ -547,6 +909,12 @@ async def get_response(
         - Case 3 - non-empty ara_id, empty kp_id == error... option not provided here ... too much bandwidth!
         - Case 4 - empty ara_id and kp_id == error ...At least a 'kp_id' must be specified!
 
+    The (Content-Length sized) TRAPI response is streamed in fixed size chunks. A single byte range may be requested
+    with a HTTP 'Range' header (e.g. to resume an interrupted download, along with an 'If-Range' header, giving the
+    'ETag' of the response previously downloaded). TRAPI responses stored compressed are passed through as they are,
+    with a 'Content-Encoding' header, to clients accepting their encoding (e.g. 'Accept-Encoding: gzip'); they
+    are otherwise decompressed on the fly (i.e. without 'Content-Length' or byte range support).
+
     \f
     :param test_run_id: str, test run identifier (as returned by /run_tests endpoint)
     :param edge_num: str, target input 'edge_num' edge number, as found in edge leaf nodes of the JSON test run summary.
@@ -559,24 +927,23 @@ async def get_response(
         - Case 2 - non-empty ara_id, non-empty kp_id == return the one specific KP tested via the specified ARA
         - Case 3 - non-empty ara_id, empty kp_id == error... option not provided here ... too much bandwidth!
         - Case 4 - empty ara_id and kp_id == error ...At least a 'kp_id' must be specified!
+    :param range: Optional[str], HTTP 'Range' request header, of a single byte range (e.g. 'bytes=1000-')
+    :param if_range: Optional[str], HTTP 'If-Range' request header, i.e. ETag of a previously downloaded TRAPI response
+    :param accept_encoding: Optional[str], HTTP 'Accept-Encoding' request header, of the content codings accepted
 
     :return: StreamingResponse, HTTP status code 200 with downloadable text file of TRAPI response
+             or HTTP status code 206 with the requested byte range of the downloadable text file of TRAPI response
              or HTTP Status Code(400) unsupported parameter configuration.
              or HTTP Status Code(404) if the requested TRAPI response JSON text data file is not (yet?) available.
+             or HTTP Status Code(416) if the requested byte range is not satisfiable.
     """
     # TODO: maybe we can validate the ara_id and kp_id against the /index catalog?
     try:
-        content_generator: Generator
+        component: str
         if ara_id:
             if kp_id:
                 # Case 2: return the one specific KP tested via the specified ARA
-                content_generator = OneHopTestHarness(test_run_id=test_run_id).get_streamed_response_file(
-                    component="ARA",
-                    ara_id=ara_id,
-                    kp_id=kp_id,
-                    edge_num=edge_num,
-                    test_id=test_id
-                )
+                component = "ARA"
             else:
                 # Case 3: error... option not provided here ... too much bandwidth!
                 return JSONResponse(
@@ -586,18 +953,62 @@ async def get_response(
         else:  # empty 'ara_id'
             if kp_id:
                 # Case 1: just return the summary of the one directly tested KP resource
-                content_generator = OneHopTestHarness(test_run_id=test_run_id).get_streamed_response_file(
-                    component="KP",
-                    kp_id=kp_id,
-                    edge_num=edge_num,
-                    test_id=test_id
-                )
+                component = "KP"
             else:
                 # Case 4: error...at least 'kp_id' needs to be provided.
                 return JSONResponse(status_code=400, content={"message": "At least a 'kp_id' must be specified!"})
 
+        test_run: OneHopTestHarness = await run_in_threadpool(OneHopTestHarness, test_run_id=test_run_id)
+        # the (possibly carried forward) TRAPI Response file is located once, then streamed from where it was found
+        test_report: Optional[TestReport]
+        test_report, document_key, size, compression = await run_in_threadpool(
+            test_run.get_response_file,
+            component=component,
+            ara_id=ara_id,
+            kp_id=kp_id,
+            edge_num=edge_num,
+            test_id=test_id
+        )
+        if test_report is None or size is None:
+            raise RuntimeError("TRAPI Response JSON text file not found")
+
+        if compression and not _accepts_encoding(accept_encoding, compression):
+            # decompressed on the fly, i.e. of unknown length, thus without byte range support
+            # (the chunks of the synchronous generator are iterated in the thread pool by the StreamingResponse)
+            return StreamingResponse(
+                content=test_report.stream_document(document_type="Details", document_key=document_key),
+                headers={"Accept-Ranges": "none", "Vary": "Accept-Encoding"},
+                media_type="application/json"
+            )
+
+        # stored TRAPI responses are never modified, thus identified by their unit test, size and compression
+        response_file: str = f"{test_run_id}/{component}/{str(ara_id)}/{kp_id}/{edge_num}/{test_id}"
+        etag: str = '"' + sha1(f"{response_file}/{size}/{str(compression)}".encode("utf-8")).hexdigest() + '"'
+        headers: Dict[str, str] = {"Accept-Ranges": "bytes", "ETag": etag}
+        if compression:
+            # compressed TRAPI responses are passed through as stored
+            headers["Content-Encoding"] = compression
+            headers["Vary"] = "Accept-Encoding"
+        try:
+            byte_range: Optional[Tuple[int, int]] = \
+                _parse_byte_range(range, size) if not if_range or if_range == etag else None
+        except ValueError:
+            headers["Content-Range"] = f"bytes */{size}"
+            return Response(status_code=416, headers=headers)
+
+        start, end = byte_range if byte_range else (0, size - 1)
+        headers["Content-Length"] = str(end - start + 1)
+        if byte_range:
+            headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+
+        # the chunks of the (synchronous) generator are read in the thread pool by the StreamingResponse
+        content_generator: Generator = test_report.stream_document(
+            document_type="Details", document_key=document_key, start=start, end=end, decompress=False
+        )
         return StreamingResponse(
             content=content_generator,
+            status_code=206 if byte_range else 200,
+            headers=headers,
             media_type="application/json"
         )
     except RuntimeError:
@@ -1,17 +1,20 @@
 """
 Configure one hop tests
 """
-from typing import Optional, Union, List, Set, Dict, Any
+from typing import Optional, Union, List, Set, Dict, Any, Mapping
 from sys import stderr
 from os import path, walk, sep
-from collections import defaultdict
+from collections import defaultdict, ChainMap
 
 import json
 
 import logging
 
+import pytest
+
 from deprecation import deprecated
-from pytest_harvest import get_session_results_dct
+from pytest_harvest import get_fixture_store
+from pytest_harvest.xdist_api import is_xdist_worker, is_xdist_master
 
 from reasoner_validator.biolink import check_biolink_model_compliance_of_input_edge, BiolinkValidator
 from reasoner_validator.versioning import latest
@@ -22,339 +25,353 @@ from translator.registry import (
     extract_component_test_metadata_from_registry
 )
 
-from translator.trapi import generate_edge_id, DEFAULT_TRAPI_VERSION, UnitTestReport
+from translator.trapi import generate_edge_id, DEFAULT_TRAPI_VERSION
 
 from tests.onehop import util as oh_util
 from tests.onehop.util import (
     get_unit_test_codes, get_unit_test_list
 )
-from translator.sri.testing.onehops_test_runner import (
-    OneHopTestHarness,
-    parse_unit_test_name
+from translator.sri.testing.onehops_test_runner import OneHopTestHarness
+from translator.sri.testing.report_aggregator import ReportAggregator, get_live_summary_key
+from translator.sri.testing.result_sink import StreamingResultSink
+from translator.sri.testing.distributed import get_shard_summary_key
+from translator.sri.testing.incremental import (
+    compute_resource_fingerprint,
+    get_carried_forward_summary,
+    get_baseline_test_run_id
+)
+from translator.sri.testing.scheduler import (
+    DEFAULT_ENDPOINT_CONCURRENCY,
+    parse_endpoint_concurrency,
+    get_endpoint_latencies,
+    schedule_unit_tests
+)
+from translator.sri.testing.edge_sampling import (
+    DEFAULT_EDGE_BUDGET,
+    DEFAULT_SAMPLING_SEED,
+    parse_edge_budgets,
+    get_edge_budget,
+    sample_test_edges
 )
 
 logger = logging.getLogger(__name__)
 
 
-# TODO: temporary circuit breaker for huge edge test data sets
-REASONABLE_NUMBER_OF_TEST_EDGES: int = 100
-
-
-def _new_kp_test_case_summary(trapi_version: str, biolink_version: str) -> Dict[str, Union[int, str, Dict]]:
-    """
-    Initialize a dictionary to capture statistics for a single KP test case summary.
-
-    :param trapi_version: str, TRAPI version associated with the test case (SemVer)
-    :param biolink_version:  str, Biolink Model version associated with the test case (SemVer)
-
-    :return: Dict[str, Union[int, str, Dict]], initialized
-    """
-    new_test_case_summary: Dict[str, Union[int, str, Dict]] = {
-        'no_of_edges': 0,
-        'trapi_version': trapi_version,
-        'biolink_version': biolink_version,
-        'results': dict()
-    }
-    return new_test_case_summary
-
-
-def _new_kp_resource_summary(trapi_version: str, biolink_version: str) -> Dict[str, Union[str, Dict]]:
-    """
-    Initialize a dictionary to capture statistics for a single KP test case summary.
-
-    :param trapi_version: str, TRAPI version associated with the test case (SemVer)
-    :param biolink_version:  str, Biolink Model version associated with the test case (SemVer)
-
-    :return: Dict[str, Union[int, str, Dict]], initialized
-    """
-    new_test_case_summary: Dict[str, Union[str, Dict]] = {
-        'trapi_version': trapi_version,
-        'biolink_version': biolink_version,
-        'test_edges': dict()
-    }
-    return new_test_case_summary
-
-
-def _new_unit_test_statistics() -> Dict[str, int]:
-    """
-    Initialize a dictionary to capture statistics for a single unit test category.
-
-    :return: Dict[int] initialized
-    """
-    new_stats: Dict[str, int] = {
-        'passed': 0,
-        'failed': 0,
-        'skipped': 0,
-        # might add 'warning' and 'info' tallies in the future?
-        # 'warning': 0,
-        # 'info': 0,
-    }
-    return new_stats
-
-
-def _tally_unit_test_result(test_case_summary: Dict, test_id: str, edge_num: int, test_result: str):
-
-    # Sanity checks...
-    assert 'results' in test_case_summary, "Missing results in summary?"
-
-    assert test_id in get_unit_test_list(), \
-        f"Invalid test_result '{str(test_result)}'"
-    assert test_result in ['passed', 'failed', 'skipped', 'warning', 'info'], \
-        f"Invalid test_result '{str(test_result)}'"
-
-    while edge_num + 1 > test_case_summary['no_of_edges']:
-        test_case_summary['no_of_edges'] += 1
-
-    results = test_case_summary['results']
-    if test_id not in results:
-        results[test_id] = _new_unit_test_statistics()
-
-    results[test_id][test_result] += 1
-
-
 ##########################################################################################
-# JSON Test Reports are emitted in this pytest_sessionfinish() postprocessor as follows:
+# JSON Test Reports are emitted, as the unit tests are done, by a result sink fed from
+# the pytest_runtest_logreport() hook, then committed by pytest_sessionfinish(), as follows:
 #
 # 1. Test Summary:  summary statistics of entire test run, indexed by ARA and KP resources
 # 2. Resource Summary: ARA or KP level summary across all edges
 # 3. Edge Details: details of test results for one edge in a given resource test dataset
 # 4. Response: TRAPI JSON response message (may be huge; use file streaming to access!)
+#
+# The Response documents of failed unit tests are saved as soon as these are done, and the
+# Edge Details and Resource Summaries as soon as all the unit tests of their test edge or
+# resource are done; only the Test Summary is saved at the end of the test run.
+#
+# When the unit tests are distributed across pytest-xdist workers (i.e. 'pytest -n'),
+# each worker streams its own results, then sends back its (partial) results not yet saved
+# to the xdist controller, which merges them into a single consistent test run summary
+# (plus any resource summary and edge details whose unit tests were run by several workers).
 ##########################################################################################
 
-# Selective list of Resource Summary fields
-RESOURCE_SUMMARY_FIELDS = [
-    "subject_category",
-    "object_category",
-    "predicate",
-    "subject",
-    "object"
-]
+# The shards of distributed test runs (see translator.sri.testing.distributed) each test
+# a single KP or ARA, saving their edge details and resource summaries as usual, but
+# only a partial test run summary, later merged into the summary of the test run.
+#
+# Key of the partial test run results in the pytest-xdist 'workeroutput'
+XDIST_PARTIAL_RESULTS = "sri_testing_partial_results"
 
+# Partial test run results received by the pytest-xdist controller from its workers
+_xdist_partial_results: List[Dict] = list()
 
-def pytest_sessionfinish(session):
-    """ Gather all results and save them to a csv.
-    Works both on worker and master nodes, and also with xdist disabled
-    """
-    # test_run_id may not be set (i.e. may be 'None'),
-    # in which case, a OneHopTestHarness test run
-    # object is, instantiated with a 'fake' test_run_id
-    test_run: OneHopTestHarness = OneHopTestHarness(
-        session.config.option.test_run_id
-        if "test_run_id" in session.config.option and session.config.option.test_run_id else None
-    )
+# Identifiers of the pytest-xdist workers which went down without sending back their partial results
+_xdist_failed_workers: List[str] = list()
 
-    session_results = get_session_results_dct(session)
+# Sink of the unit test results of this (non xdist controller) Pytest process
+_result_sink: Optional[StreamingResultSink] = None
 
-    test_run_summary: Dict = dict()
-    resource_summaries: Dict = dict()
-    case_details: Dict = dict()
+# pytest-harvest fixture store, holding the results bags of the unit tests
+_fixture_store: Optional[Dict] = None
 
-    for unit_test_key, details in session_results.items():
 
-        rb: Dict = details['fixtures']['results_bag']
+def _get_test_run_id(config) -> Optional[str]:
+    """
+    :param config: Pytest configuration
+    :return: Optional[str], test run identifier, either specified on the command line
+                            or, for pytest-xdist workers, as shared by the xdist controller
+    """
+    if "test_run_id" in config.option and config.option.test_run_id:
+        return config.option.test_run_id
+    elif hasattr(config, "workerinput"):
+        # pytest-xdist worker
+        return config.workerinput.get("test_run_id", None)
+    else:
+        return None
 
-        # sanity check: clean up MS Windoze EOL characters, when present in results_bag keys
-        rb = {key.strip("\r\n"): value for key, value in rb.items()}
 
-        # Sanity check? Missing 'case' would seem like an SRI Testing logical bug?
-        assert 'case' in rb
-        test_case = rb['case']
+# Incremental test runs: test run summary entries of the unchanged resources of the baseline
+# test run, carried forward (instead of being tested again), indexed by component and resource
+_carried_forward_summaries: Dict[str, Dict[str, Dict]] = dict()
 
-        # clean up the name for safe file system usage
-        component, ara_id, kp_id, edge_num, test_id, edge_details_key = parse_unit_test_name(
-            unit_test_key=unit_test_key
-        )
+_baseline_summary: Optional[Dict] = None
 
-        # Sanity check: missing 'url' is likely a logical bug in SRI Testing?
-        assert 'url' in test_case
-        url: str = test_case['url']
 
-        # Sanity check: missing TRAPI version is likely a logical bug in SRI Testing?
-        assert 'trapi_version' in test_case
-        trapi_version: Optional[str] = test_case['trapi_version']
+def _get_carried_forward_summary(config, component: str, resource_id: str, fingerprint: str) -> Optional[Dict]:
+    """
+    :param config: Pytest configuration
+    :param component: str, Translator component of the resource: 'ARA' or 'KP'
+    :param resource_id: str, ARA or KP resource identifier
+    :param fingerprint: str, fingerprint of the current inputs of the resource tests
+    :return: Optional[Dict], test run summary entry carried forward from the baseline test run of
+                             an incremental test run; None if the resource needs to be (re-)tested
+    """
+    global _baseline_summary
+    baseline_test_run_id: Optional[str] = config.getoption("baseline_test_run_id", default=None)
+    if not baseline_test_run_id:
+        return None
+    if _baseline_summary is None:
+        _baseline_summary = OneHopTestHarness(baseline_test_run_id).get_summary()
+        if not _baseline_summary:
+            logger.warning(f"Baseline test run '{baseline_test_run_id}' has no summary? All resources are tested.")
+            _baseline_summary = dict()
+    summary: Optional[Dict] = get_carried_forward_summary(
+        baseline_test_run_id, _baseline_summary, component, resource_id, fingerprint
+    )
+    if summary:
+        logger.info(f"{component} '{resource_id}' is unchanged since test run '{baseline_test_run_id}': not tested.")
+        _carried_forward_summaries.setdefault(component, dict())[resource_id] = summary
+    return summary
 
-        # Sanity check: missing Biolink Model version is likely a logical bug in SRI Testing?
-        assert 'biolink_version' in test_case
-        biolink_version: Optional[str] = test_case['biolink_version']
 
-        ##############################################################
-        # Summary file indexed by component, resources and edge cases
-        ##############################################################
-        if component not in test_run_summary:
-            test_run_summary[component] = dict()
+def _is_sharded(config) -> bool:
+    """
+    :param config: Pytest configuration
+    :return: bool, True if the tests are restricted to specified KP and/or ARA test data locations
+    """
+    return bool(config.getoption("kp_location", default=None) or config.getoption("ara_location", default=None))
 
-            # Set up indexed resource summaries in parallel
-            resource_summaries[component] = dict()
 
-        case_summary: Dict
-        if ara_id:
-            if ara_id not in test_run_summary[component]:
-                test_run_summary[component][ara_id] = dict()
-                test_run_summary[component][ara_id]['url'] = url
-                test_run_summary[component][ara_id]['test_data_location'] = test_case['ara_test_data_location']
-                test_run_summary[component][ara_id]['kps'] = dict()
+def _normalize_location(location: str) -> str:
+    # Local test data locations are compared as absolute file paths
+    return location if location.startswith("http") else path.abspath(location)
 
-                resource_summaries[component][ara_id] = dict()
 
-            if kp_id not in test_run_summary[component][ara_id]['kps']:
-                test_run_summary[component][ara_id]['kps'][kp_id] = _new_kp_test_case_summary(
-                    trapi_version=trapi_version,
-                    biolink_version=biolink_version
-                )
-                resource_summaries[component][ara_id][kp_id] = _new_kp_resource_summary(
-                    trapi_version=trapi_version,
-                    biolink_version=biolink_version
-                )
+# Mean unit test latency history of the tested endpoints, indexed by url
+_endpoint_latencies: Optional[Dict[str, float]] = None
 
-            case_summary = test_run_summary[component][ara_id]['kps'][kp_id]
-            resource_summary = resource_summaries[component][ara_id][kp_id]
 
+def _get_endpoint_latencies(config) -> Dict[str, float]:
+    """
+    :param config: Pytest configuration
+    :return: Dict[str, float], mean unit test latencies (in seconds) of endpoints, as recorded in a previous
+                               test run (or, for pytest-xdist workers, as shared by the xdist controller)
+    """
+    global _endpoint_latencies
+    if _endpoint_latencies is None:
+        if hasattr(config, "workerinput") and "endpoint_latencies" in config.workerinput:
+            # pytest-xdist worker
+            _endpoint_latencies = config.workerinput["endpoint_latencies"]
         else:
-            if kp_id not in test_run_summary[component]:
-                test_run_summary[component][kp_id] = _new_kp_test_case_summary(
-                    trapi_version=trapi_version,
-                    biolink_version=biolink_version
-                )
-                test_run_summary[component][kp_id]['url'] = url
-                test_run_summary[component][kp_id]['test_data_location'] = test_case['kp_test_data_location']
+            history_test_run_id: Optional[str] = \
+                config.getoption("latency_history_test_run_id", default=None) or \
+                config.getoption("baseline_test_run_id", default=None) or \
+                get_baseline_test_run_id(OneHopTestHarness.get_completed_test_runs(), _get_test_run_id(config))
+            _endpoint_latencies = get_endpoint_latencies(
+                OneHopTestHarness(history_test_run_id).get_summary() if history_test_run_id else None
+            )
+    return _endpoint_latencies
 
-                resource_summaries[component][kp_id] = _new_kp_resource_summary(
-                    trapi_version=trapi_version,
-                    biolink_version=biolink_version
-                )
 
-            case_summary = test_run_summary[component][kp_id]
-            resource_summary = resource_summaries[component][kp_id]
+def _get_test_case(item) -> Optional[Mapping]:
+    callspec = getattr(item, "callspec", None)
+    if callspec is None:
+        return None
+    test_case = callspec.params.get("kp_trapi_case", callspec.params.get("ara_trapi_case", None))
+    # ARA test cases are (ChainMap) overlays of KP test cases
+    return test_case if isinstance(test_case, Mapping) else None
 
-        # Tally up the number of test results of a given 'status' across 'test_id' unit test categories
-        _tally_unit_test_result(case_summary, test_id, edge_num, details['status'])
 
-        # TODO: merge case details here into a Cartesian product table of edges
-        #       and unit test id's for a given resource indexed by ARA and KP
-        idx: str = str(test_case['idx'])
+# Run before the pytest-xdist (worker) hook, which only sees the 'xdist_group' markers added by then
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(session, config, items):
+    """
+    Deselect the (empty parameter set) unit test placeholders of components not being tested in a
+    restricted test run, then schedule the unit tests round-robin across their endpoints (see
+    translator.sri.testing.scheduler). The unit tests of each endpoint are also grouped together
+    (in as many groups as the concurrency allowed for the endpoint), so that the pytest-xdist
+    '--dist loadgroup' scheduler sends all the unit tests of a given group to the same worker.
+    """
+    if _is_sharded(config):
+        deselected = [item for item in items if _get_test_case(item) is None]
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+            items[:] = [item for item in items if item not in deselected]
+
+    unit_tests: List = list()
+    other_items: List = list()
+    for item in items:
+        test_case: Optional[Mapping] = _get_test_case(item)
+        if test_case and 'url' in test_case:
+            unit_tests.append((item, test_case['url'], test_case.get('idx', 0)))
+        else:
+            other_items.append(item)
+
+    if config.getoption("schedule", default="endpoint") == "endpoint":
+        scheduled: List = schedule_unit_tests(
+            unit_tests,
+            latencies=_get_endpoint_latencies(config),
+            endpoint_concurrency=parse_endpoint_concurrency(config.getoption("endpoint_concurrency", default=None)),
+            default_concurrency=config.getoption("default_endpoint_concurrency", default=DEFAULT_ENDPOINT_CONCURRENCY)
+        )
+        items[:] = other_items + [item for item, _ in scheduled]
+    else:
+        scheduled: List = [(item, url) for item, url, _ in unit_tests]
+
+    # Results of the unit tests are saved by the Pytest process running them
+    global _result_sink, _fixture_store
+    _fixture_store = get_fixture_store(session)
+    test_run_shard: Optional[str] = config.getoption("test_run_shard", default=None)
+    worker_id: Optional[str] = config.workerinput["workerid"] if hasattr(config, "workerinput") else None
+    _result_sink = StreamingResultSink(
+        test_run=OneHopTestHarness(_get_test_run_id(config)),
+        unit_test_keys=[item.nodeid for item, _ in scheduled],
+        unit_test_ids=get_unit_test_list(),
+        live_summary_key=get_live_summary_key(shard_id=test_run_shard, worker_id=worker_id),
+        shard_id=test_run_shard
+    )
+
+    if not config.pluginmanager.hasplugin("xdist"):
+        return
+    for item, group in scheduled:
+        item.add_marker(pytest.mark.xdist_group(name=group))
+
+
+def pytest_runtest_logreport(report):
+    """
+    Streams the result of each unit test into the result sink, as soon as the unit test is done
+    (i.e. its 'call' phase, unless its 'setup' phase was skipped or failed). The pytest-xdist
+    controller, to which worker reports are forwarded, has no result sink and ignores them.
+    """
+    if _result_sink is None:
+        return
+    if not (report.when == "call" or (report.when == "setup" and report.outcome != "passed")):
+        return
+
+    # Results bags are released from the (session-wide) pytest-harvest fixture store, once saved
+    rb: Optional[Dict] = _fixture_store.get('results_bag', dict()).pop(report.nodeid, None)
+    if not (rb and 'case' in rb):
+        # e.g. a unit test whose 'setup' failed before its results bag was set up
+        logger.warning(f"pytest_runtest_logreport(): unit test '{report.nodeid}' has no test case results?")
+        return
+
+    _result_sink.add_unit_test_result(
+        unit_test_key=report.nodeid,
+        status=report.outcome,
+        rb=rb,
+        duration_ms=report.duration * 1000 if report.when == "call" else None
+    )
 
-        if idx not in resource_summary['test_edges']:
-            resource_summary['test_edges'][idx] = {
-                'test_data': dict(),
-                'results': dict()
-            }
 
-        for field in RESOURCE_SUMMARY_FIELDS:
-            if field not in resource_summary['test_edges'][idx]['test_data'] and field in test_case:
-                resource_summary['test_edges'][idx]['test_data'][field] = test_case[field]
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """
+    pytest-xdist controller hook, sharing a single test run identifier with all the xdist workers.
+    """
+    config = node.config
+    if not ("test_run_id" in config.option and config.option.test_run_id):
+        config.option.test_run_id = OneHopTestHarness.generate_test_run_id()
+    node.workerinput["test_run_id"] = config.option.test_run_id
+    if config.getoption("schedule", default="endpoint") == "endpoint":
+        # all the workers need the same latency history, to collect the unit tests in the same order
+        node.workerinput["endpoint_latencies"] = _get_endpoint_latencies(config)
 
-        if test_id not in resource_summary['test_edges'][idx]['results']:
-            resource_summary['test_edges'][idx]['results'][test_id] = dict()
-        resource_summary['test_edges'][idx]['results'][test_id]['outcome'] = details['status']
 
-        test_report: UnitTestReport = rb['unit_test_report']
-        if test_report and test_report.has_messages:
-            resource_summary['test_edges'][idx]['results'][test_id]['validation'] = test_report.get_messages()
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """
+    pytest-xdist controller hook, collecting the partial test run results of each worker which is done.
+    """
+    if error:
+        logger.error(f"pytest_testnodedown(): xdist worker '{node.gateway.id}' failed: {str(error)}")
+    partial_results: Optional[Dict] = getattr(node, "workeroutput", dict()).get(XDIST_PARTIAL_RESULTS, None)
+    if partial_results is not None and not error:
+        _xdist_partial_results.append(partial_results)
+    else:
+        # a crashed worker, whose results are (partly) missing from the test run
+        _xdist_failed_workers.append(node.gateway.id)
 
-        ###################################################
-        # Full test details will still be indexed by edge #
-        ###################################################
-        if edge_details_key not in case_details:
 
-            # TODO: this is a bit memory intensive... may need a
-            #       better strategy for saving some of the details?
-            case_details[edge_details_key] = dict()
+# The partial results of pytest-xdist workers are sent to the xdist
+# controller (see above), so the default pytest-harvest strategy of
+# pickling the complete worker fixture stores into a (shared) local
+# folder, for reloading by the xdist controller, is bypassed here.
+@pytest.hookimpl(optionalhook=True)
+def pytest_harvest_xdist_init():
+    return True
 
-            if 'case' in rb and 'case' not in case_details[edge_details_key]:
-                case_details[edge_details_key] = test_case
 
-            if 'results' not in case_details[edge_details_key]:
-                case_details[edge_details_key]['results'] = dict()
+@pytest.hookimpl(optionalhook=True)
+def pytest_harvest_xdist_worker_dump(worker_id, session_items, fixture_store):
+    return True
 
-        if test_id not in case_details[edge_details_key]['results']:
-            case_details[edge_details_key]['results'][test_id] = dict()
 
-        test_details = case_details[edge_details_key]['results'][test_id]
+@pytest.hookimpl(optionalhook=True)
+def pytest_harvest_xdist_load():
+    return dict()
 
-        # Replicating 'PASSED, FAILED, SKIPPED' test status
-        # for each unit test, here in the detailed report
-        test_details['outcome'] = details['status']
 
-        # Capture more request/response details for test failures
-        if details['status'] == 'failed':
+@pytest.hookimpl(optionalhook=True)
+def pytest_harvest_xdist_cleanup():
+    return True
 
-            if 'request' in rb:
-                # TODO: maybe the 'request' document could be persisted
-                #       separately JIT, to avoid using too much RAM?
-                test_details['request'] = rb['request']
-            else:
-                test_details['request'] = "No 'request' generated for this unit test?"
-
-            if 'response' in rb:
-                case_response: Dict = dict()
-                case_response['url'] = test_case['url'] if 'url' in test_case else "Unknown?!"
-                case_response['unit_test_key'] = unit_test_key
-                case_response['http_status_code'] = rb["response"]["status_code"]
-                case_response['response'] = rb['response']['response_json']
-
-                response_document_key = f"{edge_details_key}-{test_id}"
-                test_run.save_json_document(
-                    document_type="TRAPI I/O",
-                    document=case_response,
-                    document_key=response_document_key,
-                    is_big=True
-                )
 
-            else:
-                test_details['response'] = "No 'response' generated for this unit test?"
-
-        # TODO: in principle, with a database, we could now simply update
-        #       the 'test_details' document here, updated with the
-        #       just encountered test result, rather than cache it in RAM
-        #       then defer writing it out later below, once it is complete?
-
-    # TODO: it would be nice to avoid compiling the case_details dictionary in RAM, for later saving,
-    #       but this currently seems *almost* unavoidable, for the aggregated details file document?
-    #       By "almost", one means that a document already written out could be read back into memory
-    #       then updated, but if one is doing this, why not rather use a (document) database?
-    #
-    # Save the cached details of each edge test case
-    for edge_details_key in case_details:
-        test_run.save_json_document(
-            document_type="Details",
-            document=case_details[edge_details_key],
-            document_key=edge_details_key
+def pytest_sessionfinish(session):
+    """ Commit the results streamed during the session to the test run report.
+    Works both on xdist worker and controller nodes, and also with xdist disabled
+    """
+    global _result_sink
+    test_run_shard: Optional[str] = session.config.getoption("test_run_shard", default=None)
+    summary_key: str = get_shard_summary_key(test_run_shard) if test_run_shard else "test_run_summary"
+
+    if is_xdist_master(session):
+        # The pytest-xdist controller simply merges the partial results of its workers
+        report: ReportAggregator = ReportAggregator()
+        for partial_results in _xdist_partial_results:
+            report.merge(partial_results)
+        _xdist_partial_results.clear()
+        error: Optional[str] = None
+        if _xdist_failed_workers:
+            error = f"xdist workers {', '.join(_xdist_failed_workers)} failed: " + \
+                    "their (unsaved) results are missing from the test run summary"
+            logger.error(f"pytest_sessionfinish(): {error}")
+            _xdist_failed_workers.clear()
+            # the Pytest session fails as well, e.g. for the shard of a distributed test run to be run again
+            session.exitstatus = pytest.ExitCode.INTERNAL_ERROR
+        test_run: OneHopTestHarness = OneHopTestHarness(_get_test_run_id(session.config))
+        report.save(test_run, summary_key=summary_key, error=error)
+        test_run.close()
+        return
+
+    if _result_sink is None:
+        # nothing collected, e.g. all the resources of an incremental test run are carried forward
+        _result_sink = StreamingResultSink(
+            test_run=OneHopTestHarness(_get_test_run_id(session.config)),
+            unit_test_keys=list()
         )
 
-    #
-    # Save the various resource test summaries
-    #
-    # All KP's individually
-    if "KP" in resource_summaries:
-        kp_summaries = resource_summaries["KP"]
-        for kp in kp_summaries:
-            # Save Test Run Summary
-            document_key: str = f"KP/{kp}/resource_summary"
-            test_run.save_json_document(
-                document_type="Direct KP Summary",
-                document=kp_summaries[kp],
-                document_key=document_key
-            )
+    for component, summaries in _carried_forward_summaries.items():
+        for resource_id, summary in summaries.items():
+            _result_sink.carry_forward(component, resource_id, summary)
 
-    # All KP's called by ARA's
-    if "ARA" in resource_summaries:
-        ara_summaries = resource_summaries["ARA"]
-        for ara in ara_summaries:
-            for kp in ara_summaries[ara]:
-                # Save embedded KP Resource Summary
-                document_key: str = f"ARA/{ara}/{kp}/resource_summary"
-                test_run.save_json_document(
-                    document_type="ARA Embedded KP Summary",
-                    document=ara_summaries[ara][kp],
-                    document_key=document_key
-                )
-
-    # Save Test Run Summary
-    test_run.save_json_document(
-        document_type="Test Run Summary",
-        document=test_run_summary,
-        document_key="test_run_summary"
-    )
+    if is_xdist_worker(session):
+        # pytest-xdist workers send their partial results back to the xdist controller
+        session.config.workeroutput[XDIST_PARTIAL_RESULTS] = _result_sink.get_partial_results()
+    else:
+        _result_sink.commit(summary_key=summary_key)
+    _result_sink.close()
+    _result_sink = None
 
 
 def pytest_addoption(parser):
@@ -363,6 +380,53 @@ def pytest_addoption(parser):
     """
     parser.addoption("--teststyle", action="store", default='all', help='Which Test to Run?')
     parser.addoption("--one", action="store_true", help="Only use first edge from each KP file")
+    parser.addoption(
+        "--edge_budget", action="store", type=int, default=DEFAULT_EDGE_BUDGET,
+        help="Maximum number of test edges sampled from each KP file; zero or less means no limit " +
+             f"(Default: {DEFAULT_EDGE_BUDGET})."
+    )
+    parser.addoption(
+        "--kp_edge_budget", action="append", default=None,
+        help="KP-specific edge budget, as 'kp_id=budget' (where 'kp_id' is the KP InfoRes object identifier), " +
+             "overriding the --edge_budget value for that KP. May be given more than once."
+    )
+    parser.addoption(
+        "--edge_sampling_seed", action="store", default=DEFAULT_SAMPLING_SEED,
+        help="Seed for the (deterministic) stratified sampling of test edges " +
+             f"from KP files exceeding their edge budget (Default: '{DEFAULT_SAMPLING_SEED}')."
+    )
+    parser.addoption(
+        "--schedule", action="store", default="endpoint", choices=["endpoint", "collection"],
+        help="Order of the unit tests: 'endpoint' interleaves the unit tests round-robin across their endpoints, " +
+             "starting with the endpoints expected to take longest (from their latency history); 'collection' " +
+             "runs them in their collection order (Default: 'endpoint')."
+    )
+    parser.addoption(
+        "--default_endpoint_concurrency", action="store", type=int, default=DEFAULT_ENDPOINT_CONCURRENCY,
+        help="Maximum number of pytest-xdist workers concurrently testing a given endpoint " +
+             f"(Default: {DEFAULT_ENDPOINT_CONCURRENCY})."
+    )
+    parser.addoption(
+        "--endpoint_concurrency", action="append", default=None,
+        help="Endpoint-specific concurrency, as 'url=concurrency', overriding the --default_endpoint_concurrency " +
+             "for that endpoint. May be given more than once."
+    )
+    parser.addoption(
+        "--latency_history_test_run_id", action="store", default=None,
+        help="Optional identifier of the test run whose recorded endpoint latencies are used to schedule the " +
+             "unit tests (Default: the baseline test run, if any, otherwise the latest completed test run)."
+    )
+    parser.addoption(
+        "--kp_location", action="append", default=None,
+        help="Only test the KP with the given test data location (URL or file path, as listed by the " +
+             "--triple_source). May be given more than once. If any --kp_location or --ara_location " +
+             "is given, then only the specified KPs and ARAs are tested."
+    )
+    parser.addoption(
+        "--ara_location", action="append", default=None,
+        help="Only test the ARA with the given test data location (URL or file path, as listed by the " +
+             "--ARA_source). May be given more than once."
+    )
     parser.addoption(
         "--triple_source", action="store", default='REGISTRY',  # 'test_triples/KP',
         help="'REGISTRY', directory or file from which to retrieve triples (Default: 'REGISTRY', which triggers " +
@@ -392,6 +456,16 @@ def pytest_addoption(parser):
         "--test_run_id", action="store", default="",
         help='Optional Test Run Identifier for internal use to index test results.'
     )
+    parser.addoption(
+        "--baseline_test_run_id", action="store", default=None,
+        help='Optional identifier of a completed test run, making this test run incremental: resources ' +
+             'whose test inputs are unchanged, and which had no failing unit tests, in the baseline test ' +
+             'run are not tested again, but their results are carried forward from the baseline test run.'
+    )
+    parser.addoption(
+        "--test_run_shard", action="store", default=None,
+        help='Optional shard identifier, for internal use by the workers of distributed test runs.'
+    )
 
 
 def _fix_path(file_path: str) -> str:
@@ -609,15 +683,22 @@ def get_kp_edge(resource_id: str, edge_idx: int) -> Optional[Dict[str, Any]]:
     return None
 
 
-def generate_trapi_kp_tests(metafunc, trapi_version: str, biolink_version: str) -> List:
+def generate_trapi_kp_tests(
+        metafunc,
+        trapi_version: str,
+        biolink_version: str,
+        locations: Optional[List[str]] = None
+) -> List:
     """
     Generate set of TRAPI Knowledge Provider unit tests with test data edges.
 
     :param metafunc: Dict, diverse One Step Pytest metadata
     :param trapi_version, str, TRAPI release set to be used in the validation
     :param biolink_version, str, Biolink Model release set to be used in the validation
+    :param locations, Optional[List[str]], if not None, only the KP test data locations listed are used
     """
     edges: List = []
+    test_cases: List = []
     idlist: List = []
 
     # TODO: test_run_id is currently unused in this method; it is otherwise an
@@ -626,6 +707,10 @@ def generate_trapi_kp_tests(metafunc, trapi_version: str, biolink_version: str)
 
     triple_source = metafunc.config.getoption('triple_source')
 
+    default_edge_budget: Optional[int] = metafunc.config.getoption('edge_budget', default=DEFAULT_EDGE_BUDGET)
+    kp_edge_budgets: Dict[str, int] = parse_edge_budgets(metafunc.config.getoption('kp_edge_budget', default=None))
+    sampling_seed: str = metafunc.config.getoption('edge_sampling_seed', default=DEFAULT_SAMPLING_SEED)
+
     kp_metadata: Dict[str, Dict[str, Optional[str]]] = \
         get_test_data_sources(
             source=triple_source,
@@ -634,8 +719,14 @@ def generate_trapi_kp_tests(metafunc, trapi_version: str, biolink_version: str)
             component_type="KP"
         )
 
+    if locations is not None:
+        locations = [_normalize_location(location) for location in locations]
+
     for source, metadata in kp_metadata.items():
 
+        if locations is not None and _normalize_location(source) not in locations:
+            continue
+
         # User CLI may trapi_version, biolink_version may (but not necessarily) here
         # override the target Biolink Model version during KP test data preparation
         kpjson = load_test_data_source(source, metadata)
@@ -663,10 +754,48 @@ def generate_trapi_kp_tests(metafunc, trapi_version: str, biolink_version: str)
             logger.error(err_msg)
             continue
 
+        # Select a representative sample of the KP test edges, within the edge budget of the KP
+        kp_infores_id: str = kpjson['infores'] if 'infores' in kpjson \
+            else str(kpjson['api_name']).lower().replace("_", "-")
+        edge_budget: Optional[int] = get_edge_budget(
+            resource_id=kp_infores_id,
+            default_budget=default_edge_budget,
+            edge_budgets=kp_edge_budgets
+        )
+        # Fingerprint of the test inputs of the KP, computed before the test edges are annotated below
+        kp_fingerprint: str = compute_resource_fingerprint(
+            test_data=kpjson,
+            url=kpjson['url'],
+            trapi_version=kpjson['trapi_version'],
+            biolink_version=kpjson['biolink_version'],
+            test_parameters={
+                "edge_budget": edge_budget,
+                "edge_sampling_seed": sampling_seed,
+                "one": metafunc.config.getoption('one', default=False),
+                "teststyle": metafunc.config.getoption('teststyle', default='all')
+            }
+        )
+        # The KP test edges are still needed by the ARA tests, even if the KP itself is not tested again
+        kp_carried_forward: bool = "kp_trapi_case" in metafunc.fixturenames and \
+            _get_carried_forward_summary(metafunc.config, "KP", kp_infores_id, kp_fingerprint) is not None
+
+        sampled_edges: List[int] = sample_test_edges(
+            kpjson['edges'],
+            budget=edge_budget,
+            seed=f"{sampling_seed}:{kp_infores_id}"
+        )
+        if len(sampled_edges) < len(kpjson['edges']):
+            logger.info(
+                f"generate_trapi_kp_tests(): sampled {len(sampled_edges)} of the " +
+                f"{len(kpjson['edges'])} test edges of KP '{kp_infores_id}'"
+            )
+
         # TODO: see below about echoing the edge input data to the Pytest stdout
         print(f"### Start of Test Input Edges for KP '{kpjson['api_name']}' ###")
 
-        for edge_i, edge in enumerate(kpjson['edges']):
+        for edge_i in sampled_edges:
+
+            edge: Dict = kpjson['edges'][edge_i]
 
             # We tag each edge internally with its
             # sequence number, for later convenience
@@ -692,6 +821,8 @@ def generate_trapi_kp_tests(metafunc, trapi_version: str, biolink_version: str)
             edge['trapi_version'] = kpjson['trapi_version']
             edge['biolink_version'] = kpjson['biolink_version']
 
+            edge['resource_fingerprint'] = kp_fingerprint
+
             if 'infores' in kpjson:
                 edge['kp_source'] = f"infores:{kpjson['infores']}"
             else:
@@ -732,34 +863,34 @@ def generate_trapi_kp_tests(metafunc, trapi_version: str, biolink_version: str)
 
             edges.append(edge)
 
-            # Start using the object_id of the Infores
-            # CURIE of the KP instead of its api_name...
-            # resource_id = edge['kp_api_name']
-            kp_id = edge['kp_source'].replace("infores:", "")
+            if not kp_carried_forward:
 
-            #
-            # TODO: caching the edge here doesn't help parsing of the results into a report since
-            #       the cache is not shared with the parent process.
-            #       Instead, we will try to echo the edge directly to stdout, for later parsing for the report.
-            #
-            # add_kp_edge(resource_id, edge_i, edge)
-            # json.dump(edge, stdout)
+                test_cases.append(edge)
 
-            edge_id = generate_edge_id(kp_id, edge_i)
-            idlist.append(edge_id)
+                # Start using the object_id of the Infores
+                # CURIE of the KP instead of its api_name...
+                # resource_id = edge['kp_api_name']
+                kp_id = edge['kp_source'].replace("infores:", "")
 
-            if metafunc.config.getoption('one', default=False):
-                break
+                #
+                # TODO: caching the edge here doesn't help parsing of the results into a report since
+                #       the cache is not shared with the parent process.
+                #       Instead, we will try to echo the edge directly to stdout, for later parsing for the report.
+                #
+                # add_kp_edge(resource_id, edge_i, edge)
+                # json.dump(edge, stdout)
+
+                edge_id = generate_edge_id(kp_id, edge_i)
+                idlist.append(edge_id)
 
-            # Circuit breaker for overly large edge test data sets
-            if edge_i > REASONABLE_NUMBER_OF_TEST_EDGES:
+            if metafunc.config.getoption('one', default=False):
                 break
 
         print(f"### End of Test Input Edges for KP '{kpjson['api_name']}' ###")
 
     if "kp_trapi_case" in metafunc.fixturenames:
 
-        metafunc.parametrize('kp_trapi_case', edges, ids=idlist)
+        metafunc.parametrize('kp_trapi_case', test_cases, ids=idlist)
 
         teststyle = metafunc.config.getoption('teststyle')
 
@@ -784,7 +915,7 @@ def generate_trapi_kp_tests(metafunc, trapi_version: str, biolink_version: str)
 
 
 # Once the smartapi tests are up, we'll want to pass them in here as well
-def generate_trapi_ara_tests(metafunc, kp_edges, trapi_version, biolink_version):
+def generate_trapi_ara_tests(metafunc, kp_edges, trapi_version, biolink_version, locations=None):
     """
     Generate set of TRAPI Autonomous Relay Agents (ARA) unit tests with KP test data edges.
 
@@ -792,6 +923,7 @@ def generate_trapi_ara_tests(metafunc, kp_edges, trapi_version, biolink_version)
     :param kp_edges: List, list of knowledge provider test edges from knowledge providers associated
     :param trapi_version, str, TRAPI release set to be used in the validation
     :param biolink_version, str, Biolink Model release set to be used in the validation
+    :param locations, Optional[List[str]], if not None, only the ARA test data locations listed are used
     """
     kp_dict = defaultdict(list)
     for e in kp_edges:
@@ -811,8 +943,14 @@ def generate_trapi_ara_tests(metafunc, kp_edges, trapi_version, biolink_version)
             component_type="ARA"
         )
 
+    if locations is not None:
+        locations = [_normalize_location(location) for location in locations]
+
     for source, metadata in ara_metadata.items():
 
+        if locations is not None and _normalize_location(source) not in locations:
+            continue
+
         # User CLI may override here the target Biolink Model version during KP test data preparation
         arajson = load_test_data_source(source, metadata)
 
@@ -826,6 +964,22 @@ def generate_trapi_ara_tests(metafunc, kp_edges, trapi_version, biolink_version)
         # No point in caching for latest implementation of reporting
         # cache_resource_metadata(arajson)
 
+        # Fingerprint of the test inputs of the ARA, including those of the KPs whose test edges it uses
+        ara_fingerprint: str = compute_resource_fingerprint(
+            test_data=arajson,
+            url=arajson['url'],
+            trapi_version=arajson['trapi_version'],
+            biolink_version=arajson['biolink_version'],
+            dependencies=[
+                kp_dict[kp][0]['resource_fingerprint'] for kp in arajson['KPs']
+                if kp in kp_dict and 'resource_fingerprint' in kp_dict[kp][0]
+            ]
+        )
+        ara_infores_id: str = arajson['infores'] if 'infores' in arajson \
+            else str(arajson['api_name']).lower().replace("_", "-")
+        if _get_carried_forward_summary(metafunc.config, "ARA", ara_infores_id, ara_fingerprint):
+            continue
+
         for kp in arajson['KPs']:
 
             #
@@ -844,7 +998,9 @@ def generate_trapi_ara_tests(metafunc, kp_edges, trapi_version, biolink_version)
 
             for edge_i, kp_edge in enumerate(kp_dict[kp]):
 
-                edge: dict = kp_edge.copy()
+                # The (read-only) KP test edge data is shared by the ARA test cases, rather than copied:
+                # the ARA specific fields below are only written to the overlay of the ChainMap
+                edge: ChainMap = ChainMap(dict(), kp_edge)
 
                 edge['url'] = arajson['url']
                 edge['ara_test_data_location'] = arajson['location']
@@ -856,6 +1012,8 @@ def generate_trapi_ara_tests(metafunc, kp_edges, trapi_version, biolink_version)
                 edge['trapi_version'] = arajson['trapi_version']
                 edge['biolink_version'] = arajson['biolink_version']
 
+                edge['resource_fingerprint'] = ara_fingerprint
+
                 # Resetting the Biolink Model version here may have the peculiar side effect of some
                 # KP edge test data now becoming non-compliant with the 'new' ARA Biolink Model version?
                 biolink_validator: BiolinkValidator = \
@@ -928,6 +1086,32 @@ def pytest_generate_tests(metafunc):
     biolink_version = metafunc.config.getoption('Biolink_Version')
     logger.debug(f"pytest_generate_tests(): caller specified Biolink_Version == {str(biolink_version)}")
 
+    if _is_sharded(metafunc.config):
+        # Only the KP and/or ARA test data locations specified are tested. Unit tests of the other component
+        # are (cheaply) parametrized with an empty set, later deselected in pytest_collection_modifyitems().
+        kp_locations: List[str] = metafunc.config.getoption('kp_location', default=None)
+        ara_locations: List[str] = metafunc.config.getoption('ara_location', default=None)
+        if metafunc.definition.name == 'test_trapi_kps':
+            generate_trapi_kp_tests(
+                metafunc,
+                trapi_version=trapi_version,
+                biolink_version=biolink_version,
+                locations=kp_locations if kp_locations else list()
+            )
+        elif metafunc.definition.name == 'test_trapi_aras':
+            if ara_locations:
+                # ARA tests still need the KP test edges of all the KPs
+                generate_trapi_ara_tests(
+                    metafunc,
+                    generate_trapi_kp_tests(metafunc, trapi_version=trapi_version, biolink_version=biolink_version),
+                    trapi_version=trapi_version,
+                    biolink_version=biolink_version,
+                    locations=ara_locations
+                )
+            else:
+                metafunc.parametrize('ara_trapi_case', list(), ids=list())
+        return
+
     trapi_kp_edges = generate_trapi_kp_tests(
         metafunc,
         trapi_version=trapi_version,
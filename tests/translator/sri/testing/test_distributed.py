@@ -0,0 +1,155 @@
+"""
+Unit tests for distributed test runs (the job queue tests need a running Mongodb instance)
+"""
+from typing import Dict, Optional, List
+from sys import platform
+from os.path import exists
+from time import sleep
+from datetime import datetime
+
+import pytest
+
+from translator.sri.testing.report_db import TestReport, MongoReportDatabase
+from translator.sri.testing.distributed import (
+    TestRunJobQueue,
+    TestRunWorker,
+    get_shard_summary_key
+)
+
+# For early testing of the Unit test, test data is not deleted when DEBUG is True;
+# however, this interferes with idempotency of the tests (i.e. data must be manually deleted from the test database)
+DEBUG: bool = False
+
+TEST_DATABASE = "distributed-test-run-unit-test-database"
+
+SAMPLE_SHARDS: List[Dict[str, str]] = [
+    {"shard_id": "KP-0", "component": "KP", "location": "https://some-kp/test_data.json"},
+    {"shard_id": "ARA-1", "component": "ARA", "location": "/some/path/Test ARA.json"}
+]
+
+
+def _test_run_id(seq: int) -> str:
+    return f"{datetime.now().strftime('%Y-%b-%d_%Hhr%M')}.{str(seq)}"
+
+
+def test_get_command_line():
+    command_line: str = TestRunWorker.get_command_line(
+        {
+            "test_run_id": "2022-10-19_10-00-00",
+            "shard_id": "ARA-1",
+            "component": "ARA",
+            "location": "/some/path/Test ARA.json",
+            "pytest_options": " --one"
+        }
+    )
+    assert "test_onehops.py::test_trapi_aras" in command_line
+    assert "--test_run_id=2022-10-19_10-00-00 --test_run_shard=ARA-1" in command_line
+    assert command_line.endswith("--ara_location='/some/path/Test ARA.json' --one")
+
+
+class LostLeaseJobQueue:
+    """
+    Stand-in for a TestRunJobQueue, whose leases are always lost.
+    """
+    def heartbeat(self, job: Dict, lease_duration: Optional[int] = None) -> bool:
+        return False
+
+
+def _is_running(pid: int) -> bool:
+    try:
+        with open(f"/proc/{pid}/stat") as stat_file:
+            # (orphaned) zombie processes are no longer running
+            return stat_file.read().split(")")[-1].split()[0] != "Z"
+    except FileNotFoundError:
+        return False
+
+
+@pytest.mark.skipif(not platform.startswith("linux"), reason="process status read from /proc")
+def test_shard_terminated_once_lease_lost(tmp_path, monkeypatch):
+    # the shell spawns a child process, like the Pytest session of a shard
+    pid_file = tmp_path / "pid"
+    monkeypatch.setattr(
+        TestRunWorker, "get_command_line", staticmethod(lambda job: f"sleep 60 & echo $! > {pid_file}; wait")
+    )
+    worker = TestRunWorker(job_queue=LostLeaseJobQueue(), lease_duration=2, heartbeat_interval=1)
+    assert worker.run_job({"test_run_id": _test_run_id(0), "shard_id": "KP-0"}) is None
+    assert exists(pid_file)
+    pid: int = int(pid_file.read_text())
+    for _ in range(20):
+        if not _is_running(pid):
+            break
+        sleep(0.1)
+    assert not _is_running(pid)
+
+
+def test_job_queue_leases_and_heartbeats():
+    mrd = MongoReportDatabase(db_name=TEST_DATABASE)
+    job_queue = TestRunJobQueue(mrd, max_attempts=2)
+    test_run_id: str = _test_run_id(1)
+    job_queue.enqueue(test_run_id=test_run_id, shards=SAMPLE_SHARDS, pytest_options=" --one")
+    assert job_queue.get_percentage_completion(test_run_id) == 0
+
+    first: Optional[Dict] = job_queue.lease("worker-1")
+    second: Optional[Dict] = job_queue.lease("worker-2")
+    assert first["shard_id"] == "KP-0" and second["shard_id"] == "ARA-1"
+    assert job_queue.lease("worker-3") is None
+    assert job_queue.heartbeat(first)
+
+    # the first worker 'crashes': its lease expires and is taken over by another worker
+    assert job_queue.heartbeat(first, lease_duration=0)
+    sleep(0.01)
+    retry: Optional[Dict] = job_queue.lease("worker-3")
+    assert retry["shard_id"] == "KP-0" and retry["attempts"] == 2
+    assert not job_queue.heartbeat(first)
+
+    # shard runs which did not complete are released again, unless leased too often
+    job_queue.complete(second, return_code=3)
+    assert job_queue.lease("worker-2")["shard_id"] == "ARA-1"
+
+    job_queue.complete(retry, return_code=1)
+    assert job_queue.get_percentage_completion(test_run_id) == 47
+
+    job_queue.cancel(test_run_id)
+    assert job_queue.get_run_state(test_run_id) == TestRunJobQueue.CANCELLED
+    assert job_queue.lease("worker-1") is None
+
+    if not DEBUG:
+        mrd.drop_database()
+
+
+def test_job_queue_finalization():
+    mrd = MongoReportDatabase(db_name=TEST_DATABASE)
+    job_queue = TestRunJobQueue(mrd)
+    test_run_id: str = _test_run_id(2)
+    job_queue.enqueue(test_run_id=test_run_id, shards=SAMPLE_SHARDS)
+
+    test_report: TestReport = mrd.get_test_report(identifier=test_run_id)
+    shard_summaries: Dict[str, Dict] = {
+        "KP-0": {"KP": {"some-kp": {"no_of_edges": 1}}},
+        "ARA-1": {"ARA": {"some-ara": {"kps": {"some-kp": {"no_of_edges": 1}}}}}
+    }
+    while True:
+        job: Optional[Dict] = job_queue.lease("worker-1")
+        if not job:
+            break
+        # test run is only finalized once all its shards are done
+        assert not job_queue.finalize_test_runs()
+        test_report.save_json_document(
+            document_type="Shard Summary",
+            document=shard_summaries[job["shard_id"]],
+            document_key=get_shard_summary_key(job["shard_id"])
+        )
+        test_report.flush()
+        job_queue.complete(job, return_code=0)
+
+    assert job_queue.finalize_test_runs() == [test_run_id]
+    assert not job_queue.finalize_test_runs()
+    assert job_queue.get_percentage_completion(test_run_id) == 100
+    assert test_run_id in mrd.get_available_reports()
+
+    summary: Dict = test_report.retrieve_document(document_type="Summary", document_key="test_run_summary")
+    assert summary["KP"]["some-kp"]["no_of_edges"] == 1
+    assert summary["ARA"]["some-ara"]["kps"]["some-kp"]["no_of_edges"] == 1
+
+    if not DEBUG:
+        mrd.drop_database()
@@ -0,0 +1,73 @@
+"""
+Unit tests of the read-through cache of the documents of completed test runs
+"""
+from typing import Dict, List, Optional
+
+from translator.sri.testing.document_cache import DocumentCache
+
+
+def _retrieval(document: Optional[Dict], retrievals: List[str], document_key: str):
+    def retrieve() -> Optional[Dict]:
+        retrievals.append(document_key)
+        return document
+    return retrieve
+
+
+def test_read_through_and_metrics():
+    cache = DocumentCache()
+    retrievals: List[str] = list()
+    summary: Dict = {"KP": {"some-kp": {"no_of_edges": 1}}}
+
+    assert cache.get("run-1", "test_run_summary", _retrieval(summary, retrievals, "test_run_summary")) == summary
+    assert cache.get("run-1", "test_run_summary", _retrieval(summary, retrievals, "test_run_summary")) is summary
+    assert retrievals == ["test_run_summary"]
+
+    # missing documents are not cached
+    assert cache.get("run-1", "unknown", _retrieval(None, retrievals, "unknown")) is None
+    assert cache.get("run-1", "unknown", _retrieval(None, retrievals, "unknown")) is None
+    assert retrievals == ["test_run_summary", "unknown", "unknown"]
+
+    metrics: Dict = cache.get_metrics()
+    assert metrics["documents"] == 1 and metrics["hits"] == 1 and metrics["misses"] == 3
+    assert metrics["hit_rate"] == 0.25
+    assert metrics["size"] == len(b'{"KP":{"some-kp":{"no_of_edges":1}}}')
+
+
+def test_byte_weighted_eviction():
+    # room for two documents of ~110 bytes
+    cache = DocumentCache(max_size=250)
+    retrievals: List[str] = list()
+    for document_key in ["one", "two", "one", "three"]:
+        cache.get("run-1", document_key, _retrieval({"padding": "x" * 100}, retrievals, document_key))
+
+    # 'two' is the least recently used document, thus evicted first
+    assert retrievals == ["one", "two", "three"]
+    cache.get("run-1", "one", _retrieval({"padding": "x" * 100}, retrievals, "one"))
+    cache.get("run-1", "two", _retrieval({"padding": "x" * 100}, retrievals, "two"))
+    assert retrievals == ["one", "two", "three", "two"]
+    assert cache.get_metrics()["evictions"] == 2
+    assert cache.get_metrics()["size"] <= 250
+
+    # documents bigger than the whole cache are not cached
+    cache.get("run-1", "big", _retrieval({"padding": "x" * 1000}, retrievals, "big"))
+    cache.get("run-1", "big", _retrieval({"padding": "x" * 1000}, retrievals, "big"))
+    assert retrievals[-2:] == ["big", "big"]
+
+
+def test_invalidation():
+    cache = DocumentCache()
+    retrievals: List[str] = list()
+    for test_run_id in ["run-1", "run-2"]:
+        cache.get(test_run_id, "test_run_summary", _retrieval({"run": test_run_id}, retrievals, test_run_id))
+
+    # the documents of a deleted test run are no longer cached
+    assert cache.invalidate("run-1") == 1
+    assert cache.get_metrics()["documents"] == 1
+    cache.get("run-1", "test_run_summary", _retrieval({"run": "run-1"}, retrievals, "run-1"))
+    cache.get("run-2", "test_run_summary", _retrieval({"run": "run-2"}, retrievals, "run-2"))
+    assert retrievals == ["run-1", "run-2", "run-1"]
+
+    # a zero size cache caches nothing
+    cache = DocumentCache(max_size=0)
+    cache.get("run-1", "test_run_summary", _retrieval({"run": "run-1"}, retrievals, "run-1"))
+    assert cache.get_metrics()["documents"] == 0
@@ -0,0 +1,105 @@
+"""
+Unit tests for the stratified sampling of KP test edges
+"""
+from typing import Dict, List
+from shlex import split
+import re
+
+import pytest
+
+from translator.sri.testing.processor import WorkerProcess
+from translator.sri.testing.onehops_test_runner import OneHopTestHarness
+
+from translator.sri.testing.edge_sampling import (
+    DEFAULT_EDGE_BUDGET,
+    get_edge_stratum,
+    parse_edge_budgets,
+    get_edge_budget,
+    sample_test_edges
+)
+
+
+def _edge(subject_category: str, predicate: str, object_category: str) -> Dict:
+    return {
+        "subject_category": subject_category,
+        "predicate": predicate,
+        "object_category": object_category,
+        "subject": "FOO:1",
+        "object": "BAR:2"
+    }
+
+
+# 80 'biolink:interacts_with' edges listed first, then 10 of each of two other predicates
+SAMPLE_EDGES: List[Dict] = \
+    [_edge("biolink:Gene", "biolink:interacts_with", "biolink:Gene") for _ in range(80)] + \
+    [_edge("biolink:Gene", "biolink:related_to", "biolink:Disease") for _ in range(10)] + \
+    [_edge("biolink:Drug", "biolink:treats", "biolink:Disease") for _ in range(10)]
+
+
+def test_get_edge_stratum():
+    assert get_edge_stratum(SAMPLE_EDGES[-1]) == ("biolink:Drug", "biolink:treats", "biolink:Disease")
+
+
+def test_parse_edge_budgets():
+    assert parse_edge_budgets(None) == {}
+    assert parse_edge_budgets(["molepro=10", "infores:rtx-kg2=0"]) == {"molepro": 10, "rtx-kg2": 0}
+    for spec in [
+        "molepro", "molepro=", "molepro=ten", "molepro=1.5", "molepro=-1",
+        # resource identifiers are not InfoRes-style
+        "=10", "mole pro=10", "x; touch /tmp/owned; #=10", "$(touch /tmp/owned)=10"
+    ]:
+        with pytest.raises(ValueError, match=re.escape(f"Invalid edge budget '{spec}'")):
+            parse_edge_budgets([spec])
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        ("some-kp", DEFAULT_EDGE_BUDGET, None, DEFAULT_EDGE_BUDGET),
+        ("some-kp", 0, None, None),
+        ("some-kp", 10, {"some-kp": 20}, 20),
+        ("some-kp", 10, {"some-kp": -1}, None),
+        ("other-kp", 10, {"some-kp": 20}, 10)
+    ]
+)
+def test_get_edge_budget(query):
+    assert get_edge_budget(resource_id=query[0], default_budget=query[1], edge_budgets=query[2]) == query[3]
+
+
+def test_sample_within_budget_returns_all_edges():
+    assert sample_test_edges(SAMPLE_EDGES, budget=None) == list(range(len(SAMPLE_EDGES)))
+    assert sample_test_edges(SAMPLE_EDGES, budget=len(SAMPLE_EDGES)) == list(range(len(SAMPLE_EDGES)))
+
+
+def test_sample_is_stratified():
+    sample: List[int] = sample_test_edges(SAMPLE_EDGES, budget=30)
+    assert len(sample) == 30
+    assert sample == sorted(set(sample))
+    predicates = [SAMPLE_EDGES[i]["predicate"] for i in sample]
+    # unlike a simple truncation, all strata are evenly represented
+    assert predicates.count("biolink:interacts_with") == 10
+    assert predicates.count("biolink:related_to") == 10
+    assert predicates.count("biolink:treats") == 10
+
+
+def test_sample_maximizes_predicate_coverage():
+    sample: List[int] = sample_test_edges(SAMPLE_EDGES, budget=3)
+    assert {SAMPLE_EDGES[i]["predicate"] for i in sample} == \
+           {"biolink:interacts_with", "biolink:related_to", "biolink:treats"}
+
+
+def test_sample_is_deterministic():
+    assert sample_test_edges(SAMPLE_EDGES, budget=15, seed="one") == \
+           sample_test_edges(SAMPLE_EDGES, budget=15, seed="one")
+    assert sample_test_edges(SAMPLE_EDGES, budget=15, seed="one") != \
+           sample_test_edges(SAMPLE_EDGES, budget=15, seed="two")
+
+
+def test_kp_edge_budgets_are_quoted_on_the_command_line(monkeypatch):
+    # the command line of the One Hop tests is run as a shell command
+    command_lines: List[str] = list()
+    monkeypatch.setattr(WorkerProcess, "run_command", lambda self, command_line: command_lines.append(command_line))
+    hostile_kp_id: str = "x; touch /tmp/owned; #"
+    OneHopTestHarness().run(kp_edge_budgets={hostile_kp_id: 10, "molepro": 0})
+    assert f"--kp_edge_budget={hostile_kp_id}=10" in split(command_lines[0])
+    assert "--kp_edge_budget=molepro=0" in split(command_lines[0])
@@ -1,11 +1,27 @@
 import json
+import pytest
 
-from os.path import sep
+from collections import ChainMap
+from io import BytesIO
+from threading import Thread
+from time import sleep
+
+from os.path import sep, exists
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Dict, Optional, List
 
 from tests.onehop import get_test_results_dir
-from translator.sri.testing.report_db import FileReportDatabase, TestReport
+from translator.sri.testing.report_db import (
+    FileReportDatabase,
+    FileTestReport,
+    TestReport,
+    TestReportDatabaseException,
+    COMPRESSION_SUFFIXES,
+    zstandard,
+    dump_report_json,
+    TEST_RUN_PACK,
+    SPLIT_DOCUMENT_SUFFIX
+)
 
 # For early testing of the Unit test, test data is not deleted when DEBUG is True;
 # however, this interferes with idempotency of the tests (i.e. data must be manually deleted from the test database)
@@ -41,6 +57,7 @@ def test_delete_file_report_db_database():
 
 SAMPLE_DOCUMENT_KEY: str = "test_run_summary"
 SAMPLE_DOCUMENT: Dict = {}
+SAMPLE_BIG_DOCUMENT: Dict = {"message": {"results": [{"edge_bindings": str(i)} for i in range(100)]}}
 
 
 def sample_file_document_creation_and_insertion(
@@ -62,6 +79,12 @@ def sample_file_document_creation_and_insertion(
         document_key=SAMPLE_DOCUMENT_KEY,
         is_big=is_big
     )
+    # saved documents are written out in the background
+    test_report.flush()
+
+    # test runs are only available once completed in the test run catalog
+    assert identifier not in frd.get_available_reports()
+    test_report.set_completed()
     assert identifier in frd.get_available_reports()
 
     return test_report
@@ -115,7 +138,7 @@ def test_create_test_report_then_save_and_retrieve_a_big_document():
 
     test_report: TestReport = sample_file_document_creation_and_insertion(frd, test_id, is_big=True)
 
-    text_file: str = ""
+    text_file: bytes = b""
     for line in test_report.stream_document(document_type="test document", document_key=SAMPLE_DOCUMENT_KEY):
         text_file += line
 
@@ -133,6 +156,461 @@ def test_create_test_report_then_save_and_retrieve_a_big_document():
         frd.drop_database()
 
 
+def test_stream_document_chunks_and_byte_ranges():
+
+    # the big document is read directly from its file, thus not saved in the blob store
+    frd = FileReportDatabase(db_name=TEST_DATABASE, blob_store=False)
+
+    test_id = _test_id(14)
+
+    test_report: TestReport = frd.get_test_report(identifier=test_id)
+    test_report.save_json_document(
+        document_type="TRAPI Response",
+        document={"message": {"results": [{"edge_bindings": str(i)} for i in range(100)]}},
+        document_key=SAMPLE_DOCUMENT_KEY,
+        is_big=True
+    )
+    test_report.flush()
+
+    size: Optional[int] = test_report.get_document_size(
+        document_type="TRAPI Response", document_key=SAMPLE_DOCUMENT_KEY
+    )
+    with open(f"{test_report.get_absolute_file_path(SAMPLE_DOCUMENT_KEY)}.json", mode="rb") as datafile:
+        stored: bytes = datafile.read()
+    assert size == len(stored)
+
+    # the stored bytes are streamed as they are, in fixed size chunks
+    chunks: List[bytes] = list(
+        test_report.stream_document(document_type="TRAPI Response", document_key=SAMPLE_DOCUMENT_KEY, chunk_size=100)
+    )
+    assert all([len(chunk) == 100 for chunk in chunks[:-1]]) and 0 < len(chunks[-1]) <= 100
+    assert b"".join(chunks) == stored
+
+    # byte ranges, i.e. for resumed downloads
+    assert b"".join(
+        test_report.stream_document(
+            document_type="TRAPI Response", document_key=SAMPLE_DOCUMENT_KEY, start=10, end=249, chunk_size=100
+        )
+    ) == stored[10:250]
+    assert b"".join(
+        test_report.stream_document(document_type="TRAPI Response", document_key=SAMPLE_DOCUMENT_KEY, start=size - 5)
+    ) == stored[-5:]
+
+    assert test_report.get_document_size(document_type="TRAPI Response", document_key="unknown/document") is None
+    assert not list(test_report.stream_document(document_type="TRAPI Response", document_key="unknown/document"))
+
+    if not DEBUG:
+        frd.drop_database()
+
+
+@pytest.mark.parametrize(
+    "compression",
+    [
+        "gzip",
+        pytest.param("zstd", marks=pytest.mark.skipif(zstandard is None, reason="needs the 'zstandard' package"))
+    ]
+)
+def test_compressed_big_documents(compression: str):
+
+    frd = FileReportDatabase(db_name=TEST_DATABASE, compression=compression, blob_store=False)
+
+    test_id = _test_id(15)
+
+    test_report: TestReport = frd.get_test_report(identifier=test_id)
+    document: Dict = {"message": {"results": [{"edge_bindings": str(i)} for i in range(100)]}}
+    test_report.save_json_document(
+        document_type="TRAPI Response",
+        document=document,
+        document_key=SAMPLE_DOCUMENT_KEY,
+        is_big=True
+    )
+    # only big documents are compressed
+    test_report.save_json_document(document_type="Details", document={"one": 1}, document_key="details")
+    test_report.flush()
+
+    document_path: str = test_report.get_absolute_file_path(SAMPLE_DOCUMENT_KEY)
+    assert exists(f"{document_path}.json{COMPRESSION_SUFFIXES[compression]}")
+    assert not exists(f"{document_path}.json")
+    assert exists(f"{test_report.get_absolute_file_path('details')}.json")
+    assert test_report.get_document_compression(document_type="TRAPI Response", document_key=SAMPLE_DOCUMENT_KEY) \
+        == compression
+    assert test_report.get_document_compression(document_type="Details", document_key="details") is None
+
+    # compressed documents are transparently decompressed when read...
+    retrieved: Dict = test_report.retrieve_document(document_type="TRAPI Response", document_key=SAMPLE_DOCUMENT_KEY)
+    assert retrieved["message"] == document["message"]
+    streamed: bytes = b"".join(
+        test_report.stream_document(document_type="TRAPI Response", document_key=SAMPLE_DOCUMENT_KEY, chunk_size=100)
+    )
+    assert json.loads(streamed)["message"] == document["message"]
+
+    # ...unless streamed as stored, e.g. to be passed through to a HTTP client
+    with open(f"{document_path}.json{COMPRESSION_SUFFIXES[compression]}", mode="rb") as datafile:
+        stored: bytes = datafile.read()
+    assert len(stored) < len(streamed)
+    assert test_report.get_document_size(document_type="TRAPI Response", document_key=SAMPLE_DOCUMENT_KEY) \
+        == len(stored)
+    assert b"".join(
+        test_report.stream_document(
+            document_type="TRAPI Response", document_key=SAMPLE_DOCUMENT_KEY, start=10, decompress=False
+        )
+    ) == stored[10:]
+
+    if not DEBUG:
+        frd.drop_database()
+
+
+def test_blob_store():
+
+    frd = FileReportDatabase(db_name=TEST_DATABASE, compression="gzip")
+
+    # a broken KP returns the same big TRAPI response, night after night...
+    document: Dict = {"message": {"results": [{"edge_bindings": str(i)} for i in range(100)]}}
+    test_ids: List[str] = [_test_id(16), _test_id(17)]
+    blob_ids: List[str] = list()
+    for test_id in test_ids:
+        frd.register_test_run(test_id)
+        test_report: TestReport = frd.get_test_report(identifier=test_id)
+        for document_key in [SAMPLE_DOCUMENT_KEY, f"{SAMPLE_DOCUMENT_KEY}-again"]:
+            test_report.save_json_document(
+                document_type="TRAPI Response",
+                document=dict(document),
+                document_key=document_key,
+                is_big=True
+            )
+        test_report.flush()
+        with open(f"{test_report.get_absolute_file_path(SAMPLE_DOCUMENT_KEY)}.blob") as pointer_file:
+            blob_ids.append(pointer_file.read())
+
+        # the documents of the test run are only pointers to the (compressed) blob...
+        assert not exists(f"{test_report.get_absolute_file_path(SAMPLE_DOCUMENT_KEY)}.json")
+        assert test_report.get_document_compression(document_type="TRAPI Response", document_key=SAMPLE_DOCUMENT_KEY) \
+            == "gzip"
+        retrieved: Dict = test_report.retrieve_document(
+            document_type="TRAPI Response", document_key=SAMPLE_DOCUMENT_KEY
+        )
+        assert retrieved["message"] == document["message"]
+        streamed: bytes = b"".join(
+            test_report.stream_document(document_type="TRAPI Response", document_key=SAMPLE_DOCUMENT_KEY)
+        )
+        assert json.loads(streamed)["message"] == document["message"]
+
+    # ...which is saved only once
+    blob_id: str = blob_ids[0]
+    assert blob_ids == [blob_id, blob_id]
+    blob_file, compression = frd.find_blob_file(blob_id)
+    assert blob_file and compression == "gzip"
+
+    # the blob is only deleted once no longer referenced by any test run
+    frd.get_test_report(identifier=test_ids[0]).delete()
+    assert test_ids[0] in frd.reap_deleted_test_runs()
+    assert exists(blob_file)
+    assert json.loads(
+        b"".join(
+            frd.get_test_report(identifier=test_ids[1]).stream_document(
+                document_type="TRAPI Response", document_key=SAMPLE_DOCUMENT_KEY
+            )
+        )
+    )["message"] == document["message"]
+
+    frd.get_test_report(identifier=test_ids[1]).delete()
+    assert test_ids[1] in frd.reap_deleted_test_runs()
+    assert not exists(blob_file)
+    assert frd.find_blob_file(blob_id) == (None, None)
+
+    if not DEBUG:
+        frd.drop_database()
+
+
+def test_blob_store_concurrency():
+
+    frd = FileReportDatabase(db_name=TEST_DATABASE)
+    data: bytes = json.dumps({"message": {"results": "same big response"}}).encode("utf-8")
+
+    # the blob is repeatedly referenced (then released) by one test run while being released by another...
+    def churn():
+        for i in range(200):
+            frd.put_blob(_test_id(1000 + i), data)
+            frd.release_blobs(_test_id(1000 + i))
+
+    churner = Thread(target=churn)
+    churner.start()
+    try:
+        # ...yet a blob is always available to the test runs still referencing it
+        for i in range(200):
+            blob_id: str = frd.put_blob(_test_id(2000 + i), data)
+            assert frd.find_blob_file(blob_id)[0] is not None
+            frd.release_blobs(_test_id(2000 + i))
+    finally:
+        churner.join()
+
+    if not DEBUG:
+        frd.drop_database()
+
+
+def test_packed_test_run():
+
+    frd = FileReportDatabase(db_name=TEST_DATABASE, compression="gzip")
+
+    test_id = _test_id(18)
+
+    test_report: FileTestReport = frd.get_test_report(identifier=test_id)
+    big_document: Dict = {"message": {"results": [{"edge_bindings": str(i)} for i in range(100)]}}
+    test_report.save_json_document(document_type="TRAPI Response", document=big_document, document_key="KP/big")
+    test_report.save_json_document(
+        document_type="TRAPI Response", document=dict(big_document), document_key="KP/blob", is_big=True
+    )
+    test_report.save_json_document(document_type="Details", document={"edge": 1}, document_key="KP/Test_KP/details")
+    test_report.save_json_document(document_type="Test Run Summary", document={}, document_key=SAMPLE_DOCUMENT_KEY)
+    test_report.set_completed()
+
+    # the document files of the completed test run are packed into a single archive...
+    assert exists(f"{test_report.get_root_path()}{sep}{TEST_RUN_PACK}")
+    assert not exists(f"{test_report.get_absolute_file_path('KP/Test_KP/details')}.json")
+    assert not exists(f"{test_report.get_root_path()}{sep}KP")
+    assert test_id in frd.get_available_reports()
+    assert test_report.exists_document(f"{SAMPLE_DOCUMENT_KEY}.json")
+
+    # ...from which they are read, whatever their codec
+    assert test_report.retrieve_document(document_type="Details", document_key="KP/Test_KP/details")["edge"] == 1
+    assert test_report.retrieve_document(document_type="Details", document_key="KP/big")["message"] \
+        == big_document["message"]
+    assert test_report.get_document_compression(document_type="TRAPI Response", document_key="KP/blob") == "gzip"
+    streamed: bytes = b"".join(
+        test_report.stream_document(document_type="TRAPI Response", document_key="KP/blob", chunk_size=100)
+    )
+    assert json.loads(streamed)["message"] == big_document["message"]
+    stored: bytes = b"".join(test_report.stream_document(document_type="TRAPI Response", document_key="KP/big"))
+    assert test_report.get_document_size(document_type="TRAPI Response", document_key="KP/big") == len(stored)
+    assert b"".join(
+        test_report.stream_document(document_type="TRAPI Response", document_key="KP/big", start=10, end=249)
+    ) == stored[10:250]
+    assert test_report.retrieve_document(document_type="Details", document_key="unknown/document") is None
+
+    # documents saved again take precedence over their archived version, until packed again
+    test_report.save_json_document(document_type="Details", document={"edge": 2}, document_key="KP/Test_KP/details")
+    test_report.flush()
+    assert test_report.retrieve_document(document_type="Details", document_key="KP/Test_KP/details")["edge"] == 2
+    assert test_report.pack()
+    assert not exists(f"{test_report.get_absolute_file_path('KP/Test_KP/details')}.json")
+    assert test_report.retrieve_document(document_type="Details", document_key="KP/Test_KP/details")["edge"] == 2
+    assert test_report.retrieve_document(document_type="Details", document_key="KP/big")["message"] \
+        == big_document["message"]
+
+    # unpacked test runs are still read from their document files
+    unpacked_frd = FileReportDatabase(db_name=TEST_DATABASE, pack_test_runs=False)
+    unpacked_test_id: str = _test_id(19)
+    unpacked_test_report: TestReport = sample_file_document_creation_and_insertion(unpacked_frd, unpacked_test_id)
+    assert not exists(f"{unpacked_test_report.get_root_path()}{sep}{TEST_RUN_PACK}")
+
+    # deleting the test run removes its archive
+    root_path: str = test_report.get_root_path()
+    assert test_report.delete()
+    assert test_id in frd.reap_deleted_test_runs()
+    assert not exists(root_path)
+
+    if not DEBUG:
+        frd.drop_database()
+
+
+def test_summary_projections():
+
+    frd = FileReportDatabase(db_name=TEST_DATABASE)
+
+    test_id = _test_id(20)
+
+    test_report: FileTestReport = frd.get_test_report(identifier=test_id)
+    summary: Dict = {
+        "KP": {"infores:some-kp": {"no_of_edges": 2}},
+        "ARA": {"infores:some-ara": {"kps": {"infores:some-kp": {"no_of_edges": 1}}}}
+    }
+    test_report.save_json_document(document_type="Test Run Summary", document=summary, document_key=SAMPLE_DOCUMENT_KEY)
+    test_report.flush()
+
+    # the summary is also written out split into its per-resource parts...
+    assert exists(
+        test_report.get_absolute_file_path(f"{SAMPLE_DOCUMENT_KEY}{SPLIT_DOCUMENT_SUFFIX}/KP/infores:some-kp.json")
+    )
+
+    # ...from which (only) the projected parts are read, before and after the test run is packed
+    for completed in [False, True]:
+        if completed:
+            test_report.set_completed()
+            assert exists(f"{test_report.get_root_path()}{sep}{TEST_RUN_PACK}")
+        assert test_report.retrieve_document_projection(
+            document_type="Summary", document_key=SAMPLE_DOCUMENT_KEY, path=["KP", "infores:some-kp"]
+        ) == {"no_of_edges": 2}
+        assert test_report.retrieve_document_projection(
+            document_type="Summary", document_key=SAMPLE_DOCUMENT_KEY, path=["ARA", "infores:some-ara", "kps"]
+        ) == {"infores:some-kp": {"no_of_edges": 1}}
+        assert test_report.retrieve_document_projection(
+            document_type="Summary", document_key=SAMPLE_DOCUMENT_KEY, path=["KP", "infores:unknown-kp"]
+        ) is None
+        assert test_report.retrieve_document_projection(
+            document_type="Summary", document_key=SAMPLE_DOCUMENT_KEY, path=["document_key"]
+        ) == SAMPLE_DOCUMENT_KEY
+        assert test_report.retrieve_document_keys(
+            document_type="Summary", document_key=SAMPLE_DOCUMENT_KEY, path=[]
+        ) == ["KP", "ARA", "document_key"]
+        assert test_report.retrieve_document_keys(
+            document_type="Summary", document_key=SAMPLE_DOCUMENT_KEY, path=["ARA"]
+        ) == ["infores:some-ara"]
+        assert test_report.retrieve_document_keys(
+            document_type="Summary", document_key=SAMPLE_DOCUMENT_KEY, path=["ARA", "infores:some-ara", "kps"]
+        ) == ["infores:some-kp"]
+        assert test_report.retrieve_document_keys(
+            document_type="Summary", document_key=SAMPLE_DOCUMENT_KEY, path=["document_key"]
+        ) is None
+
+    # documents which are not split are projected once retrieved
+    test_report.save_json_document(document_type="Details", document={"edge": {"one": 1}}, document_key="details")
+    assert test_report.retrieve_document_projection(
+        document_type="Details", document_key="details", path=["edge", "one"]
+    ) == 1
+
+    if not DEBUG:
+        frd.drop_database()
+
+
+def test_test_run_rollups():
+
+    frd = FileReportDatabase(db_name=TEST_DATABASE)
+
+    test_ids: List[str] = [_test_id(21), _test_id(22)]
+    for day, test_id in enumerate(test_ids):
+        frd.save_rollups(
+            test_id,
+            completed=f"2023-01-0{day + 1}T00:00:00",
+            rollups=[
+                {
+                    "component": "KP", "ara_id": None, "kp_id": "some-kp", "unit_test": "by_subject",
+                    "passed": day, "failed": 1, "skipped": 0,
+                    "latency_count": 1, "latency_mean_ms": 10.0, "latency_min_ms": 10, "latency_max_ms": 10
+                },
+                {
+                    "component": "ARA", "ara_id": "some-ara", "kp_id": "some-kp", "unit_test": "by_subject",
+                    "passed": 1, "failed": 0, "skipped": 0,
+                    "latency_count": 0, "latency_mean_ms": None, "latency_min_ms": None, "latency_max_ms": None
+                }
+            ]
+        )
+
+    # the history of a resource is retrieved in one query, as a time series
+    history: List[Dict] = frd.get_rollups(component="KP", kp_id="some-kp", unit_test="by_subject")
+    assert [(row["test_run_id"], row["passed"]) for row in history] == [(test_ids[0], 0), (test_ids[1], 1)]
+    assert history[0]["latency_mean_ms"] == 10.0 and history[0]["ara_id"] is None
+    assert len(frd.get_rollups(kp_id="some-kp")) == 4
+    assert [row["test_run_id"] for row in frd.get_rollups(ara_id="some-ara", since="2023-01-02")] == [test_ids[1]]
+    assert frd.get_rollups(kp_id="some-kp", until="2022-12-31") == []
+
+    # the rollups of a test run are replaced when saved again, and removed once the test run is deleted
+    frd.save_rollups(test_ids[0], completed="2023-01-01T00:00:00", rollups=[])
+    assert [row["test_run_id"] for row in frd.get_rollups(kp_id="some-kp")] == [test_ids[1]] * 2
+    frd.tombstone_test_run(test_ids[1])
+    assert frd.get_rollups() == []
+
+    if not DEBUG:
+        frd.drop_database()
+
+
+class _SampleRecord:
+    def to_json(self) -> Dict:
+        return {"passed": 1}
+
+
+def test_dump_report_json():
+    document: Dict = {
+        "outcomes": {"passed"},
+        "record": _SampleRecord(),
+        "test_case": ChainMap({"idx": 0}, {"url": "https://some-kp"}),
+        1: (1, 2)
+    }
+    assert json.loads(dump_report_json(document)) == {
+        "outcomes": ["passed"],
+        "record": {"passed": 1},
+        "test_case": {"idx": 0, "url": "https://some-kp"},
+        "1": [1, 2]
+    }
+    assert b"\n" not in dump_report_json(document, pretty=False)
+    assert b"\n" in dump_report_json(document, pretty=True)
+    with pytest.raises(TypeError):
+        dump_report_json({"not_serializable": object()})
+
+
+def test_unknown_compression():
+    with pytest.raises(TestReportDatabaseException):
+        FileReportDatabase(db_name=TEST_DATABASE, compression="lzma")
+
+
+def test_background_writers():
+
+    frd = FileReportDatabase(db_name=TEST_DATABASE)
+
+    test_id = _test_id(5)
+
+    # tiny writer queues, so that saving documents is throttled by the writer threads
+    test_report: TestReport = FileTestReport(identifier=test_id, database=frd, writer_threads=2, writer_queue_size=2)
+    for i in range(20):
+        test_report.save_json_document(
+            document_type="Details", document={"edge": i}, document_key=f"KP/Test_KP/Test_KP-{i % 5}"
+        )
+    test_report.close()
+
+    # the last document saved with any given key is the one written out
+    for i in range(5):
+        document: Optional[Dict] = test_report.retrieve_document(
+            document_type="Details", document_key=f"KP/Test_KP/Test_KP-{i}"
+        )
+        assert document["edge"] == 15 + i
+
+    if not DEBUG:
+        test_report.delete()
+        frd.drop_database()
+
+
+class FailingFileTestReport(FileTestReport):
+    """
+    FileTestReport failing to write out the documents of a given key.
+    """
+    def __init__(self, failing_document_key: str, **kwargs):
+        FileTestReport.__init__(self, **kwargs)
+        self.failing_document_key: str = failing_document_key
+
+    def _write_json_document(self, document_type: str, document: Dict, document_key: str, is_big: bool = False):
+        if document_key == self.failing_document_key:
+            raise OSError("No space left on device")
+        FileTestReport._write_json_document(self, document_type, document, document_key, is_big)
+
+
+def test_background_writer_failures():
+
+    frd = FileReportDatabase(db_name=TEST_DATABASE)
+
+    test_report: TestReport = FailingFileTestReport(
+        failing_document_key="KP/Test_KP/Test_KP-3", identifier=_test_id(30), database=frd, writer_threads=2
+    )
+    for i in range(5):
+        test_report.save_json_document(
+            document_type="Details", document={"edge": i}, document_key=f"KP/Test_KP/Test_KP-{i}"
+        )
+    # the documents which could not be written out by the writer threads are reported...
+    with pytest.raises(TestReportDatabaseException, match="Details 'KP/Test_KP/Test_KP-3'"):
+        test_report.flush()
+    assert test_report.retrieve_document(document_type="Details", document_key="KP/Test_KP/Test_KP-4")["edge"] == 4
+
+    # ... once, ...
+    test_report.flush()
+
+    # ... then upon closing the test report as well
+    test_report.save_json_document(document_type="Details", document={"edge": 3}, document_key="KP/Test_KP/Test_KP-3")
+    with pytest.raises(TestReportDatabaseException, match="1 document"):
+        test_report.close()
+
+    if not DEBUG:
+        test_report.delete()
+        frd.drop_database()
+
+
 def test_file_report_process_logger():
 
     frd = FileReportDatabase(db_name=TEST_DATABASE)
@@ -140,10 +618,218 @@ def test_file_report_process_logger():
     test_id = _test_id(4)
     test_report: TestReport = frd.get_test_report(identifier=test_id)
 
+    # the log lines are buffered, then saved in chunks, even once the flush interval elapsed
+    test_report.open_logger(chunk_lines=3, flush_interval=3600.0)
+    for i in range(7):
+        test_report.write_logger(f"Hello World {i}!\n")
+    test_report.flush()
+    assert test_report.read_log()["total"] == 6
+    test_report.close_logger()
+
+    page: Dict = test_report.read_log()
+    assert page["total"] == 7 and page["offset"] == 0
+    assert page["lines"] == [f"Hello World {i}!\n" for i in range(7)]
+    assert test_report.read_log(offset=2, limit=3)["lines"] == [f"Hello World {i}!\n" for i in range(2, 5)]
+    assert test_report.read_log(tail=2) == {"offset": 5, "total": 7, "lines": ["Hello World 5!\n", "Hello World 6!\n"]}
+    assert test_report.read_log(offset=10)["lines"] == []
+
+    # the pending lines are saved once the flush interval elapsed, even if nothing is logged afterwards
+    silent_report: TestReport = frd.get_test_report(identifier=_test_id(24))
+    silent_report.open_logger(chunk_lines=3, flush_interval=0.1)
+    silent_report.write_logger("Hello World!\n")
+    sleep(0.5)
+    assert silent_report.read_log()["lines"] == ["Hello World!\n"]
+    silent_report.close_logger()
+
+    # a test run logged before the logs were chunked is read from its (single) log file
+    legacy_report: TestReport = frd.get_test_report(identifier=_test_id(23))
+    assert legacy_report.read_log() is None
+    with open(legacy_report.get_absolute_file_path(document_key="test.log", create_path=True), "w") as log_file:
+        log_file.write("one\ntwo\nthree\n")
+    assert legacy_report.read_log(tail=2) == {"offset": 1, "total": 3, "lines": ["two\n", "three\n"]}
+
+    if not DEBUG:
+        frd.drop_database()
+
+
+def test_export_import_test_run():
+
+    frd = FileReportDatabase(db_name=TEST_DATABASE, compression="gzip")
+
+    test_id, imported_id = _test_id(24), _test_id(25)
+    frd.register_test_run(test_id, parameters={"environment": "ci"})
+    test_report: TestReport = frd.get_test_report(identifier=test_id)
+    test_report.save_json_document(
+        document_type="TRAPI Response", document=dict(SAMPLE_BIG_DOCUMENT), document_key="response", is_big=True
+    )
+    test_report.save_json_document(
+        document_type="Summary", document={"KP": {"some-kp": {"passed": 1}}}, document_key="test_run_summary"
+    )
     test_report.open_logger()
-    test_report.write_logger("Hello World!")
+    test_report.write_logger("Hello World!\n")
     test_report.close_logger()
+    rollups: List[Dict] = [{
+        "component": "KP", "ara_id": None, "kp_id": "some-kp", "unit_test": "by_subject",
+        "passed": 1, "failed": 0, "skipped": 0,
+        "latency_count": 1, "latency_mean_ms": 10.0, "latency_min_ms": 10, "latency_max_ms": 10
+    }]
+    test_report.set_completed(counts={"unit_tests": 1}, rollups=rollups)
+
+    # a completed test run is exported, big documents included, as a single (gzip compressed NDJSON) archive
+    archive = BytesIO()
+    assert frd.export_test_run(test_id, archive) == 4
+    assert archive.getvalue()[:2] == b"\x1f\x8b"
+
+    archive.seek(0)
+    assert frd.import_test_run(archive, test_run_id=imported_id) == imported_id
+    imported: Dict = frd.get_test_run(imported_id)
+    assert imported["state"] == "completed" and imported["counts"] == {"unit_tests": 1}
+    assert imported["parameters"] == {"environment": "ci"}
+    assert imported["completed"] == frd.get_test_run(test_id)["completed"]
+    assert [row["test_run_id"] for row in frd.get_rollups(kp_id="some-kp")] == [test_id, imported_id]
+
+    imported_report: TestReport = frd.get_test_report(identifier=imported_id)
+    assert sorted(imported_report.list_documents()) == sorted(test_report.list_documents())
+    assert imported_report.retrieve_document("Summary", "test_run_summary")["KP"] == {"some-kp": {"passed": 1}}
+    streamed: bytes = b"".join(imported_report.stream_document(document_type="TRAPI Response", document_key="response"))
+    assert json.loads(streamed)["message"] == SAMPLE_BIG_DOCUMENT["message"]
+    assert imported_report.read_log()["lines"] == ["Hello World!\n"]
+
+    # the test run cannot be imported again, nor can a running test run be exported
+    archive.seek(0)
+    with pytest.raises(TestReportDatabaseException):
+        frd.import_test_run(archive, test_run_id=imported_id)
+    frd.register_test_run(_test_id(26))
+    with pytest.raises(TestReportDatabaseException):
+        frd.export_test_run(_test_id(26), BytesIO())
+
+    # the documents of the resources of an incremental test run, carried forward from a baseline test run,
+    # are exported with its own documents, the restored test run thus being complete
+    baseline_id, incremental_id, restored_id = _test_id(27), _test_id(28), _test_id(29)
+    frd.register_test_run(baseline_id)
+    baseline_report: TestReport = frd.get_test_report(identifier=baseline_id)
+    baseline_report.save_json_document(
+        document_type="Resource Summary", document={"passed": 1}, document_key="KP/some-kp/resource_summary"
+    )
+    baseline_report.save_json_document(
+        document_type="TRAPI Response", document=dict(SAMPLE_BIG_DOCUMENT), document_key="KP/some-kp/response",
+        is_big=True
+    )
+    baseline_report.save_json_document(
+        document_type="Resource Summary", document={"passed": 1}, document_key="KP/other-kp/resource_summary"
+    )
+    baseline_report.set_completed()
+    frd.register_test_run(incremental_id)
+    incremental_report: TestReport = frd.get_test_report(identifier=incremental_id)
+    incremental_report.save_json_document(
+        document_type="Summary",
+        document={"KP": {"some-kp": {"passed": 1, "carried_forward_from": baseline_id}}},
+        document_key="test_run_summary"
+    )
+    incremental_report.set_completed(references=[baseline_id])
+
+    archive = BytesIO()
+    assert frd.export_test_run(incremental_id, archive) == 3
+    archive.seek(0)
+    assert frd.import_test_run(archive, test_run_id=restored_id) == restored_id
+    assert "references" not in frd.get_test_run(restored_id)
+    restored_report: TestReport = frd.get_test_report(identifier=restored_id)
+    assert restored_report.retrieve_document("Summary", "KP/some-kp/resource_summary")["passed"] == 1
+    streamed = b"".join(
+        restored_report.stream_document(document_type="TRAPI Response", document_key="KP/some-kp/response")
+    )
+    assert json.loads(streamed)["message"] == SAMPLE_BIG_DOCUMENT["message"]
+    assert not restored_report.exists_document("KP/other-kp/resource_summary")
+
+    if not DEBUG:
+        frd.drop_database()
+
 
-    # logs: List[Dict] = frd.get_report_logs()
-    # assert logs
-    # assert any(['time_created' in doc for doc in frd.get_report_logs()])
+def test_test_run_catalog():
+
+    frd = FileReportDatabase(db_name=TEST_DATABASE)
+
+    test_id = _test_id(6)
+    frd.register_test_run(test_id, parameters={"one": True})
+    assert frd.get_test_run(test_id)["state"] == FileReportDatabase.RUNNING
+    assert test_id not in frd.get_available_reports()
+
+    test_report: TestReport = frd.get_test_report(identifier=test_id)
+    test_report.set_completed(counts={"passed": 1})
+    entry: Dict = frd.get_test_run(test_id)
+    assert entry["state"] == FileReportDatabase.COMPLETED
+    assert entry["parameters"] == {"one": True} and entry["counts"] == {"passed": 1}
+    assert test_id in [entry["test_run_id"] for entry in frd.list_test_runs(state=FileReportDatabase.COMPLETED)]
+
+    # test runs with results missing are failed, rather than completed
+    failed_test_id = _test_id(8)
+    frd.register_test_run(failed_test_id)
+    frd.get_test_report(identifier=failed_test_id).set_failed(error="xdist workers gw1 failed")
+    entry = frd.get_test_run(failed_test_id)
+    assert entry["state"] == FileReportDatabase.FAILED and entry["error"] == "xdist workers gw1 failed"
+    assert failed_test_id not in frd.get_available_reports()
+
+    # completed test runs predating the test run catalog are catalogued by the migration
+    legacy_test_id = _test_id(7)
+    legacy_test_report: TestReport = frd.get_test_report(identifier=legacy_test_id)
+    legacy_test_report.save_json_document("Test Run Summary", document={}, document_key=SAMPLE_DOCUMENT_KEY)
+    legacy_test_report.flush()
+    assert legacy_test_id not in frd.get_available_reports()
+    frd.migrate()
+    assert legacy_test_id in frd.get_available_reports()
+
+    # deletion is logical: the test run is unavailable, but only physically removed by the reaper
+    root_path: str = test_report.get_root_path()
+    assert test_report.delete()
+    assert frd.get_test_run(test_id)["state"] == FileReportDatabase.DELETED
+    assert test_id not in frd.get_available_reports()
+    assert not frd.get_test_report(identifier=test_id).exists_document(SAMPLE_DOCUMENT_KEY)
+    assert test_id in frd.reap_deleted_test_runs()
+    assert frd.get_test_run(test_id) is None
+    assert not exists(root_path)
+
+    if not DEBUG:
+        frd.drop_database()
+
+
+def test_test_run_retention():
+
+    frd = FileReportDatabase(db_name=TEST_DATABASE)
+
+    test_ids: List[str] = [_test_id(11), _test_id(12), _test_id(13)]
+    for test_id in test_ids:
+        frd.register_test_run(test_id)
+    # failed test runs are subject to the retention policy as well
+    failed_test_id: str = _test_id(9)
+    frd.register_test_run(failed_test_id)
+    frd.get_test_report(identifier=failed_test_id).set_failed(error="xdist workers gw0 failed")
+    frd.get_test_report(identifier=test_ids[0]).set_completed()
+    frd.get_test_report(identifier=test_ids[1]).set_completed()
+    # the latest test run is an incremental test run, with resources carried forward from the first one
+    frd.get_test_report(identifier=test_ids[2]).set_completed(references=[test_ids[0]])
+    assert test_ids[0] in frd.get_referenced_test_runs()
+
+    # no retention policy, nothing deleted
+    assert not frd.apply_retention()
+
+    # all completed test runs are recent enough...
+    assert not set(test_ids) & set(frd.apply_retention(max_age_days=1))
+
+    # ...but only the latest of them is kept, with the test run it refers to
+    deleted: List[str] = frd.apply_retention(keep_latest=1)
+    assert test_ids[1] in deleted and test_ids[0] not in deleted and test_ids[2] not in deleted
+    assert failed_test_id in deleted
+    assert {test_ids[0], test_ids[2]} <= set(frd.get_available_reports())
+    assert test_ids[1] not in frd.get_available_reports()
+
+    # referenced test runs are only removed by the reaper once no longer referenced
+    frd.get_test_report(identifier=test_ids[0]).delete()
+    assert test_ids[0] not in frd.reap_deleted_test_runs()
+    assert frd.get_test_run(test_ids[0]) is not None
+
+    # deleted test runs are not deleted again, while test runs deleted together no longer refer to each other
+    assert frd.delete_test_runs(test_ids) == [test_ids[2]]
+    assert test_ids[0] in frd.reap_deleted_test_runs()
+
+    if not DEBUG:
+        frd.drop_database()
@@ -0,0 +1,119 @@
+"""
+Unit tests for incremental test runs
+"""
+from typing import Dict
+
+import pytest
+
+from translator.sri.testing.incremental import (
+    CARRIED_FORWARD_FROM,
+    compute_resource_fingerprint,
+    has_failures,
+    get_carried_forward_summary,
+    get_carried_forward_test_runs,
+    get_baseline_test_run_id
+)
+from translator.sri.testing.report_aggregator import ReportAggregator
+
+SAMPLE_TEST_DATA: Dict = {
+    "url": "https://some-kp",
+    "infores": "some-kp",
+    "edges": [{"subject": "NCBIGene:1", "predicate": "biolink:interacts_with", "object": "NCBIGene:2"}]
+}
+
+
+def _fingerprint(**kwargs) -> str:
+    parameters: Dict = {
+        "test_data": SAMPLE_TEST_DATA,
+        "url": "https://some-kp",
+        "trapi_version": "1.3.0",
+        "biolink_version": "2.4.8",
+        "test_parameters": {"edge_budget": 100}
+    }
+    parameters.update(kwargs)
+    return compute_resource_fingerprint(**parameters)
+
+
+def test_resource_fingerprint():
+    assert _fingerprint() == _fingerprint()
+    assert _fingerprint(test_data={"edges": [], "infores": "some-kp", "url": "https://some-kp"}) != _fingerprint()
+    assert _fingerprint(url="https://other-kp") != _fingerprint()
+    assert _fingerprint(trapi_version="1.2.0") != _fingerprint()
+    assert _fingerprint(biolink_version="3.0.0") != _fingerprint()
+    assert _fingerprint(test_parameters={"edge_budget": 10}) != _fingerprint()
+    assert _fingerprint(dependencies=["a", "b"]) == _fingerprint(dependencies=["b", "a"])
+    assert _fingerprint(dependencies=["a"]) != _fingerprint()
+
+
+KP_SUMMARY: Dict = {
+    "no_of_edges": 1,
+    "fingerprint": "abc",
+    "results": {"by_subject": {"passed": 1, "failed": 0, "skipped": 0}}
+}
+FAILING_KP_SUMMARY: Dict = {
+    "no_of_edges": 1,
+    "fingerprint": "abc",
+    "results": {"by_subject": {"passed": 0, "failed": 1, "skipped": 0}}
+}
+
+
+def test_has_failures():
+    assert not has_failures(KP_SUMMARY)
+    assert has_failures(FAILING_KP_SUMMARY)
+    assert has_failures({"fingerprint": "def", "kps": {"kp-1": KP_SUMMARY, "kp-2": FAILING_KP_SUMMARY}})
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        ({"KP": {"some-kp": KP_SUMMARY}}, "abc", "baseline"),  # unchanged
+        ({"KP": {"some-kp": dict(KP_SUMMARY, **{CARRIED_FORWARD_FROM: "older"})}}, "abc", "older"),  # chained
+        ({"KP": {"some-kp": KP_SUMMARY}}, "def", None),  # changed
+        ({"KP": {"some-kp": FAILING_KP_SUMMARY}}, "abc", None),  # previously failing
+        ({"KP": {"other-kp": KP_SUMMARY}}, "abc", None),  # new
+        (None, "abc", None)  # no baseline
+    ]
+)
+def test_get_carried_forward_summary(query):
+    summary = get_carried_forward_summary("baseline", query[0], "KP", "some-kp", query[1])
+    if query[2]:
+        assert summary[CARRIED_FORWARD_FROM] == query[2]
+        assert summary["results"] == KP_SUMMARY["results"]
+    else:
+        assert summary is None
+
+
+def test_get_baseline_test_run_id():
+    assert get_baseline_test_run_id([]) is None
+    assert get_baseline_test_run_id(
+        ["2022-10-18_23-00-00", "2022-10-19_23-00-00", "2022-10-17_23-00-00"]
+    ) == "2022-10-19_23-00-00"
+    assert get_baseline_test_run_id(["2022-10-18_23-00-00", "2022-10-19_23-00-00"], "2022-10-19_23-00-00") == \
+           "2022-10-18_23-00-00"
+
+
+def test_merging_of_carried_forward_summaries():
+    summary: Dict = dict(KP_SUMMARY, **{CARRIED_FORWARD_FROM: "baseline"})
+    # e.g. every pytest-xdist worker carries forward the same unchanged resource
+    partial_results = list()
+    for _ in range(2):
+        report = ReportAggregator()
+        report.carry_forward("KP", "some-kp", summary)
+        partial_results.append(report.get_partial_results())
+    controller = ReportAggregator()
+    for partial in partial_results:
+        controller.merge(partial)
+    assert controller.test_run_summary == {"KP": {"some-kp": summary}}
+    assert controller.resource_summaries == {"KP": {}}
+
+
+def test_get_carried_forward_test_runs():
+    assert get_carried_forward_test_runs(None) == []
+    assert get_carried_forward_test_runs({
+        "KP": {
+            "some-kp": dict(KP_SUMMARY, **{CARRIED_FORWARD_FROM: "baseline"}),
+            "other-kp": dict(KP_SUMMARY, **{CARRIED_FORWARD_FROM: "older"}),
+            "tested-kp": KP_SUMMARY
+        },
+        "ARA": {"some-ara": {"kps": {}, CARRIED_FORWARD_FROM: "baseline"}}
+    }) == ["baseline", "older"]
@@ -1,14 +1,20 @@
 import json
-from typing import Dict, Optional
+from typing import Dict, Optional, List
 from sys import stderr
 from os.path import sep
 from datetime import datetime
 
+import pytest
+
+from pymongo.collection import Collection
+from pymongo.errors import AutoReconnect
+
 from tests.onehop import get_test_results_dir
 from translator.sri.testing.report_db import (
     TestReportDatabaseException,
     TestReport,
-    MongoReportDatabase
+    MongoReportDatabase,
+    TEST_RUN_BLOBS
 )
 
 # For early testing of the Unit test, test data is not deleted when DEBUG is True;
@@ -104,6 +110,11 @@ def sample_mongodb_document_creation_and_insertion(
         document_key=SAMPLE_DOCUMENT_KEY,
         is_big=is_big
     )
+    # saved documents are buffered, for bulk writing
+    test_report.flush()
+
+    # test runs are only available once completed in the test run catalog
+    test_report.set_completed()
     assert test_run_id in mrd.get_available_reports(), f"Report '{test_run_id}' should be in available reports!"
 
     assert test_report.exists_document(SAMPLE_DOCUMENT_KEY), f"Document {SAMPLE_DOCUMENT_KEY} should exist!"
@@ -159,7 +170,7 @@ def test_create_test_report_then_save_and_retrieve_a_big_document():
         test_run_id = _test_run_id(3)
         test_report: TestReport = sample_mongodb_document_creation_and_insertion(mrd, test_run_id, is_big=True)
 
-        text_file: str = ""
+        text_file: bytes = b""
         for line in test_report.stream_document(document_type="test document", document_key=SAMPLE_DOCUMENT_KEY):
             text_file += line
 
@@ -187,10 +198,140 @@ def test_mongo_report_process_logger():
     test_run_id = _test_run_id(4)
     test_report: TestReport = frd.get_test_report(identifier=test_run_id)
 
-    test_report.open_logger()
-    test_report.write_logger("Hello World!")
+    test_report.open_logger(chunk_lines=2)
+    for i in range(3):
+        test_report.write_logger(f"Hello World {i}!\n")
     test_report.close_logger()
 
-    # logs: List[Dict] = frd.get_report_logs()
-    # assert logs
-    # assert any(['time_created' in doc for doc in frd.get_report_logs()])
+    assert test_report.read_log(tail=2) == {"offset": 1, "total": 3, "lines": ["Hello World 1!\n", "Hello World 2!\n"]}
+
+
+def test_document_key_index_migration():
+    mrd = MongoReportDatabase(db_name=TEST_DATABASE)
+    test_run_id: str = _test_run_id(5)
+
+    # documents saved twice in a test run collection predating its document key index
+    collection = mrd.get_mongo_db()[test_run_id]
+    collection.insert_many(
+        [
+            {"document_key": "test_run_summary", "version": 1},
+            {"document_key": "test_run_summary", "version": 2},
+            {"document_key": "KP/some-kp/resource_summary"}
+        ]
+    )
+    mrd.migrate()
+    assert "unique_document_key" in collection.index_information()
+    assert collection.count_documents(filter={"document_key": "test_run_summary"}) == 1
+
+    test_report: TestReport = mrd.get_test_report(identifier=test_run_id)
+    assert test_report.retrieve_document("Summary", "test_run_summary")["version"] == 2
+
+    # new test run collections are indexed as soon as they are first written to
+    new_test_run_id: str = _test_run_id(6)
+    new_test_report: TestReport = mrd.get_test_report(identifier=new_test_run_id)
+    new_test_report.save_json_document("Summary", {"KP": {}}, document_key="test_run_summary")
+    new_test_report.flush()
+    assert "unique_document_key" in mrd.get_mongo_db()[new_test_run_id].index_information()
+
+    if not DEBUG:
+        mrd.drop_database()
+
+
+def test_test_run_catalog():
+    mrd = MongoReportDatabase(db_name=TEST_DATABASE)
+    test_run_id: str = _test_run_id(7)
+
+    mrd.register_test_run(test_run_id, parameters={"one": True})
+    assert mrd.get_test_run(test_run_id)["state"] == MongoReportDatabase.RUNNING
+    assert test_run_id not in mrd.get_available_reports()
+
+    test_report: TestReport = sample_mongodb_document_creation_and_insertion(mrd, test_run_id)
+    entry: Dict = mrd.get_test_run(test_run_id)
+    assert entry["state"] == MongoReportDatabase.COMPLETED
+    assert entry["parameters"] == {"one": True}
+
+    # deletion is logical: the test run is unavailable, but only physically removed by the reaper
+    assert test_report.delete()
+    assert mrd.get_test_run(test_run_id)["state"] == MongoReportDatabase.DELETED
+    assert test_run_id not in mrd.get_available_reports()
+    assert not mrd.get_test_report(identifier=test_run_id).exists_document(SAMPLE_DOCUMENT_KEY)
+    assert test_run_id in mrd._get_test_run_collection_names()
+    assert test_run_id in mrd.reap_deleted_test_runs()
+    assert mrd.get_test_run(test_run_id) is None
+    assert test_run_id not in mrd._get_test_run_collection_names()
+
+    if not DEBUG:
+        mrd.drop_database()
+
+
+def test_blob_store():
+    mrd = MongoReportDatabase(db_name=TEST_DATABASE, compression="gzip")
+
+    # a broken KP returns the same big TRAPI response, night after night...
+    document: Dict = {"message": {"results": [{"edge_bindings": str(i)} for i in range(100)]}}
+    test_run_ids: List[str] = [_test_run_id(8), _test_run_id(9)]
+    for test_run_id in test_run_ids:
+        mrd.register_test_run(test_run_id)
+        test_report: TestReport = mrd.get_test_report(identifier=test_run_id)
+        test_report.save_json_document(
+            document_type="TRAPI Response", document=dict(document), document_key=SAMPLE_DOCUMENT_KEY, is_big=True
+        )
+        test_report.flush()
+        assert test_report.get_document_compression(document_type="TRAPI Response", document_key=SAMPLE_DOCUMENT_KEY) \
+            == "gzip"
+        streamed: bytes = b"".join(
+            test_report.stream_document(document_type="TRAPI Response", document_key=SAMPLE_DOCUMENT_KEY)
+        )
+        assert json.loads(streamed)["message"] == document["message"]
+
+    # ...which is saved only once, then only deleted once no longer referenced by any test run
+    blobs: Collection = mrd.get_mongo_db()[TEST_RUN_BLOBS]
+    assert blobs.count_documents({"refs": {"$all": test_run_ids}}) == 1
+    blob_id: str = blobs.find_one({"refs": {"$all": test_run_ids}})["_id"]
+
+    mrd.get_test_report(identifier=test_run_ids[0]).delete()
+    mrd.reap_deleted_test_runs()
+    assert blobs.find_one({"_id": blob_id})["refs"] == [test_run_ids[1]]
+
+    mrd.get_test_report(identifier=test_run_ids[1]).delete()
+    mrd.reap_deleted_test_runs()
+    assert blobs.find_one({"_id": blob_id}) is None
+    assert mrd.open_blob(blob_id) is None
+
+    if not DEBUG:
+        mrd.drop_database()
+
+
+def test_failed_bulk_writes_are_retried(monkeypatch):
+    mrd = MongoReportDatabase(db_name=TEST_DATABASE)
+    test_run_id = _test_run_id(10)
+    test_report: TestReport = mrd.get_test_report(identifier=test_run_id)
+    for i in range(3):
+        test_report.save_json_document(
+            document_type="Details", document={"edge": i}, document_key=f"KP/Test_KP/Test_KP-{i}"
+        )
+
+    # the bulk write of the pending documents fails once...
+    collection: Collection = mrd.get_mongo_db()[test_run_id]
+    bulk_write = collection.bulk_write
+
+    def failing_bulk_write(*args, **kwargs):
+        monkeypatch.setattr(collection, "bulk_write", bulk_write)
+        raise AutoReconnect("connection lost")
+
+    monkeypatch.setattr(collection, "bulk_write", failing_bulk_write)
+    monkeypatch.setattr(test_report, "_collection", collection)
+    with pytest.raises(TestReportDatabaseException, match="3 document"):
+        test_report.flush()
+
+    # ...thus the documents are still pending, then written out by the next flush
+    test_report.flush()
+    for i in range(3):
+        document: Optional[Dict] = test_report.retrieve_document(
+            document_type="Details", document_key=f"KP/Test_KP/Test_KP-{i}"
+        )
+        assert document["edge"] == i
+
+    if not DEBUG:
+        test_report.delete()
+        mrd.drop_database()
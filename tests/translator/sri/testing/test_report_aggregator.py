@@ -0,0 +1,100 @@
+"""
+Unit tests for the aggregation (and pytest-xdist style merging) of One Hop unit test results
+"""
+from typing import Dict, List, Tuple, Mapping
+from collections import ChainMap
+
+from translator.sri.testing.onehops_test_runner import parse_unit_test_name
+from translator.sri.testing.report_aggregator import ReportAggregator
+
+
+def _test_case(idx: int, ara_id: str = None) -> Mapping:
+    test_case: Dict = {
+        "idx": idx,
+        "subject_category": "biolink:Gene",
+        "object_category": "biolink:Gene",
+        "predicate": "biolink:interacts_with",
+        "subject": "NCBIGene:1",
+        "object": "NCBIGene:2",
+        "url": "https://some-kp",
+        "kp_test_data_location": "Test_KP_1.json",
+        "trapi_version": "1.3.0",
+        "biolink_version": "2.4.8"
+    }
+    if ara_id:
+        # ARA test cases overlay (rather than copy) the test case of the KP
+        return ChainMap({"url": "https://some-ara", "ara_test_data_location": "Test_ARA.json"}, test_case)
+    return test_case
+
+
+SAMPLE_RESULTS: List[Tuple[str, str]] = [
+    ("test_onehops.py::test_trapi_kps[Test_KP_1#0-by_subject]", "passed"),
+    ("test_onehops.py::test_trapi_kps[Test_KP_1#0-by_object]", "failed"),
+    ("test_onehops.py::test_trapi_kps[Test_KP_1#1-by_subject]", "skipped"),
+    ("test_onehops.py::test_trapi_kps[Test_KP_1#1-by_object]", "passed"),
+    ("test_onehops.py::test_trapi_aras[Test_ARA|Test_KP_1#0-by_subject]", "passed"),
+    ("test_onehops.py::test_trapi_aras[Test_ARA|Test_KP_1#1-by_subject]", "failed")
+]
+
+
+def _aggregate(results: List[Tuple[str, str]]) -> ReportAggregator:
+    report = ReportAggregator()
+    for unit_test_key, status in results:
+        component, ara_id, kp_id, edge_num, test_id, edge_details_key = parse_unit_test_name(unit_test_key)
+        report.add_unit_test_result(
+            unit_test_key=unit_test_key,
+            component=component,
+            ara_id=ara_id,
+            kp_id=kp_id,
+            edge_num=edge_num,
+            test_id=test_id,
+            edge_details_key=edge_details_key,
+            status=status,
+            rb={"case": _test_case(edge_num, ara_id)}
+        )
+    return report
+
+
+def test_aggregation():
+    report = _aggregate(SAMPLE_RESULTS)
+    results: Dict = report.get_partial_results()
+    kp_summary: Dict = results["test_run_summary"]["KP"]["Test_KP_1"]
+    assert kp_summary["no_of_edges"] == 2
+    assert kp_summary["results"]["by_subject"] == {"passed": 1, "failed": 0, "skipped": 1}
+    assert kp_summary["results"]["by_object"] == {"passed": 1, "failed": 1, "skipped": 0}
+    assert results["test_run_summary"]["ARA"]["Test_ARA"]["kps"]["Test_KP_1"]["results"]["by_subject"]["failed"] == 1
+    assert results["resource_summaries"]["KP"]["Test_KP_1"]["test_edges"]["1"]["results"]["by_subject"] == \
+           {"outcome": "skipped"}
+    assert report.case_details["KP/Test_KP_1/Test_KP_1-0"]["results"]["by_object"]["request"]
+
+
+def test_merging_of_partial_results():
+    # any split of the unit tests across workers yields the same merged results
+    expected: Dict = _aggregate(SAMPLE_RESULTS).get_partial_results()
+    for split in range(len(SAMPLE_RESULTS) + 1):
+        controller = ReportAggregator()
+        controller.merge(_aggregate(SAMPLE_RESULTS[:split]).get_partial_results())
+        controller.merge(_aggregate(SAMPLE_RESULTS[split:]).get_partial_results())
+        assert controller.get_partial_results() == expected
+
+
+def test_merging_of_test_run_summaries_only():
+    # the shards of distributed test runs only merge their (disjoint) test run summaries
+    kp_results: Dict = _aggregate(SAMPLE_RESULTS[:4]).get_partial_results()
+    ara_results: Dict = _aggregate(SAMPLE_RESULTS[4:]).get_partial_results()
+    report = ReportAggregator()
+    report.merge({"test_run_summary": kp_results["test_run_summary"]})
+    report.merge({"test_run_summary": ara_results["test_run_summary"]})
+    assert report.get_test_run_summary() == _aggregate(SAMPLE_RESULTS).get_partial_results()["test_run_summary"]
+    assert not report.case_details
+
+
+def test_summary_records_round_trip():
+    results: Dict = _aggregate(SAMPLE_RESULTS).get_partial_results()
+    report = ReportAggregator()
+    report.merge(results)
+    assert report.get_partial_results() == results
+    ara_summary: Dict = results["test_run_summary"]["ARA"]["Test_ARA"]
+    assert list(ara_summary.keys()) == ["url", "test_data_location", "kps"]
+    assert ara_summary["url"] == "https://some-ara"
+    assert results["case_details"]["ARA/Test_ARA/Test_KP_1/Test_KP_1-0"]["ara_test_data_location"] == "Test_ARA.json"
@@ -0,0 +1,222 @@
+"""
+Unit tests for the streaming of One Hop unit test results into a test run report
+"""
+from typing import Optional, Dict, List, Tuple
+
+import pytest
+
+from translator.sri.testing.onehops_test_runner import parse_unit_test_name
+from translator.sri.testing.report_aggregator import (
+    ReportAggregator,
+    get_live_summary_key,
+    merge_live_summaries
+)
+from translator.sri.testing.report_db import TestReportDatabaseException
+from translator.sri.testing.result_sink import StreamingResultSink
+from translator.sri.testing.scheduler import get_endpoint_group
+
+from tests.translator.sri.testing.test_report_aggregator import SAMPLE_RESULTS, _aggregate, _test_case
+
+
+class MockTestRun:
+    """
+    Stand-in for a OneHopTestHarness, recording the documents saved, in order.
+    """
+    def __init__(self):
+        self.saved: List[Tuple[str, Dict]] = list()
+        self.counts: Optional[Dict] = None
+        self.rollups: Optional[List[Dict]] = None
+        self.references: Optional[List[str]] = None
+        self.error: Optional[str] = None
+
+    def save_json_document(self, document_type: str, document: Dict, document_key: str, is_big: bool = False):
+        self.saved.append((document_key, document))
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
+
+    def set_completed(
+            self,
+            counts: Optional[Dict] = None,
+            rollups: Optional[List[Dict]] = None,
+            references: Optional[List[str]] = None
+    ):
+        self.counts = counts
+        self.rollups = rollups
+        self.references = references
+
+    def set_failed(self, error: str):
+        self.error = error
+
+    def get_saved_keys(self) -> List[str]:
+        return [document_key for document_key, _ in self.saved]
+
+
+def _stream(sink: StreamingResultSink, results: List[Tuple[str, str]]):
+    for unit_test_key, status in results:
+        _, ara_id, _, edge_num, _, _ = parse_unit_test_name(unit_test_key)
+        sink.add_unit_test_result(
+            unit_test_key=unit_test_key,
+            status=status,
+            rb={"case": _test_case(edge_num, ara_id)},
+            duration_ms=10.0
+        )
+
+
+def test_documents_are_saved_as_soon_as_complete():
+    test_run = MockTestRun()
+    sink = StreamingResultSink(test_run, unit_test_keys=[unit_test_key for unit_test_key, _ in SAMPLE_RESULTS])
+
+    # both unit tests of the first KP edge are done: its details are saved and released
+    _stream(sink, SAMPLE_RESULTS[:2])
+    assert test_run.get_saved_keys() == ["KP/Test_KP_1/Test_KP_1-0"]
+    assert not sink.report.case_details
+
+    # all the unit tests of the KP are done: its resource summary is saved as well
+    _stream(sink, SAMPLE_RESULTS[2:4])
+    assert test_run.get_saved_keys()[1:] == ["KP/Test_KP_1/Test_KP_1-1", "KP/Test_KP_1/resource_summary"]
+    assert not sink.report.resource_summaries["KP"]
+
+    _stream(sink, SAMPLE_RESULTS[4:])
+    assert "ARA/Test_ARA/Test_KP_1/resource_summary" in test_run.get_saved_keys()
+    assert "test_run_summary" not in test_run.get_saved_keys()
+
+    # only the test run summary remains to be committed
+    saved: int = len(test_run.saved)
+    sink.commit()
+    assert test_run.get_saved_keys()[saved:] == ["test_run_summary"]
+    summary: Dict = test_run.saved[-1][1]
+    expected: Dict = _aggregate(SAMPLE_RESULTS).get_test_run_summary()
+    assert summary["KP"]["Test_KP_1"]["results"] == expected["KP"]["Test_KP_1"]["results"]
+    assert summary["ARA"]["Test_ARA"]["kps"]["Test_KP_1"]["results"] == \
+           expected["ARA"]["Test_ARA"]["kps"]["Test_KP_1"]["results"]
+    assert summary["KP"]["Test_KP_1"]["duration_ms"] == 40
+    assert test_run.counts == {"no_of_kps": 1, "no_of_aras": 1, "passed": 3, "failed": 2, "skipped": 1}
+
+    # one rollup row per unit test (category) of each resource, with its outcome counts and latency statistics
+    assert len(test_run.rollups) == 3
+    assert {
+        "component": "KP", "ara_id": None, "kp_id": "Test_KP_1", "unit_test": "by_subject",
+        "passed": 1, "failed": 0, "skipped": 1,
+        "latency_count": 2, "latency_mean_ms": 10.0, "latency_min_ms": 10, "latency_max_ms": 10
+    } in test_run.rollups
+    assert summary["ARA"]["Test_ARA"]["kps"]["Test_KP_1"]["latencies"]["by_subject"] == \
+           {"count": 2, "total_ms": 20, "min_ms": 10, "max_ms": 10}
+
+
+class FailingMockTestRun(MockTestRun):
+    """
+    Stand-in for a OneHopTestHarness whose saved documents could not all be written out.
+    """
+    def flush(self):
+        raise TestReportDatabaseException("1 document(s) could not be written out?")
+
+
+def test_test_run_with_failed_writes_is_not_completed():
+    test_run = FailingMockTestRun()
+    sink = StreamingResultSink(test_run, unit_test_keys=[unit_test_key for unit_test_key, _ in SAMPLE_RESULTS])
+    _stream(sink, SAMPLE_RESULTS)
+    with pytest.raises(TestReportDatabaseException):
+        sink.commit()
+    assert "test_run_summary" not in test_run.get_saved_keys()
+    assert test_run.counts is None
+
+
+def test_incomplete_results_are_merged_by_the_controller():
+    # unit tests of the first KP edge split across two (xdist) workers, each collecting all unit tests
+    unit_test_keys: List[str] = [unit_test_key for unit_test_key, _ in SAMPLE_RESULTS]
+    workers: List[StreamingResultSink] = [StreamingResultSink(MockTestRun(), unit_test_keys) for _ in range(2)]
+    _stream(workers[0], SAMPLE_RESULTS[:1] + SAMPLE_RESULTS[2:])
+    _stream(workers[1], SAMPLE_RESULTS[1:2])
+
+    controller = ReportAggregator()
+    for worker in workers:
+        controller.merge(worker.get_partial_results())
+    details: Dict = controller.case_details["KP/Test_KP_1/Test_KP_1-0"]
+    assert details["results"]["by_subject"]["outcome"] == "passed"
+    assert details["results"]["by_object"]["outcome"] == "failed"
+    merged: Dict = controller.get_partial_results()
+    assert merged["resource_summaries"]["KP"]["Test_KP_1"]["test_edges"]["0"]["results"]["by_object"] == \
+           {"outcome": "failed"}
+    # the ARA resource summary was completed, then saved, by the first worker
+    assert not merged["resource_summaries"]["ARA"]["Test_ARA"]
+    assert merged["test_run_summary"]["ARA"]["Test_ARA"]["kps"]["Test_KP_1"]["results"]["by_subject"]["failed"] == 1
+
+
+def test_missing_results_fail_the_test_run():
+    # the partial results of the second (crashed) xdist worker are missing
+    unit_test_keys: List[str] = [unit_test_key for unit_test_key, _ in SAMPLE_RESULTS]
+    worker = StreamingResultSink(MockTestRun(), unit_test_keys)
+    _stream(worker, SAMPLE_RESULTS[:4])
+
+    controller = ReportAggregator()
+    controller.merge(worker.get_partial_results())
+    test_run = MockTestRun()
+    controller.save(test_run, error="xdist workers gw1 failed")
+
+    # the (incomplete) test run summary is saved, but the test run is failed rather than completed
+    assert test_run.get_saved_keys()[-1] == "test_run_summary"
+    assert test_run.error == "xdist workers gw1 failed"
+    assert test_run.counts is None and test_run.rollups is None
+
+
+def test_xdist_grouped_results_are_saved_as_soon_as_complete():
+    # xdist (loadgroup) workers report the collected unit test node ids with an '@<group>' suffix
+    unit_test_keys: List[str] = [unit_test_key for unit_test_key, _ in SAMPLE_RESULTS]
+    test_runs: List[MockTestRun] = [MockTestRun() for _ in range(2)]
+    workers: List[StreamingResultSink] = [StreamingResultSink(test_run, unit_test_keys) for test_run in test_runs]
+    for unit_test_key, status in SAMPLE_RESULTS:
+        edge_num: int = int(parse_unit_test_name(unit_test_key)[3])
+        group: str = get_endpoint_group("https://test-kp-1/trapi", edge_num)
+        _stream(workers[edge_num], [(f"{unit_test_key}@{group}", status)])
+
+    # each worker ran all the unit tests of its own edges, so saved their details, under the unsuffixed keys
+    assert test_runs[0].get_saved_keys() == ["KP/Test_KP_1/Test_KP_1-0", "ARA/Test_ARA/Test_KP_1/Test_KP_1-0"]
+    assert test_runs[1].get_saved_keys() == ["KP/Test_KP_1/Test_KP_1-1", "ARA/Test_ARA/Test_KP_1/Test_KP_1-1"]
+    assert all(not worker.report.case_details for worker in workers)
+
+    # the resource summaries, spread over both workers, are merged by the controller
+    controller = ReportAggregator()
+    for worker in workers:
+        controller.merge(worker.get_partial_results())
+    merged: Dict = controller.get_partial_results()
+    assert sorted(merged["resource_summaries"]["KP"]["Test_KP_1"]["test_edges"]) == ["0", "1"]
+    assert merged["test_run_summary"]["KP"]["Test_KP_1"]["results"] == \
+           _aggregate(SAMPLE_RESULTS).get_test_run_summary()["KP"]["Test_KP_1"]["results"]
+
+
+def test_live_summaries_of_xdist_workers():
+    unit_test_keys: List[str] = [unit_test_key for unit_test_key, _ in SAMPLE_RESULTS]
+    test_runs: List[MockTestRun] = [MockTestRun() for _ in range(2)]
+    workers: List[StreamingResultSink] = [
+        StreamingResultSink(
+            test_run,
+            unit_test_keys,
+            live_summary_key=get_live_summary_key(worker_id=f"gw{worker}"),
+            live_summary_interval=0.0
+        )
+        for worker, test_run in enumerate(test_runs)
+    ]
+    # live summaries are saved as soon as the (unit test) session starts...
+    assert test_runs[0].get_saved_keys() == ["live_summary/gw0"]
+    assert test_runs[0].saved[0][1]["no_of_unit_tests_done"] == 0
+
+    # ... then updated as the unit tests are done
+    _stream(workers[0], SAMPLE_RESULTS[:4])
+    _stream(workers[1], SAMPLE_RESULTS[4:])
+    live_summaries: List[Dict] = [
+        [document for document_key, document in test_run.saved if document_key.startswith("live_summary")][-1]
+        for test_run in test_runs
+    ]
+    assert live_summaries[1]["latest_failures"][0]["edge_details_key"] == "ARA/Test_ARA/Test_KP_1/Test_KP_1-1"
+
+    live_summary: Dict = merge_live_summaries(live_summaries)
+    assert live_summary["in_progress"]
+    assert live_summary["no_of_unit_tests"] == len(SAMPLE_RESULTS)
+    assert live_summary["no_of_unit_tests_done"] == len(SAMPLE_RESULTS)
+    assert live_summary["KP"]["Test_KP_1"]["results"]["by_object"] == {"passed": 1, "failed": 1, "skipped": 0}
+    assert live_summary["ARA"]["Test_ARA"]["kps"]["Test_KP_1"]["results"]["by_subject"]["failed"] == 1
+    assert len(live_summary["latest_failures"]) == 2
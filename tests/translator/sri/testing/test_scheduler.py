@@ -0,0 +1,135 @@
+"""
+Unit tests for the endpoint-aware scheduling of One Hop unit tests
+"""
+from typing import Dict, List, Tuple, Set
+from pathlib import Path
+
+import pytest
+
+from translator.sri.testing.onehops_test_runner import strip_xdist_group
+from translator.sri.testing.scheduler import (
+    parse_endpoint_concurrency,
+    get_endpoint_latencies,
+    get_endpoint_group,
+    schedule_unit_tests
+)
+
+# 4 unit tests (of 2 edges) of 'kp-a', 2 of 'kp-b' and 1 of 'ara-c', in collection order
+SAMPLE_UNIT_TESTS: List[Tuple[str, str, int]] = \
+    [(f"kp-a-{i}", "https://kp-a", i // 2) for i in range(4)] + \
+    [(f"kp-b-{i}", "https://kp-b", i) for i in range(2)] + \
+    [("ara-c-0", "https://ara-c", 0)]
+
+# runs scratch Pytest projects, i.e. with pytest-xdist
+pytest_plugins = ["pytester"]
+
+
+def test_parse_endpoint_concurrency():
+    assert parse_endpoint_concurrency(None) == {}
+    assert parse_endpoint_concurrency(["https://kp-a?x=1=3"]) == {"https://kp-a?x=1": 3}
+    with pytest.raises(ValueError):
+        parse_endpoint_concurrency(["https://kp-a"])
+    with pytest.raises(ValueError):
+        parse_endpoint_concurrency(["https://kp-a=0"])
+
+
+def test_get_endpoint_latencies():
+    summary: Dict = {
+        "KP": {
+            "kp-a": {
+                "url": "https://kp-a", "duration_ms": 4000,
+                "results": {"by_subject": {"passed": 1, "failed": 1, "skipped": 0}}
+            },
+            "kp-b": {"url": "https://kp-b", "results": {"by_subject": {"passed": 1, "failed": 0, "skipped": 0}}}
+        },
+        "ARA": {
+            "ara-c": {
+                "url": "https://ara-c",
+                "kps": {
+                    "kp-a": {"duration_ms": 9000, "results": {"by_subject": {"passed": 2, "failed": 0, "skipped": 1}}}
+                }
+            }
+        },
+        "document_key": "test_run_summary"
+    }
+    assert get_endpoint_latencies(summary) == {"https://kp-a": 2.0, "https://ara-c": 3.0}
+    assert get_endpoint_latencies(None) == {}
+
+
+def test_round_robin_schedule():
+    schedule = schedule_unit_tests(SAMPLE_UNIT_TESTS)
+    # without latency history, the endpoints with the most unit tests start first
+    assert [unit_test for unit_test, _ in schedule] == \
+           ["kp-a-0", "kp-b-0", "ara-c-0", "kp-a-1", "kp-b-1", "kp-a-2", "kp-a-3"]
+    assert {group for _, group in schedule} == \
+           {get_endpoint_group("https://kp-a"), get_endpoint_group("https://kp-b"), get_endpoint_group("https://ara-c")}
+
+
+def test_longest_processing_time_first():
+    # a slow ARA outweighs KPs with more, but faster, unit tests
+    latencies: Dict[str, float] = {"https://ara-c": 30.0, "https://kp-a": 1.0, "https://kp-b": 3.0}
+    schedule = schedule_unit_tests(SAMPLE_UNIT_TESTS, latencies=latencies)
+    assert [unit_test for unit_test, _ in schedule][:3] == ["ara-c-0", "kp-b-0", "kp-a-0"]
+    # endpoints without history are assumed to have the mean latency of the known endpoints (here, 15.5 seconds)
+    schedule = schedule_unit_tests(SAMPLE_UNIT_TESTS, latencies={"https://kp-a": 1.0, "https://ara-c": 30.0})
+    assert [unit_test for unit_test, _ in schedule][:3] == ["kp-b-0", "ara-c-0", "kp-a-0"]
+    # the schedule is deterministic, as required by pytest-xdist workers all collecting the unit tests
+    assert schedule == schedule_unit_tests(list(SAMPLE_UNIT_TESTS), latencies={"https://ara-c": 30.0, "https://kp-a": 1.0})
+
+
+def test_endpoint_concurrency_groups():
+    schedule = schedule_unit_tests(SAMPLE_UNIT_TESTS, endpoint_concurrency={"https://kp-a": 2})
+    groups: Dict[str, str] = {unit_test: group for unit_test, group in schedule}
+    # the unit tests of a given edge are in the same group
+    assert groups["kp-a-0"] == groups["kp-a-1"] == get_endpoint_group("https://kp-a", 0)
+    assert groups["kp-a-2"] == groups["kp-a-3"] == get_endpoint_group("https://kp-a", 1)
+    assert groups["kp-b-0"] == groups["kp-b-1"] == get_endpoint_group("https://kp-b")
+    # pytest-xdist appends the group names to the node ids, thus these have no '/' (nor '@') character
+    assert all(["/" not in group and "@" not in group for group in groups.values()])
+
+
+# Scratch Pytest project grouping its unit tests like tests/onehop/conftest.py does
+XDIST_GROUPING_CONFTEST = '''
+import pytest
+from translator.sri.testing.scheduler import schedule_unit_tests
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(session, config, items):
+    unit_tests = [(item, item.callspec.params["url"], item.callspec.params["edge_num"]) for item in items]
+    scheduled = schedule_unit_tests(unit_tests, endpoint_concurrency={"https://kp-a/trapi": 2})
+    items[:] = [item for item, _ in scheduled]
+    for item, group in scheduled:
+        item.add_marker(pytest.mark.xdist_group(name=group))
+'''
+
+XDIST_GROUPING_TESTS = '''
+import pytest
+
+
+@pytest.mark.parametrize(
+    "url,edge_num",
+    [("https://kp-a/trapi", i // 2) for i in range(4)] + [("https://kp-b/trapi", i) for i in range(4)]
+)
+def test_unit(url, edge_num, request, worker_id):
+    with open("nodeids.txt", "a") as nodeids:
+        nodeids.write(f"{request.node.nodeid} {worker_id}\\n")
+'''
+
+
+def test_xdist_groups(pytester, monkeypatch):
+    pytest.importorskip("xdist")
+    # the scratch project imports the scheduler of this repository
+    monkeypatch.setenv("PYTHONPATH", str(Path(__file__).parents[4]))
+    pytester.makeconftest(XDIST_GROUPING_CONFTEST)
+    pytester.makepyfile(test_grouping=XDIST_GROUPING_TESTS)
+    result = pytester.runpytest_subprocess("-n", "2", "--dist", "loadgroup", "-p", "xdist")
+    result.assert_outcomes(passed=8)
+
+    # the pytest-xdist scheduler saw the groups (as the suffix of the node ids), each run by a single worker
+    workers: Dict[str, Set[str]] = dict()
+    for line in (pytester.path / "nodeids.txt").read_text().splitlines():
+        nodeid, worker_id = line.split(" ")
+        assert "@" in nodeid and strip_xdist_group(nodeid).endswith("]")
+        workers.setdefault(nodeid.split("@")[-1], set()).add(worker_id)
+    assert len(workers) == 3 and all([len(worker_ids) == 1 for worker_ids in workers.values()])
@@ -0,0 +1,448 @@
+import json
+import pytest
+from io import BytesIO
+from threading import Thread
+
+from datetime import datetime
+from typing import Dict, Optional, List
+
+from translator.sri.testing.report_db import (
+    SqliteReportDatabase,
+    SqliteTestReport,
+    TestReport,
+    TestReportDatabaseException
+)
+
+# For early testing of the Unit test, test data is not deleted when DEBUG is True;
+# however, this interferes with idempotency of the tests (i.e. data must be manually deleted from the test database)
+DEBUG: bool = False
+
+TEST_DATABASE = "sqlite-report-unit-test-database"
+
+SAMPLE_DOCUMENT_KEY: str = "test_run_summary"
+SAMPLE_BIG_DOCUMENT: Dict = {"message": {"results": [{"edge_bindings": str(i)} for i in range(100)]}}
+
+
+def _test_id(seq: int) -> str:
+    return f"{datetime.now().strftime('%Y-%b-%d_%Hhr%M')}.{str(seq)}"
+
+
+def test_create_sqlite_report_database():
+
+    srd = SqliteReportDatabase(db_name=TEST_DATABASE)
+
+    assert TEST_DATABASE in srd.list_databases()
+
+    assert any(['time_created' in doc for doc in srd.get_report_logs()])
+
+    # the database is in Write-Ahead Logging mode
+    assert srd.get_connection().execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    srd.drop_database()
+
+    assert TEST_DATABASE not in srd.list_databases()
+
+
+def test_create_test_report_then_save_and_retrieve_document():
+
+    srd = SqliteReportDatabase(db_name=TEST_DATABASE)
+
+    test_id = _test_id(1)
+
+    test_report: TestReport = srd.get_test_report(identifier=test_id)
+    assert isinstance(test_report, SqliteTestReport)
+    test_report.save_json_document(document_type="Test Run Summary", document={}, document_key=SAMPLE_DOCUMENT_KEY)
+    test_report.flush()
+
+    assert test_report.exists_document(SAMPLE_DOCUMENT_KEY)
+    assert test_id not in srd.get_available_reports()
+    test_report.set_completed()
+    assert test_id in srd.get_available_reports()
+
+    document: Optional[Dict] = test_report.retrieve_document(
+        document_type="test document", document_key=SAMPLE_DOCUMENT_KEY
+    )
+    assert document
+    assert document["document_key"] == SAMPLE_DOCUMENT_KEY
+    assert test_report.retrieve_document(document_type="test document", document_key="unknown/document") is None
+
+    # documents saved again are replaced
+    test_report.save_json_document(document_type="Details", document={"edge": 1}, document_key="details")
+    test_report.save_json_document(document_type="Details", document={"edge": 2}, document_key="details")
+    test_report.flush()
+    assert test_report.retrieve_document(document_type="Details", document_key="details")["edge"] == 2
+
+    if not DEBUG:
+        srd.drop_database()
+
+
+def test_stream_big_documents():
+
+    # the big document is rather held by the test run itself, thus not saved in the blob store
+    srd = SqliteReportDatabase(db_name=TEST_DATABASE, blob_store=False)
+
+    test_id = _test_id(2)
+
+    test_report: TestReport = srd.get_test_report(identifier=test_id)
+    test_report.save_json_document(
+        document_type="TRAPI Response",
+        document=dict(SAMPLE_BIG_DOCUMENT),
+        document_key=SAMPLE_DOCUMENT_KEY,
+        is_big=True
+    )
+    test_report.flush()
+
+    stored: bytes = b"".join(
+        test_report.stream_document(document_type="TRAPI Response", document_key=SAMPLE_DOCUMENT_KEY)
+    )
+    assert json.loads(stored)["message"] == SAMPLE_BIG_DOCUMENT["message"]
+    size: Optional[int] = test_report.get_document_size(
+        document_type="TRAPI Response", document_key=SAMPLE_DOCUMENT_KEY
+    )
+    assert size == len(stored)
+
+    # the stored bytes are streamed in fixed size chunks, or as byte ranges
+    chunks: List[bytes] = list(
+        test_report.stream_document(document_type="TRAPI Response", document_key=SAMPLE_DOCUMENT_KEY, chunk_size=100)
+    )
+    assert all([len(chunk) == 100 for chunk in chunks[:-1]]) and 0 < len(chunks[-1]) <= 100
+    assert b"".join(chunks) == stored
+    assert b"".join(
+        test_report.stream_document(
+            document_type="TRAPI Response", document_key=SAMPLE_DOCUMENT_KEY, start=10, end=249, chunk_size=100
+        )
+    ) == stored[10:250]
+    assert b"".join(
+        test_report.stream_document(document_type="TRAPI Response", document_key=SAMPLE_DOCUMENT_KEY, start=size - 5)
+    ) == stored[-5:]
+
+    assert test_report.get_document_size(document_type="TRAPI Response", document_key="unknown/document") is None
+
+    if not DEBUG:
+        srd.drop_database()
+
+
+def test_compressed_big_documents():
+
+    srd = SqliteReportDatabase(db_name=TEST_DATABASE, compression="gzip", blob_store=False)
+
+    test_id = _test_id(3)
+
+    test_report: TestReport = srd.get_test_report(identifier=test_id)
+    test_report.save_json_document(
+        document_type="TRAPI Response",
+        document=dict(SAMPLE_BIG_DOCUMENT),
+        document_key=SAMPLE_DOCUMENT_KEY,
+        is_big=True
+    )
+    # only big documents are compressed
+    test_report.save_json_document(document_type="Details", document={"one": 1}, document_key="details")
+    test_report.flush()
+
+    assert test_report.get_document_compression(document_type="TRAPI Response", document_key=SAMPLE_DOCUMENT_KEY) \
+        == "gzip"
+    assert test_report.get_document_compression(document_type="Details", document_key="details") is None
+
+    # compressed documents are transparently decompressed when read, unless streamed as stored
+    retrieved: Dict = test_report.retrieve_document(document_type="TRAPI Response", document_key=SAMPLE_DOCUMENT_KEY)
+    assert retrieved["message"] == SAMPLE_BIG_DOCUMENT["message"]
+    streamed: bytes = b"".join(
+        test_report.stream_document(document_type="TRAPI Response", document_key=SAMPLE_DOCUMENT_KEY, chunk_size=100)
+    )
+    assert json.loads(streamed)["message"] == SAMPLE_BIG_DOCUMENT["message"]
+    stored: bytes = b"".join(
+        test_report.stream_document(document_type="TRAPI Response", document_key=SAMPLE_DOCUMENT_KEY, decompress=False)
+    )
+    assert stored[:2] == b"\x1f\x8b" and len(stored) < len(streamed)
+
+    if not DEBUG:
+        srd.drop_database()
+
+
+def test_process_logger():
+
+    srd = SqliteReportDatabase(db_name=TEST_DATABASE, compression="gzip", blob_store=False)
+
+    test_id = _test_id(12)
+
+    # compressed log chunks are saved as big documents, once full
+    test_report: TestReport = srd.get_test_report(identifier=test_id)
+    test_report.open_logger(chunk_lines=2, compression=True)
+    for i in range(5):
+        test_report.write_logger(f"line {i}\n")
+    test_report.close_logger()
+
+    assert test_report.get_document_compression(document_type="Log Chunk", document_key="logs/000000") == "gzip"
+    assert test_report.get_document_compression(document_type="Log Chunk", document_key="logs/000002") is None
+    assert test_report.read_log()["lines"] == [f"line {i}\n" for i in range(5)]
+    assert test_report.read_log(offset=1, limit=2) == {"offset": 1, "total": 5, "lines": ["line 1\n", "line 2\n"]}
+    assert test_report.read_log(tail=1)["lines"] == ["line 4\n"]
+
+    if not DEBUG:
+        srd.drop_database()
+
+
+def test_export_import_test_run():
+
+    srd = SqliteReportDatabase(db_name=TEST_DATABASE, compression="gzip")
+
+    test_id, imported_id = _test_id(13), _test_id(14)
+    srd.register_test_run(test_id, parameters={"environment": "ci"})
+    test_report: TestReport = srd.get_test_report(identifier=test_id)
+    test_report.save_json_document(
+        document_type="TRAPI Response", document=dict(SAMPLE_BIG_DOCUMENT), document_key="response", is_big=True
+    )
+    test_report.save_json_document(
+        document_type="Summary", document={"KP": {"some-kp": {"passed": 1}}}, document_key="test_run_summary"
+    )
+    test_report.open_logger()
+    test_report.write_logger("Hello World!\n")
+    test_report.close_logger()
+    rollups: List[Dict] = [{
+        "component": "KP", "ara_id": None, "kp_id": "some-kp", "unit_test": "by_subject",
+        "passed": 1, "failed": 0, "skipped": 0,
+        "latency_count": 1, "latency_mean_ms": 10.0, "latency_min_ms": 10, "latency_max_ms": 10
+    }]
+    test_report.set_completed(counts={"unit_tests": 1}, rollups=rollups)
+
+    # a completed test run is exported, big documents included, as a single (gzip compressed NDJSON) archive
+    archive = BytesIO()
+    assert srd.export_test_run(test_id, archive) == 4
+    assert archive.getvalue()[:2] == b"\x1f\x8b"
+
+    archive.seek(0)
+    assert srd.import_test_run(archive, test_run_id=imported_id) == imported_id
+    imported: Dict = srd.get_test_run(imported_id)
+    assert imported["state"] == "completed" and imported["counts"] == {"unit_tests": 1}
+    assert imported["parameters"] == {"environment": "ci"}
+    assert imported["completed"] == srd.get_test_run(test_id)["completed"]
+    assert [row["test_run_id"] for row in srd.get_rollups(kp_id="some-kp")] == [test_id, imported_id]
+
+    imported_report: TestReport = srd.get_test_report(identifier=imported_id)
+    assert sorted(imported_report.list_documents()) == sorted(test_report.list_documents())
+    assert imported_report.retrieve_document("Summary", "test_run_summary")["KP"] == {"some-kp": {"passed": 1}}
+    streamed: bytes = b"".join(imported_report.stream_document(document_type="TRAPI Response", document_key="response"))
+    assert json.loads(streamed)["message"] == SAMPLE_BIG_DOCUMENT["message"]
+    assert imported_report.read_log()["lines"] == ["Hello World!\n"]
+
+    # the test run cannot be imported again, nor can a running test run be exported
+    archive.seek(0)
+    with pytest.raises(TestReportDatabaseException):
+        srd.import_test_run(archive, test_run_id=imported_id)
+    srd.register_test_run(_test_id(15))
+    with pytest.raises(TestReportDatabaseException):
+        srd.export_test_run(_test_id(15), BytesIO())
+
+    if not DEBUG:
+        srd.drop_database()
+
+
+def test_blob_store():
+
+    srd = SqliteReportDatabase(db_name=TEST_DATABASE, compression="gzip")
+
+    # a broken KP returns the same big TRAPI response, night after night...
+    test_ids: List[str] = [_test_id(4), _test_id(5)]
+    for test_id in test_ids:
+        srd.register_test_run(test_id)
+        test_report: TestReport = srd.get_test_report(identifier=test_id)
+        for document_key in [SAMPLE_DOCUMENT_KEY, f"{SAMPLE_DOCUMENT_KEY}-again"]:
+            test_report.save_json_document(
+                document_type="TRAPI Response",
+                document=dict(SAMPLE_BIG_DOCUMENT),
+                document_key=document_key,
+                is_big=True
+            )
+        test_report.flush()
+        assert test_report.get_document_compression(document_type="TRAPI Response", document_key=SAMPLE_DOCUMENT_KEY) \
+            == "gzip"
+        streamed: bytes = b"".join(
+            test_report.stream_document(document_type="TRAPI Response", document_key=SAMPLE_DOCUMENT_KEY)
+        )
+        assert json.loads(streamed)["message"] == SAMPLE_BIG_DOCUMENT["message"]
+
+    # ...which is saved only once
+    blob_ids: List[str] = [
+        row[0] for row in srd.get_connection().execute(
+            "SELECT DISTINCT blob_id FROM documents WHERE document_key = ?", (SAMPLE_DOCUMENT_KEY,)
+        )
+    ]
+    assert len(blob_ids) == 1
+
+    # the blob is only deleted once no longer referenced by any test run
+    srd.get_test_report(identifier=test_ids[0]).delete()
+    assert test_ids[0] in srd.reap_deleted_test_runs()
+    assert srd.get_blob_compression(blob_ids[0]) == "gzip"
+    assert srd.get_test_report(identifier=test_ids[1]).retrieve_document(
+        document_type="TRAPI Response", document_key=SAMPLE_DOCUMENT_KEY
+    )["message"] == SAMPLE_BIG_DOCUMENT["message"]
+
+    srd.get_test_report(identifier=test_ids[1]).delete()
+    assert test_ids[1] in srd.reap_deleted_test_runs()
+    assert srd.open_blob(blob_ids[0]) is None
+
+    if not DEBUG:
+        srd.drop_database()
+
+
+def test_concurrent_writers_and_readers():
+
+    srd = SqliteReportDatabase(db_name=TEST_DATABASE)
+
+    test_id = _test_id(6)
+
+    # several background writer threads (each with its own connection) write out the documents...
+    test_report: TestReport = SqliteTestReport(identifier=test_id, database=srd, writer_threads=4)
+    for i in range(100):
+        test_report.save_json_document(document_type="Details", document={"edge": i}, document_key=f"KP/{i % 10}")
+
+    # ...while other threads read them
+    failures: List[Exception] = list()
+
+    def read_documents():
+        try:
+            for _ in range(10):
+                srd.get_test_report(identifier=test_id).retrieve_document(document_type="Details", document_key="KP/0")
+        except Exception as exc:
+            failures.append(exc)
+
+    readers: List[Thread] = [Thread(target=read_documents) for _ in range(4)]
+    for reader in readers:
+        reader.start()
+    for reader in readers:
+        reader.join()
+    test_report.close()
+    assert not failures
+
+    # the last document saved with any given key is the one written out
+    for i in range(10):
+        assert test_report.retrieve_document(document_type="Details", document_key=f"KP/{i}")["edge"] == 90 + i
+
+    if not DEBUG:
+        srd.drop_database()
+
+
+def test_test_run_catalog():
+
+    srd = SqliteReportDatabase(db_name=TEST_DATABASE)
+
+    test_id = _test_id(7)
+    srd.register_test_run(test_id, parameters={"one": True})
+    assert srd.get_test_run(test_id)["state"] == SqliteReportDatabase.RUNNING
+    assert test_id not in srd.get_available_reports()
+
+    test_report: TestReport = srd.get_test_report(identifier=test_id)
+    test_report.save_json_document("Details", document={"one": 1}, document_key="details")
+    test_report.set_completed(counts={"passed": 1})
+    entry: Dict = srd.get_test_run(test_id)
+    assert entry["state"] == SqliteReportDatabase.COMPLETED
+    assert entry["parameters"] == {"one": True} and entry["counts"] == {"passed": 1}
+    assert test_id in [entry["test_run_id"] for entry in srd.list_test_runs(state=SqliteReportDatabase.COMPLETED)]
+
+    # completed test runs not yet catalogued are catalogued by the migration
+    legacy_test_id = _test_id(8)
+    legacy_test_report: TestReport = srd.get_test_report(identifier=legacy_test_id)
+    legacy_test_report.save_json_document("Test Run Summary", document={}, document_key=SAMPLE_DOCUMENT_KEY)
+    legacy_test_report.flush()
+    assert legacy_test_id not in srd.get_available_reports()
+    srd.migrate()
+    assert legacy_test_id in srd.get_available_reports()
+
+    # deletion is logical: the test run is unavailable, but only physically removed by the reaper
+    assert test_report.delete()
+    assert srd.get_test_run(test_id)["state"] == SqliteReportDatabase.DELETED
+    assert test_id not in srd.get_available_reports()
+    assert not srd.get_test_report(identifier=test_id).exists_document("details")
+    assert test_id in srd.reap_deleted_test_runs()
+    assert srd.get_test_run(test_id) is None
+    assert srd.get_connection().execute(
+        "SELECT 1 FROM documents WHERE test_run_id = ?", (test_id,)
+    ).fetchone() is None
+
+    if not DEBUG:
+        srd.drop_database()
+
+
+def test_summary_projections():
+
+    srd = SqliteReportDatabase(db_name=TEST_DATABASE)
+
+    test_id = _test_id(9)
+
+    test_report: TestReport = srd.get_test_report(identifier=test_id)
+    summary: Dict = {
+        "KP": {"infores:some-kp": {"no_of_edges": 2, "passed": True}},
+        "ARA": {"infores:some-ara": {"kps": {"infores:some-kp": {"no_of_edges": 1}}}}
+    }
+    test_report.save_json_document(document_type="Test Run Summary", document=summary, document_key=SAMPLE_DOCUMENT_KEY)
+    test_report.flush()
+
+    # the projected parts of the summary are extracted by the SQLite JSON functions
+    assert test_report.retrieve_document_projection(
+        document_type="Summary", document_key=SAMPLE_DOCUMENT_KEY, path=["KP", "infores:some-kp"]
+    ) == {"no_of_edges": 2, "passed": True}
+    assert test_report.retrieve_document_projection(
+        document_type="Summary", document_key=SAMPLE_DOCUMENT_KEY, path=["KP", "infores:some-kp", "passed"]
+    ) is True
+    assert test_report.retrieve_document_projection(
+        document_type="Summary", document_key=SAMPLE_DOCUMENT_KEY, path=["document_key"]
+    ) == SAMPLE_DOCUMENT_KEY
+    assert test_report.retrieve_document_projection(
+        document_type="Summary", document_key=SAMPLE_DOCUMENT_KEY, path=["KP", "infores:unknown-kp"]
+    ) is None
+    assert test_report.retrieve_document_keys(
+        document_type="Summary", document_key=SAMPLE_DOCUMENT_KEY, path=[]
+    ) == ["KP", "ARA", "document_key"]
+    assert test_report.retrieve_document_keys(
+        document_type="Summary", document_key=SAMPLE_DOCUMENT_KEY, path=["ARA", "infores:some-ara", "kps"]
+    ) == ["infores:some-kp"]
+    assert test_report.retrieve_document_keys(
+        document_type="Summary", document_key=SAMPLE_DOCUMENT_KEY, path=["KP", "infores:some-kp", "passed"]
+    ) is None
+    assert test_report.retrieve_document_keys(
+        document_type="Summary", document_key="unknown/document", path=[]
+    ) is None
+
+    if not DEBUG:
+        srd.drop_database()
+
+
+def test_test_run_rollups():
+
+    srd = SqliteReportDatabase(db_name=TEST_DATABASE)
+
+    test_ids: List[str] = [_test_id(10), _test_id(11)]
+    for day, test_id in enumerate(test_ids):
+        srd.save_rollups(
+            test_id,
+            completed=f"2023-01-0{day + 1}T00:00:00",
+            rollups=[
+                {
+                    "component": "KP", "ara_id": None, "kp_id": "some-kp", "unit_test": "by_subject",
+                    "passed": day, "failed": 1, "skipped": 0,
+                    "latency_count": 1, "latency_mean_ms": 10.0, "latency_min_ms": 10, "latency_max_ms": 10
+                },
+                {
+                    "component": "ARA", "ara_id": "some-ara", "kp_id": "some-kp", "unit_test": "by_subject",
+                    "passed": 1, "failed": 0, "skipped": 0,
+                    "latency_count": 0, "latency_mean_ms": None, "latency_min_ms": None, "latency_max_ms": None
+                }
+            ]
+        )
+
+    # the history of a resource is retrieved in one query, as a time series
+    history: List[Dict] = srd.get_rollups(component="KP", kp_id="some-kp", unit_test="by_subject")
+    assert [(row["test_run_id"], row["passed"]) for row in history] == [(test_ids[0], 0), (test_ids[1], 1)]
+    assert history[0]["latency_mean_ms"] == 10.0 and history[0]["ara_id"] is None
+    assert len(srd.get_rollups(kp_id="some-kp")) == 4
+    assert [row["test_run_id"] for row in srd.get_rollups(ara_id="some-ara", since="2023-01-02")] == [test_ids[1]]
+    assert srd.get_rollups(kp_id="some-kp", until="2022-12-31") == []
+
+    # the rollups of a test run are replaced when saved again, and removed once the test run is deleted
+    srd.save_rollups(test_ids[0], completed="2023-01-01T00:00:00", rollups=[])
+    assert [row["test_run_id"] for row in srd.get_rollups(kp_id="some-kp")] == [test_ids[1]] * 2
+    srd.tombstone_test_run(test_ids[1])
+    assert srd.get_rollups() == []
+
+    if not DEBUG:
+        srd.drop_database()
@@ -0,0 +1,534 @@
+"""
+Distributed One Hop test runs, coordinated through a job collection of the MongoDb test report database.
+
+A distributed test run is split into shards - one per KP or ARA test data location - which are enqueued
+as jobs in the TEST_RUN_JOB_COLLECTION. Any number of worker hosts (see main() below) lease the shards,
+run each one as a distinct Pytest session saving its results under the same test run identifier, and
+keep their leases alive with heartbeats. The lease of a crashed worker simply expires, after which its
+shard is leased again by another worker. Once all the shards of a test run are done, the partial summaries
+of the shards are merged (by a single worker) into the final 'test_run_summary' document of the test run.
+
+A worker host is started (in the root directory of the project) as follows:
+
+    python -m translator.sri.testing.distributed
+"""
+from typing import Optional, Dict, List
+from sys import stderr
+from os import getpid
+from os.path import isabs, join
+from socket import gethostname
+from datetime import datetime, timedelta
+from shlex import quote
+from signal import SIGTERM
+from subprocess import Popen, TimeoutExpired
+from time import sleep
+import argparse
+
+try:
+    # process groups (POSIX platforms)
+    from os import killpg
+except ImportError:
+    killpg = None
+
+from pymongo import ASCENDING, ReturnDocument
+from pymongo.collection import Collection
+
+from tests.onehop import ONEHOP_TEST_DIRECTORY
+
+from translator.sri.testing.processor import CMD_DELIMITER
+from translator.sri.testing.report_db import (
+    TestReport,
+    TestReportDatabase,
+    MongoReportDatabase,
+    get_test_report_database
+)
+from translator.sri.testing.report_aggregator import ReportAggregator
+
+import logging
+logger = logging.getLogger(__name__)
+
+# The 'test_' prefix of the collection name hides it from the listing of available test run reports
+TEST_RUN_JOB_COLLECTION = "test_run_jobs"
+
+DEFAULT_LEASE_DURATION = 300  # seconds
+DEFAULT_HEARTBEAT_INTERVAL = 60  # seconds, should be well below the lease duration
+DEFAULT_POLLING_INTERVAL = 10  # seconds, between job queue polls of idle workers
+DEFAULT_MAX_ATTEMPTS = 3
+
+# Pytest exit codes of a shard which ran to completion: all tests passed,
+# some tests failed (just a test outcome here!) or no tests were collected.
+COMPLETED_EXIT_CODES = (0, 1, 5)
+
+
+def get_shard_summary_key(shard_id: str) -> str:
+    """
+    :param shard_id: str, identifier of a shard of a distributed test run
+    :return: str, document key of the partial test run summary saved by the shard
+    """
+    return f"shards/{shard_id}/test_run_summary"
+
+
+def get_test_run_shards(triple_source: Optional[str] = None, ara_source: Optional[str] = None) -> List[Dict[str, str]]:
+    """
+    Split a test run into shards, one per KP or ARA test data location.
+
+    :param triple_source: Optional[str], 'REGISTRY', directory or file from which to retrieve KP triples
+    :param ara_source: Optional[str], 'REGISTRY', directory or file from which to retrieve ARA Config
+    :return: List[Dict[str, str]], list of shards with 'shard_id', 'component' and (test data) 'location' values
+    """
+    # deferred import, since the Pytest configuration of the One Hop
+    # tests itself imports the test harness which imports this module
+    from tests.onehop.conftest import get_test_data_sources
+
+    shards: List[Dict[str, str]] = list()
+    for component, source in (("KP", triple_source), ("ARA", ara_source)):
+        source = source if source else "REGISTRY"
+        if source != "REGISTRY" and not isabs(source):
+            # Local test data sources are relative to the One Hop test directory, from
+            # which the shards are run, thus resolved here to the absolute file paths
+            source = join(ONEHOP_TEST_DIRECTORY, source)
+        for location in sorted(get_test_data_sources(source=source, component_type=component).keys()):
+            shards.append(
+                {
+                    "shard_id": f"{component}-{len(shards)}",
+                    "component": component,
+                    "location": location
+                }
+            )
+    return shards
+
+
+class TestRunJobQueue:
+    """
+    Queue of the shards of distributed test runs, persisted in a collection of a MongoReportDatabase.
+    The collection holds one 'run' document per test run and one 'shard' document per shard of the test run.
+    """
+
+    # Job (shard) states
+    PENDING: str = "pending"
+    LEASED: str = "leased"
+    COMPLETED: str = "completed"
+    FAILED: str = "failed"
+    CANCELLED: str = "cancelled"
+
+    # Additional test run states
+    RUNNING: str = "running"
+    FINALIZING: str = "finalizing"
+
+    def __init__(self, database: MongoReportDatabase, max_attempts: int = DEFAULT_MAX_ATTEMPTS):
+        """
+        TestRunJobQueue constructor.
+
+        :param database: MongoReportDatabase, test report database hosting the job collection
+        :param max_attempts: int, maximum number of times that a given shard is leased (Default: DEFAULT_MAX_ATTEMPTS)
+        """
+        self._database: MongoReportDatabase = database
+        self._max_attempts: int = max_attempts
+        self._jobs: Collection = database.get_mongo_db()[TEST_RUN_JOB_COLLECTION]
+        self._jobs.create_index([("kind", ASCENDING), ("state", ASCENDING), ("created", ASCENDING)])
+        self._jobs.create_index([("test_run_id", ASCENDING), ("kind", ASCENDING)])
+
+    def get_database(self) -> TestReportDatabase:
+        return self._database
+
+    def enqueue(self, test_run_id: str, shards: List[Dict[str, str]], pytest_options: str = ""):
+        """
+        Enqueue the shards of a new distributed test run.
+
+        :param test_run_id: str, test run identifier
+        :param shards: List[Dict[str, str]], shards of the test run (see get_test_run_shards())
+        :param pytest_options: str, additional Pytest command line options, shared by all the shards
+        """
+        assert shards  # a distributed test run without any shards would never be completed
+        now: datetime = datetime.utcnow()
+        self._jobs.insert_one(
+            {
+                "kind": "run",
+                "test_run_id": test_run_id,
+                "state": self.RUNNING,
+                "no_of_shards": len(shards),
+                "created": now
+            }
+        )
+        self._jobs.insert_many(
+            [
+                {
+                    "kind": "shard",
+                    "test_run_id": test_run_id,
+                    "shard_id": shard["shard_id"],
+                    "component": shard["component"],
+                    "location": shard["location"],
+                    "pytest_options": pytest_options,
+                    "state": self.PENDING,
+                    "attempts": 0,
+                    "worker_id": None,
+                    "lease_expires": None,
+                    "created": now
+                }
+                for shard in shards
+            ]
+        )
+
+    def _fail_exhausted_jobs(self, now: datetime):
+        # Expired leases of shards which were already leased too often are not leased again
+        self._jobs.update_many(
+            filter={
+                "kind": "shard",
+                "state": self.LEASED,
+                "lease_expires": {"$lt": now},
+                "attempts": {"$gte": self._max_attempts}
+            },
+            update={"$set": {"state": self.FAILED, "lease_expires": None, "finished": now}}
+        )
+
+    def lease(self, worker_id: str, lease_duration: int = DEFAULT_LEASE_DURATION) -> Optional[Dict]:
+        """
+        Lease the oldest pending shard (or shard with an expired lease) of any test run.
+
+        :param worker_id: str, identifier of the worker leasing the shard
+        :param lease_duration: int, duration of the lease in seconds, unless extended by a heartbeat()
+        :return: Optional[Dict], leased shard job document; None if no shard is available
+        """
+        now: datetime = datetime.utcnow()
+        self._fail_exhausted_jobs(now)
+        return self._jobs.find_one_and_update(
+            filter={
+                "kind": "shard",
+                "attempts": {"$lt": self._max_attempts},
+                "$or": [
+                    {"state": self.PENDING},
+                    {"state": self.LEASED, "lease_expires": {"$lt": now}}
+                ]
+            },
+            update={
+                "$set": {
+                    "state": self.LEASED,
+                    "worker_id": worker_id,
+                    "lease_expires": now + timedelta(seconds=lease_duration),
+                    "heartbeat": now
+                },
+                "$inc": {"attempts": 1}
+            },
+            sort=[("created", ASCENDING)],
+            return_document=ReturnDocument.AFTER
+        )
+
+    @staticmethod
+    def _lease_filter(job: Dict) -> Dict:
+        # matches a shard job document only while its lease is held by the given (attempt of the) worker
+        return {
+            "_id": job["_id"],
+            "state": TestRunJobQueue.LEASED,
+            "worker_id": job["worker_id"],
+            "attempts": job["attempts"]
+        }
+
+    def heartbeat(self, job: Dict, lease_duration: int = DEFAULT_LEASE_DURATION) -> bool:
+        """
+        Extend the lease of a shard.
+
+        :param job: Dict, shard job document, as returned by lease()
+        :param lease_duration: int, duration of the extended lease, in seconds
+        :return: bool, False if the lease was lost (i.e. expired and leased by another worker, or cancelled)
+        """
+        now: datetime = datetime.utcnow()
+        result = self._jobs.update_one(
+            filter=self._lease_filter(job),
+            update={"$set": {"lease_expires": now + timedelta(seconds=lease_duration), "heartbeat": now}}
+        )
+        return result.matched_count == 1
+
+    def complete(self, job: Dict, return_code: int):
+        """
+        Record the outcome of a leased shard. Shards which could not run to completion
+        are released for another attempt, unless they were already leased too often.
+
+        :param job: Dict, shard job document, as returned by lease()
+        :param return_code: int, exit code of the Pytest session of the shard
+        """
+        state: str
+        if return_code in COMPLETED_EXIT_CODES:
+            state = self.COMPLETED
+        elif job["attempts"] < self._max_attempts:
+            state = self.PENDING
+        else:
+            state = self.FAILED
+        self._jobs.update_one(
+            filter=self._lease_filter(job),
+            update={
+                "$set": {
+                    "state": state,
+                    "return_code": return_code,
+                    "lease_expires": None,
+                    "finished": datetime.utcnow()
+                }
+            }
+        )
+
+    def cancel(self, test_run_id: str):
+        """
+        Cancel a distributed test run. Workers running its shards lose their lease at their next heartbeat.
+
+        :param test_run_id: str, test run identifier
+        """
+        self._jobs.update_many(
+            filter={"test_run_id": test_run_id, "state": {"$in": [self.PENDING, self.LEASED, self.RUNNING]}},
+            update={"$set": {"state": self.CANCELLED, "lease_expires": None}}
+        )
+
+    def get_run_state(self, test_run_id: str) -> Optional[str]:
+        """
+        :param test_run_id: str, test run identifier
+        :return: Optional[str], state of the distributed test run; None if unknown
+        """
+        run: Optional[Dict] = self._jobs.find_one(filter={"kind": "run", "test_run_id": test_run_id})
+        return run["state"] if run else None
+
+    def get_shard_ids(self, test_run_id: str) -> List[str]:
+        """
+        :param test_run_id: str, test run identifier
+        :return: List[str], identifiers of the shards of the distributed test run (empty if unknown test run)
+        """
+        return [
+            shard["shard_id"]
+            for shard in self._jobs.find(
+                filter={"kind": "shard", "test_run_id": test_run_id}, projection={"shard_id": 1}
+            )
+        ]
+
+    def get_percentage_completion(self, test_run_id: str) -> int:
+        """
+        :param test_run_id: str, test run identifier
+        :return: int, 0..100 percentage of the shards of the test run which are done; -1 if unknown test run
+        """
+        run: Optional[Dict] = self._jobs.find_one(filter={"kind": "run", "test_run_id": test_run_id})
+        if not run:
+            return -1
+        if run["state"] in [self.COMPLETED, self.CANCELLED]:
+            return 100
+        no_of_shards_done: int = self._jobs.count_documents(
+            filter={"kind": "shard", "test_run_id": test_run_id, "state": {"$in": [self.COMPLETED, self.FAILED]}}
+        )
+        # We hold back declaring 100% completion until the test run summary is saved
+        return int(95 * no_of_shards_done / run["no_of_shards"])
+
+    def finalize_test_runs(self) -> List[str]:
+        """
+        Merge the partial summaries of the shards of every test run whose shards are all done,
+        into the final test run summary. Only one worker ever finalizes a given test run.
+
+        :return: List[str], identifiers of the test runs finalized by this call
+        """
+        self._fail_exhausted_jobs(datetime.utcnow())
+        finalized: List[str] = list()
+        for run in self._jobs.find(filter={"kind": "run", "state": self.RUNNING}):
+            test_run_id: str = run["test_run_id"]
+            if self._jobs.count_documents(
+                filter={"kind": "shard", "test_run_id": test_run_id, "state": {"$in": [self.PENDING, self.LEASED]}},
+                limit=1
+            ):
+                continue
+            if not self._jobs.find_one_and_update(
+                filter={"_id": run["_id"], "state": self.RUNNING},
+                update={"$set": {"state": self.FINALIZING}}
+            ):
+                # some other worker got there first
+                continue
+            self._merge_shard_summaries(test_run_id)
+            self._jobs.update_one(
+                filter={"_id": run["_id"]},
+                update={"$set": {"state": self.COMPLETED, "finished": datetime.utcnow()}}
+            )
+            finalized.append(test_run_id)
+        return finalized
+
+    def _merge_shard_summaries(self, test_run_id: str):
+        test_report: TestReport = self._database.get_test_report(identifier=test_run_id)
+        report: ReportAggregator = ReportAggregator()
+        failed_shards: List[str] = list()
+        for shard in self._jobs.find(filter={"kind": "shard", "test_run_id": test_run_id}):
+            if shard["state"] != self.COMPLETED:
+                logger.warning(
+                    f"Shard '{shard['shard_id']}' ({shard['location']}) of test run '{test_run_id}' " +
+                    f"failed after {shard['attempts']} attempts. Its results are missing from the test run summary?"
+                )
+                failed_shards.append(shard["shard_id"])
+                continue
+            shard_summary: Optional[Dict] = test_report.retrieve_document(
+                document_type="Shard Summary", document_key=get_shard_summary_key(shard["shard_id"])
+            )
+            if shard_summary:
+                shard_summary.pop("document_key", None)
+                report.merge({"test_run_summary": shard_summary})
+        report.save(
+            test_report,
+            error=f"shards {', '.join(failed_shards)} failed: their results are missing from the test run summary"
+            if failed_shards else None
+        )
+        test_report.close()
+
+
+_test_run_job_queue: Optional[TestRunJobQueue] = None
+
+
+def get_test_run_job_queue() -> Optional[TestRunJobQueue]:
+    """
+    :return: Optional[TestRunJobQueue], job queue of distributed test runs;
+             None if the test report database is not a MongoReportDatabase.
+    """
+    global _test_run_job_queue
+    if not _test_run_job_queue:
+        database: TestReportDatabase = get_test_report_database()
+        if isinstance(database, MongoReportDatabase):
+            _test_run_job_queue = TestRunJobQueue(database)
+    return _test_run_job_queue
+
+
+class TestRunWorker:
+    """
+    Worker running the leased shards of distributed test runs, as Pytest sessions.
+    """
+    def __init__(
+            self,
+            job_queue: TestRunJobQueue,
+            worker_id: Optional[str] = None,
+            lease_duration: int = DEFAULT_LEASE_DURATION,
+            heartbeat_interval: int = DEFAULT_HEARTBEAT_INTERVAL,
+            polling_interval: int = DEFAULT_POLLING_INTERVAL
+    ):
+        """
+        TestRunWorker constructor.
+
+        :param job_queue: TestRunJobQueue, queue from which shards are leased
+        :param worker_id: Optional[str], worker identifier (Default: '<hostname>:<process id>')
+        :param lease_duration: int, duration of shard leases, in seconds
+        :param heartbeat_interval: int, interval between lease extending heartbeats, in seconds
+        :param polling_interval: int, interval between job queue polls when idle, in seconds
+        """
+        assert heartbeat_interval < lease_duration
+        self._job_queue: TestRunJobQueue = job_queue
+        self._worker_id: str = worker_id if worker_id else f"{gethostname()}:{getpid()}"
+        self._lease_duration: int = lease_duration
+        self._heartbeat_interval: int = heartbeat_interval
+        self._polling_interval: int = polling_interval
+
+    def get_worker_id(self) -> str:
+        return self._worker_id
+
+    @staticmethod
+    def get_command_line(job: Dict) -> str:
+        """
+        :param job: Dict, shard job document
+        :return: str, Pytest command line running the shard
+        """
+        if job["component"] == "KP":
+            test_function = "test_trapi_kps"
+            location_option = "kp_location"
+        else:
+            test_function = "test_trapi_aras"
+            location_option = "ara_location"
+        command_line: str = f"cd {ONEHOP_TEST_DIRECTORY} {CMD_DELIMITER} " + \
+                            f"pytest --tb=line -vv test_onehops.py::{test_function}"
+        command_line += f" --test_run_id={job['test_run_id']}"
+        command_line += f" --test_run_shard={job['shard_id']}"
+        command_line += f" --{location_option}={quote(job['location'])}"
+        command_line += job["pytest_options"]
+        return command_line
+
+    def run_job(self, job: Dict) -> Optional[int]:
+        """
+        Run a leased shard, extending its lease with heartbeats while it runs.
+
+        :param job: Dict, shard job document, as returned by TestRunJobQueue.lease()
+        :return: Optional[int], exit code of the Pytest session; None if the lease was lost
+        """
+        command_line: str = self.get_command_line(job)
+        logger.info(f"Worker '{self._worker_id}' running shard '{job['shard_id']}': {command_line}")
+        # the shell, then Pytest (and its pytest-xdist workers), are run in a new process group (session)
+        with Popen(args=command_line, shell=True, start_new_session=True) as proc:
+            while True:
+                try:
+                    return proc.wait(timeout=self._heartbeat_interval)
+                except TimeoutExpired:
+                    if not self._job_queue.heartbeat(job, self._lease_duration):
+                        logger.warning(
+                            f"Worker '{self._worker_id}' lost its lease of shard '{job['shard_id']}' " +
+                            f"of test run '{job['test_run_id']}'. Terminating the shard?"
+                        )
+                        self._terminate(proc)
+                        return None
+
+    @staticmethod
+    def _terminate(proc: Popen):
+        """
+        Terminates a shard, i.e. its whole process group: terminating only the shell running
+        the command line of the shard would leave its Pytest session running (orphaned).
+
+        :param proc: Popen, process (group leader) running the shard
+        """
+        if killpg is not None:
+            try:
+                killpg(proc.pid, SIGTERM)
+            except ProcessLookupError:
+                pass
+        else:
+            # no process groups (i.e. on Windows)
+            proc.terminate()
+        proc.wait()
+
+    def run(self, exit_when_idle: bool = False):
+        """
+        Lease and run shards, until interrupted (or until no shards are left, if so indicated).
+
+        :param exit_when_idle: bool, if True, return once no shard is available to be leased
+        """
+        while True:
+            job: Optional[Dict] = self._job_queue.lease(self._worker_id, self._lease_duration)
+            if job:
+                return_code: Optional[int] = self.run_job(job)
+                if return_code is not None:
+                    self._job_queue.complete(job, return_code)
+
+            for test_run_id in self._job_queue.finalize_test_runs():
+                logger.info(f"Worker '{self._worker_id}' completed test run '{test_run_id}'")
+
+            if not job:
+                if exit_when_idle:
+                    return
+                sleep(self._polling_interval)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Worker running shards of distributed SRI Testing test runs.")
+    parser.add_argument("--worker_id", default=None, help="Worker identifier (Default: '<hostname>:<process id>').")
+    parser.add_argument(
+        "--lease_duration", type=int, default=DEFAULT_LEASE_DURATION,
+        help=f"Duration of shard leases, in seconds (Default: {DEFAULT_LEASE_DURATION})."
+    )
+    parser.add_argument(
+        "--heartbeat_interval", type=int, default=DEFAULT_HEARTBEAT_INTERVAL,
+        help=f"Interval between lease extending heartbeats, in seconds (Default: {DEFAULT_HEARTBEAT_INTERVAL})."
+    )
+    parser.add_argument(
+        "--polling_interval", type=int, default=DEFAULT_POLLING_INTERVAL,
+        help=f"Interval between job queue polls when idle, in seconds (Default: {DEFAULT_POLLING_INTERVAL})."
+    )
+    parser.add_argument("--exit_when_idle", action="store_true", help="Exit once no shard is left to be run.")
+    args = parser.parse_args()
+
+    job_queue: Optional[TestRunJobQueue] = get_test_run_job_queue()
+    if not job_queue:
+        print("Distributed test runs need a MongoDb test report database... Exiting!", file=stderr)
+        exit(1)
+
+    TestRunWorker(
+        job_queue=job_queue,
+        worker_id=args.worker_id,
+        lease_duration=args.lease_duration,
+        heartbeat_interval=args.heartbeat_interval,
+        polling_interval=args.polling_interval
+    ).run(exit_when_idle=args.exit_when_idle)
+
+
+if __name__ == '__main__':
+    main()
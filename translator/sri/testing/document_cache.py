@@ -0,0 +1,122 @@
+"""
+Read-through cache of the documents of completed test runs.
+
+The documents of a completed test run never change (until the test run is deleted), yet the web service
+retrieves - i.e. reads in and parses - the same few of them (e.g. the test run summary, polled by the
+dashboard) again and again. The parsed documents of completed test runs are rather cached, in a least
+recently used (LRU) cache bounded by the total (JSON text) size of the cached documents.
+"""
+from typing import Optional, Dict, Tuple, Callable, Any
+from os import environ
+from collections import OrderedDict
+from threading import RLock
+
+import orjson
+
+import logging
+logger = logging.getLogger(__name__)
+
+# Maximum total size (in bytes of JSON text) of the cached documents; 0 disables the cache
+DEFAULT_DOCUMENT_CACHE_SIZE = int(environ.get('DOCUMENT_CACHE_SIZE', 64 * 1024 * 1024))
+
+
+class DocumentCache:
+    """
+    Byte-weighted LRU cache of (parsed) test run documents, indexed by test run identifier and document key.
+    Cached documents are shared by all their readers, thus should not be modified.
+    """
+    def __init__(self, max_size: int = DEFAULT_DOCUMENT_CACHE_SIZE):
+        """
+        DocumentCache constructor.
+
+        :param max_size: int, maximum total size (in bytes of JSON text) of the cached documents (0: no caching)
+        """
+        self._max_size: int = max_size
+        self._size: int = 0
+
+        # cached documents, with their size, most recently used last
+        self._documents: OrderedDict = OrderedDict()
+        self._lock: RLock = RLock()
+
+        self._hits: int = 0
+        self._misses: int = 0
+        self._evictions: int = 0
+
+    def get(self, test_run_id: str, document_key: str, retrieve: Callable[[], Optional[Any]]) -> Optional[Any]:
+        """
+        Returns a cached document, else retrieves it (outside the cache lock) then caches it.
+
+        :param test_run_id: str, identifier of the (completed) test run of the document
+        :param document_key: str, the key ('path') of the document (or of a projection of the document)
+        :param retrieve: Callable[[], Optional[Any]], retrieval of the document, on a cache miss
+        :return: Optional[Any], the document (or its projection); None if not available (which is not cached)
+        """
+        key: Tuple[str, str] = (test_run_id, document_key)
+        with self._lock:
+            entry: Optional[Tuple[Any, int]] = self._documents.get(key, None)
+            if entry is not None:
+                self._documents.move_to_end(key)
+                self._hits += 1
+                return entry[0]
+            self._misses += 1
+
+        document: Optional[Any] = retrieve()
+        if document is None or self._max_size <= 0:
+            return document
+        size: int = len(orjson.dumps(document, option=orjson.OPT_NON_STR_KEYS))
+        if size > self._max_size:
+            # documents bigger than the whole cache are not cached
+            return document
+
+        with self._lock:
+            if key in self._documents:
+                # concurrently retrieved by another reader
+                self._size -= self._documents[key][1]
+            self._documents[key] = (document, size)
+            self._documents.move_to_end(key)
+            self._size += size
+            while self._size > self._max_size:
+                _, (_, evicted_size) = self._documents.popitem(last=False)
+                self._size -= evicted_size
+                self._evictions += 1
+        return document
+
+    def invalidate(self, test_run_id: str) -> int:
+        """
+        Removes the cached documents of a test run, i.e. once deleted.
+
+        :param test_run_id: str, test run identifier
+        :return: int, number of documents removed
+        """
+        with self._lock:
+            keys = [key for key in self._documents if key[0] == test_run_id]
+            for key in keys:
+                self._size -= self._documents.pop(key)[1]
+        if keys:
+            logger.debug(f"Removed {len(keys)} cached documents of deleted test run '{test_run_id}'")
+        return len(keys)
+
+    def clear(self):
+        """
+        Removes all the cached documents (the metrics are kept).
+        """
+        with self._lock:
+            self._documents.clear()
+            self._size = 0
+
+    def get_metrics(self) -> Dict:
+        """
+        :return: Dict, cache metrics: number of cached documents, their total size (bytes), maximum size (bytes),
+                       number of hits, misses and evictions, and hit rate (i.e. fraction of cache lookups hit)
+        """
+        with self._lock:
+            lookups: int = self._hits + self._misses
+            return {
+                "documents": len(self._documents),
+                "size": self._size,
+                "max_size": self._max_size,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "hit_rate": self._hits / lookups if lookups else 0.0
+            }
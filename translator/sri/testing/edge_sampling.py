@@ -0,0 +1,141 @@
+"""
+Test edge budgeting and sampling for the One Hop test generation.
+
+Large KP test data files may publish many more test edges than are tractable
+to test in a single test run. Rather than simply truncating the list of edges
+(which biases the selection towards the top of the test data file), a
+deterministic, seeded, stratified sample of edges is selected, spreading the
+edge budget across the distinct (subject_category, predicate, object_category)
+'strata' of the test data, with priority given to covering distinct predicates.
+"""
+from typing import Optional, Dict, List, Tuple
+from random import Random
+from collections import OrderedDict
+import re
+
+import logging
+logger = logging.getLogger(__name__)
+
+# Default maximum number of test edges selected per test data file
+# (the historic REASONABLE_NUMBER_OF_TEST_EDGES circuit breaker)
+DEFAULT_EDGE_BUDGET: int = 100
+
+# Default seed used for the edge sampling, for reproducibility of test runs
+DEFAULT_SAMPLING_SEED: str = "sri-testing"
+
+# (InfoRes-style) resource identifiers, which are safely used as (shell) command line option values
+RESOURCE_ID_PATTERN = re.compile(r"[\w.:-]+")
+
+Stratum = Tuple[str, str, str]
+
+
+def get_edge_stratum(edge: Dict) -> Stratum:
+    """
+    :param edge: Dict, test data edge
+    :return: Tuple[str, str, str], the (subject_category, predicate, object_category) stratum of the edge
+    """
+    return (
+        str(edge.get('subject_category', "")),
+        str(edge.get('predicate', "")),
+        str(edge.get('object_category', ""))
+    )
+
+
+def parse_edge_budgets(budgets: Optional[List[str]]) -> Dict[str, int]:
+    """
+    Parse resource-specific edge budgets, as specified on the command line.
+
+    :param budgets: Optional[List[str]], list of 'resource_id=budget' strings (may be None)
+    :return: Dict[str, int], edge budgets indexed by resource identifier
+    :raises ValueError: if a budget specification is malformed, i.e. its resource identifier is not
+                        InfoRes-style (see RESOURCE_ID_PATTERN) or its budget is not a non-negative integer
+    """
+    edge_budgets: Dict[str, int] = dict()
+    if not budgets:
+        return edge_budgets
+    for spec in budgets:
+        resource_id, sep, budget = spec.partition("=")
+        resource_id = resource_id.strip().replace("infores:", "")
+        budget = budget.strip()
+        # a zero budget signals 'no limit'
+        if not (RESOURCE_ID_PATTERN.fullmatch(resource_id) and sep and budget.isdecimal()):
+            raise ValueError(f"Invalid edge budget '{spec}': should be 'resource_id=<non-negative integer>'")
+        edge_budgets[resource_id] = int(budget)
+    return edge_budgets
+
+
+def get_edge_budget(
+        resource_id: str,
+        default_budget: Optional[int] = DEFAULT_EDGE_BUDGET,
+        edge_budgets: Optional[Dict[str, int]] = None
+) -> Optional[int]:
+    """
+    :param resource_id: str, identifier (i.e. InfoRes object identifier) of the resource being tested
+    :param default_budget: Optional[int], run-level edge budget (default: DEFAULT_EDGE_BUDGET)
+    :param edge_budgets: Optional[Dict[str, int]], resource-specific edge budgets, overriding the default
+    :return: Optional[int], maximum number of test edges for the resource; 'None' if unlimited
+    """
+    budget: Optional[int] = default_budget
+    if edge_budgets and resource_id in edge_budgets:
+        budget = edge_budgets[resource_id]
+    # zero or negative budgets signal 'no limit'
+    return budget if budget and budget > 0 else None
+
+
+def sample_test_edges(
+        edges: List[Dict],
+        budget: Optional[int],
+        seed: Optional[str] = DEFAULT_SAMPLING_SEED
+) -> List[int]:
+    """
+    Select a representative subset of test edges, stratified by edge (subject_category, predicate, object_category).
+
+    Edges are drawn in rounds, one edge per stratum per round, until the budget is exhausted. Within each round,
+    strata of predicates not yet covered are drawn first, so that coverage of the predicate space is maximal
+    even when the budget is smaller than the number of strata. The sample is fully determined by the seed.
+
+    :param edges: List[Dict], test data edges
+    :param budget: Optional[int], maximum number of edges to select; 'None' selects all edges
+    :param seed: Optional[str], seed of the pseudo-random selection (default: DEFAULT_SAMPLING_SEED)
+    :return: List[int], sorted list of indices of the selected edges
+    """
+    if budget is None or budget >= len(edges):
+        return list(range(len(edges)))
+
+    rng = Random(seed)
+
+    # Group the edge indices by stratum, in order of first appearance
+    strata: Dict[Stratum, List[int]] = OrderedDict()
+    for edge_i, edge in enumerate(edges):
+        strata.setdefault(get_edge_stratum(edge), list()).append(edge_i)
+    for members in strata.values():
+        rng.shuffle(members)
+
+    # Interleave the strata by predicate: the first stratum of every
+    # predicate comes before the second stratum of any predicate, etc.
+    by_predicate: Dict[str, List[Stratum]] = OrderedDict()
+    for stratum in strata:
+        by_predicate.setdefault(stratum[1], list()).append(stratum)
+    predicates: List[str] = list(by_predicate.keys())
+    rng.shuffle(predicates)
+    for predicate in predicates:
+        rng.shuffle(by_predicate[predicate])
+    ordered_strata: List[Stratum] = [
+        by_predicate[predicate][rank]
+        for rank in range(max(len(group) for group in by_predicate.values()))
+        for predicate in predicates
+        if rank < len(by_predicate[predicate])
+    ]
+
+    selected: List[int] = list()
+    draw: int = 0
+    while len(selected) < budget:
+        for stratum in ordered_strata:
+            members = strata[stratum]
+            if draw < len(members):
+                selected.append(members[draw])
+                if len(selected) == budget:
+                    break
+        draw += 1
+
+    return sorted(selected)
@@ -0,0 +1,135 @@
+"""
+Incremental test runs, which only retest the KP and ARA resources whose test inputs changed,
+or which had failing unit tests, since a previous ('baseline') test run.
+
+The inputs of each tested resource - its test data (including its Translator SmartAPI Registry metadata),
+endpoint url, TRAPI and Biolink Model versions, the version of the Reasoner Validator and the test
+parameters constraining the selection of the test edges - are hashed into a 'fingerprint', recorded
+in the test run summary entry of the resource. The test run summary entries of unchanged resources
+of the baseline test run are carried forward into the new test run summary, tagged with the identifier
+of the test run which actually holds their resource summaries and edge details, rather than copying
+the latter documents. Test run report accessors follow such references, as needed.
+"""
+from typing import Optional, Dict, List, Any
+from copy import deepcopy
+from hashlib import sha256
+from json import dumps
+from importlib.metadata import version, PackageNotFoundError
+
+from translator.sri.testing.report_db import ReportJsonEncoder
+
+import logging
+logger = logging.getLogger(__name__)
+
+# Test run summary entry tag of the identifier of the test run holding the documents of a carried forward resource
+CARRIED_FORWARD_FROM = "carried_forward_from"
+
+_validator_version: Optional[str] = None
+
+
+def get_validator_version() -> str:
+    """
+    :return: str, version of the installed Reasoner Validator package ('unknown' if not available)
+    """
+    global _validator_version
+    if not _validator_version:
+        try:
+            _validator_version = version("reasoner-validator")
+        except PackageNotFoundError:
+            _validator_version = "unknown"
+    return _validator_version
+
+
+def compute_resource_fingerprint(
+        test_data: Dict,
+        url: Optional[str],
+        trapi_version: Optional[str],
+        biolink_version: Optional[str],
+        test_parameters: Optional[Dict[str, Any]] = None,
+        dependencies: Optional[List[str]] = None
+) -> str:
+    """
+    Compute the fingerprint of the inputs of the tests of a KP or ARA resource.
+
+    :param test_data: Dict, test data of the resource (as loaded, i.e. merged with its Registry metadata)
+    :param url: Optional[str], endpoint url of the resource
+    :param trapi_version: Optional[str], TRAPI version against which the resource is validated
+    :param biolink_version: Optional[str], Biolink Model version against which the resource is validated
+    :param test_parameters: Optional[Dict[str, Any]], test run parameters affecting the tests of the resource
+    :param dependencies: Optional[List[str]], fingerprints of other resources used by the tests (i.e. ARA KPs)
+    :return: str, hexadecimal SHA-256 fingerprint
+    """
+    inputs: Dict = {
+        "test_data": sha256(dumps(test_data, cls=ReportJsonEncoder, sort_keys=True).encode("utf-8")).hexdigest(),
+        "url": url,
+        "trapi_version": trapi_version,
+        "biolink_version": biolink_version,
+        "validator_version": get_validator_version(),
+        "test_parameters": test_parameters if test_parameters else dict(),
+        "dependencies": sorted(dependencies) if dependencies else list()
+    }
+    return sha256(dumps(inputs, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def has_failures(summary: Dict) -> bool:
+    """
+    :param summary: Dict, test run summary entry of a KP, or of an ARA (with its embedded KP summaries)
+    :return: bool, True if any unit test of the resource failed
+    """
+    if 'kps' in summary:
+        return any([has_failures(kp_summary) for kp_summary in summary['kps'].values()])
+    return any([statistics.get('failed', 0) > 0 for statistics in summary.get('results', dict()).values()])
+
+
+def get_carried_forward_summary(
+        baseline_test_run_id: str,
+        baseline_summary: Optional[Dict],
+        component: str,
+        resource_id: str,
+        fingerprint: str
+) -> Optional[Dict]:
+    """
+    Checks whether the test results of a resource in a baseline test run may be carried forward.
+
+    :param baseline_test_run_id: str, identifier of the baseline test run
+    :param baseline_summary: Optional[Dict], test run summary of the baseline test run
+    :param component: str, Translator component of the resource: 'ARA' or 'KP'
+    :param resource_id: str, ARA or KP resource identifier
+    :param fingerprint: str, fingerprint of the current inputs of the resource tests
+    :return: Optional[Dict], test run summary entry to be carried forward, tagged with the identifier of the test
+                             run holding its documents; None if the resource needs to be (re-)tested.
+    """
+    if not baseline_summary:
+        return None
+    entry: Optional[Dict] = baseline_summary.get(component, dict()).get(resource_id, None)
+    if not entry or entry.get('fingerprint', None) != fingerprint or has_failures(entry):
+        return None
+    entry = deepcopy(entry)
+    # Resources carried forward more than once still refer to the test run which actually tested them
+    entry.setdefault(CARRIED_FORWARD_FROM, baseline_test_run_id)
+    return entry
+
+
+def get_carried_forward_test_runs(summary: Optional[Dict]) -> List[str]:
+    """
+    :param summary: Optional[Dict], test run summary of an (incremental) test run
+    :return: List[str], sorted identifiers of the test runs holding the documents of its carried forward resources
+    """
+    if not summary:
+        return list()
+    return sorted({
+        entry[CARRIED_FORWARD_FROM]
+        for resources in summary.values() if isinstance(resources, dict)
+        for entry in resources.values() if isinstance(entry, dict) and CARRIED_FORWARD_FROM in entry
+    })
+
+
+def get_baseline_test_run_id(test_run_ids: List[str], test_run_id: Optional[str] = None) -> Optional[str]:
+    """
+    :param test_run_ids: List[str], identifiers of the completed test runs
+    :param test_run_id: Optional[str], identifier of the new test run (ignored in the list, if present)
+    :return: Optional[str], identifier of the most recent completed test run; None if there is none
+    """
+    # timestamp test run identifiers sort chronologically
+    candidates: List[str] = [identifier for identifier in test_run_ids if identifier != test_run_id]
+    return max(candidates) if candidates else None
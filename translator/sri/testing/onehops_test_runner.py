@@ -1,8 +1,10 @@
 """
 SRI Testing Report utility functions.
 """
-from typing import Optional, Dict, Tuple, List, Generator
+from typing import Optional, Dict, Tuple, List, Set, Any
+from sys import intern
 from datetime import datetime
+from shlex import quote
 import re
 
 from translator.sri.testing.processor import CMD_DELIMITER, WorkerProcess
@@ -12,8 +14,19 @@ from tests.onehop import ONEHOP_TEST_DIRECTORY
 from translator.sri.testing.report_db import (
     TestReport,
     TestReportDatabase,
-    get_test_report_database
+    get_test_report_database,
+    project_document,
+    ROLLUP_KEY_FIELDS,
+    ROLLUP_STATISTICS_FIELDS
 )
+from translator.sri.testing.distributed import (
+    TestRunJobQueue,
+    get_test_run_job_queue,
+    get_test_run_shards
+)
+from translator.sri.testing.incremental import CARRIED_FORWARD_FROM, get_baseline_test_run_id
+from translator.sri.testing.document_cache import DocumentCache
+from translator.sri.testing.report_aggregator import get_live_summary_key, merge_live_summaries
 
 import logging
 logger = logging.getLogger()
@@ -77,14 +90,27 @@ def build_edge_details_key(component: str, ara_id: Optional[str], kp_id: str, ed
     return f"{build_resource_key(component,ara_id,kp_id)}/{kp_id}-{edge_num}"
 
 
+def strip_xdist_group(unit_test_key: str) -> str:
+    """
+    Strips the '@<group>' suffix which pytest-xdist ('--dist loadgroup') appends to the node ids of grouped unit
+    tests (the same way pytest-xdist does, i.e. unless the last '@' is part of the unit test parameters).
+
+    :param unit_test_key: str, full unit test label (i.e. Pytest node id)
+    :return: str, unit test label without any xdist group suffix
+    """
+    if unit_test_key.rfind("@") > unit_test_key.rfind("]"):
+        return unit_test_key[:unit_test_key.rfind("@")]
+    return unit_test_key
+
+
 def parse_unit_test_name(unit_test_key: str) -> Tuple[str, str, str, int, str, str]:
     """
     Reformat (test run key) source identifier into a well-behaved test file name.
-    :param unit_test_key: original full unit test label
+    :param unit_test_key: original full unit test label (with or without its xdist group suffix)
 
     :return: Tuple[ component, ara_id, kp_id, int(edge_num), test_id, edge_details_file_path]
     """
-    unit_test_name = unit_test_key.split('/')[-1]
+    unit_test_name = strip_xdist_group(unit_test_key).split('/')[-1]
 
     psf = UNIT_TEST_NAME_PATTERN.match(unit_test_name)
     if psf:
@@ -108,12 +134,14 @@ def parse_unit_test_name(unit_test_key: str) -> Tuple[str, str, str, int, str, s
                         if edge_num:
                             test_id = tci["test_id"] if tci["test_id"] else "input"
 
+                            # identifiers recur in every unit test (and summary record) of a
+                            # test run, thus are interned rather than held as many copies
                             return (
-                                component,
-                                ara_id,
-                                kp_id,
+                                intern(component),
+                                intern(ara_id) if ara_id else None,
+                                intern(kp_id),
                                 int(edge_num),
-                                test_id,
+                                intern(test_id),
                                 build_edge_details_key(component, ara_id, kp_id, edge_num)
                             )
 
@@ -122,17 +150,102 @@ def parse_unit_test_name(unit_test_key: str) -> Tuple[str, str, str, int, str, s
 
 class OneHopTestHarness:
 
-    # Caching of processes, indexed by test_run_id (timestamp identifier as string)
+    # Caching of processes, indexed by test_run_id (timestamp identifier as string).
+    # The worker process cache is shared by the (thread pooled) web service requests, thus only accessed
+    # with single (atomic) dictionary operations, rather than checked then accessed
     _test_run_id_2_worker_process: Dict[str, Dict] = dict()
 
     _test_report_database: Optional[TestReportDatabase] = None
 
+    # Read-through cache of the documents of the completed test runs, known as such from the test run catalog
+    _document_cache: DocumentCache = DocumentCache()
+    _completed_test_runs: Set[str] = set()
+
     @classmethod
     def test_report_database(cls):
         if cls._test_report_database is None:
             cls._test_report_database = get_test_report_database()
         return cls._test_report_database
 
+    @classmethod
+    def document_cache(cls) -> DocumentCache:
+        return cls._document_cache
+
+    @classmethod
+    def _is_completed(cls, test_run_id: str) -> bool:
+        """
+        :param test_run_id: str, test run identifier
+        :return: bool, True if the test run catalog marks the test run as completed, i.e. its documents as immutable
+        """
+        if test_run_id in cls._completed_test_runs:
+            return True
+        entry: Optional[Dict] = cls.test_report_database().get_test_run(test_run_id)
+        if entry and entry.get("state", None) == TestReportDatabase.COMPLETED:
+            cls._completed_test_runs.add(test_run_id)
+            return True
+        return False
+
+    @classmethod
+    def _invalidate_cached_documents(cls, test_run_id: str):
+        """
+        :param test_run_id: str, identifier of a deleted test run, whose documents are no longer cached
+        """
+        cls._completed_test_runs.discard(test_run_id)
+        cls._document_cache.invalidate(test_run_id)
+
+    @classmethod
+    def _retrieve_document(cls, test_report: TestReport, document_type: str, document_key: str) -> Optional[Dict]:
+        """
+        Retrieves a document of a test run report, through the document cache if the test run is completed.
+
+        :param test_report: TestReport, of the test run
+        :param document_type: str, name of report type simply used for informative error reporting.
+        :param document_key: str, the key ('path') of the document being requested.
+        :return: Optional[Dict], JSON document retrieved (not to be modified, if cached); None if not available
+        """
+        test_run_id: str = test_report.get_identifier()
+        if test_report.is_deleted() or not cls._is_completed(test_run_id):
+            return test_report.retrieve_document(document_type=document_type, document_key=document_key)
+        return cls._document_cache.get(
+            test_run_id,
+            document_key,
+            lambda: test_report.retrieve_document(document_type=document_type, document_key=document_key)
+        )
+
+    @classmethod
+    def _retrieve_document_part(
+            cls,
+            test_report: TestReport,
+            document_type: str,
+            document_key: str,
+            path: List[str],
+            keys: bool = False
+    ) -> Optional[Any]:
+        """
+        Retrieves the projection - or only the keys of the projection - of a document of a test run report,
+        through the document cache if the test run is completed.
+
+        :param test_report: TestReport, of the test run
+        :param document_type: str, name of report type simply used for informative error reporting.
+        :param document_key: str, the key ('path') of the document being requested.
+        :param path: List[str], keys of the path of the projected part of the document (empty for the whole document)
+        :param keys: bool, if True, only the keys of the projected part of the document are retrieved
+        :return: Optional[Any], projected part of the JSON document (not to be modified, if cached) - or its keys;
+                                None if not available
+        """
+        if not (path or keys):
+            return cls._retrieve_document(test_report, document_type=document_type, document_key=document_key)
+
+        def retrieve() -> Optional[Any]:
+            if keys:
+                return test_report.retrieve_document_keys(document_type, document_key, path)
+            return test_report.retrieve_document_projection(document_type, document_key, path)
+
+        test_run_id: str = test_report.get_identifier()
+        if test_report.is_deleted() or not cls._is_completed(test_run_id):
+            return retrieve()
+        return cls._document_cache.get(test_run_id, f"{document_key}#{'keys' if keys else 'path'}:{path}", retrieve)
+
     @classmethod
     def initialize(cls):
         """
@@ -140,6 +253,11 @@ class OneHopTestHarness:
         i.e. to recognized persisted test runs (in the TestReportDatabase)
         """
         logger.debug("Initializing the OneHopTestHarness environment")
+        cls.test_report_database().migrate()
+
+        # deleted test runs - including any not yet reaped by a previous process - are removed in the background
+        cls.test_report_database().start_reaper()
+        cls.test_report_database().wakeup_reaper()
         for test_run_id in cls.get_completed_test_runs():
             logger.debug(f"Found persisted test run {test_run_id} in TestReportDatabase")
             cls._test_run_id_2_worker_process[test_run_id] = {
@@ -147,11 +265,12 @@ class OneHopTestHarness:
                 "worker_process": None,
                 "timeout": DEFAULT_WORKER_TIMEOUT,
                 "percentage_completion": 100,
-                "test_run_completed": True
+                "test_run_completed": True,
+                "job_queue": None
             }
 
     @staticmethod
-    def _generate_test_run_id() -> str:
+    def generate_test_run_id() -> str:
         return datetime.now().strftime("%F_%H-%M-%S")
 
     def __init__(self, test_run_id: Optional[str] = None):
@@ -163,6 +282,7 @@ class OneHopTestHarness:
         """
         self._command_line: Optional[str] = None
         self._process: Optional[WorkerProcess] = None
+        self._job_queue: Optional[TestRunJobQueue] = None
         self._timeout: Optional[int] = DEFAULT_WORKER_TIMEOUT
         self._test_run_completed: bool = False
         if test_run_id is not None:
@@ -171,7 +291,7 @@ class OneHopTestHarness:
             self._reload_run_parameters()
         else:
             # new (or 'local') test run? no run parameters to reload?
-            self._test_run_id = self._generate_test_run_id()
+            self._test_run_id = self.generate_test_run_id()
             self._test_run_id_2_worker_process[self._test_run_id] = {}
 
         # Retrieve the associated test run report object
@@ -196,7 +316,13 @@ class OneHopTestHarness:
             ara_source: Optional[str] = None,
             one: bool = False,
             log: Optional[str] = None,
-            timeout: Optional[int] = DEFAULT_WORKER_TIMEOUT
+            timeout: Optional[int] = DEFAULT_WORKER_TIMEOUT,
+            edge_budget: Optional[int] = None,
+            kp_edge_budgets: Optional[Dict[str, int]] = None,
+            workers: Optional[int] = None,
+            distributed: bool = False,
+            incremental: bool = False,
+            endpoint_concurrency: Optional[Dict[str, int]] = None
     ):
         """
         Run the SRT Testing test harness as a worker process.
@@ -219,21 +345,89 @@ class OneHopTestHarness:
 
         :param timeout: Optional[int], worker process timeout in seconds (defaults to about 120 seconds
 
+        :param edge_budget: Optional[int], maximum number of test edges sampled from each KP test data file
+                                           (default: None, implying the DEFAULT_EDGE_BUDGET; zero means no limit).
+
+        :param kp_edge_budgets: Optional[Dict[str, int]], KP-specific edge budgets, indexed by KP InfoRes
+                                                           object identifier, overriding the 'edge_budget'.
+
+        :param workers: Optional[int], number of pytest-xdist worker processes across which the unit tests are
+                                       distributed, keeping together the unit tests of each KP or ARA endpoint
+                                       (default: None, implying that the unit tests are run in a single process).
+
+        :param distributed: bool, if True, the test run is split into shards - one per KP or ARA - which are
+                                  enqueued in the job queue of the (MongoDb) test report database, to be run by
+                                  any number of worker hosts (see translator.sri.testing.distributed). Falls back
+                                  to a local test run if no such job queue is available (default: False).
+
+        :param incremental: bool, if True, only the resources whose test inputs changed - or which had failing
+                                  unit tests - since the most recent completed test run are tested; the results
+                                  of the other resources are carried forward by reference (default: False).
+
+        :param endpoint_concurrency: Optional[Dict[str, int]], maximum number of pytest-xdist workers concurrently
+                                                               testing a given endpoint, indexed by endpoint url
+                                                               (default: None, implying one worker per endpoint).
+
         :return: None
         """
         # possible override of timeout here?
         self._timeout = timeout if timeout else self._timeout
 
+        self.test_report_database().register_test_run(
+            self._test_run_id,
+            parameters={
+                "trapi_version": trapi_version,
+                "biolink_version": biolink_version,
+                "triple_source": triple_source,
+                "ara_source": ara_source,
+                "one": one,
+                "edge_budget": edge_budget,
+                "kp_edge_budgets": kp_edge_budgets,
+                "workers": workers,
+                "distributed": distributed,
+                "incremental": incremental,
+                # endpoint urls are not safe (MongoDb) field names
+                "endpoint_concurrency": [
+                    f"{url}={concurrency}" for url, concurrency in endpoint_concurrency.items()
+                ] if endpoint_concurrency else None
+            }
+        )
+
+        pytest_options: str = ""
+        pytest_options += f" --log-cli-level={log}" if log else ""
+        pytest_options += f" -n {workers} --dist loadgroup" if workers and workers > 1 else ""
+        pytest_options += f" --TRAPI_Version={trapi_version}" if trapi_version else ""
+        pytest_options += f" --Biolink_Version={biolink_version}" if biolink_version else ""
+        pytest_options += f" --triple_source={triple_source}" if triple_source else ""
+        pytest_options += f" --ARA_source={ara_source}" if ara_source else ""
+        pytest_options += " --one" if one else ""
+        pytest_options += f" --edge_budget={edge_budget}" if edge_budget is not None else ""
+        if kp_edge_budgets:
+            for kp_id, kp_edge_budget in kp_edge_budgets.items():
+                pytest_options += f" --kp_edge_budget={quote(f'{kp_id}={kp_edge_budget}')}"
+        if endpoint_concurrency:
+            for url, concurrency in endpoint_concurrency.items():
+                pytest_options += f" --endpoint_concurrency={quote(f'{url}={concurrency}')}"
+        if incremental:
+            baseline_test_run_id: Optional[str] = \
+                get_baseline_test_run_id(self.get_completed_test_runs(), self._test_run_id)
+            if baseline_test_run_id:
+                pytest_options += f" --baseline_test_run_id={baseline_test_run_id}"
+                # the baseline test run, and those it refers to, are retained while this test run may refer to them
+                baseline: Dict = self.test_report_database().get_test_run(baseline_test_run_id) or dict()
+                self.test_report_database().update_test_run(
+                    self._test_run_id,
+                    references=sorted({baseline_test_run_id, *baseline.get("references", list())})
+                )
+            else:
+                logger.warning("No completed test run to serve as a baseline: all resources are tested.")
+
+        if distributed and self._enqueue_test_run(pytest_options, triple_source, ara_source):
+            return
+
         self._command_line = f"cd {ONEHOP_TEST_DIRECTORY} {CMD_DELIMITER} " + \
-                             f"pytest --tb=line -vv"
-        self._command_line += f" --log-cli-level={log}" if log else ""
-        self._command_line += f" test_onehops.py"
-        self._command_line += f" --test_run_id={self._test_run_id}"
-        self._command_line += f" --TRAPI_Version={trapi_version}" if trapi_version else ""
-        self._command_line += f" --Biolink_Version={biolink_version}" if biolink_version else ""
-        self._command_line += f" --triple_source={triple_source}" if triple_source else ""
-        self._command_line += f" --ARA_source={ara_source}" if ara_source else ""
-        self._command_line += " --one" if one else ""
+                             f"pytest --tb=line -vv test_onehops.py --test_run_id={self._test_run_id}"
+        self._command_line += pytest_options
 
         logger.debug(f"OneHopTestHarness.run() command line: {self._command_line}")
 
@@ -248,35 +442,72 @@ class OneHopTestHarness:
             "worker_process": self._process,
             "timeout": self._timeout,
             "percentage_completion": 0,  # Percentage Completion needs to be updated later?
-            "test_run_completed": False
+            "test_run_completed": False,
+            "job_queue": None
+        }
+
+    def _enqueue_test_run(self, pytest_options: str, triple_source: Optional[str], ara_source: Optional[str]) -> bool:
+        """
+        Enqueue the shards of a distributed test run.
+
+        :param pytest_options: str, Pytest command line options shared by all the shards
+        :param triple_source: Optional[str], 'REGISTRY', directory or file from which to retrieve triples
+        :param ara_source: Optional[str], 'REGISTRY', directory or file from which to retrieve ARA Config
+        :return: bool, True if the test run was enqueued
+        """
+        job_queue: Optional[TestRunJobQueue] = get_test_run_job_queue()
+        if not job_queue:
+            logger.warning("Distributed test runs need a MongoDb test report database. Running the tests locally?")
+            return False
+
+        shards: List[Dict[str, str]] = get_test_run_shards(triple_source=triple_source, ara_source=ara_source)
+        if not shards:
+            logger.warning("No KP or ARA test data available to be distributed. Running the tests locally?")
+            return False
+
+        job_queue.enqueue(test_run_id=self._test_run_id, shards=shards, pytest_options=pytest_options)
+        logger.debug(f"OneHopTestHarness.run() enqueued {len(shards)} shards of test run '{self._test_run_id}'")
+
+        self._job_queue = job_queue
+        self._test_run_id_2_worker_process[self._test_run_id] = {
+            "command_line": None,
+            "worker_process": None,
+            "timeout": self._timeout,
+            "percentage_completion": 0,
+            "test_run_completed": False,
+            "job_queue": job_queue
         }
+        return True
 
     def get_worker(self) -> Optional[WorkerProcess]:
         return self._process
 
     def _set_percentage_completion(self, value: int):
-        if self._test_run_id in self._test_run_id_2_worker_process:
-            self._test_run_id_2_worker_process[self._test_run_id]["percentage_completion"] = value
+        run_parameters: Optional[Dict] = self._test_run_id_2_worker_process.get(self._test_run_id, None)
+        if run_parameters is not None:
+            run_parameters["percentage_completion"] = value
         else:
             raise RuntimeError(
                 f"_set_percentage_completion(): '{str(self._test_run_id)}' Worker Process is unknown!"
             )
     
     def _get_percentage_completion(self) -> int:
-        if self._test_run_id in self._test_run_id_2_worker_process:
-            return self._test_run_id_2_worker_process[self._test_run_id]["percentage_completion"]
+        run_parameters: Optional[Dict] = self._test_run_id_2_worker_process.get(self._test_run_id, None)
+        if run_parameters is not None:
+            return run_parameters["percentage_completion"]
         else:
             return -1  # signal unknown test run process?
 
     def _reload_run_parameters(self):
         # TODO: do we also need to reconnect to the TestReportDatabase here?
-        if self._test_run_id in self._test_run_id_2_worker_process:
-            run_parameters: Dict = self._test_run_id_2_worker_process[self._test_run_id]
+        run_parameters: Optional[Dict] = self._test_run_id_2_worker_process.get(self._test_run_id, None)
+        if run_parameters is not None:
             self._command_line = run_parameters["command_line"]
             self._process = run_parameters["worker_process"]
             self._timeout = run_parameters["timeout"]
             self._percentage_completion = run_parameters["percentage_completion"]
             self._test_run_completed = run_parameters["test_run_completed"]
+            self._job_queue = run_parameters.get("job_queue", None)
         else:
             logger.warning(
                 f"Test run '{self._test_run_id}' is not associated with a Worker Process. " +
@@ -288,8 +519,13 @@ class OneHopTestHarness:
 
     def test_run_complete(self) -> bool:
         if not self._test_run_completed:
+            if self._job_queue:
+                # Distributed test runs are completed once their shard summaries are merged
+                self._test_run_completed = self._job_queue.get_run_state(self._test_run_id) in [
+                    TestRunJobQueue.COMPLETED, TestRunJobQueue.CANCELLED
+                ]
             # If there is an active WorkerProcess...
-            if self._process:
+            elif self._process:
                 # ... then poll the Queue for task completion
                 status: str = self._process.status()
                 if status.startswith(WorkerProcess.COMPLETED) or \
@@ -307,11 +543,15 @@ class OneHopTestHarness:
 
         :return: int, 0..100 indicating the percentage completion of the test run. -1 if unknown test run ID
         """
-        completed_test_runs: List[str] = self.get_completed_test_runs()
-        if self._test_run_id in completed_test_runs:
+        catalog_entry: Optional[Dict] = self.test_report_database().get_test_run(self._test_run_id)
+        if catalog_entry and catalog_entry.get("state", None) == TestReportDatabase.COMPLETED:
             # Option 1: detection of a completed_test_run
             self._set_percentage_completion(100)
 
+        elif self._job_queue:
+            # Distributed test run: percentage of its shards which are done
+            self._set_percentage_completion(self._job_queue.get_percentage_completion(self._test_run_id))
+
         elif 0 <= self._get_percentage_completion() < 95:
             for percentage_complete in self._process.get_output(timeout=1):
                 logger.debug(f"Pytest % completion: {percentage_complete}")
@@ -329,7 +569,13 @@ class OneHopTestHarness:
         try:
             if not (self.test_run_complete() and self._test_report):
                 # test run still in progress...
-                if self._process:
+                if self._job_queue:
+                    # the workers running the shards of a distributed test
+                    # run abandon them when they next fail to renew their lease
+                    self._job_queue.cancel(self._test_run_id)
+                    self._test_run_id_2_worker_process.pop(self._test_run_id, None)
+
+                elif self._process:
 
                     # this is a blocking process termination but leaves
                     # an incomplete TestReport in the TestReportDatabase
@@ -337,10 +583,10 @@ class OneHopTestHarness:
                     self._process = None
 
                     # Remove the process from the OneHopTestHarness cache
-                    if self._test_run_id in self._test_run_id_2_worker_process:
-                        self._test_run_id_2_worker_process.pop(self._test_run_id)
+                    self._test_run_id_2_worker_process.pop(self._test_run_id, None)
 
             success = self._test_report.delete(ignore_errors=True)
+            self._invalidate_cached_documents(self._test_run_id)
 
         except Exception as exc:
             # Not sure what other conditions would trigger this, if any
@@ -356,6 +602,38 @@ class OneHopTestHarness:
 
         return outcome
 
+    @classmethod
+    def delete_test_runs(
+            cls,
+            test_run_ids: Optional[List[str]] = None,
+            max_age_days: Optional[int] = None,
+            keep_latest: Optional[int] = None
+    ) -> List[str]:
+        """
+        Bulk deletion of test runs: the given test runs (cancelled first, if still running), then the
+        completed test runs beyond the given retention policy. Returns immediately: the documents
+        of the deleted test runs are physically removed later, in the background.
+
+        :param test_run_ids: Optional[List[str]], identifiers of the test runs to delete
+        :param max_age_days: Optional[int], maximum age (in days) of the retained completed test runs
+        :param keep_latest: Optional[int], number of most recent completed test runs always retained
+        :return: List[str], identifiers of the test runs deleted
+        """
+        deleted: List[str] = list()
+        for test_run_id in test_run_ids if test_run_ids else list():
+            if cls.test_report_database().get_test_run(test_run_id) is None:
+                logger.warning(f"delete_test_runs(): unknown test run '{test_run_id}'?")
+                continue
+            cls(test_run_id=test_run_id).delete()
+            deleted.append(test_run_id)
+        if max_age_days is not None or keep_latest is not None:
+            expired: List[str] = \
+                cls.test_report_database().apply_retention(max_age_days=max_age_days, keep_latest=keep_latest)
+            for test_run_id in expired:
+                cls._invalidate_cached_documents(test_run_id)
+            deleted.extend(expired)
+        return deleted
+
     def save_json_document(self, document_type: str, document: Dict, document_key: str, is_big: bool = False):
         """
         Saves an indexed document either to a test report database or the filing system.
@@ -372,6 +650,41 @@ class OneHopTestHarness:
             is_big=is_big
         )
 
+    def flush(self):
+        """
+        Writes out any documents saved, but still queued or buffered, by the test run report.
+        """
+        self.get_test_report().flush()
+
+    def close(self):
+        """
+        Writes out all the documents saved to the test run report, then stops its background writers.
+        """
+        self.get_test_report().close()
+
+    def set_completed(
+            self,
+            counts: Optional[Dict] = None,
+            rollups: Optional[List[Dict]] = None,
+            references: Optional[List[str]] = None
+    ):
+        """
+        Marks the test run as completed in the test run catalog.
+
+        :param counts: Optional[Dict], summary counts of the test run (e.g. number of resources and unit tests)
+        :param rollups: Optional[List[Dict]], rollup rows of the test run (see report_aggregator.get_test_run_rollups())
+        :param references: Optional[List[str]], identifiers of the test runs holding carried forward documents
+        """
+        self.get_test_report().set_completed(counts=counts, rollups=rollups, references=references)
+
+    def set_failed(self, error: str):
+        """
+        Marks the test run as failed in the test run catalog, i.e. with (some of) its results missing.
+
+        :param error: str, description of the failure
+        """
+        self.get_test_report().set_failed(error=error)
+
     @classmethod
     def get_completed_test_runs(cls) -> List[str]:
         """
@@ -379,65 +692,224 @@ class OneHopTestHarness:
         """
         return cls.test_report_database().get_available_reports()
 
-    def get_index(self) -> Optional[Dict]:
+    @classmethod
+    def get_history(
+            cls,
+            component: Optional[str] = None,
+            ara_id: Optional[str] = None,
+            kp_id: Optional[str] = None,
+            unit_test: Optional[str] = None,
+            since: Optional[str] = None,
+            until: Optional[str] = None
+    ) -> List[Dict]:
+        """
+        Returns the history of the (selected) unit tests of the (selected) resources across the completed
+        test runs, as time series of their outcome counts and latency statistics, from the test run rollups.
+
+        :param component: Optional[str], Translator component of the resources: 'ARA' or 'KP' (default: any)
+        :param ara_id: Optional[str], identifier of the ARA (default: any, including none)
+        :param kp_id: Optional[str], identifier of the (direct, or ARA embedded) KP (default: any)
+        :param unit_test: Optional[str], unit test (category), e.g. 'by_subject' (default: any)
+        :param since: Optional[str], earliest completion time (ISO format timestamp) of the test runs (default: none)
+        :param until: Optional[str], latest completion time (ISO format timestamp) of the test runs (default: none)
+        :return: List[Dict], one time series per resource unit test, with its 'component', 'ara_id', 'kp_id' and
+                             'unit_test', then its 'points' (sorted by test run completion time)
+        """
+        series: Dict[Tuple, Dict] = dict()
+        for row in cls.test_report_database().get_rollups(
+            component=component, ara_id=ara_id, kp_id=kp_id, unit_test=unit_test, since=since, until=until
+        ):
+            key: Tuple = tuple([row.get(field, None) for field in ROLLUP_KEY_FIELDS])
+            if key not in series:
+                series[key] = dict(zip(ROLLUP_KEY_FIELDS, key))
+                series[key]["points"] = list()
+            series[key]["points"].append(
+                {field: row.get(field, None) for field in ["test_run_id", "completed"] + ROLLUP_STATISTICS_FIELDS}
+            )
+        return list(series.values())
+
+    def get_index(self, projection: Optional[List[str]] = None) -> Optional[Any]:
         """
         If available, returns a test result index - KP and ARA tags - for the most recent OneHopTestHarness run.
+        Only the keys of the (parts of the) test run summary covered by the projection are retrieved.
 
-        :return: Optional[str], JSON document KP/ARA index of unit test results. 'None' if not (yet) available.
+        :param projection: Optional[List[str]], keys of the path of the projected part of the index,
+                           e.g. ['KP'] or ['ARA', <ara_id>] (default: None, i.e. the whole index)
+        :return: Optional[Any], JSON document KP/ARA index of unit test results (or its projected part).
+                                'None' if not (yet) available.
         """
-        # TODO: can some part of this operation be cached, maybe by pushing
-        #       the index access down one more level, into the TestReport?
-        summary: Optional[Dict] = self.get_test_report().retrieve_document(
-            document_type="Summary", document_key="test_run_summary"
-        )
+        test_report: TestReport = self.get_test_report()
+
+        def get_keys(path: List[str]) -> Optional[List[str]]:
+            return self._retrieve_document_part(
+                test_report, document_type="Summary", document_key="test_run_summary", path=path, keys=True
+            )
+
         # Sanity check for existence of the summary...
-        if not summary:
+        if get_keys([]) is None:
             return None
 
-        # We extract the 'index' from the available 'test_run_summary' document
+        # We extract the 'index' from the keys of the available 'test_run_summary' document
+        component: Optional[str] = projection[0] if projection else None
         index: Dict = dict()
-        if "KP" in summary and summary["KP"]:
-            index["KP"] = [str(key) for key in summary["KP"].keys()]
-        if "ARA" in summary and summary["ARA"]:
-            index["ARA"] = dict()
-            for ara_id, ara in summary["ARA"].items():
-                if "kps" in ara and ara["kps"]:
-                    kps: Dict = ara["kps"]
-                    index["ARA"][ara_id] = [str(key) for key in kps.keys()]
-
-        return index
-
-    def get_summary(self) -> Optional[Dict]:
+        if component in [None, "KP"]:
+            kp_ids: Optional[List[str]] = get_keys(["KP"])
+            if kp_ids:
+                index["KP"] = kp_ids
+        if component in [None, "ARA"]:
+            ara_ids: Optional[List[str]] = [projection[1]] if projection and len(projection) > 1 else get_keys(["ARA"])
+            if ara_ids:
+                index["ARA"] = dict()
+                for ara_id in ara_ids:
+                    kp_ids: Optional[List[str]] = get_keys(["ARA", ara_id, "kps"])
+                    if kp_ids:
+                        index["ARA"][ara_id] = kp_ids
+
+        return project_document(index, projection) if projection else index
+
+    def get_summary(self, projection: Optional[List[str]] = None) -> Optional[Any]:
         """
         If available, returns a test result summary for the most recent OneHopTestHarness run.
 
-        :return: Optional[str], JSON document summary of unit test results. 'None' if not (yet) available.
+        :param projection: Optional[List[str]], keys of the path of the projected part of the summary,
+                           e.g. ['KP', <kp_id>] or ['ARA', <ara_id>, 'kps'] (default: None, i.e. the whole summary)
+        :return: Optional[Any], JSON document summary of unit test results (or its projected part).
+                                'None' if not (yet) available.
         """
-        summary: Optional[Dict] = self.get_test_report().retrieve_document(
-            document_type="Summary", document_key="test_run_summary"
+        summary: Optional[Any] = self._retrieve_document_part(
+            self.get_test_report(), document_type="Summary", document_key="test_run_summary", path=projection or []
         )
         return summary
 
-    def get_resource_summary(
+    def get_log(self, offset: int = 0, limit: Optional[int] = None, tail: Optional[int] = None) -> Optional[Dict]:
+        """
+        Returns a page of the lines of the process (i.e. Pytest) log of the OneHopTestHarness run,
+        saved so far if the test run is still in progress.
+
+        :param offset: int, (zero based) number of the first line returned (default: 0)
+        :param limit: Optional[int], maximum number of lines returned (default: None, i.e. up to the end of the log)
+        :param tail: Optional[int], if given, rather returns (at most) this number of the last lines of the log
+        :return: Optional[Dict], 'lines' of the page, with their 'offset' and the 'total' number of lines of the log;
+                                 'None' if not (yet) available.
+        """
+        return self.get_test_report().read_log(offset=offset, limit=limit, tail=tail)
+
+    def get_live_summary(self) -> Optional[Dict]:
+        """
+        If available, returns the live (partial) test result summary of a OneHopTestHarness run in progress,
+        merged from the live summaries of its (shard) Pytest sessions and their pytest-xdist workers.
+
+        :return: Optional[Dict], JSON document summary of the unit test results so far, with progress counts and
+                                 the latest failing unit tests. 'None' if not available (e.g. test run not started)
+        """
+        shard_ids: List[Optional[str]] = \
+            self._job_queue.get_shard_ids(self._test_run_id) if self._job_queue else [None]
+        live_summaries: List[Dict] = list()
+        for shard_id in shard_ids:
+            live_summary: Optional[Dict] = self.get_test_report().retrieve_document(
+                document_type="Live Summary", document_key=get_live_summary_key(shard_id=shard_id)
+            )
+            if live_summary:
+                live_summaries.append(live_summary)
+                continue
+            # otherwise, the Pytest session is running its unit tests with (as many) numbered pytest-xdist workers
+            worker: int = 0
+            while True:
+                live_summary = self.get_test_report().retrieve_document(
+                    document_type="Live Summary",
+                    document_key=get_live_summary_key(shard_id=shard_id, worker_id=f"gw{worker}")
+                )
+                if not live_summary:
+                    break
+                live_summaries.append(live_summary)
+                worker += 1
+        return merge_live_summaries(live_summaries)
+
+    def get_live_resource_summary(
             self,
             component: str,
             kp_id: str,
             ara_id: Optional[str] = None
     ) -> Optional[Dict]:
+        """
+        Returns the live (partial) test result summary of a given resource, in a OneHopTestHarness run in progress.
+
+        :param component: str, Translator component being tested: 'ARA' or 'KP'
+        :param kp_id: str, identifier of a KP resource being accessed.
+        :param ara_id: Optional[str], identifier of the ARA resource being accessed. May be missing or None
+
+        :return: Optional[Dict], unit test counts of the resource so far, with its latest failing unit tests;
+                                 'None' if not (yet) available.
+        """
+        live_summary: Optional[Dict] = self.get_live_summary()
+        if not live_summary:
+            return None
+        entry: Optional[Dict] = live_summary.get(component, dict()).get(ara_id if ara_id else kp_id, None)
+        if entry and ara_id:
+            entry = entry.get("kps", dict()).get(kp_id, None)
+        if not entry:
+            return None
+        resource_summary: Dict = dict(entry)
+        resource_summary["in_progress"] = True
+        resource_summary["latest_failures"] = [
+            failure for failure in live_summary["latest_failures"]
+            if failure["component"] == component and failure["kp_id"] == kp_id and failure["ara_id"] == ara_id
+        ]
+        return resource_summary
+
+    def _get_carried_forward_report(
+            self,
+            component: str,
+            kp_id: str,
+            ara_id: Optional[str] = None
+    ) -> Optional[TestReport]:
+        """
+        Returns the report of the test run actually holding the documents of a resource
+        carried forward (by reference) into this (incremental) test run, if applicable.
+
+        :param component: str, Translator component being tested: 'ARA' or 'KP'
+        :param kp_id: str, identifier of a KP resource being accessed.
+        :param ara_id: Optional[str], identifier of the ARA resource being accessed. May be missing or None
+
+        :return: Optional[TestReport], report of the referenced test run; None if the resource was not carried forward
+        """
+        summary: Optional[Dict] = self.get_summary()
+        if not summary:
+            return None
+        entry: Optional[Dict] = summary.get(component, dict()).get(ara_id if ara_id else kp_id, None)
+        if not (entry and CARRIED_FORWARD_FROM in entry):
+            return None
+        return self.test_report_database().get_test_report(identifier=entry[CARRIED_FORWARD_FROM])
+
+    def get_resource_summary(
+            self,
+            component: str,
+            kp_id: str,
+            ara_id: Optional[str] = None,
+            projection: Optional[List[str]] = None
+    ) -> Optional[Any]:
         """
         Returns test result summary across all edges for given resource component.
 
         :param component: str, Translator component being tested: 'ARA' or 'KP'
         :param kp_id: str, identifier of a KP resource being accessed.
         :param ara_id: Optional[str], identifier of the ARA resource being accessed. May be missing or None
+        :param projection: Optional[List[str]], keys of the path of the projected part of the resource summary
+                           (default: None, i.e. the whole resource summary)
 
-        :return: Optional[Dict], JSON structured document of test details for a specified test edge of a
-                                 KP or ARA resource, or 'None' if the details are not (yet) available.
+        :return: Optional[Any], JSON structured document of test details for a specified test edge of a
+                                KP or ARA resource (or its projected part), or 'None' if not (yet) available.
         """
         document_key: str = build_resource_summary_key(component, ara_id, kp_id)
-        resource_summary: Optional[Dict] = self.get_test_report().retrieve_document(
-            document_type="Resource Summary", document_key=document_key
+        resource_summary: Optional[Any] = self._retrieve_document_part(
+            self.get_test_report(), document_type="Resource Summary", document_key=document_key, path=projection or []
         )
+        if resource_summary is None:
+            test_report: Optional[TestReport] = self._get_carried_forward_report(component, kp_id, ara_id)
+            if test_report:
+                resource_summary = self._retrieve_document_part(
+                    test_report, document_type="Resource Summary", document_key=document_key, path=projection or []
+                )
         return resource_summary
 
     def get_details(
@@ -459,21 +931,51 @@ class OneHopTestHarness:
                                  KP or ARA resource, or 'None' if the details are not (yet) available.
         """
         document_key: str = build_edge_details_key(component, ara_id, kp_id, edge_num)
-        details: Optional[Dict] = self.get_test_report().retrieve_document(
-            document_type="Details", document_key=document_key
+        details: Optional[Dict] = self._retrieve_document(
+            self.get_test_report(), document_type="Details", document_key=document_key
         )
+        if details is None:
+            test_report: Optional[TestReport] = self._get_carried_forward_report(component, kp_id, ara_id)
+            if test_report:
+                details = self._retrieve_document(test_report, document_type="Details", document_key=document_key)
         return details
 
-    def get_streamed_response_file(
+    def _get_response_file_report(
             self,
             component: str,
             edge_num: str,
             test_id: str,
             kp_id: str,
             ara_id: Optional[str] = None
-    ) -> Generator:
+    ) -> Tuple[Optional[TestReport], str, Optional[int]]:
         """
-        Returns the TRAPI Response file path for given resource component, edge and unit test identities.
+        Locates the TRAPI Response file for given resource component, edge and unit test identities,
+        i.e. in this test run or, for a resource carried forward, in the test run actually holding it.
+
+        :return: Tuple[Optional[TestReport], str, Optional[int]], report holding the TRAPI Response file (None if
+                 not (yet) available), document key and size (in bytes) of the TRAPI Response file.
+        """
+        document_key: str = f"{build_edge_details_key(component, ara_id, kp_id, edge_num)}-{test_id}"
+        test_report: Optional[TestReport] = self.get_test_report()
+        size: Optional[int] = \
+            test_report.get_document_size(document_type="Details", document_key=document_key) if test_report else None
+        if size is None:
+            test_report = self._get_carried_forward_report(component, kp_id, ara_id)
+            if test_report:
+                size = test_report.get_document_size(document_type="Details", document_key=document_key)
+        return (test_report if size is not None else None), document_key, size
+
+    def get_response_file(
+            self,
+            component: str,
+            edge_num: str,
+            test_id: str,
+            kp_id: str,
+            ara_id: Optional[str] = None
+    ) -> Tuple[Optional[TestReport], str, Optional[int], Optional[str]]:
+        """
+        Locates the TRAPI Response file for given resource component, edge and unit test identities, once, such that
+        it may then be streamed, using TestReport.stream_document(), without any further lookup.
 
         :param component: str, Translator component being tested: 'ARA' or 'KP'
         :param edge_num: str, target input 'edge_num' edge number, as indexed as an edge of the JSON test run summary.
@@ -482,9 +984,12 @@ class OneHopTestHarness:
         :param kp_id: str, identifier of a KP resource being accessed.
         :param ara_id: Optional[str], identifier of the ARA resource being accessed. May be missing or None
 
-        :return: str, TRAPI Response text data file path (generated, but not tested here for file existence)
+        :return: Tuple[Optional[TestReport], str, Optional[int], Optional[str]], report holding the TRAPI Response
+                 file (None if not (yet) available), its document key, size (in bytes) and compression
+                 ('gzip' or 'zstd'; None if uncompressed).
         """
-        document_key: str = build_edge_details_key(component, ara_id, kp_id, edge_num)
-        return self.get_test_report().stream_document(
-            document_type="Details", document_key=f"{document_key}-{test_id}"
-        )
+        test_report, document_key, size = self._get_response_file_report(component, edge_num, test_id, kp_id, ara_id)
+        compression: Optional[str] = \
+            test_report.get_document_compression(document_type="Details", document_key=document_key) \
+            if test_report else None
+        return test_report, document_key, size, compression
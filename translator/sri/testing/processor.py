@@ -51,10 +51,15 @@ _test_report_database: TestReportDatabase = get_test_report_database()
 
 PERCENTAGE_COMPLETION_SUFFIX_PATTERN = compile(r"(\[\s*(?P<percentage_completion>\d+)%])?$")
 
+# pytest-xdist verbose output reports the percentage completion up front, e.g. "[gw0] [ 50%] PASSED ..."
+XDIST_PERCENTAGE_COMPLETION_PATTERN = compile(r"^\[gw\d+]\s+\[\s*(?P<percentage_completion>\d+)%]")
+
 
 def _progress_monitor(line: str) -> Optional[str]:
     logger.debug(f"Pytest output: {line}")
     pc = PERCENTAGE_COMPLETION_SUFFIX_PATTERN.search(line)
+    if not (pc and pc.group()):
+        pc = XDIST_PERCENTAGE_COMPLETION_PATTERN.search(line)
     if pc and pc.group():
         return pc["percentage_completion"]
     else:
@@ -0,0 +1,934 @@
+"""
+Aggregation of One Hop unit test results into the JSON documents of a test run report:
+
+1. Test Summary:  summary statistics of entire test run, indexed by ARA and KP resources
+2. Resource Summary: ARA or KP level summary across all edges
+3. Edge Details: details of test results for one edge in a given resource test dataset
+4. Response: TRAPI JSON response message (may be huge; use file streaming to access!)
+
+A ReportAggregator may also export its partially aggregated results, for later merging into
+another ReportAggregator, e.g. when the unit tests are distributed across pytest-xdist workers.
+The edge details and resource summaries which are complete may also be saved (then released)
+before the end of the test run (see translator.sri.testing.result_sink).
+"""
+from typing import Optional, Union, Dict, Tuple, List, Mapping, Deque
+from sys import intern
+from collections import deque
+from datetime import datetime
+import orjson
+
+from translator.sri.testing.report_db import dump_report_json
+from translator.sri.testing.incremental import CARRIED_FORWARD_FROM, get_carried_forward_test_runs
+
+import logging
+logger = logging.getLogger(__name__)
+
+# Selective list of Resource Summary fields
+RESOURCE_SUMMARY_FIELDS = [
+    "subject_category",
+    "object_category",
+    "predicate",
+    "subject",
+    "object"
+]
+
+UNIT_TEST_OUTCOMES = ['passed', 'failed', 'skipped', 'warning', 'info']
+
+# Document key of the live (partial) test run summary, periodically saved while a test run is in progress
+LIVE_SUMMARY_KEY = "live_summary"
+
+# Maximum number of the latest failing unit tests reported by a live test run summary
+MAX_LATEST_FAILURES = 20
+
+
+class UnitTestStatistics:
+    """
+    Tallies of the outcomes of the unit tests of a given unit test category (e.g. 'by_subject').
+    """
+    __slots__ = ('passed', 'failed', 'skipped')
+
+    def __init__(self, passed: int = 0, failed: int = 0, skipped: int = 0):
+        self.passed: int = passed
+        self.failed: int = failed
+        self.skipped: int = skipped
+        # might add 'warning' and 'info' tallies in the future?
+
+    def tally(self, outcome: str):
+        setattr(self, outcome, getattr(self, outcome) + 1)
+
+    def merge(self, other: "UnitTestStatistics"):
+        self.passed += other.passed
+        self.failed += other.failed
+        self.skipped += other.skipped
+
+    def to_json(self) -> Dict[str, int]:
+        return {'passed': self.passed, 'failed': self.failed, 'skipped': self.skipped}
+
+    @classmethod
+    def from_json(cls, statistics: Dict[str, int]) -> "UnitTestStatistics":
+        return cls(
+            passed=statistics.get('passed', 0),
+            failed=statistics.get('failed', 0),
+            skipped=statistics.get('skipped', 0)
+        )
+
+
+class LatencyStatistics:
+    """
+    Latency statistics (milliseconds) of the unit tests of a given unit test category (e.g. 'by_subject').
+    """
+    __slots__ = ('count', 'total_ms', 'min_ms', 'max_ms')
+
+    def __init__(self, count: int = 0, total_ms: int = 0, min_ms: Optional[int] = None, max_ms: Optional[int] = None):
+        self.count: int = count
+        self.total_ms: int = total_ms
+        self.min_ms: Optional[int] = min_ms
+        self.max_ms: Optional[int] = max_ms
+
+    def tally(self, duration_ms: float):
+        duration: int = int(round(duration_ms))
+        self.count += 1
+        self.total_ms += duration
+        self.min_ms = duration if self.min_ms is None else min(self.min_ms, duration)
+        self.max_ms = duration if self.max_ms is None else max(self.max_ms, duration)
+
+    def merge(self, other: "LatencyStatistics"):
+        if not other.count:
+            return
+        self.count += other.count
+        self.total_ms += other.total_ms
+        self.min_ms = other.min_ms if self.min_ms is None else min(self.min_ms, other.min_ms)
+        self.max_ms = other.max_ms if self.max_ms is None else max(self.max_ms, other.max_ms)
+
+    def get_mean_ms(self) -> Optional[float]:
+        return self.total_ms / self.count if self.count else None
+
+    def to_json(self) -> Dict[str, Optional[int]]:
+        return {'count': self.count, 'total_ms': self.total_ms, 'min_ms': self.min_ms, 'max_ms': self.max_ms}
+
+    @classmethod
+    def from_json(cls, statistics: Dict[str, Optional[int]]) -> "LatencyStatistics":
+        return cls(
+            count=statistics.get('count', 0),
+            total_ms=statistics.get('total_ms', 0),
+            min_ms=statistics.get('min_ms', None),
+            max_ms=statistics.get('max_ms', None)
+        )
+
+
+class KPTestCaseSummary:
+    """
+    Test run summary statistics of a directly tested KP, or of a KP embedded in an ARA
+    (in which case, its url, test data location and fingerprint are those of the ARA entry).
+    """
+    __slots__ = (
+        'no_of_edges',
+        'trapi_version',
+        'biolink_version',
+        'duration_ms',
+        'results',
+        'latencies',
+        'url',
+        'test_data_location',
+        'fingerprint'
+    )
+
+    def __init__(
+            self,
+            trapi_version: Optional[str],
+            biolink_version: Optional[str],
+            url: Optional[str] = None,
+            test_data_location: Optional[str] = None,
+            fingerprint: Optional[str] = None
+    ):
+        """
+        :param trapi_version: str, TRAPI version associated with the test case (SemVer)
+        :param biolink_version:  str, Biolink Model version associated with the test case (SemVer)
+        :param url: Optional[str], endpoint url of a directly tested KP
+        :param test_data_location: Optional[str], test data location of a directly tested KP
+        :param fingerprint: Optional[str], fingerprint of the test inputs of a directly tested KP
+        """
+        self.no_of_edges: int = 0
+        self.trapi_version: Optional[str] = trapi_version
+        self.biolink_version: Optional[str] = biolink_version
+        # cumulative unit test latency (milliseconds)
+        self.duration_ms: int = 0
+        self.results: Dict[str, UnitTestStatistics] = dict()
+        # latency statistics of the unit tests, by unit test category
+        self.latencies: Dict[str, LatencyStatistics] = dict()
+        self.url: Optional[str] = url
+        self.test_data_location: Optional[str] = test_data_location
+        self.fingerprint: Optional[str] = fingerprint
+
+    def tally(self, test_id: str, edge_num: int, outcome: str, duration_ms: Optional[float] = None):
+        """
+        Tally up the outcome of one unit test.
+
+        :param test_id: str, unit test identifier (e.g. 'by_subject')
+        :param edge_num: int, test edge number
+        :param outcome: str, unit test outcome ('passed', 'failed' or 'skipped')
+        :param duration_ms: Optional[float], duration of the unit test (milliseconds)
+        """
+        assert outcome in UNIT_TEST_OUTCOMES, f"Invalid test_result '{str(outcome)}'"
+        self.no_of_edges = max(self.no_of_edges, edge_num + 1)
+        if test_id not in self.results:
+            self.results[test_id] = UnitTestStatistics()
+        self.results[test_id].tally(outcome)
+        if duration_ms:
+            self.duration_ms += int(round(duration_ms))
+        if duration_ms is not None:
+            if test_id not in self.latencies:
+                self.latencies[test_id] = LatencyStatistics()
+            self.latencies[test_id].tally(duration_ms)
+
+    def merge(self, other: "KPTestCaseSummary"):
+        """
+        Merge the statistics of a partial KP test case summary into this one.
+
+        :param other: KPTestCaseSummary, (partial) KP test case summary being merged
+        """
+        self.no_of_edges = max(self.no_of_edges, other.no_of_edges)
+        self.duration_ms += other.duration_ms
+        for test_id, statistics in other.results.items():
+            if test_id not in self.results:
+                self.results[test_id] = UnitTestStatistics()
+            self.results[test_id].merge(statistics)
+        for test_id, latency in other.latencies.items():
+            if test_id not in self.latencies:
+                self.latencies[test_id] = LatencyStatistics()
+            self.latencies[test_id].merge(latency)
+
+    def to_json(self) -> Dict:
+        summary: Dict = {
+            'no_of_edges': self.no_of_edges,
+            'trapi_version': self.trapi_version,
+            'biolink_version': self.biolink_version,
+            'duration_ms': self.duration_ms,
+            'results': {test_id: statistics.to_json() for test_id, statistics in self.results.items()}
+        }
+        if self.latencies:
+            summary['latencies'] = {test_id: latency.to_json() for test_id, latency in self.latencies.items()}
+        if self.url is not None:
+            summary['url'] = self.url
+            summary['test_data_location'] = self.test_data_location
+        if self.fingerprint is not None:
+            summary['fingerprint'] = self.fingerprint
+        return summary
+
+    @classmethod
+    def from_json(cls, summary: Dict) -> "KPTestCaseSummary":
+        kp_summary = cls(
+            trapi_version=summary.get('trapi_version', None),
+            biolink_version=summary.get('biolink_version', None),
+            url=summary.get('url', None),
+            test_data_location=summary.get('test_data_location', None),
+            fingerprint=summary.get('fingerprint', None)
+        )
+        kp_summary.no_of_edges = summary.get('no_of_edges', 0)
+        # test runs predating the recording of unit test latencies have no 'duration_ms'
+        kp_summary.duration_ms = summary.get('duration_ms', 0)
+        kp_summary.results = {
+            intern(test_id): UnitTestStatistics.from_json(statistics)
+            for test_id, statistics in summary.get('results', dict()).items()
+        }
+        # nor the unit test latency statistics
+        kp_summary.latencies = {
+            intern(test_id): LatencyStatistics.from_json(latency)
+            for test_id, latency in summary.get('latencies', dict()).items()
+        }
+        return kp_summary
+
+
+class ARATestCaseSummary:
+    """
+    Test run summary of an ARA, with the summary statistics of its embedded KPs.
+    """
+    __slots__ = ('url', 'test_data_location', 'fingerprint', 'kps')
+
+    def __init__(self, url: str, test_data_location: str, fingerprint: Optional[str] = None):
+        self.url: str = url
+        self.test_data_location: str = test_data_location
+        self.fingerprint: Optional[str] = fingerprint
+        self.kps: Dict[str, KPTestCaseSummary] = dict()
+
+    def to_json(self) -> Dict:
+        summary: Dict = {'url': self.url, 'test_data_location': self.test_data_location}
+        if self.fingerprint is not None:
+            summary['fingerprint'] = self.fingerprint
+        summary['kps'] = {kp_id: kp_summary.to_json() for kp_id, kp_summary in self.kps.items()}
+        return summary
+
+    @classmethod
+    def from_json(cls, summary: Dict) -> "ARATestCaseSummary":
+        ara_summary = cls(
+            url=summary.get('url', None),
+            test_data_location=summary.get('test_data_location', None),
+            fingerprint=summary.get('fingerprint', None)
+        )
+        ara_summary.kps = {
+            intern(kp_id): KPTestCaseSummary.from_json(kp_summary)
+            for kp_id, kp_summary in summary.get('kps', dict()).items()
+        }
+        return ara_summary
+
+
+class UnitTestOutcome:
+    """
+    Outcome - and validation messages, if any - of one unit test of a test edge, in a resource summary.
+    """
+    __slots__ = ('outcome', 'validation')
+
+    def __init__(self, outcome: str, validation: Optional[Dict] = None):
+        self.outcome: str = outcome
+        self.validation: Optional[Dict] = validation
+
+    def to_json(self) -> Dict:
+        result: Dict = {'outcome': self.outcome}
+        if self.validation is not None:
+            result['validation'] = self.validation
+        return result
+
+    @classmethod
+    def from_json(cls, result: Dict) -> "UnitTestOutcome":
+        return cls(outcome=intern(result['outcome']), validation=result.get('validation', None))
+
+
+class EdgeTestSummary:
+    """
+    Resource summary entry of a test edge: its (selected) test data and the outcomes of its unit tests.
+    """
+    __slots__ = ('test_data', 'results')
+
+    def __init__(self, test_data: Optional[Dict] = None):
+        self.test_data: Dict = test_data if test_data is not None else dict()
+        self.results: Dict[str, UnitTestOutcome] = dict()
+
+    def merge(self, other: "EdgeTestSummary"):
+        for field, value in other.test_data.items():
+            self.test_data.setdefault(field, value)
+        self.results.update(other.results)
+
+    def to_json(self) -> Dict:
+        return {
+            'test_data': self.test_data,
+            'results': {test_id: result.to_json() for test_id, result in self.results.items()}
+        }
+
+    @classmethod
+    def from_json(cls, test_edge: Dict) -> "EdgeTestSummary":
+        edge_summary = cls(test_data=test_edge.get('test_data', dict()))
+        edge_summary.results = {
+            intern(test_id): UnitTestOutcome.from_json(result)
+            for test_id, result in test_edge.get('results', dict()).items()
+        }
+        return edge_summary
+
+
+class KPResourceSummary:
+    """
+    Resource summary of a directly tested, or ARA embedded, KP: the unit test outcomes of each of its test edges.
+    """
+    __slots__ = ('trapi_version', 'biolink_version', 'test_edges')
+
+    def __init__(self, trapi_version: Optional[str], biolink_version: Optional[str]):
+        """
+        :param trapi_version: str, TRAPI version associated with the test case (SemVer)
+        :param biolink_version:  str, Biolink Model version associated with the test case (SemVer)
+        """
+        self.trapi_version: Optional[str] = trapi_version
+        self.biolink_version: Optional[str] = biolink_version
+        self.test_edges: Dict[str, EdgeTestSummary] = dict()
+
+    def merge(self, other: "KPResourceSummary"):
+        """
+        Merge the test edges of a partial KP resource summary into this one.
+
+        :param other: KPResourceSummary, (partial) KP resource summary being merged
+        """
+        for idx, test_edge in other.test_edges.items():
+            if idx not in self.test_edges:
+                self.test_edges[idx] = test_edge
+            else:
+                self.test_edges[idx].merge(test_edge)
+
+    def to_json(self) -> Dict:
+        return {
+            'trapi_version': self.trapi_version,
+            'biolink_version': self.biolink_version,
+            'test_edges': {idx: test_edge.to_json() for idx, test_edge in self.test_edges.items()}
+        }
+
+    @classmethod
+    def from_json(cls, resource_summary: Dict) -> "KPResourceSummary":
+        kp_resource_summary = cls(
+            trapi_version=resource_summary.get('trapi_version', None),
+            biolink_version=resource_summary.get('biolink_version', None)
+        )
+        kp_resource_summary.test_edges = {
+            idx: EdgeTestSummary.from_json(test_edge)
+            for idx, test_edge in resource_summary.get('test_edges', dict()).items()
+        }
+        return kp_resource_summary
+
+
+def get_resource_summary_key(component: str, ara_id: Optional[str], kp_id: str) -> str:
+    """
+    :param component: str, Translator component of the resource: 'ARA' or 'KP'
+    :param ara_id: Optional[str], ARA identifier (None for directly tested KPs)
+    :param kp_id: str, KP identifier
+    :return: str, document key of the resource summary of the (ARA embedded) KP
+    """
+    return f"ARA/{ara_id}/{kp_id}/resource_summary" if component == "ARA" else f"KP/{kp_id}/resource_summary"
+
+
+def get_test_run_counts(test_run_summary: Dict) -> Dict[str, int]:
+    """
+    :param test_run_summary: Dict, (JSON) test run summary
+    :return: Dict[str, int], numbers of KPs, ARAs and unit test outcomes of the test run, for the test run catalog
+    """
+    counts: Dict[str, int] = {
+        'no_of_kps': len(test_run_summary.get('KP', dict())),
+        'no_of_aras': len(test_run_summary.get('ARA', dict())),
+        'passed': 0,
+        'failed': 0,
+        'skipped': 0
+    }
+    kp_summaries: List[Dict] = list(test_run_summary.get('KP', dict()).values())
+    for ara_summary in test_run_summary.get('ARA', dict()).values():
+        kp_summaries.extend(ara_summary.get('kps', dict()).values())
+    for kp_summary in kp_summaries:
+        for statistics in kp_summary.get('results', dict()).values():
+            for outcome in ['passed', 'failed', 'skipped']:
+                counts[outcome] += statistics.get(outcome, 0)
+    return counts
+
+
+def get_test_run_rollups(test_run_summary: Dict) -> List[Dict]:
+    """
+    :param test_run_summary: Dict, (JSON) test run summary
+    :return: List[Dict], rollup rows of the test run, i.e. the outcome counts and latency statistics of each unit test
+                         (category) of each (direct, or ARA embedded) KP, for the history of the resources
+    """
+    kp_summaries: List[Tuple[str, Optional[str], str, Dict]] = [
+        ("KP", None, kp_id, kp_summary) for kp_id, kp_summary in test_run_summary.get('KP', dict()).items()
+    ]
+    for ara_id, ara_summary in test_run_summary.get('ARA', dict()).items():
+        kp_summaries.extend([
+            ("ARA", ara_id, kp_id, kp_summary) for kp_id, kp_summary in ara_summary.get('kps', dict()).items()
+        ])
+    rollups: List[Dict] = list()
+    for component, ara_id, kp_id, kp_summary in kp_summaries:
+        latencies: Dict = kp_summary.get('latencies', dict())
+        for test_id, statistics in kp_summary.get('results', dict()).items():
+            latency: LatencyStatistics = LatencyStatistics.from_json(latencies.get(test_id, dict()))
+            rollups.append({
+                'component': component,
+                'ara_id': ara_id,
+                'kp_id': kp_id,
+                'unit_test': test_id,
+                'passed': statistics.get('passed', 0),
+                'failed': statistics.get('failed', 0),
+                'skipped': statistics.get('skipped', 0),
+                'latency_count': latency.count,
+                'latency_mean_ms': latency.get_mean_ms(),
+                'latency_min_ms': latency.min_ms,
+                'latency_max_ms': latency.max_ms
+            })
+    return rollups
+
+
+def get_live_summary_key(shard_id: Optional[str] = None, worker_id: Optional[str] = None) -> str:
+    """
+    :param shard_id: Optional[str], identifier of the shard of a distributed test run (if applicable)
+    :param worker_id: Optional[str], identifier of the pytest-xdist worker (e.g. 'gw0') saving the live summary
+    :return: str, document key of the live summary saved by a (shard) Pytest session, or one of its xdist workers
+    """
+    document_key: str = f"shards/{shard_id}/{LIVE_SUMMARY_KEY}" if shard_id else LIVE_SUMMARY_KEY
+    return f"{document_key}/{worker_id}" if worker_id else document_key
+
+
+def _to_json(value):
+    """
+    :param value: test run summary or resource summary (sub-)entry, possibly of a summary record
+    :return: plain (JSON and BSON safe) dictionary rendition of the value
+    """
+    if hasattr(value, 'to_json'):
+        return value.to_json()
+    if isinstance(value, dict):
+        return {key: _to_json(entry) for key, entry in value.items()}
+    return value
+
+
+class ReportAggregator:
+    """
+    Aggregator of the test run summary, resource summaries and edge
+    details of a set of One Hop unit test results, in a test run.
+
+    The test run summary entries and resource summaries are held as (slotted) summary records,
+    rendered as plain JSON only when they are saved or exported; carried forward test
+    run summary entries, which are never updated, are held as plain JSON.
+    """
+    def __init__(self, test_run=None):
+        """
+        ReportAggregator constructor.
+
+        :param test_run: Optional[OneHopTestHarness], test run to which the TRAPI I/O documents of
+                         failed unit tests are immediately saved, as they are aggregated (may be None)
+        """
+        self._test_run = test_run
+
+        self.test_run_summary: Dict[str, Dict[str, Union[KPTestCaseSummary, ARATestCaseSummary, Dict]]] = dict()
+        self.resource_summaries: Dict[str, Dict[str, Union[KPResourceSummary, Dict[str, KPResourceSummary]]]] = dict()
+        self.case_details: Dict[str, Dict] = dict()
+
+        # Most recent failing unit tests, reported by the live test run summary
+        self.latest_failures: Deque[Dict] = deque(maxlen=MAX_LATEST_FAILURES)
+
+    def _get_case_and_resource_summaries(
+            self,
+            component: str,
+            ara_id: Optional[str],
+            kp_id: str,
+            test_case: Mapping,
+            trapi_version: Optional[str],
+            biolink_version: Optional[str]
+    ) -> Tuple[KPTestCaseSummary, KPResourceSummary]:
+        """
+        Retrieves (creating as necessary) the test case summary and resource summary of a given resource.
+
+        :return: Tuple[KPTestCaseSummary, KPResourceSummary], test case summary and resource summary of the resource.
+        """
+        ##############################################################
+        # Summary file indexed by component, resources and edge cases
+        ##############################################################
+        if component not in self.test_run_summary:
+            self.test_run_summary[component] = dict()
+
+            # Set up indexed resource summaries in parallel
+            self.resource_summaries[component] = dict()
+
+        test_run_summary: Dict = self.test_run_summary[component]
+        resource_summaries: Dict = self.resource_summaries[component]
+
+        if ara_id:
+            if ara_id not in test_run_summary:
+                test_run_summary[ara_id] = ARATestCaseSummary(
+                    url=test_case['url'],
+                    test_data_location=test_case['ara_test_data_location'],
+                    fingerprint=test_case.get('resource_fingerprint', None)
+                )
+                resource_summaries[ara_id] = dict()
+
+            ara_summary: ARATestCaseSummary = test_run_summary[ara_id]
+            if kp_id not in ara_summary.kps:
+                ara_summary.kps[kp_id] = KPTestCaseSummary(
+                    trapi_version=trapi_version,
+                    biolink_version=biolink_version
+                )
+                resource_summaries[ara_id][kp_id] = KPResourceSummary(
+                    trapi_version=trapi_version,
+                    biolink_version=biolink_version
+                )
+
+            return ara_summary.kps[kp_id], resource_summaries[ara_id][kp_id]
+
+        else:
+            if kp_id not in test_run_summary:
+                test_run_summary[kp_id] = KPTestCaseSummary(
+                    trapi_version=trapi_version,
+                    biolink_version=biolink_version,
+                    url=test_case['url'],
+                    test_data_location=test_case['kp_test_data_location'],
+                    fingerprint=test_case.get('resource_fingerprint', None)
+                )
+                resource_summaries[kp_id] = KPResourceSummary(
+                    trapi_version=trapi_version,
+                    biolink_version=biolink_version
+                )
+
+            return test_run_summary[kp_id], resource_summaries[kp_id]
+
+    def add_unit_test_result(
+            self,
+            unit_test_key: str,
+            component: str,
+            ara_id: Optional[str],
+            kp_id: str,
+            edge_num: int,
+            test_id: str,
+            edge_details_key: str,
+            status: str,
+            rb: Dict,
+            duration_ms: Optional[float] = None
+    ):
+        """
+        Aggregate the result of one unit test.
+
+        :param unit_test_key: str, full Pytest unit test label
+        :param component: str, Translator component being tested: 'ARA' or 'KP'
+        :param ara_id: Optional[str], identifier of the ARA resource being accessed. May be None
+        :param kp_id: str, identifier of a KP resource being accessed.
+        :param edge_num: int, test edge number
+        :param test_id: str, unit test identifier (e.g. 'by_subject')
+        :param edge_details_key: str, key ('path') of the edge details document of the unit test
+        :param status: str, unit test outcome ('passed', 'failed' or 'skipped')
+        :param rb: Dict, Pytest-harvest results bag of the unit test
+        :param duration_ms: Optional[float], duration of the unit test (milliseconds), recorded as endpoint latency
+        """
+        # Sanity check? Missing 'case' would seem like an SRI Testing logical bug?
+        assert 'case' in rb
+        test_case: Mapping = rb['case']
+
+        # Sanity check: missing 'url' is likely a logical bug in SRI Testing?
+        assert 'url' in test_case
+
+        # Sanity check: missing TRAPI version is likely a logical bug in SRI Testing?
+        assert 'trapi_version' in test_case
+        trapi_version: Optional[str] = test_case['trapi_version']
+
+        # Sanity check: missing Biolink Model version is likely a logical bug in SRI Testing?
+        assert 'biolink_version' in test_case
+        biolink_version: Optional[str] = test_case['biolink_version']
+
+        case_summary, resource_summary = self._get_case_and_resource_summaries(
+            component, ara_id, kp_id, test_case, trapi_version, biolink_version
+        )
+
+        # Tally up the number of test results of a given 'status' across 'test_id' unit test categories
+        case_summary.tally(test_id, edge_num, status, duration_ms)
+
+        # TODO: merge case details here into a Cartesian product table of edges
+        #       and unit test id's for a given resource indexed by ARA and KP
+        idx: str = str(test_case['idx'])
+
+        if idx not in resource_summary.test_edges:
+            resource_summary.test_edges[idx] = EdgeTestSummary(
+                test_data={field: test_case[field] for field in RESOURCE_SUMMARY_FIELDS if field in test_case}
+            )
+
+        test_report = rb.get('unit_test_report', None)
+        resource_summary.test_edges[idx].results[test_id] = UnitTestOutcome(
+            outcome=status,
+            validation=test_report.get_messages() if test_report and test_report.has_messages() else None
+        )
+
+        ###################################################
+        # Full test details will still be indexed by edge #
+        ###################################################
+        if edge_details_key not in self.case_details:
+
+            # Shallow (flattened) copy, since the test case itself is shared with (and outlives) the unit tests,
+            # or is even a (ChainMap) overlay of the test case of a KP, for an ARA: the (bulky) results of the
+            # edge details saved before the end of the test run are thus released with the copy.
+            self.case_details[edge_details_key] = dict(test_case)
+
+            if 'results' not in self.case_details[edge_details_key]:
+                self.case_details[edge_details_key]['results'] = dict()
+
+        if test_id not in self.case_details[edge_details_key]['results']:
+            self.case_details[edge_details_key]['results'][test_id] = dict()
+
+        test_details = self.case_details[edge_details_key]['results'][test_id]
+
+        # Replicating 'PASSED, FAILED, SKIPPED' test status
+        # for each unit test, here in the detailed report
+        test_details['outcome'] = status
+
+        # Capture more request/response details for test failures
+        if status == 'failed':
+
+            self.latest_failures.append(
+                {
+                    "component": component,
+                    "ara_id": ara_id,
+                    "kp_id": kp_id,
+                    "edge_num": edge_num,
+                    "test_id": test_id,
+                    "edge_details_key": edge_details_key,
+                    "time": datetime.utcnow().isoformat()
+                }
+            )
+
+            if 'request' in rb:
+                # TODO: maybe the 'request' document could be persisted
+                #       separately JIT, to avoid using too much RAM?
+                test_details['request'] = rb['request']
+            else:
+                test_details['request'] = "No 'request' generated for this unit test?"
+
+            if 'response' in rb:
+                case_response: Dict = dict()
+                case_response['url'] = test_case['url'] if 'url' in test_case else "Unknown?!"
+                case_response['unit_test_key'] = unit_test_key
+                case_response['http_status_code'] = rb["response"]["status_code"]
+                case_response['response'] = rb['response']['response_json']
+
+                if self._test_run is not None:
+                    response_document_key = f"{edge_details_key}-{test_id}"
+                    self._test_run.save_json_document(
+                        document_type="TRAPI I/O",
+                        document=case_response,
+                        document_key=response_document_key,
+                        is_big=True
+                    )
+
+            else:
+                test_details['response'] = "No 'response' generated for this unit test?"
+
+    def flush_case_details(self, test_run, edge_details_key: str):
+        """
+        Save, then release, the edge details of a test edge whose unit tests are all done.
+
+        :param test_run: OneHopTestHarness (or TestReport), test run to which the document is saved.
+        :param edge_details_key: str, key ('path') of the edge details document
+        """
+        details: Optional[Dict] = self.case_details.pop(edge_details_key, None)
+        if details is not None:
+            test_run.save_json_document(document_type="Details", document=details, document_key=edge_details_key)
+
+    def flush_resource_summary(self, test_run, component: str, ara_id: Optional[str], kp_id: str):
+        """
+        Save, then release, the resource summary of a (ARA embedded) KP whose unit tests are all done.
+        Its test run summary entry is retained, for the final test run summary.
+
+        :param test_run: OneHopTestHarness (or TestReport), test run to which the document is saved.
+        :param component: str, Translator component of the resource: 'ARA' or 'KP'
+        :param ara_id: Optional[str], ARA identifier (None for directly tested KPs)
+        :param kp_id: str, KP identifier
+        """
+        resource_summaries: Dict = self.resource_summaries.get(component, dict())
+        if ara_id:
+            resource_summaries = resource_summaries.get(ara_id, dict())
+        resource_summary: Optional[KPResourceSummary] = resource_summaries.pop(kp_id, None)
+        if resource_summary is not None:
+            test_run.save_json_document(
+                document_type="ARA Embedded KP Summary" if ara_id else "Direct KP Summary",
+                document=resource_summary.to_json(),
+                document_key=get_resource_summary_key(component, ara_id, kp_id)
+            )
+
+    def carry_forward(self, component: str, resource_id: str, summary: Dict):
+        """
+        Add the test run summary entry of a resource carried forward from a previous test run,
+        whose resource summaries and edge details remain in (and are referenced from) that test run.
+
+        :param component: str, Translator component of the resource: 'ARA' or 'KP'
+        :param resource_id: str, ARA or KP resource identifier
+        :param summary: Dict, test run summary entry of the resource, tagged with its CARRIED_FORWARD_FROM test run
+        """
+        assert CARRIED_FORWARD_FROM in summary
+        self.test_run_summary.setdefault(component, dict()).setdefault(resource_id, summary)
+        self.resource_summaries.setdefault(component, dict())
+
+    def get_test_run_summary(self) -> Dict:
+        """
+        :return: Dict, (plain JSON) test run summary of the results aggregated so far.
+        """
+        return _to_json(self.test_run_summary)
+
+    def get_live_summary(
+            self,
+            no_of_unit_tests: int,
+            no_of_unit_tests_done: int,
+            shard_id: Optional[str] = None
+    ) -> Dict:
+        """
+        :param no_of_unit_tests: int, number of unit tests to be run (by the Pytest session)
+        :param no_of_unit_tests_done: int, number of unit tests already done (by this aggregator)
+        :param shard_id: Optional[str], identifier of the shard of a distributed test run (if applicable)
+        :return: Dict, live (partial) test run summary of the results aggregated so far, with progress
+                       counts and the latest failing unit tests (most recent first).
+        """
+        live_summary: Dict = self.get_test_run_summary()
+        live_summary["in_progress"] = True
+        live_summary["updated"] = datetime.utcnow().isoformat()
+        live_summary["no_of_unit_tests"] = no_of_unit_tests
+        live_summary["no_of_unit_tests_done"] = no_of_unit_tests_done
+        live_summary["latest_failures"] = list(reversed(self.latest_failures))
+        if shard_id:
+            live_summary["shard_id"] = shard_id
+        return live_summary
+
+    def get_partial_results(self) -> Dict:
+        """
+        :return: Dict, JSON-safe copy of the results aggregated so far, for merging into another ReportAggregator.
+        """
+        return orjson.loads(
+            dump_report_json(
+                {
+                    "test_run_summary": self.get_test_run_summary(),
+                    "resource_summaries": _to_json(self.resource_summaries),
+                    "case_details": self.case_details
+                },
+                pretty=False
+            )
+        )
+
+    def merge(self, partial_results: Dict):
+        """
+        Merge (partial) results aggregated elsewhere, i.e. by another ReportAggregator.
+
+        :param partial_results: Dict, output of ReportAggregator.get_partial_results(). The 'resource_summaries'
+                                and 'case_details' may be omitted, when these were already saved elsewhere
+                                (i.e. by the shards of a distributed test run), for merging of the summary only;
+                                resource summaries already saved (i.e. flushed) by a worker are also omitted.
+        """
+        for component, resources in partial_results["test_run_summary"].items():
+            test_run_summary: Dict = self.test_run_summary.setdefault(component, dict())
+            resource_summaries: Dict = self.resource_summaries.setdefault(component, dict())
+            partial_summaries: Dict = partial_results.get("resource_summaries", dict()).get(component, None) or dict()
+            for resource_id, resource in resources.items():
+                resource_id = intern(resource_id)
+                if CARRIED_FORWARD_FROM in resource:
+                    # identical copies of the same carried forward summary entry
+                    test_run_summary.setdefault(resource_id, resource)
+                elif 'kps' in resource:
+                    # ARA, with embedded KP test case summaries
+                    if resource_id not in test_run_summary:
+                        test_run_summary[resource_id] = ARATestCaseSummary.from_json(
+                            {field: value for field, value in resource.items() if field != 'kps'}
+                        )
+                    ara_summary: ARATestCaseSummary = test_run_summary[resource_id]
+                    if resource_id in partial_summaries:
+                        # the ARA embedded KP resource summaries may all have been saved already
+                        resource_summaries.setdefault(resource_id, dict())
+                    for kp_id, kp_summary in resource['kps'].items():
+                        kp_id = intern(kp_id)
+                        if kp_id not in ara_summary.kps:
+                            ara_summary.kps[kp_id] = KPTestCaseSummary.from_json(kp_summary)
+                        else:
+                            ara_summary.kps[kp_id].merge(KPTestCaseSummary.from_json(kp_summary))
+                        partial_summary: Optional[Dict] = partial_summaries.get(resource_id, dict()).get(kp_id, None)
+                        if partial_summary is not None:
+                            ara_summaries: Dict = resource_summaries.setdefault(resource_id, dict())
+                            if kp_id not in ara_summaries:
+                                ara_summaries[kp_id] = KPResourceSummary.from_json(partial_summary)
+                            else:
+                                ara_summaries[kp_id].merge(KPResourceSummary.from_json(partial_summary))
+                else:
+                    # directly tested KP
+                    if resource_id not in test_run_summary:
+                        test_run_summary[resource_id] = KPTestCaseSummary.from_json(resource)
+                    else:
+                        test_run_summary[resource_id].merge(KPTestCaseSummary.from_json(resource))
+                    if resource_id in partial_summaries:
+                        if resource_id not in resource_summaries:
+                            resource_summaries[resource_id] = KPResourceSummary.from_json(partial_summaries[resource_id])
+                        else:
+                            resource_summaries[resource_id].merge(
+                                KPResourceSummary.from_json(partial_summaries[resource_id])
+                            )
+
+        for edge_details_key, details in partial_results.get("case_details", dict()).items():
+            if edge_details_key not in self.case_details:
+                self.case_details[edge_details_key] = details
+            else:
+                self.case_details[edge_details_key]['results'].update(details['results'])
+
+    def save(self, test_run, summary_key: str = "test_run_summary", error: Optional[str] = None):
+        """
+        Save the aggregated edge details, resource summaries and test run summary to the test run report.
+
+        :param test_run: OneHopTestHarness (or TestReport), test run to which the documents are saved.
+        :param summary_key: str, document key of the saved test run summary (default: "test_run_summary");
+                                 the shards of a distributed test run save a partial summary under another key.
+        :param error: Optional[str], if set, results are known to be missing from the aggregated results, thus the
+                                     test run is marked as failed, with this error, rather than completed.
+        """
+        # Save the cached details of each edge test case
+        for edge_details_key in self.case_details:
+            test_run.save_json_document(
+                document_type="Details",
+                document=self.case_details[edge_details_key],
+                document_key=edge_details_key
+            )
+
+        #
+        # Save the various resource test summaries
+        #
+        # All KP's individually
+        if "KP" in self.resource_summaries:
+            kp_summaries = self.resource_summaries["KP"]
+            for kp in kp_summaries:
+                # Save Test Run Summary
+                document_key: str = get_resource_summary_key("KP", None, kp)
+                test_run.save_json_document(
+                    document_type="Direct KP Summary",
+                    document=kp_summaries[kp].to_json(),
+                    document_key=document_key
+                )
+
+        # All KP's called by ARA's
+        if "ARA" in self.resource_summaries:
+            ara_summaries = self.resource_summaries["ARA"]
+            for ara in ara_summaries:
+                for kp in ara_summaries[ara]:
+                    # Save embedded KP Resource Summary
+                    document_key: str = get_resource_summary_key("ARA", ara, kp)
+                    test_run.save_json_document(
+                        document_type="ARA Embedded KP Summary",
+                        document=ara_summaries[ara][kp].to_json(),
+                        document_key=document_key
+                    )
+
+        # The test run summary signals the completion of the test run,
+        # thus is only written out after all the other documents
+        test_run.flush()
+
+        # Save Test Run Summary
+        test_run_summary: Dict = self.get_test_run_summary()
+        test_run.save_json_document(
+            document_type="Test Run Summary",
+            document=test_run_summary,
+            document_key=summary_key
+        )
+        test_run.flush()
+
+        if summary_key != "test_run_summary":
+            # partial summaries (i.e. of the shards of a distributed test run) do not complete the test run
+            return
+        if error:
+            test_run.set_failed(error=error)
+        else:
+            test_run.set_completed(
+                counts=get_test_run_counts(test_run_summary),
+                rollups=get_test_run_rollups(test_run_summary),
+                references=get_carried_forward_test_runs(test_run_summary)
+            )
+
+
+def merge_live_summaries(live_summaries: List[Dict]) -> Optional[Dict]:
+    """
+    Merge the live summaries of the Pytest sessions (and xdist workers) of a test run in progress.
+
+    :param live_summaries: List[Dict], live summaries saved by the Pytest sessions of a test run
+    :return: Optional[Dict], merged live summary; None if the list is empty
+    """
+    if not live_summaries:
+        return None
+    report: ReportAggregator = ReportAggregator()
+    latest_failures: List[Dict] = list()
+    no_of_unit_tests: Dict[Optional[str], int] = dict()
+    no_of_unit_tests_done: int = 0
+    for live_summary in live_summaries:
+        report.merge(
+            {
+                "test_run_summary": {
+                    component: live_summary[component] for component in ["KP", "ARA"] if component in live_summary
+                }
+            }
+        )
+        latest_failures.extend(live_summary.get("latest_failures", list()))
+        # all the xdist workers of a (shard) Pytest session collect all of its unit tests
+        shard_id: Optional[str] = live_summary.get("shard_id", None)
+        no_of_unit_tests[shard_id] = max(no_of_unit_tests.get(shard_id, 0), live_summary.get("no_of_unit_tests", 0))
+        no_of_unit_tests_done += live_summary.get("no_of_unit_tests_done", 0)
+    merged: Dict = report.get_test_run_summary()
+    merged["in_progress"] = True
+    merged["updated"] = max([live_summary.get("updated", "") for live_summary in live_summaries])
+    merged["no_of_unit_tests"] = sum(no_of_unit_tests.values())
+    merged["no_of_unit_tests_done"] = no_of_unit_tests_done
+    merged["latest_failures"] = sorted(
+        latest_failures, key=lambda failure: failure.get("time", ""), reverse=True
+    )[:MAX_LATEST_FAILURES]
+    return merged
@@ -1,19 +1,52 @@
 
-from typing import Dict, Optional, List, IO, Generator
+from typing import Dict, Optional, List, Set, IO, Generator, Union, Mapping, Tuple, Iterable, Any, Callable
 from sys import stderr
-from os import environ, makedirs, listdir
-from os.path import sep, normpath, exists
-from time import sleep
+from os import environ, makedirs, listdir, replace, remove, rmdir, walk, stat, fstat, SEEK_SET, SEEK_CUR, SEEK_END
+from os.path import sep, normpath, exists, relpath
+from io import RawIOBase
+from tempfile import NamedTemporaryFile
+from contextlib import contextmanager
+from time import monotonic
+from concurrent.futures import ThreadPoolExecutor, Future
+from threading import Thread, RLock, Event, local
+from queue import Queue, Empty
+from collections import OrderedDict
+from itertools import chain
 import shutil
-from datetime import datetime
+import mmap
+import struct
+from datetime import datetime, timedelta
 from urllib.parse import quote_plus
-from json import JSONEncoder, dump, dumps
+from json import JSONEncoder, dump
+import gzip
+from hashlib import sha256
+import sqlite3
 import orjson
 
-from pymongo import MongoClient
+try:
+    # optional Zstandard compression of the big documents (see DEFAULT_DOCUMENT_COMPRESSION)
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    # inter-process locking of the blobs of the FileReportDatabase blob store (POSIX platforms)
+    import fcntl
+except ImportError:
+    fcntl = None
+
+from pymongo import MongoClient, ReplaceOne, ASCENDING
 from pymongo.collection import Collection
 from pymongo.database import Database
-from pymongo.errors import ConnectionFailure, ServerSelectionTimeoutError, ConfigurationError
+from pymongo.errors import (
+    ConnectionFailure,
+    ServerSelectionTimeoutError,
+    ConfigurationError,
+    BulkWriteError,
+    DuplicateKeyError,
+    PyMongoError
+)
+from bson.errors import InvalidDocument
 
 # for saving big MongoDb files
 from gridfs import GridFS
@@ -28,13 +61,173 @@ logger.setLevel("DEBUG")
 
 RUNNING_INSIDE_DOCKER = environ.get('RUNNING_INSIDE_DOCKER', False)
 
+# MongoTestReport documents are buffered, then written out in (unordered) bulk, once
+# this many documents are pending, or the oldest pending document is this old (seconds)
+DEFAULT_WRITE_BATCH_SIZE = int(environ.get('MONGO_WRITE_BATCH_SIZE', 100))
+DEFAULT_WRITE_FLUSH_INTERVAL = float(environ.get('MONGO_WRITE_FLUSH_INTERVAL', 5.0))
+
+# Number of threads concurrently uploading big documents to GridFS
+DEFAULT_GRIDFS_UPLOAD_THREADS = 4
+
+# Documents saved to a TestReport are written out by background writer threads (none means
+# synchronous writes), each fed by a bounded queue: saving blocks while the queue is full
+DEFAULT_WRITER_THREADS = int(environ.get('TEST_REPORT_WRITER_THREADS', 1))
+DEFAULT_WRITER_QUEUE_SIZE = int(environ.get('TEST_REPORT_WRITER_QUEUE_SIZE', 1000))
+
+# Name of the unique 'document_key' index of each MongoDb test run collection
+DOCUMENT_KEY_INDEX = "unique_document_key"
+
+# Name of the catalog of the test runs of a test report database (MongoDb collection or file system directory)
+TEST_RUN_CATALOG = "test_run_catalog"
+
+# Name of the rollups of the completed test runs of a test report database (MongoDb collection, SQLite table or
+# file system directory): one row per unit test of each resource of a test run, with its outcome counts and
+# latency statistics, indexed for the (cross test run) history of the resources
+TEST_RUN_ROLLUPS = "test_run_rollups"
+
+# Fields of the rollup rows, besides the test run identifier and completion time: the resource and unit test...
+ROLLUP_KEY_FIELDS: List[str] = ["component", "ara_id", "kp_id", "unit_test"]
+
+# ...then its outcome counts and latency statistics (milliseconds)
+ROLLUP_STATISTICS_FIELDS: List[str] = [
+    "passed", "failed", "skipped", "latency_count", "latency_mean_ms", "latency_min_ms", "latency_max_ms"
+]
+
+# Interval (in seconds) between the runs of the background reaper, physically removing the deleted test runs
+DEFAULT_REAPER_INTERVAL = float(environ.get('TEST_RUN_REAPER_INTERVAL', 60.0))
+
+# Maximum number of deleted test runs physically removed by the background reaper in one go
+DEFAULT_REAPER_BATCH_SIZE = int(environ.get('TEST_RUN_REAPER_BATCH_SIZE', 10))
+
+# Size (in bytes) of the chunks in which (big) documents are streamed
+DEFAULT_STREAM_CHUNK_SIZE = int(environ.get('DOCUMENT_STREAM_CHUNK_SIZE', 256 * 1024))
+
+# Compression of the big documents (e.g. TRAPI responses) of the test reports: 'gzip', 'zstd'
+# (requiring the 'zstandard' package) or none (the default), with the file suffix of each compression
+DEFAULT_DOCUMENT_COMPRESSION: Optional[str] = environ.get('TEST_REPORT_COMPRESSION', None) or None
+COMPRESSION_SUFFIXES: Dict[str, str] = {"gzip": ".gz", "zstd": ".zst"}
+
+
+def compress_document(data: bytes, compression: Optional[str]) -> bytes:
+    """
+    :param data: bytes, (JSON text) bytes of a document
+    :param compression: Optional[str], compression of the document: 'gzip', 'zstd' or None
+    :return: bytes, compressed bytes of the document (the data itself if no compression)
+    """
+    if compression == "gzip":
+        # a null modification time makes the compressed bytes reproducible
+        return gzip.compress(data, mtime=0)
+    elif compression == "zstd":
+        return zstandard.ZstdCompressor().compress(data)
+    return data
+
+
+def open_decompressed(datafile: Union[str, IO], compression: Optional[str]) -> IO:
+    """
+    :param datafile: Union[str, IO], path or (binary) file of the compressed bytes of a document
+    :param compression: Optional[str], compression of the document: 'gzip', 'zstd' or None
+    :return: IO, binary file of the decompressed bytes of the document, closing the given file once closed
+    """
+    if compression == "gzip":
+        return gzip.open(datafile, mode="rb")
+    elif compression == "zstd":
+        return zstandard.open(datafile, mode="rb")
+    return open(datafile, mode="rb") if isinstance(datafile, str) else datafile
+
+
+def open_compressed(datafile: IO, compression: Optional[str]) -> IO:
+    """
+    :param datafile: IO, binary file the compressed bytes of a document are written to
+    :param compression: Optional[str], compression of the document: 'gzip', 'zstd' or None
+    :return: IO, binary file compressing the bytes written to it into the given file (the file itself if
+                 no compression), to be closed before the given file
+    """
+    if compression == "gzip":
+        return gzip.GzipFile(fileobj=datafile, mode="wb", mtime=0)
+    elif compression == "zstd":
+        return zstandard.ZstdCompressor().stream_writer(datafile, closefd=False)
+    return datafile
+
+
+# Name of the store of the (content-addressed) big documents, shared by the test runs of
+# a test report database (MongoDb collection, with its GridFS bucket, or file system directory)
+TEST_RUN_BLOBS = "test_run_blobs"
+
+# Big documents (e.g. TRAPI responses) are saved in the content-addressed store, by default
+DEFAULT_BLOB_STORE = environ.get('TEST_REPORT_BLOB_STORE', "true").lower() in ["1", "true", "yes"]
+
+# Pretty-printing (indentation) of the JSON documents written out, for debugging only
+PRETTY_JSON_DOCUMENTS = environ.get('TEST_REPORT_PRETTY_JSON', "").lower() in ["1", "true", "yes"]
+
+# Name of the packed (single file) archive of the documents of a completed FileTestReport, in its directory
+TEST_RUN_PACK = "test_run.pack"
+
+# The documents of FileTestReports are packed into their archive once the test runs are completed, by default
+DEFAULT_PACK_TEST_RUNS = environ.get('TEST_REPORT_PACK', "true").lower() in ["1", "true", "yes"]
+
+# Number of (memory mapped) test run archives kept open by a FileReportDatabase
+DEFAULT_PACK_CACHE_SIZE = int(environ.get('TEST_REPORT_PACK_CACHE_SIZE', 16))
+
+# Documents (i.e. the test run summary) a FileTestReport also writes out split into their per-resource parts,
+# with an outline of their keys, such that their projections only read in the requested parts
+SPLIT_DOCUMENT_KEYS: Set[str] = {"test_run_summary"}
+SPLIT_DOCUMENT_SUFFIX = ".split"
+
+# The process log of a test run is buffered, then saved in chunks of (at most) this many lines - documents keyed
+# under the TEST_RUN_LOG prefix, with their 'index' document - once this many lines are pending or the oldest
+# pending line is this old (seconds), even if the process is silent meanwhile: a partially filled chunk is saved
+# again, as it fills up, until full
+TEST_RUN_LOG = "logs"
+DEFAULT_LOG_CHUNK_LINES = int(environ.get('TEST_RUN_LOG_CHUNK_LINES', 1000))
+DEFAULT_LOG_FLUSH_INTERVAL = float(environ.get('TEST_RUN_LOG_FLUSH_INTERVAL', 5.0))
+
+# The full log chunks are saved as big documents, i.e. compressed as configured by TEST_REPORT_COMPRESSION
+# (the partially filled chunk, saved again at each flush, is saved as a plain document until full)
+DEFAULT_LOG_COMPRESSION = environ.get('TEST_RUN_LOG_COMPRESSION', "").lower() in ["1", "true", "yes"]
+
+
+def get_log_chunk_key(chunk: int) -> str:
+    """
+    :param chunk: int, (zero based) sequence number of a chunk of the process log of a test run
+    :return: str, document key of the log chunk
+    """
+    return f"{TEST_RUN_LOG}/{chunk:06d}"
+
+
+def get_log_index_key() -> str:
+    """
+    :return: str, document key of the index of the process log of a test run (i.e. its number of lines and chunks)
+    """
+    return f"{TEST_RUN_LOG}/index"
+
+
+# Format (and its version) of the (gzip compressed NDJSON) archives of exported test runs: as of version 2,
+# the bytes of the big documents follow their (document key) line, as length-prefixed frames
+TEST_RUN_ARCHIVE_FORMAT = "sri-testing-test-run"
+TEST_RUN_ARCHIVE_VERSION = 2
+
+# Name of the database file of a SqliteReportDatabase, in its test results directory
+SQLITE_DATABASE_FILE = "test_reports.sqlite"
+
+# Time (in seconds) a SqliteReportDatabase connection waits for the write lock held by another connection
+DEFAULT_SQLITE_TIMEOUT = float(environ.get('SQLITE_BUSY_TIMEOUT', 30.0))
+
 
 class TestReportDatabaseException(RuntimeError):
     pass
 
 
 class ReportJsonEncoder(JSONEncoder):
+    """
+    JSON encoder of test run report documents, rendering summary records (i.e. objects
+    with a 'to_json()' method), read-only mappings (e.g. the ChainMap test cases of ARAs),
+    sets and other iterables, none of which are natively serializable.
+    """
     def default(self, o):
+        if hasattr(o, 'to_json'):
+            return o.to_json()
+        if isinstance(o, Mapping):
+            return dict(o)
         try:
             iterable = iter(o)
         except TypeError:
@@ -45,20 +238,125 @@ class ReportJsonEncoder(JSONEncoder):
         return JSONEncoder.default(self, o)
 
 
+def _report_json_default(o):
+    """
+    orjson rendering of the objects of test run report documents which are not natively serializable: the same
+    as ReportJsonEncoder, with (the most common) sets - e.g. of the outcomes of unit tests - checked first.
+    """
+    if isinstance(o, (set, frozenset)):
+        return list(o)
+    if hasattr(o, 'to_json'):
+        return o.to_json()
+    if isinstance(o, Mapping):
+        return dict(o)
+    try:
+        return list(iter(o))
+    except TypeError:
+        raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
+def get_blob_id(data: bytes) -> str:
+    """
+    :param data: bytes, (uncompressed JSON text) bytes of a big document
+    :return: str, content address of the document in the blob store, i.e. its hexadecimal SHA-256 hash
+    """
+    return sha256(data).hexdigest()
+
+
+def dump_report_json(document, pretty: bool = PRETTY_JSON_DOCUMENTS) -> bytes:
+    """
+    Serializes a test run report document, with orjson.
+
+    :param document: test run report document (or any part of it)
+    :param pretty: bool, if True, the JSON text is indented (default: PRETTY_JSON_DOCUMENTS, for debugging only)
+    :return: bytes, UTF-8 encoded JSON text of the document
+    """
+    # non-string (e.g. integer) keys are rendered as strings, like the Python json module does
+    option: int = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+    return orjson.dumps(document, default=_report_json_default, option=option)
+
+
+def parse_projection(projection: Optional[str]) -> List[str]:
+    """
+    :param projection: Optional[str], dotted path of a part of a document, e.g. 'KP.<kp_id>' or 'ARA.<ara_id>.kps'
+    :return: List[str], keys of the path (empty if no projection, i.e. the whole document)
+    """
+    return [key for key in projection.split(".") if key] if projection else list()
+
+
+def project_document(document: Optional[Any], path: List[str]) -> Optional[Any]:
+    """
+    :param document: Optional[Any], (JSON) document, or any part of it
+    :param path: List[str], keys of the path of the projected part of the document (empty for the whole document)
+    :return: Optional[Any], projected part of the document; None if the document does not hold the path
+    """
+    for key in path:
+        if not isinstance(document, Mapping) or key not in document:
+            return None
+        document = document[key]
+    return document
+
+
 class TestReportDatabase:
 
     LOG_NAME = "logs"
 
+    # States of the test runs in the test run catalog
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"  # i.e. ran to its end, but with (some of) its results missing
+    DELETED = "deleted"
+
     """
     Abstract superclass of a Test Report Database
     """
-    def __init__(self, db_name: Optional[str] = TEST_RESULTS_DB, **kwargs):
+    def __init__(
+            self,
+            db_name: Optional[str] = TEST_RESULTS_DB,
+            reaper_interval: float = DEFAULT_REAPER_INTERVAL,
+            reaper_batch_size: int = DEFAULT_REAPER_BATCH_SIZE,
+            compression: Optional[str] = DEFAULT_DOCUMENT_COMPRESSION,
+            blob_store: bool = DEFAULT_BLOB_STORE,
+            **kwargs
+    ):
         self._db_name: str = db_name if db_name else TEST_RESULTS_DB
         self._test_results_path: str = get_test_results_dir(self.get_db_name())
 
+        # Compression of the big documents (already saved documents are read whatever their compression)
+        if compression and compression not in COMPRESSION_SUFFIXES:
+            raise TestReportDatabaseException(f"Unknown test report document compression '{compression}'?")
+        if compression == "zstd" and zstandard is None:
+            raise TestReportDatabaseException("The 'zstd' test report document compression needs 'zstandard'?")
+        self._compression: Optional[str] = compression
+
+        # Big documents are saved once, in a content-addressed store shared by the test runs
+        self._blob_store: bool = blob_store
+
+        # Test runs deleted by this process, i.e. no longer readable even before they are physically removed
+        self._deleted_test_runs: Set[str] = set()
+
+        # Background reaper thread, physically removing the deleted test runs
+        self._reaper_interval: float = reaper_interval
+        self._reaper_batch_size: int = reaper_batch_size
+        self._reaper: Optional[Thread] = None
+        self._reaper_wakeup: Event = Event()
+        self._reaper_lock: RLock = RLock()
+
     def get_db_name(self) -> str:
         return self._db_name
 
+    def get_compression(self) -> Optional[str]:
+        """
+        :return: Optional[str], compression of the big documents saved: 'gzip', 'zstd' or None
+        """
+        return self._compression
+
+    def uses_blob_store(self) -> bool:
+        """
+        :return: bool, True if big documents are saved in the content-addressed store shared by the test runs
+        """
+        return self._blob_store
+
     def get_test_results_path(self) -> str:
         return self._test_results_path
 
@@ -72,11 +370,464 @@ class TestReportDatabase:
         """
         :return: list of identifiers of available ('completed') reports.
         """
-        raise NotImplementedError("Abstract method - implement in child subclass!")
+        return [entry["test_run_id"] for entry in self.list_test_runs(state=self.COMPLETED)]
 
     def get_test_report(self, identifier):
         raise NotImplementedError("Abstract method - implement in child subclass!")
 
+    def register_test_run(self, test_run_id: str, parameters: Optional[Dict] = None):
+        """
+        Adds a new test run to the test run catalog, as running.
+
+        :param test_run_id: str, test run identifier
+        :param parameters: Optional[Dict], test run parameters
+        """
+        now: str = datetime.utcnow().isoformat()
+        self.update_test_run(
+            test_run_id,
+            state=self.RUNNING,
+            parameters=parameters if parameters else dict(),
+            created=now
+        )
+
+    def update_test_run(self, test_run_id: str, **fields):
+        """
+        Atomically updates (creating as needed) the test run catalog entry of a test run.
+
+        :param test_run_id: str, test run identifier
+        :param fields: catalog entry fields to be set, e.g. 'state', 'completed' (timestamp) or 'counts'
+        """
+        raise NotImplementedError("Abstract method - implement in child subclass!")
+
+    def get_test_run(self, test_run_id: str) -> Optional[Dict]:
+        """
+        :param test_run_id: str, test run identifier
+        :return: Optional[Dict], test run catalog entry of the test run; None if unknown
+        """
+        raise NotImplementedError("Abstract method - implement in child subclass!")
+
+    def list_test_runs(self, state: Optional[str] = None) -> List[Dict]:
+        """
+        :param state: Optional[str], state of the listed test runs (default: None, i.e. all the test runs)
+        :return: List[Dict], test run catalog entries, sorted by test run identifier
+        """
+        raise NotImplementedError("Abstract method - implement in child subclass!")
+
+    def remove_test_run(self, test_run_id: str):
+        """
+        :param test_run_id: str, identifier of a (deleted) test run, removed from the test run catalog
+        """
+        raise NotImplementedError("Abstract method - implement in child subclass!")
+
+    def save_rollups(self, test_run_id: str, completed: str, rollups: List[Dict]):
+        """
+        Replaces the rollup rows of a (completed) test run.
+
+        :param test_run_id: str, test run identifier
+        :param completed: str, completion time (ISO format timestamp) of the test run
+        :param rollups: List[Dict], rollup rows of the test run, with the ROLLUP_KEY_FIELDS and ROLLUP_STATISTICS_FIELDS
+        """
+        raise NotImplementedError("Abstract method - implement in child subclass!")
+
+    def delete_rollups(self, test_run_id: str):
+        """
+        :param test_run_id: str, identifier of a (deleted) test run, whose rollup rows are removed
+        """
+        raise NotImplementedError("Abstract method - implement in child subclass!")
+
+    def get_rollups(
+            self,
+            component: Optional[str] = None,
+            ara_id: Optional[str] = None,
+            kp_id: Optional[str] = None,
+            unit_test: Optional[str] = None,
+            since: Optional[str] = None,
+            until: Optional[str] = None
+    ) -> List[Dict]:
+        """
+        Retrieves (in one query) the rollup rows of the completed test runs, matching all the given criteria.
+
+        :param component: Optional[str], Translator component of the resources: 'ARA' or 'KP' (default: any)
+        :param ara_id: Optional[str], identifier of the ARA (default: any, including none)
+        :param kp_id: Optional[str], identifier of the (direct, or ARA embedded) KP (default: any)
+        :param unit_test: Optional[str], unit test (category), e.g. 'by_subject' (default: any)
+        :param since: Optional[str], earliest completion time (ISO format timestamp) of the test runs (default: none)
+        :param until: Optional[str], latest completion time (ISO format timestamp) of the test runs (default: none)
+        :return: List[Dict], rollup rows (with their 'test_run_id' and 'completed' time), sorted by completion time
+        """
+        raise NotImplementedError("Abstract method - implement in child subclass!")
+
+    @staticmethod
+    def _get_rollup_filters(
+            component: Optional[str],
+            ara_id: Optional[str],
+            kp_id: Optional[str],
+            unit_test: Optional[str]
+    ) -> Dict[str, str]:
+        """
+        :return: Dict[str, str], values of the rollup key fields to be matched (see get_rollups())
+        """
+        values: Tuple = (component, ara_id, kp_id, unit_test)
+        return {field: value for field, value in zip(ROLLUP_KEY_FIELDS, values) if value is not None}
+
+    def _find_completed_test_runs(self) -> List[str]:
+        """
+        :return: List[str], identifiers of the test runs (not necessarily catalogued) whose summary was saved
+        """
+        raise NotImplementedError("Abstract method - implement in child subclass!")
+
+    def _list_carried_forward_documents(self, test_run_id: str) -> Iterable[Tuple[str, str, bool]]:
+        """
+        :param test_run_id: str, identifier of an (incremental) test run
+        :return: Iterable[Tuple[str, str, bool]], identifier of the test run holding each document of the resources
+                 carried forward (by reference) into the test run, with the document key and big document flag
+        """
+        # deferred import, since the incremental test run module itself imports this module
+        from translator.sri.testing.incremental import CARRIED_FORWARD_FROM
+
+        summary: Dict = self.get_test_report(identifier=test_run_id).retrieve_document(
+            "Test Run Summary", "test_run_summary"
+        ) or dict()
+        for component, resources in summary.items():
+            if not isinstance(resources, dict):
+                continue
+            for resource_id, resource in resources.items():
+                if not (isinstance(resource, dict) and CARRIED_FORWARD_FROM in resource):
+                    continue
+                if not self.get_test_run(resource[CARRIED_FORWARD_FROM]):
+                    logger.warning(
+                        f"Test run '{resource[CARRIED_FORWARD_FROM]}' holding the documents of {component} " +
+                        f"'{resource_id}' no longer exists, thus these cannot be exported?"
+                    )
+                    continue
+                source: str = resource[CARRIED_FORWARD_FROM]
+                for document_key, is_big in self.get_test_report(identifier=source).list_documents():
+                    if document_key.startswith(f"{component}/{resource_id}/"):
+                        yield source, document_key, is_big
+
+    def export_test_run(self, test_run_id: str, archive: IO, compresslevel: int = 6) -> int:
+        """
+        Exports a completed test run - its catalog entry, rollups and all its documents, big ones included -
+        as a gzip compressed NDJSON archive: a header line, then one line per document. The big documents
+        are streamed into the archive in length-prefixed frames (following their line), as stored, thus the
+        export runs in constant memory. The documents of the resources carried forward (by reference) into
+        an incremental test run are exported as its own documents, the archive thus being self-contained.
+
+        :param test_run_id: str, identifier of the (completed) test run exported
+        :param archive: IO, binary file the archive is written to (e.g. opened with mode 'wb')
+        :param compresslevel: int, gzip compression level of the archive (default: 6)
+        :return: int, number of documents exported
+        :raises: TestReportDatabaseException if the test run is not completed
+        """
+        entry: Optional[Dict] = self.get_test_run(test_run_id)
+        if not entry or entry.get("state", None) != self.COMPLETED:
+            raise TestReportDatabaseException(f"Test run '{test_run_id}' is not completed, thus cannot be exported?")
+        rollups: List[Dict] = [
+            {field: value for field, value in row.items() if field not in ["test_run_id", "completed"]}
+            for row in self.get_rollups(since=entry["completed"], until=entry["completed"])
+            if row["test_run_id"] == test_run_id
+        ]
+        reports: Dict[str, TestReport] = {test_run_id: self.get_test_report(identifier=test_run_id)}
+        exported_keys: Set[str] = set()
+        exported: int = 0
+        with gzip.GzipFile(fileobj=archive, mode="wb", compresslevel=compresslevel, mtime=0) as ndjson:
+            ndjson.write(orjson.dumps({
+                "format": TEST_RUN_ARCHIVE_FORMAT,
+                "version": TEST_RUN_ARCHIVE_VERSION,
+                "test_run": entry,
+                "rollups": rollups
+            }) + b"\n")
+            documents: Iterable[Tuple[str, str, bool]] = chain(
+                ((test_run_id, document_key, is_big) for document_key, is_big in reports[test_run_id].list_documents()),
+                self._list_carried_forward_documents(test_run_id)
+            )
+            for source_id, document_key, is_big in documents:
+                if document_key in exported_keys:
+                    continue
+                if source_id not in reports:
+                    reports[source_id] = self.get_test_report(identifier=source_id)
+                source: TestReport = reports[source_id]
+                if is_big:
+                    datafile: Optional[IO] = source.open_document("Exported Document", document_key)
+                    if datafile is None:
+                        continue
+                    with datafile:
+                        ndjson.write(orjson.dumps({"document_key": document_key, "is_big": True}) + b"\n")
+                        # frames of (at most) a stream chunk of bytes each, ended by an empty frame
+                        while True:
+                            chunk: bytes = datafile.read(DEFAULT_STREAM_CHUNK_SIZE)
+                            ndjson.write(b"%d\n" % len(chunk))
+                            if not chunk:
+                                break
+                            ndjson.write(chunk)
+                else:
+                    document: Optional[Dict] = source.retrieve_document("Exported Document", document_key)
+                    if document is None:
+                        continue
+                    ndjson.write(orjson.dumps({"document_key": document_key, "is_big": False, "document": document}))
+                    ndjson.write(b"\n")
+                exported_keys.add(document_key)
+                exported += 1
+        return exported
+
+    def import_test_run(self, archive: IO, test_run_id: Optional[str] = None) -> str:
+        """
+        Imports a test run exported by export_test_run(), i.e. saves its documents (written out in bulk,
+        by the background writers of its test report) then its rollups and (completed) catalog entry.
+        The big documents are streamed from the archive into the test report (see save_big_document()).
+
+        :param archive: IO, binary file the archive is read from (e.g. opened with mode 'rb')
+        :param test_run_id: Optional[str], identifier of the imported test run (default: the exported one)
+        :return: str, identifier of the imported test run
+        :raises: TestReportDatabaseException if the archive is not a test run archive,
+                 or the test run already exists in the test report database
+        """
+        with gzip.GzipFile(fileobj=archive, mode="rb") as ndjson:
+            try:
+                header: Dict = orjson.loads(ndjson.readline())
+            except (OSError, orjson.JSONDecodeError) as exc:
+                raise TestReportDatabaseException(f"Not a test run archive: {str(exc)}?")
+            if header.get("format", None) != TEST_RUN_ARCHIVE_FORMAT or \
+                    header.get("version", None) not in range(1, TEST_RUN_ARCHIVE_VERSION + 1):
+                raise TestReportDatabaseException("Not a (supported) test run archive?")
+            entry: Dict = header["test_run"]
+            test_run_id = test_run_id if test_run_id else entry["test_run_id"]
+            if self.get_test_run(test_run_id):
+                raise TestReportDatabaseException(f"Test run '{test_run_id}' already exists, thus cannot be imported?")
+
+            # the test run is only catalogued as completed once its documents are all written out
+            self.update_test_run(
+                test_run_id,
+                **{
+                    field: value for field, value in entry.items()
+                    # the archive holds the carried forward documents, no longer referenced elsewhere
+                    if field not in ["test_run_id", "state", "completed", "counts", "updated", "references"]
+                },
+                state=self.RUNNING
+            )
+            report: TestReport = self.get_test_report(identifier=test_run_id)
+            while True:
+                line: bytes = ndjson.readline()
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                record: Dict = orjson.loads(line)
+                if "document" not in record:
+                    # the frames of the bytes of a big document follow its line
+                    datafile = FramedDocumentFile(ndjson)
+                    report.save_big_document("Imported Document", datafile, record["document_key"])
+                    datafile.skip()
+                else:
+                    # big documents of (version 1) archives are held in their line
+                    report.save_json_document(
+                        document_type="Imported Document",
+                        document=record["document"],
+                        document_key=record["document_key"],
+                        is_big=record["is_big"]
+                    )
+        report.close()
+        report.set_completed(counts=entry.get("counts", None), rollups=header["rollups"], completed=entry["completed"])
+        return test_run_id
+
+    def tombstone_test_run(self, test_run_id: str):
+        """
+        Logically deletes a test run, by tombstoning its test run catalog entry: the test run is no longer
+        available, but its documents are only physically removed later, by the background reaper.
+
+        :param test_run_id: str, identifier of the test run being deleted
+        """
+        self._deleted_test_runs.add(test_run_id)
+        self.update_test_run(test_run_id, state=self.DELETED, deleted=datetime.utcnow().isoformat())
+        # the history of the resources no longer includes the test run
+        self.delete_rollups(test_run_id)
+        self.start_reaper()
+
+    def is_deleted(self, test_run_id: str) -> bool:
+        """
+        :param test_run_id: str, test run identifier
+        :return: bool, True if the test run was deleted (by this process) but is possibly not yet physically removed
+        """
+        return test_run_id in self._deleted_test_runs
+
+    def get_referenced_test_runs(self, excluded: Optional[Iterable[str]] = None) -> Set[str]:
+        """
+        :param excluded: Optional[Iterable[str]], identifiers of test runs whose references are ignored
+                         (i.e. test runs about to be deleted)
+        :return: Set[str], identifiers of the test runs holding documents carried forward (by reference) into
+                 other (not deleted) test runs, as recorded in the 'references' of their test run catalog entries
+        """
+        excluded = set(excluded) if excluded else set()
+        return {
+            test_run_id
+            for entry in self.list_test_runs()
+            if entry.get("state", None) != self.DELETED and entry["test_run_id"] not in excluded
+            for test_run_id in entry.get("references", None) or list()
+        }
+
+    def delete_test_runs(self, test_run_ids: List[str]) -> List[str]:
+        """
+        Bulk (logical) deletion of test runs. Test runs holding documents carried forward into other
+        (not deleted) test runs are retained, since the latter would otherwise be incomplete.
+
+        :param test_run_ids: List[str], identifiers of the test runs to delete
+        :return: List[str], identifiers of the test runs deleted, i.e. those known to the test run catalog
+        """
+        referenced: Set[str] = self.get_referenced_test_runs(excluded=test_run_ids)
+        deleted: List[str] = list()
+        for test_run_id in test_run_ids:
+            if test_run_id in referenced:
+                logger.warning(f"Test run '{test_run_id}' is referenced by incremental test runs, thus retained?")
+                continue
+            entry: Optional[Dict] = self.get_test_run(test_run_id)
+            if entry and entry.get("state", None) != self.DELETED:
+                self.get_test_report(test_run_id).delete(ignore_errors=True)
+                deleted.append(test_run_id)
+        return deleted
+
+    @staticmethod
+    def _get_test_run_time(entry: Dict) -> Optional[datetime]:
+        """
+        :param entry: Dict, test run catalog entry
+        :return: Optional[datetime], completion (or failure, or else creation) time of the test run; None if unknown
+        """
+        timestamp: Optional[str] = \
+            entry.get("completed", None) or entry.get("failed", None) or entry.get("created", None)
+        if timestamp:
+            return datetime.fromisoformat(timestamp)
+        try:
+            # completed test runs catalogued by migration only have their (timestamp) identifier
+            return datetime.strptime(entry["test_run_id"], "%Y-%m-%d_%H-%M-%S")
+        except ValueError:
+            return None
+
+    def apply_retention(self, max_age_days: Optional[int] = None, keep_latest: Optional[int] = None) -> List[str]:
+        """
+        Deletes the completed (or failed) test runs beyond a retention policy, except
+        those holding documents carried forward into retained (incremental) test runs.
+
+        :param max_age_days: Optional[int], maximum age (in days) of the retained test runs (default: None, no limit)
+        :param keep_latest: Optional[int], number of most recent test runs always retained (default: None, i.e. 0)
+        :return: List[str], identifiers of the test runs deleted
+        """
+        completed: List[Dict] = sorted(
+            self.list_test_runs(state=self.COMPLETED) + self.list_test_runs(state=self.FAILED),
+            key=lambda entry: (self._get_test_run_time(entry) or datetime.min, entry["test_run_id"])
+        )
+        if keep_latest:
+            completed = completed[:-keep_latest]
+        expired: List[str] = list()
+        cutoff: Optional[datetime] = \
+            datetime.utcnow() - timedelta(days=max_age_days) if max_age_days is not None else None
+        for entry in completed:
+            if cutoff is not None:
+                test_run_time: Optional[datetime] = self._get_test_run_time(entry)
+                if test_run_time is None or test_run_time >= cutoff:
+                    continue
+            elif not keep_latest:
+                # neither an age limit nor a number of test runs to be kept: nothing to do!
+                break
+            expired.append(entry["test_run_id"])
+        return self.delete_test_runs(expired)
+
+    def reap_deleted_test_runs(self, batch_size: Optional[int] = None) -> List[str]:
+        """
+        Physically removes a batch of deleted test runs, then their test run catalog entries.
+
+        :param batch_size: Optional[int], maximum number of test runs removed (default: the reaper batch size)
+        :return: List[str], identifiers of the test runs removed
+        """
+        batch_size = batch_size if batch_size else self._reaper_batch_size
+        # test runs referenced by test runs not yet deleted (e.g. still running when deleted) are not removed (yet)
+        referenced: Set[str] = self.get_referenced_test_runs()
+        reaped: List[str] = list()
+        for entry in [
+            entry for entry in self.list_test_runs(state=self.DELETED) if entry["test_run_id"] not in referenced
+        ][:batch_size]:
+            test_run_id: str = entry["test_run_id"]
+            if self.get_test_report(test_run_id).purge():
+                self.remove_test_run(test_run_id)
+                self._deleted_test_runs.discard(test_run_id)
+                reaped.append(test_run_id)
+        if reaped:
+            logger.debug(f"Reaped {len(reaped)} deleted test runs: {reaped}")
+        return reaped
+
+    def start_reaper(self):
+        """
+        Starts (unless already running) the background reaper thread, physically removing the deleted test runs.
+        """
+        with self._reaper_lock:
+            if self._reaper is None or not self._reaper.is_alive():
+                self._reaper = Thread(target=self._run_reaper, name="test-run-reaper", daemon=True)
+                self._reaper.start()
+
+    def wakeup_reaper(self):
+        """
+        Wakes up the background reaper, i.e. for the physical removal of the deleted test runs without delay.
+        """
+        self._reaper_wakeup.set()
+
+    def _run_reaper(self):
+        while True:
+            self._reaper_wakeup.wait(timeout=self._reaper_interval)
+            self._reaper_wakeup.clear()
+            try:
+                # batch after batch, until all the deleted test runs are removed
+                while self.reap_deleted_test_runs():
+                    pass
+            except Exception as exc:
+                logger.warning(f"Deleted test runs of '{self.get_db_name()}' could not be reaped: {str(exc)}?")
+
+    def put_blob(self, test_run_id: str, data: bytes) -> str:
+        """
+        Saves a big document in the content-addressed blob store, unless already there (i.e. saved by any test
+        run), then adds the test run to the references of the blob. The references of a blob are a set of test
+        run identifiers, thus saving the same document more than once in a test run (e.g. by distinct pytest-xdist
+        workers, or under distinct document keys) only references it once.
+
+        :param test_run_id: str, identifier of the test run referencing the document
+        :param data: bytes, (uncompressed JSON text) bytes of the document
+        :return: str, content address of the document in the blob store (see get_blob_id())
+        """
+        raise NotImplementedError("Abstract method - implement in child subclass!")
+
+    def open_blob(self, blob_id: str, decompress: bool = True) -> Optional[IO]:
+        """
+        :param blob_id: str, content address of a document in the blob store
+        :param decompress: bool, if False, the bytes of a compressed document are read as stored (default: True)
+        :return: Optional[IO], binary file of the document (seekable, unless decompressed); None if not in the store
+        """
+        raise NotImplementedError("Abstract method - implement in child subclass!")
+
+    def get_blob_compression(self, blob_id: str) -> Optional[str]:
+        """
+        :param blob_id: str, content address of a document in the blob store
+        :return: Optional[str], compression of the stored document: 'gzip', 'zstd' or None (also if not in the store)
+        """
+        raise NotImplementedError("Abstract method - implement in child subclass!")
+
+    def release_blobs(self, test_run_id: str) -> List[str]:
+        """
+        Removes a (deleted) test run from the references of the blobs of the blob store,
+        then deletes the blobs which are no longer referenced by any test run.
+
+        :param test_run_id: str, identifier of the test run
+        :return: List[str], content addresses of the blobs deleted
+        """
+        raise NotImplementedError("Abstract method - implement in child subclass!")
+
+    def migrate(self):
+        """
+        Upgrades the test run reports persisted by earlier releases to the current
+        report database layout, i.e. once, upon (web service) startup. The completed
+        test runs predating the test run catalog are added to the catalog.
+        """
+        for test_run_id in self._find_completed_test_runs():
+            if self.get_test_run(test_run_id) is None:
+                logger.debug(f"Adding completed test run '{test_run_id}' to the test run catalog")
+                self.update_test_run(test_run_id, state=self.COMPLETED, parameters=dict())
+
     def get_report_logs(self) -> List[Dict]:
         """
         :return: Dict, report database log (as a Python dictionary)
@@ -88,13 +839,27 @@ class TestReport:
     """
     Abstract superclass of a Test Report, which is a related
     collection of test run documents stored in a TestReportDatabase.
+
+    Saved documents are written out asynchronously, by background writer threads (started as needed),
+    so the documents should not be modified once saved. Documents with the same key are always written
+    out by the same writer thread, in the order they were saved. The documents are only guaranteed to be
+    written out (i.e. durable) once the TestReport is flushed - or closed - which readers of the report
+    do first. Subclasses implement the actual writing of a document in _write_json_document().
     """
-    def __init__(self, identifier: str, database: TestReportDatabase):
+    def __init__(
+            self,
+            identifier: str,
+            database: TestReportDatabase,
+            writer_threads: int = DEFAULT_WRITER_THREADS,
+            writer_queue_size: int = DEFAULT_WRITER_QUEUE_SIZE
+    ):
         """
         TestReport constructor.
 
         :param identifier: report identifier (perhaps a timestamp?)
         :param database: TestReportDatabase to which the report belongs
+        :param writer_threads: int, number of background writer threads (0 means synchronous writes)
+        :param writer_queue_size: int, maximum number of documents queued for writing, per writer thread
         """
         assert identifier  # the test report 'identifier' should not be None or empty string
         self._report_identifier = identifier
@@ -102,6 +867,29 @@ class TestReport:
         self._report_root_path: Optional[str] = \
             f"{get_test_results_dir(self._database.get_db_name())}{sep}{identifier}"
 
+        self._writer_threads: int = writer_threads
+        self._writer_queue_size: int = writer_queue_size
+        self._writer_queues: List[Queue] = list()
+        self._writers: List[Thread] = list()
+        self._writers_lock: RLock = RLock()
+        # documents which the writer threads failed to write out, with their exception, per writer queue
+        # (not under the writers lock, held by _stop_writers() while the writer threads are joined)
+        self._write_failures: Dict[int, List[Tuple[str, str, Exception]]] = dict()
+        self._write_failures_lock: RLock = RLock()
+
+        # process log lines pending (None while the process log is not open), in the current chunk
+        self._log_lines: Optional[List[str]] = None
+        self._log_chunk: int = 0
+        self._log_chunk_lines: int = DEFAULT_LOG_CHUNK_LINES
+        self._log_flush_interval: float = DEFAULT_LOG_FLUSH_INTERVAL
+        self._log_compression: bool = DEFAULT_LOG_COMPRESSION
+        self._log_saved_lines: int = 0
+        self._log_oldest_line: Optional[float] = None
+        # the pending lines are also flushed by a background thread, while the process log is open
+        self._log_lock: RLock = RLock()
+        self._log_closed: Event = Event()
+        self._log_flusher: Optional[Thread] = None
+
     def get_identifier(self) -> str:
         return self._report_identifier
 
@@ -118,14 +906,88 @@ class TestReport:
         """
         raise NotImplementedError("Abstract method - implement in child subclass!")
 
-    def delete(self, ignore_errors: bool = False) -> True:
+    def list_documents(self) -> Iterable[Tuple[str, bool]]:
+        """
+        :return: Iterable[Tuple[str, bool]], key of each document of the test run, with a flag set for the
+                                             big documents (i.e. compressed, or in GridFS or the blob store)
+        """
+        raise NotImplementedError("Abstract method - implement in child subclass!")
+
+    def set_completed(
+            self,
+            counts: Optional[Dict] = None,
+            rollups: Optional[List[Dict]] = None,
+            completed: Optional[str] = None,
+            references: Optional[List[str]] = None
+    ):
+        """
+        Marks the test run as completed in the test run catalog, i.e. once its test run summary is written out.
+
+        :param counts: Optional[Dict], summary counts of the test run (e.g. number of resources and unit tests)
+        :param rollups: Optional[List[Dict]], rollup rows of the test run (see TestReportDatabase.save_rollups())
+        :param completed: Optional[str], completion time (ISO format timestamp) of the test run (default: now)
+        :param references: Optional[List[str]], identifiers of the test runs holding the documents carried forward
+                           into the test run (default: None, i.e. the references recorded so far are unchanged)
+        """
+        completed = completed if completed else datetime.utcnow().isoformat()
+        if rollups is not None:
+            self._database.save_rollups(self.get_identifier(), completed, rollups)
+        fields: Dict = {"references": references} if references is not None else dict()
+        self._database.update_test_run(
+            self.get_identifier(),
+            state=TestReportDatabase.COMPLETED,
+            completed=completed,
+            counts=counts if counts else dict(),
+            **fields
+        )
+
+    def set_failed(self, error: str):
+        """
+        Marks the test run as failed in the test run catalog, i.e. once its (incomplete) test run summary
+        is written out. A failed test run is neither available as a test run report, nor as a baseline.
+
+        :param error: str, description of the failure, e.g. the results missing from the test run summary
+        """
+        self._database.update_test_run(
+            self.get_identifier(),
+            state=TestReportDatabase.FAILED,
+            failed=datetime.utcnow().isoformat(),
+            error=error
+        )
+
+    def is_deleted(self) -> bool:
+        """
+        :return: bool, True if the test run was deleted, i.e. its (not yet reaped) documents are no longer readable
+        """
+        return self._database.is_deleted(self.get_identifier())
+
+    def delete(self, ignore_errors: bool = False) -> bool:
         """
-        Delete internal representation of the TestReport.
+        Delete internal representation of the TestReport. The deletion is only logical (i.e. a tombstone in
+        the test run catalog), thus returns immediately: the documents are physically removed later, by the
+        background reaper of the test report database (see TestReportDatabase.reap_deleted_test_runs()).
+
+        :return: bool, True is successful
         """
+        self._stop_writers(discard=True)
+        try:
+            self._database.tombstone_test_run(self.get_identifier())
+        except Exception as exc:
+            logger.warning(f"TestReport.delete(): could not delete test run '{self.get_identifier()}': {str(exc)}")
+            return ignore_errors
+
         # Signal deletion with an empty test report root path
         self._report_root_path = None
         return True
 
+    def purge(self) -> bool:
+        """
+        Physically removes all the documents of the (deleted) test run.
+
+        :return: bool, True is successful
+        """
+        raise NotImplementedError("Abstract method - implement in child subclass!")
+
     def save_json_document(
             self,
             document_type: str,
@@ -135,42 +997,397 @@ class TestReport:
     ):
         """
         Saves an indexed document either to a test report database or the filing system.
+        The document is queued for writing by a background writer thread; the call
+        only blocks while the writer queue is full (i.e. the writer is falling behind).
 
         :param document_type: Dict, Python object to persist as a JSON document.
         :param document: Dict, Python object to persist as a JSON document.
         :param document_key: str, indexing path for the document being saved.
         :param is_big: bool, if True, flags that the JSON file is expected to require special handling due to its size.
         """
-        raise NotImplementedError("Abstract method - implement in child subclass!")
+        if self._writer_threads < 1:
+            self._write_json_document(document_type, document, document_key, is_big)
+            return
+        with self._writers_lock:
+            if not self._writers:
+                self._start_writers()
+            # documents with the same key are written by the same writer, in order
+            queue: Queue = self._writer_queues[hash(document_key) % len(self._writer_queues)]
+        queue.put((document_type, document, document_key, is_big))
 
-    def retrieve_document(self, document_type: str, document_key: str) -> Optional[Dict]:
+    def save_big_document(self, document_type: str, datafile: IO, document_key: str):
         """
-        Retrieves a single report type of document, corresponding to a specified document key.
+        Saves a big document from the (uncompressed JSON text) bytes of a binary file, e.g. streamed from a test
+        run archive. The document is read in whole, then saved as any big document, unless the TestReport
+        subclass streams it (in constant memory) into its storage.
 
         :param document_type: str, name of report type simply used for informative error reporting.
-        :param document_key: str, the key ('path') of the document being requested.
-        :return: Dict, JSON document retrieved.
+        :param datafile: IO, binary file of the document, read up to its end
+        :param document_key: str, indexing path for the document being saved.
         """
-        raise NotImplementedError("Abstract method - implement in child subclass!")
+        self.save_json_document(document_type, orjson.loads(datafile.read()), document_key, is_big=True)
 
-    def stream_document(self, document_type: str, document_key: str) -> Generator:
+    def _write_json_document(
+            self,
+            document_type: str,
+            document: Dict,
+            document_key: str,
+            is_big: bool = False
+    ):
+        """
+        Writes out an indexed document either to a test report database or the filing system.
+
+        :param document_type: Dict, Python object to persist as a JSON document.
+        :param document: Dict, Python object to persist as a JSON document.
+        :param document_key: str, indexing path for the document being saved.
+        :param is_big: bool, if True, flags that the JSON file is expected to require special handling due to its size.
+        """
+        raise NotImplementedError("Abstract method - implement in child subclass!")
+
+    def _start_writers(self):
+        for i in range(self._writer_threads):
+            queue: Queue = Queue(maxsize=self._writer_queue_size)
+            writer = Thread(
+                target=self._write_queued_documents,
+                args=(queue, i),
+                name=f"{self.get_identifier()}-writer-{i}",
+                daemon=True
+            )
+            self._writer_queues.append(queue)
+            self._writers.append(writer)
+            writer.start()
+
+    def _write_queued_documents(self, queue: Queue, queue_index: int):
+        """
+        Writer thread loop, writing out queued documents until a 'None' sentinel is dequeued.
+        Documents which could not be written out are recorded, to be reported by flush() or close().
+
+        :param queue: Queue, of documents to write out
+        :param queue_index: int, index of the writer queue
+        """
+        while True:
+            entry = queue.get()
+            try:
+                if entry is None:
+                    return
+                document_type, document, document_key, is_big = entry
+                try:
+                    self._write_json_document(document_type, document, document_key, is_big)
+                except Exception as exc:
+                    logger.warning(f"{document_type} '{document_key}' could not be written out: {str(exc)}?")
+                    with self._write_failures_lock:
+                        self._write_failures.setdefault(queue_index, list()).append(
+                            (document_type, document_key, exc)
+                        )
+            finally:
+                queue.task_done()
+
+    def _raise_write_failures(self):
+        """
+        Reports (then forgets) the documents which the writer threads failed to write out, if any.
+
+        :raises TestReportDatabaseException: if any document could not be written out
+        """
+        with self._write_failures_lock:
+            failures: List[Tuple[str, str, Exception]] = [
+                failure for queue_index in sorted(self._write_failures) for failure in self._write_failures[queue_index]
+            ]
+            self._write_failures = dict()
+        if failures:
+            raise TestReportDatabaseException(
+                f"{len(failures)} document(s) of test report '{self.get_identifier()}' could not be written out: " +
+                ", ".join([f"{document_type} '{document_key}'" for document_type, document_key, _ in failures]) + "?"
+            ) from failures[0][2]
+
+    def _flush_writes(self):
+        """
+        Writes out any documents buffered by the TestReport subclass itself (i.e. for bulk writing).
+        """
+        pass
+
+    def flush(self):
+        """
+        Writes out any documents saved, but still queued or buffered, by the TestReport.
+        Should be called at the end of a test run, or before documents are read elsewhere.
+
+        :raises TestReportDatabaseException: if any saved document could not be written out
+        """
+        for queue in self._writer_queues:
+            queue.join()
+        self._flush_writes()
+        self._raise_write_failures()
+
+    def _stop_writers(self, discard: bool = False):
+        """
+        Stops the background writer threads, if any, after they wrote out all queued documents.
+
+        :param discard: bool, if True, the queued documents are rather discarded (i.e. when the report is deleted)
+        """
+        with self._writers_lock:
+            for queue in self._writer_queues:
+                if discard:
+                    try:
+                        while True:
+                            queue.get_nowait()
+                            queue.task_done()
+                    except Empty:
+                        pass
+                queue.put(None)
+            for writer in self._writers:
+                writer.join()
+            self._writer_queues = list()
+            self._writers = list()
+        if discard:
+            with self._write_failures_lock:
+                self._write_failures = dict()
+
+    def close(self):
+        """
+        Writes out all the documents saved to the TestReport, then stops its background writer threads.
+        The TestReport may still be used afterwards (new writer threads are then started, as needed).
+
+        :raises TestReportDatabaseException: if any saved document could not be written out
+        """
+        self._stop_writers()
+        self._flush_writes()
+        self._raise_write_failures()
+
+    def retrieve_document(self, document_type: str, document_key: str) -> Optional[Dict]:
         """
         Retrieves a single report type of document, corresponding to a specified document key.
 
         :param document_type: str, name of report type simply used for informative error reporting.
         :param document_key: str, the key ('path') of the document being requested.
-        :return: Generator, generator of streamed JSON document text
+        :return: Dict, JSON document retrieved.
         """
         raise NotImplementedError("Abstract method - implement in child subclass!")
 
-    def open_logger(self):
+    def retrieve_document_projection(self, document_type: str, document_key: str, path: List[str]) -> Optional[Any]:
+        """
+        Retrieves the projection - i.e. the part at a given path, e.g. ['KP', <kp_id>] - of a single report type
+        of document, corresponding to a specified document key. By default, the whole document is retrieved
+        then projected: child subclasses rather only read in the requested part of the document, when they can.
+
+        :param document_type: str, name of report type simply used for informative error reporting.
+        :param document_key: str, the key ('path') of the document being requested.
+        :param path: List[str], keys of the path of the projected part of the document (empty for the whole document)
+        :return: Optional[Any], projected part of the JSON document; None if not available
+        """
+        return project_document(self.retrieve_document(document_type, document_key), path)
+
+    def retrieve_document_keys(self, document_type: str, document_key: str, path: List[str]) -> Optional[List[str]]:
+        """
+        Retrieves the keys (only) of the projection of a single report type of document, e.g. the identifiers
+        of the KP resources of a test run summary, given the path ['KP'].
+
+        :param document_type: str, name of report type simply used for informative error reporting.
+        :param document_key: str, the key ('path') of the document being requested.
+        :param path: List[str], keys of the path of the projected part of the document (empty for the whole document)
+        :return: Optional[List[str]], keys of the projected part of the JSON document; None if not available
+                                      (or not a JSON object)
+        """
+        part: Optional[Any] = self.retrieve_document_projection(document_type, document_key, path)
+        return [str(key) for key in part.keys()] if isinstance(part, Mapping) else None
+
+    def open_document(self, document_type: str, document_key: str, decompress: bool = True) -> Optional[IO]:
+        """
+        Opens the stored (JSON text) bytes of a single report type of document, corresponding to a specified
+        document key, e.g. for streaming a big document. The caller is responsible for closing the file.
+
+        :param document_type: str, name of report type simply used for informative error reporting.
+        :param document_key: str, the key ('path') of the document being requested.
+        :param decompress: bool, if False, the bytes of a compressed document are read as stored (default: True)
+        :return: Optional[IO], binary file of the document (seekable, unless decompressed); None if not accessible
+        """
         raise NotImplementedError("Abstract method - implement in child subclass!")
 
-    def write_logger(self, line: str):
+    def get_document_compression(self, document_type: str, document_key: str) -> Optional[str]:
+        """
+        :param document_type: str, name of report type simply used for informative error reporting.
+        :param document_key: str, the key ('path') of the document being requested.
+        :return: Optional[str], compression of the stored document: 'gzip', 'zstd' or None (also if not accessible)
+        """
         raise NotImplementedError("Abstract method - implement in child subclass!")
 
+    def get_document_size(self, document_type: str, document_key: str) -> Optional[int]:
+        """
+        :param document_type: str, name of report type simply used for informative error reporting.
+        :param document_key: str, the key ('path') of the document being requested.
+        :return: Optional[int], size (in bytes, compressed if so stored) of the stored document;
+                                None if the document is not (yet) accessible
+        """
+        datafile: Optional[IO] = self.open_document(document_type, document_key, decompress=False)
+        if datafile is None:
+            return None
+        with datafile:
+            return datafile.seek(0, SEEK_END)
+
+    def stream_document(
+            self,
+            document_type: str,
+            document_key: str,
+            start: int = 0,
+            end: Optional[int] = None,
+            chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+            decompress: bool = True
+    ) -> Generator:
+        """
+        Streams (a byte range of) the stored bytes of a single report type of document, corresponding to a
+        specified document key, as fixed size chunks, i.e. without ever holding the whole document in memory.
+
+        :param document_type: str, name of report type simply used for informative error reporting.
+        :param document_key: str, the key ('path') of the document being requested.
+        :param start: int, offset of the first streamed byte (default: 0)
+        :param end: Optional[int], offset of the last streamed byte, inclusive (default: None, i.e. end of document)
+        :param chunk_size: int, maximum size (in bytes) of the streamed chunks (default: DEFAULT_STREAM_CHUNK_SIZE)
+        :param decompress: bool, if False, the bytes of a compressed document are streamed as stored (default: True)
+        :return: Generator, generator of streamed JSON document text bytes
+        """
+        datafile: Optional[IO] = self.open_document(document_type, document_key, decompress=decompress)
+        if datafile is None:
+            return
+        with datafile:
+            datafile.seek(start)
+            remaining: Optional[int] = end - start + 1 if end is not None else None
+            while remaining is None or remaining > 0:
+                chunk: bytes = datafile.read(chunk_size if remaining is None else min(chunk_size, remaining))
+                if not chunk:
+                    break
+                if remaining is not None:
+                    remaining -= len(chunk)
+                yield chunk
+
+    def open_logger(
+            self,
+            chunk_lines: int = DEFAULT_LOG_CHUNK_LINES,
+            flush_interval: float = DEFAULT_LOG_FLUSH_INTERVAL,
+            compression: bool = DEFAULT_LOG_COMPRESSION
+    ):
+        """
+        Opens the (new) process log of the test run: the lines written to it are buffered, then saved in chunks.
+
+        :param chunk_lines: int, (maximum) number of lines of a log chunk
+        :param flush_interval: float, maximum age (seconds) of the pending lines, before being saved
+        :param compression: bool, if True, the full log chunks are saved compressed (as big documents)
+        """
+        with self._log_lock:
+            self._log_lines = list()
+            self._log_chunk = 0
+            self._log_chunk_lines = max(chunk_lines, 1)
+            self._log_flush_interval = flush_interval
+            self._log_compression = compression
+            self._log_saved_lines = 0
+            self._log_oldest_line = None
+        if flush_interval > 0 and self._log_flusher is None:
+            self._log_closed.clear()
+            self._log_flusher = Thread(
+                target=self._run_log_flusher, name=f"{self.get_identifier()}-log-flusher", daemon=True
+            )
+            self._log_flusher.start()
+
+    def _run_log_flusher(self):
+        """
+        Log flusher thread loop, saving the pending lines of the process log at each flush interval, until closed:
+        lines written by a process (i.e. a Pytest session) going silent afterwards are thus saved nevertheless.
+        """
+        while not self._log_closed.wait(timeout=self._log_flush_interval):
+            try:
+                self._flush_logger()
+            except Exception as exc:
+                logger.warning(f"Log of test run '{self.get_identifier()}' could not be flushed: {str(exc)}?")
+
+    def write_logger(self, line: str):
+        """
+        Writes a line to the process log of the test run, saved once its chunk is full or the flush interval elapsed.
+
+        :param line: str, line of the process log (newline terminated)
+        """
+        with self._log_lock:
+            if self._log_lines is None:
+                return
+            self._log_lines.append(line)
+            if self._log_oldest_line is None:
+                self._log_oldest_line = monotonic()
+            if len(self._log_lines) >= self._log_chunk_lines or \
+                    monotonic() - self._log_oldest_line >= self._log_flush_interval:
+                self._flush_logger()
+
+    def _flush_logger(self):
+        """
+        Saves the pending lines of the process log, in its current chunk (then started afresh, once full),
+        and the log index. Readers thus see the lines of the log at most one flush interval late. Only full
+        chunks are compressed (if so configured), since the partially filled chunk is saved again at each flush.
+        """
+        with self._log_lock:
+            if not self._log_lines or self._log_oldest_line is None:
+                return
+            offset: int = self._log_chunk * self._log_chunk_lines
+            full: bool = len(self._log_lines) >= self._log_chunk_lines
+            self.save_json_document(
+                document_type="Log Chunk",
+                document={"offset": offset, "lines": list(self._log_lines)},
+                document_key=get_log_chunk_key(self._log_chunk),
+                is_big=self._log_compression and full
+            )
+            self._log_saved_lines = offset + len(self._log_lines)
+            self.save_json_document(
+                document_type="Log Index",
+                document={
+                    "lines": self._log_saved_lines,
+                    "chunks": self._log_chunk + 1,
+                    "chunk_lines": self._log_chunk_lines
+                },
+                document_key=get_log_index_key()
+            )
+            if full:
+                self._log_chunk += 1
+                self._log_lines = list()
+            self._log_oldest_line = None
+
     def close_logger(self):
-        raise NotImplementedError("Abstract method - implement in child subclass!")
+        """
+        Saves the pending lines of the process log, then closes it (the saved log chunks are then written out).
+        """
+        if self._log_flusher is not None:
+            self._log_closed.set()
+            self._log_flusher.join()
+            self._log_flusher = None
+        with self._log_lock:
+            if self._log_lines is None:
+                return
+            self._flush_logger()
+            self._log_lines = None
+        self.flush()
+
+    def read_log(self, offset: int = 0, limit: Optional[int] = None, tail: Optional[int] = None) -> Optional[Dict]:
+        """
+        Reads a page of the (saved) lines of the process log of the test run, only retrieving the chunks spanned.
+
+        :param offset: int, (zero based) number of the first line read (default: 0)
+        :param limit: Optional[int], maximum number of lines read (default: None, i.e. up to the end of the log)
+        :param tail: Optional[int], if given, rather reads (at most) this number of the last lines of the log
+        :return: Optional[Dict], 'lines' of the page, with their 'offset' and the 'total' number of lines saved;
+                                 None if the test run has no (saved) process log
+        """
+        index: Optional[Dict] = self.retrieve_document(document_type="Log Index", document_key=get_log_index_key())
+        if not index:
+            return None
+        total: int = index["lines"]
+        chunk_lines: int = index["chunk_lines"]
+        start: int = max(total - tail, 0) if tail is not None else min(max(offset, 0), total)
+        end: int = min(start + limit, total) if limit is not None else total
+        lines: List[str] = list()
+        for chunk in range(start // chunk_lines, (end - 1) // chunk_lines + 1 if end > start else 0):
+            log_chunk: Optional[Dict] = self.retrieve_document(
+                document_type="Log Chunk", document_key=get_log_chunk_key(chunk)
+            )
+            if not log_chunk:
+                logger.warning(f"Chunk {chunk} of the log of test run '{self.get_identifier()}' is missing?")
+                break
+            lines.extend(
+                log_chunk["lines"][max(start - log_chunk["offset"], 0):end - log_chunk["offset"]]
+            )
+        return {"offset": start, "total": total, "lines": lines}
 
 
 ###############################################################
@@ -197,44 +1414,284 @@ def _delete_test_report(obj, report: TestReport):
 TestReportDatabase.delete_test_report = _delete_test_report
 
 
+class MemoryViewFile(RawIOBase):
+    """
+    Read-only (seekable) binary file of a memoryview, e.g. of a document sliced out of a memory mapped archive.
+    """
+    def __init__(self, view: memoryview):
+        RawIOBase.__init__(self)
+        self._view: memoryview = view
+        self._position: int = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = SEEK_SET) -> int:
+        if whence == SEEK_CUR:
+            offset += self._position
+        elif whence == SEEK_END:
+            offset += len(self._view)
+        if offset < 0:
+            raise ValueError(f"Negative seek position {offset}")
+        self._position = offset
+        return self._position
+
+    def readinto(self, buffer) -> int:
+        chunk: memoryview = self._view[self._position:self._position + len(buffer)]
+        buffer[:len(chunk)] = chunk
+        self._position += len(chunk)
+        return len(chunk)
+
+    def readall(self) -> bytes:
+        chunk: bytes = self._view[self._position:].tobytes()
+        self._position += len(chunk)
+        return chunk
+
+
+class FramedDocumentFile(RawIOBase):
+    """
+    Read-only binary file of a document streamed, as length-prefixed frames ended by an empty frame,
+    within another binary file (i.e. a test run archive), which is only read up to the end of the frames.
+    """
+    def __init__(self, stream: IO):
+        RawIOBase.__init__(self)
+        self._stream: IO = stream
+        self._remaining: int = 0
+        self._ended: bool = False
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while not self._ended and not self._remaining:
+            try:
+                self._remaining = int(self._stream.readline())
+            except ValueError:
+                raise OSError("Truncated document frames?")
+            self._ended = self._remaining == 0
+        if self._ended:
+            return 0
+        chunk: bytes = self._stream.read(min(len(buffer), self._remaining))
+        if not chunk:
+            raise OSError("Truncated document frame?")
+        buffer[:len(chunk)] = chunk
+        self._remaining -= len(chunk)
+        return len(chunk)
+
+    def skip(self):
+        """
+        Reads the remaining frames of the document, if any, i.e. up to the end of the document in the stream.
+        """
+        while self.read(DEFAULT_STREAM_CHUNK_SIZE):
+            pass
+
+
+class PackedTestRun:
+    """
+    Packed (single file) archive of the documents of a (completed) FileTestReport. The stored bytes of the
+    documents - compressed if so stored, or the content address of their blob - are appended one after the
+    other, followed by a footer index of their offset, length and 'codec' (i.e. their compression, or 'blob'),
+    indexed by document key. The archive is read through a (read-only) memory map, documents being sliced
+    out of it without copying them.
+    """
+    MAGIC = b"SRIPACK1"
+
+    # codec of the documents saved in the blob store, i.e. archived as the content address of their blob
+    BLOB = "blob"
+
+    # trailer of the archive: offset of the footer index (little endian), then the magic bytes again
+    _TRAILER = struct.Struct("<Q8s")
+
+    def __init__(self, path: str):
+        """
+        PackedTestRun constructor, opening (i.e. memory mapping) an archive.
+
+        :param path: str, path of the archive file
+        :raises TestReportDatabaseException: if the file is not a (complete) test run archive
+        """
+        self._path: str = path
+        with open(path, mode='rb') as packfile:
+            status = fstat(packfile.fileno())
+            size: int = status.st_size
+            if size < len(self.MAGIC) + self._TRAILER.size:
+                raise TestReportDatabaseException(f"'{path}' is not a test run archive?")
+            self._mmap: mmap.mmap = mmap.mmap(packfile.fileno(), 0, access=mmap.ACCESS_READ)
+
+        # identifies the version of the archive file, which is replaced when packed again
+        self.file_id: Tuple[int, int, int] = (status.st_ino, status.st_size, status.st_mtime_ns)
+
+        index_offset, magic = self._TRAILER.unpack_from(self._mmap, size - self._TRAILER.size)
+        if self._mmap[:len(self.MAGIC)] != self.MAGIC or magic != self.MAGIC:
+            raise TestReportDatabaseException(f"'{path}' is not a test run archive?")
+        self._index: Dict[str, List] = orjson.loads(memoryview(self._mmap)[index_offset:size - self._TRAILER.size])
+
+    def keys(self) -> List[str]:
+        """
+        :return: List[str], keys of the archived documents
+        """
+        return list(self._index.keys())
+
+    def get_entry(self, document_key: str) -> Optional[Tuple[int, int, Optional[str]]]:
+        """
+        :param document_key: str, the key ('path') of the document being requested.
+        :return: Optional[Tuple[int, int, Optional[str]]], offset, length and codec of the archived document;
+                                                          None if not archived
+        """
+        entry: Optional[List] = self._index.get(document_key, None)
+        return tuple(entry) if entry else None
+
+    def view(self, document_key: str) -> Optional[memoryview]:
+        """
+        :param document_key: str, the key ('path') of the document being requested.
+        :return: Optional[memoryview], (zero-copy) view of the stored bytes of the document; None if not archived
+        """
+        entry: Optional[List] = self._index.get(document_key, None)
+        if not entry:
+            return None
+        offset, length, _ = entry
+        return memoryview(self._mmap)[offset:offset + length]
+
+    @classmethod
+    def write(cls, path: str, documents: Iterable[Tuple[str, Optional[str], Union[str, bytes, memoryview]]]):
+        """
+        Writes out an archive, atomically replacing any earlier archive of the same path.
+
+        :param path: str, path of the archive file
+        :param documents: Iterable[Tuple[str, Optional[str], Union[str, bytes, memoryview]]], key, codec and
+                          stored bytes (or path of the file of the stored bytes) of each document, appended
+                          to the archive in turn
+        """
+        index: Dict[str, List] = dict()
+        with open(f"{path}.tmp", mode='wb') as packfile:
+            packfile.write(cls.MAGIC)
+            for document_key, codec, data in documents:
+                offset: int = packfile.tell()
+                if isinstance(data, str):
+                    with open(data, mode='rb') as datafile:
+                        shutil.copyfileobj(datafile, packfile)
+                else:
+                    packfile.write(data)
+                index[document_key] = [offset, packfile.tell() - offset, codec]
+            index_offset: int = packfile.tell()
+            packfile.write(orjson.dumps(index))
+            packfile.write(cls._TRAILER.pack(index_offset, cls.MAGIC))
+        replace(f"{path}.tmp", path)
+
+
 class FileTestReport(TestReport):
 
-    def __init__(self, identifier: str, database: TestReportDatabase):
-        TestReport.__init__(self, identifier=identifier, database=database)
+    # Suffixes of the (loose) document files, by order of precedence, with the codec of their archived documents
+    DOCUMENT_FILE_SUFFIXES: List[Tuple[str, Optional[str]]] = \
+        [(".json", None)] + \
+        [(f".json{suffix}", compression) for compression, suffix in COMPRESSION_SUFFIXES.items()] + \
+        [(".blob", PackedTestRun.BLOB)]
+
+    def __init__(
+            self,
+            identifier: str,
+            database: TestReportDatabase,
+            writer_threads: int = DEFAULT_WRITER_THREADS,
+            writer_queue_size: int = DEFAULT_WRITER_QUEUE_SIZE
+    ):
+        TestReport.__init__(
+            self,
+            identifier=identifier,
+            database=database,
+            writer_threads=writer_threads,
+            writer_queue_size=writer_queue_size
+        )
 
         # File system based reporting needs to create a
         # 'identifier' tagged directory for test results
         makedirs(self.get_database().get_test_results_path(), exist_ok=True)
 
-        self._log_file: Optional[IO] = None
+        # directory paths of documents already created, thus not created again
+        self._created_paths: Set[str] = set()
 
     def exists_document(self, document_key: str) -> bool:
         """
         :param document_key: str, document key identifier ('path')
         :return: True if exists
         """
+        if self.is_deleted():
+            return False
+        self.flush()
+
         # sanity check: Posix key to equivalent OS directory path
-        document_key = document_key.replace('/', sep)
-        document_path = f"{self.get_root_path()}{sep}{document_key}"
-        return exists(document_path)
+        document_path = f"{self.get_root_path()}{sep}{document_key.replace('/', sep)}"
+        if exists(document_path):
+            return True
+
+        # maybe an archived document?
+        pack: Optional[PackedTestRun] = self._get_pack()
+        if document_key.endswith(".json"):
+            document_key = document_key[:-len(".json")]
+        return pack is not None and pack.get_entry(document_key) is not None
+
+    def list_documents(self) -> Iterable[Tuple[str, bool]]:
+        """
+        :return: Iterable[Tuple[str, bool]], key of each (loose or archived) document of the test run, with a flag
+                                             set for the big documents; the split parts of documents are omitted
+        """
+        if self.is_deleted():
+            return
+        self.flush()
+        root_path: str = self.get_root_path()
+        listed: Set[str] = set()
+        for dir_path, dir_names, file_names in walk(root_path):
+            if dir_path == root_path and TEST_RUN_BLOBS in dir_names:
+                dir_names.remove(TEST_RUN_BLOBS)
+            # the split parts of a document are saved again with the document itself
+            dir_names[:] = [dir_name for dir_name in dir_names if not dir_name.endswith(SPLIT_DOCUMENT_SUFFIX)]
+            for file_name in file_names:
+                for suffix, codec in self.DOCUMENT_FILE_SUFFIXES:
+                    if file_name.endswith(suffix):
+                        document_key: str = \
+                            relpath(f"{dir_path}{sep}{file_name}", root_path)[:-len(suffix)].replace(sep, '/')
+                        if document_key not in listed:
+                            listed.add(document_key)
+                            yield document_key, codec is not None
+                        break
+        pack: Optional[PackedTestRun] = self._get_pack()
+        for document_key in (pack.keys() if pack else list()):
+            if document_key not in listed and SPLIT_DOCUMENT_SUFFIX + "/" not in document_key:
+                yield document_key, pack.get_entry(document_key)[2] is not None
 
     def delete(self, ignore_errors: bool = False) -> bool:
         """
         Delete internal representation of the FileTestReport.
         """
+        # pending documents are not written out (i.e. after their directories are removed)
+        self._stop_writers(discard=True)
+        self._created_paths.clear()
+        return TestReport.delete(self, ignore_errors=ignore_errors)
+
+    def purge(self) -> bool:
+        """
+        Physically removes all the documents of the (deleted) FileTestReport.
+        """
         try:
-            # this single command does a good job of
-            # deleting all the TestReport documents
-            shutil.rmtree(self.get_root_path(), ignore_errors=ignore_errors)
-            TestReport.delete(self)
+            # the (big) documents of the test run, in the shared blob store, are only deleted once unreferenced
+            self.get_database().release_blobs(self.get_identifier())
+
+            # this single command does a good job of deleting all the TestReport
+            # documents (none were written out if a test run is deleted before it started)
+            if exists(self.get_root_path()):
+                shutil.rmtree(self.get_root_path())
+            database = self.get_database()
+            if isinstance(database, FileReportDatabase):
+                database.discard_packed_test_run(self.get_identifier())
         except OSError as ose:
             logger.warning(
-                f"FileTestReport.delete():  could not delete '{str(self.get_root_path())}' report path: {str(ose)}"
+                f"FileTestReport.purge():  could not delete '{str(self.get_root_path())}' report path: {str(ose)}"
             )
-            if ignore_errors:
-                return True
-            else:
-                return False
+            return False
 
         # Signal success if no exception is thrown above...
         return True
@@ -250,15 +1707,18 @@ class FileTestReport(TestReport):
         absolute_file_path = normpath(f"{self.get_root_path()}{sep}{document_key}")
         if create_path:
             dir_path: str = sep.join(absolute_file_path.split(sep=sep)[:-1])
+            if dir_path in self._created_paths:
+                return absolute_file_path
             try:
                 makedirs(f"{dir_path}", exist_ok=True)
+                self._created_paths.add(dir_path)
             except OSError as ose:
                 logger.warning(
                     f"get_absolute_file_path() directory path '{dir_path}' could not be created? Exception: {str(ose)}"
                 )
         return absolute_file_path
 
-    def save_json_document(
+    def _write_json_document(
             self,
             document_type: str,
             document: Dict,
@@ -266,7 +1726,7 @@ class FileTestReport(TestReport):
             is_big: bool = False
     ):
         """
-        Saves an indexed document either to a test report database or the filing system.
+        Writes out an indexed document to the filing system.
 
         :param document_type: Dict, Python object to persist as a JSON document.
         :param document: Dict, Python object to persist as a JSON document.
@@ -276,15 +1736,149 @@ class FileTestReport(TestReport):
         # for consistency relative to MongoTestReports, we add the document key to the document
         document["document_key"] = document_key
 
+        if document_key in SPLIT_DOCUMENT_KEYS and not is_big:
+            # the split document is written out before the document itself, which may flag a completed test run
+            self._write_document_split(document_type, document, document_key)
+
+        document_path = self.get_absolute_file_path(document_key=document_key, create_path=True)
+        compression: Optional[str] = self.get_database().get_compression() if is_big else None
+        try:
+            if is_big and self.get_database().uses_blob_store():
+                # the document is saved (once) in the shared blob store, only pointed to by the test run
+                blob_id: str = self.get_database().put_blob(
+                    self.get_identifier(), dump_report_json(document, pretty=False)
+                )
+                with open(f"{document_path}.blob", mode='w', encoding='utf8') as pointer_file:
+                    pointer_file.write(blob_id)
+                # versions of the document saved earlier would otherwise be read instead
+                for suffix in [""] + list(COMPRESSION_SUFFIXES.values()):
+                    if exists(f"{document_path}.json{suffix}"):
+                        remove(f"{document_path}.json{suffix}")
+            elif compression:
+                with open(f"{document_path}.json{COMPRESSION_SUFFIXES[compression]}", mode='wb') as document_file:
+                    document_file.write(compress_document(dump_report_json(document, pretty=False), compression))
+                # an uncompressed version of the document, saved earlier, would otherwise be read instead
+                if exists(f"{document_path}.json"):
+                    remove(f"{document_path}.json")
+            else:
+                with open(f"{document_path}.json", mode='wb') as document_file:
+                    document_file.write(dump_report_json(document))
+        except OSError as ose:
+            logger.warning(f"{document_type} '{document_key}' cannot be written out: {str(ose)}?")
+
+    def save_big_document(self, document_type: str, datafile: IO, document_key: str):
+        """
+        Saves a big document from the (uncompressed JSON text) bytes of a binary file, streamed (in constant
+        memory) into the blob store, or else into a (compressed) document file.
+
+        :param document_type: str, name of report type simply used for informative error reporting.
+        :param datafile: IO, binary file of the document, read up to its end
+        :param document_key: str, indexing path for the document being saved.
+        """
+        # versions of the document saved earlier, but still queued, are written out first
+        self.flush()
         document_path = self.get_absolute_file_path(document_key=document_key, create_path=True)
+        database = self.get_database()
+        suffix: Optional[str] = None
         try:
-            # TODO: maybe I need to write 'is_big' files out as binary?
-            with open(f"{document_path}.json", mode='w', encoding='utf8', buffering=1, newline='\n') as document_file:
-                dump(obj=document, fp=document_file, cls=ReportJsonEncoder, indent=4)
-                document_file.flush()
+            if database.uses_blob_store():
+                blob_id: str = database.put_blob_file(self.get_identifier(), datafile)
+                with open(f"{document_path}.blob", mode='w', encoding='utf8') as pointer_file:
+                    pointer_file.write(blob_id)
+            else:
+                compression: Optional[str] = database.get_compression()
+                suffix = COMPRESSION_SUFFIXES[compression] if compression else ""
+                with open(f"{document_path}.json{suffix}", mode='wb') as document_file:
+                    with open_compressed(document_file, compression) as compressed_file:
+                        shutil.copyfileobj(datafile, compressed_file, DEFAULT_STREAM_CHUNK_SIZE)
+            # versions of the document saved earlier would otherwise be read instead
+            for earlier in [""] + list(COMPRESSION_SUFFIXES.values()):
+                if earlier != suffix and exists(f"{document_path}.json{earlier}"):
+                    remove(f"{document_path}.json{earlier}")
         except OSError as ose:
             logger.warning(f"{document_type} '{document_key}' cannot be written out: {str(ose)}?")
 
+    def _write_document_split(self, document_type: str, document: Dict, document_key: str):
+        """
+        Writes out the per-resource parts of a document - e.g. the summary of a KP resource, at ['KP', <kp_id>] -
+        each as a (small) document of its own, then the outline of the keys of the document and of its components.
+
+        :param document_type: Dict, Python object to persist as a JSON document.
+        :param document: Dict, Python object to persist as a JSON document.
+        :param document_key: str, indexing path for the document being saved.
+        """
+        split_key: str = f"{document_key}{SPLIT_DOCUMENT_SUFFIX}"
+        outline: Dict = {"keys": [str(key) for key in document.keys()], "components": dict()}
+        try:
+            parts: List[Tuple[str, Any]] = list()
+            for component, resources in document.items():
+                if isinstance(resources, Mapping):
+                    outline["components"][str(component)] = [str(resource_id) for resource_id in resources.keys()]
+                    parts.extend([
+                        (f"{split_key}/{component}/{resource_id}", part) for resource_id, part in resources.items()
+                    ])
+            parts.append((f"{split_key}/outline", outline))
+            for part_key, part in parts:
+                part_path: str = self.get_absolute_file_path(document_key=part_key, create_path=True)
+                with open(f"{part_path}.json", mode='wb') as part_file:
+                    part_file.write(dump_report_json(part))
+        except OSError as ose:
+            logger.warning(f"{document_type} '{document_key}' cannot be split: {str(ose)}?")
+
+    def _retrieve_document_outline(self, document_key: str) -> Optional[Dict]:
+        """
+        :param document_key: str, the key ('path') of the document being requested.
+        :return: Optional[Dict], outline of the keys of a split document (see _write_document_split());
+                                 None if the document is not split (e.g. written out by an earlier release)
+        """
+        if document_key not in SPLIT_DOCUMENT_KEYS:
+            return None
+        outline_key: str = f"{document_key}{SPLIT_DOCUMENT_SUFFIX}/outline"
+        if not self.exists_document(f"{outline_key}.json"):
+            return None
+        return self.retrieve_document(document_type="Outline", document_key=outline_key)
+
+    def retrieve_document_projection(self, document_type: str, document_key: str, path: List[str]) -> Optional[Any]:
+        """
+        Retrieves the projection of a single report type of document, only reading in the part of
+        the document, at ['<component>', '<resource_id>', ...], from its precomputed split (if any).
+
+        :param document_type: str, name of report type simply used for informative error reporting.
+        :param document_key: str, the key ('path') of the document being requested.
+        :param path: List[str], keys of the path of the projected part of the document (empty for the whole document)
+        :return: Optional[Any], projected part of the JSON document; None if not available
+        """
+        outline: Optional[Dict] = self._retrieve_document_outline(document_key) if len(path) > 1 else None
+        if outline is None or path[0] not in outline["components"]:
+            return TestReport.retrieve_document_projection(self, document_type, document_key, path)
+        if path[1] not in outline["components"][path[0]]:
+            return None
+        part: Optional[Dict] = self.retrieve_document(
+            document_type=document_type, document_key=f"{document_key}{SPLIT_DOCUMENT_SUFFIX}/{path[0]}/{path[1]}"
+        )
+        return project_document(part, path[2:])
+
+    def retrieve_document_keys(self, document_type: str, document_key: str, path: List[str]) -> Optional[List[str]]:
+        """
+        Retrieves the keys of the projection of a single report type of document, from the
+        outline of its precomputed split (if any) for the keys of the document and of its components.
+
+        :param document_type: str, name of report type simply used for informative error reporting.
+        :param document_key: str, the key ('path') of the document being requested.
+        :param path: List[str], keys of the path of the projected part of the document (empty for the whole document)
+        :return: Optional[List[str]], keys of the projected part of the JSON document; None if not available
+                                      (or not a JSON object)
+        """
+        outline: Optional[Dict] = self._retrieve_document_outline(document_key) if len(path) < 2 else None
+        if outline is not None:
+            if not path:
+                return outline["keys"]
+            if path[0] in outline["components"]:
+                return outline["components"][path[0]]
+            if path[0] not in outline["keys"]:
+                return None
+        return TestReport.retrieve_document_keys(self, document_type, document_key, path)
+
     def retrieve_document(self, document_type: str, document_key: str) -> Optional[Dict]:
         """
         Retrieves a single report type of document, corresponding to a specified document key.
@@ -294,76 +1888,297 @@ class FileTestReport(TestReport):
         :return: Dict, JSON document retrieved.
         """
         assert document_key
+        if self.is_deleted():
+            return None
+        self.flush()
         document: Optional[Dict] = None
         document_path: str = self.get_absolute_file_path(document_key=document_key)
         try:
-            with open(f"{document_path}.json", mode='r', encoding='utf8', buffering=1, newline='\n') as report_file:
-                contents = report_file.read()
+            try:
+                with open(f"{document_path}.json", mode='r', encoding='utf8', buffering=1, newline='\n') as report_file:
+                    contents = report_file.read()
+            except FileNotFoundError:
+                # maybe a (big) compressed, or archived, document?
+                compressed_path, compression = self._find_document_file(document_key)
+                if compressed_path:
+                    with open_decompressed(compressed_path, compression) as report_file:
+                        contents = report_file.read()
+                else:
+                    contents = self._read_packed_document(document_key)
+                    if contents is None:
+                        raise
             if contents:
                 document = orjson.loads(contents)
-        except OSError as ose:
-            logger.warning(f"{document_type} '{document_key}' is not (yet) accessible: {str(ose)}?")
+        except (OSError, EOFError) as exc:
+            logger.warning(f"{document_type} '{document_key}' is not (yet) accessible: {str(exc)}?")
 
         return document
 
-    def stream_document(self, document_type: str, document_key: str) -> Generator:
+    def _find_document_file(self, document_key: str) -> Tuple[Optional[str], Optional[str]]:
         """
-        Retrieves a single report type of document, corresponding to a specified document key.
+        :param document_key: str, the key ('path') of the document being requested.
+        :return: Tuple[Optional[str], Optional[str]], path and compression of the file of the document (i.e. of
+                                                      its blob, if a big document saved in the blob store);
+                                                      None path if the document was not (yet) written out.
+        """
+        document_path: str = self.get_absolute_file_path(document_key=document_key)
+        if exists(f"{document_path}.json"):
+            return f"{document_path}.json", None
+        for compression, suffix in COMPRESSION_SUFFIXES.items():
+            if exists(f"{document_path}.json{suffix}"):
+                return f"{document_path}.json{suffix}", compression
+        if exists(f"{document_path}.blob"):
+            database = self.get_database()
+            if isinstance(database, FileReportDatabase):
+                with open(f"{document_path}.blob", mode='r', encoding='utf8') as pointer_file:
+                    return database.find_blob_file(pointer_file.read().strip())
+        return None, None
+
+    def open_document(self, document_type: str, document_key: str, decompress: bool = True) -> Optional[IO]:
+        """
+        Opens the stored (JSON text) bytes of a single report type of document, corresponding to a specified
+        document key, e.g. for streaming a big document. The caller is responsible for closing the file.
 
         :param document_type: str, name of report type simply used for informative error reporting.
         :param document_key: str, the key ('path') of the document being requested.
-        :return: Generator, generator of streamed JSON document text
+        :param decompress: bool, if False, the bytes of a compressed document are read as stored (default: True)
+        :return: Optional[IO], binary file of the document (seekable, unless decompressed); None if not accessible
         """
-        document_path = self.get_absolute_file_path(document_key)
+        if self.is_deleted():
+            return None
+        self.flush()
+        document_path, compression = self._find_document_file(document_key)
         try:
-            with open(f"{document_path}.json", mode="rb") as datafile:
-                data: bytes
-                for data in datafile.readlines():
-                    line: str = data.decode(encoding="utf8")
-                    yield line.strip()
+            if document_path:
+                return open_decompressed(document_path, compression if decompress else None)
+            datafile: Optional[IO] = self._open_packed_document(document_key, decompress=decompress)
+            if datafile is None:
+                logger.warning(f"{document_type} '{document_key}' is not (yet) accessible?")
+            return datafile
         except OSError as ose:
             logger.warning(f"{document_type} '{document_key}' is not (yet) accessible: {str(ose)}?")
+            return None
 
-    def open_logger(self):
-        self._log_file: Optional[IO] = None
-        if self.get_root_path():
-            log_file_path: str = self.get_absolute_file_path(document_key="test.log", create_path=True)
-            try:
-                self._log_file = open(log_file_path, "w")
-            except FileNotFoundError as fnfe:
-                logger.warning(f"Cannot open log file: {str(fnfe)}")
-        else:
-            logger.warning(f"ProcessLogger(): 'log_file_path' is not set. No process logging shall be done.")
+    def get_document_compression(self, document_type: str, document_key: str) -> Optional[str]:
+        """
+        :param document_type: str, name of report type simply used for informative error reporting.
+        :param document_key: str, the key ('path') of the document being requested.
+        :return: Optional[str], compression of the stored document: 'gzip', 'zstd' or None (also if not accessible)
+        """
+        if self.is_deleted():
+            return None
+        self.flush()
+        document_path, compression = self._find_document_file(document_key)
+        if document_path:
+            return compression
+        pack: Optional[PackedTestRun] = self._get_pack()
+        entry: Optional[Tuple[int, int, Optional[str]]] = pack.get_entry(document_key) if pack else None
+        if not entry:
+            return None
+        if entry[2] == PackedTestRun.BLOB:
+            return self.get_database().get_blob_compression(pack.view(document_key).tobytes().decode().strip())
+        return entry[2]
 
-    def write_logger(self, line: str):
-        if self._log_file:
-            self._log_file.write(line)
+    def _get_pack(self) -> Optional[PackedTestRun]:
+        """
+        :return: Optional[PackedTestRun], archive of the (completed) test run; None if not packed
+        """
+        database = self.get_database()
+        if isinstance(database, FileReportDatabase):
+            return database.get_packed_test_run(self.get_identifier())
+        return None
 
-            # Will this help log performance?
-            self._log_file.flush()
+    def _read_packed_document(self, document_key: str) -> Optional[Union[bytes, memoryview]]:
+        """
+        :param document_key: str, the key ('path') of the document being requested.
+        :return: Optional[Union[bytes, memoryview]], (decompressed) JSON text bytes of an archived document,
+                                                     viewed in place if not compressed; None if not archived
+        """
+        pack: Optional[PackedTestRun] = self._get_pack()
+        entry: Optional[Tuple[int, int, Optional[str]]] = pack.get_entry(document_key) if pack else None
+        if not entry:
+            return None
+        if entry[2] is None:
+            return pack.view(document_key)
+        datafile: Optional[IO] = self._open_packed_document(document_key)
+        if datafile is None:
+            return None
+        with datafile:
+            return datafile.read()
 
-    def close_logger(self):
-        if self._log_file:
-            self._log_file.flush()
-            self._log_file.close()
-            self._log_file = None
+    def _open_packed_document(self, document_key: str, decompress: bool = True) -> Optional[IO]:
+        """
+        :param document_key: str, the key ('path') of the document being requested.
+        :param decompress: bool, if False, the bytes of a compressed document are read as stored (default: True)
+        :return: Optional[IO], binary file of an archived document (seekable, unless decompressed);
+                               None if not archived
+        """
+        pack: Optional[PackedTestRun] = self._get_pack()
+        entry: Optional[Tuple[int, int, Optional[str]]] = pack.get_entry(document_key) if pack else None
+        if not entry:
+            return None
+        codec: Optional[str] = entry[2]
+        if codec == PackedTestRun.BLOB:
+            return self.get_database().open_blob(pack.view(document_key).tobytes().decode().strip(), decompress)
+        datafile: IO = MemoryViewFile(pack.view(document_key))
+        return open_decompressed(datafile, codec) if decompress and codec else datafile
 
+    def set_completed(
+            self,
+            counts: Optional[Dict] = None,
+            rollups: Optional[List[Dict]] = None,
+            completed: Optional[str] = None,
+            references: Optional[List[str]] = None
+    ):
+        """
+        Packs the documents of the test run into its archive (unless disabled), then marks
+        the test run as completed in the test run catalog.
 
-class FileReportDatabase(TestReportDatabase):
-    """
-    Wrapper class for an OS filing system-based repository for storing and retrieving SRI Testing test results.
-    """
+        :param counts: Optional[Dict], summary counts of the test run (e.g. number of resources and unit tests)
+        :param rollups: Optional[List[Dict]], rollup rows of the test run (see TestReportDatabase.save_rollups())
+        :param completed: Optional[str], completion time (ISO format timestamp) of the test run (default: now)
+        :param references: Optional[List[str]], identifiers of the test runs holding the documents carried forward
+                           into the test run (default: None, i.e. the references recorded so far are unchanged)
+        """
+        database = self.get_database()
+        if isinstance(database, FileReportDatabase) and database.packs_test_runs():
+            self.pack()
+        TestReport.set_completed(self, counts=counts, rollups=rollups, completed=completed, references=references)
 
-    def __init__(self, db_name: Optional[str] = None, **kwargs):
-        TestReportDatabase.__init__(self, db_name=db_name, **kwargs)
+    def pack(self) -> bool:
+        """
+        Appends the (loose) document files of the test run - and the documents of its earlier archive, if any,
+        not saved again since - to a new archive (see PackedTestRun), atomically replacing the earlier archive,
+        then removes them. Documents saved afterwards are written out as loose files again, taking precedence
+        over their archived version (until packed again). The (legacy) process log file and the blob references
+        of the test run are not archived.
 
-        # File system based reporting needs to create
-        # a db_name'd root directory for test results
-        makedirs(self.get_test_results_path(), exist_ok=True)
+        :return: bool, True if successful
+        """
+        if self.is_deleted():
+            return False
+        self.flush()
+        if not exists(self.get_root_path()):
+            return False
 
-        self._logs: str = normpath(f"{self.get_test_results_path()}{sep}{self.LOG_NAME}")
+        # (loose) document files, with their codec and precedence, indexed by document key
+        root_path: str = self.get_root_path()
+        documents: Dict[str, Tuple[int, Optional[str], str]] = dict()
+        document_files: List[str] = list()
+        for dir_path, dir_names, file_names in walk(root_path):
+            if dir_path == root_path and TEST_RUN_BLOBS in dir_names:
+                dir_names.remove(TEST_RUN_BLOBS)
+            for file_name in file_names:
+                for precedence, (suffix, codec) in enumerate(self.DOCUMENT_FILE_SUFFIXES):
+                    if file_name.endswith(suffix):
+                        document_file: str = f"{dir_path}{sep}{file_name}"
+                        document_key: str = relpath(document_file, root_path)[:-len(suffix)].replace(sep, '/')
+                        if document_key not in documents or precedence < documents[document_key][0]:
+                            documents[document_key] = (precedence, codec, document_file)
+                        document_files.append(document_file)
+                        break
+        if not documents:
+            return True
+
+        pack: Optional[PackedTestRun] = self._get_pack()
+        archived: List[Tuple[str, Optional[str], Union[str, memoryview]]] = [
+            (document_key, pack.get_entry(document_key)[2], pack.view(document_key))
+            for document_key in (pack.keys() if pack else list())
+            if document_key not in documents
+        ]
+        try:
+            PackedTestRun.write(
+                f"{root_path}{sep}{TEST_RUN_PACK}",
+                archived + [(document_key, codec, path) for document_key, (_, codec, path) in documents.items()]
+            )
+            for document_file in document_files:
+                remove(document_file)
+            # the directories of the document files are removed, once empty
+            for dir_path, _, _ in walk(root_path, topdown=False):
+                if dir_path != root_path:
+                    try:
+                        rmdir(dir_path)
+                    except OSError:
+                        pass
+            self._created_paths.clear()
+        except OSError as ose:
+            logger.warning(f"Test run '{self.get_identifier()}' could not be packed: {str(ose)}?")
+            return False
+        return True
+
+    def read_log(self, offset: int = 0, limit: Optional[int] = None, tail: Optional[int] = None) -> Optional[Dict]:
+        """
+        Reads a page of the lines of the process log of the test run (see TestReport.read_log()),
+        including from the (single) 'test.log' file of the test runs logged before their logs were chunked.
+        """
+        page: Optional[Dict] = TestReport.read_log(self, offset=offset, limit=limit, tail=tail)
+        if page is not None or self.is_deleted():
+            return page
+        log_file_path: str = self.get_absolute_file_path(document_key="test.log")
+        if not exists(log_file_path):
+            return None
+        with open(log_file_path, mode='r', encoding='utf8') as log_file:
+            log_lines: List[str] = log_file.readlines()
+        total: int = len(log_lines)
+        start: int = max(total - tail, 0) if tail is not None else min(max(offset, 0), total)
+        end: int = min(start + limit, total) if limit is not None else total
+        return {"offset": start, "total": total, "lines": log_lines[start:end]}
+
+
+class FileReportDatabase(TestReportDatabase):
+    """
+    Wrapper class for an OS filing system-based repository for storing and retrieving SRI Testing test results.
+    """
+
+    def __init__(
+            self,
+            db_name: Optional[str] = None,
+            pack_test_runs: bool = DEFAULT_PACK_TEST_RUNS,
+            pack_cache_size: int = DEFAULT_PACK_CACHE_SIZE,
+            **kwargs
+    ):
+        """
+        FileReportDatabase constructor.
+
+        :param db_name: str, name of database (default: "sri_testing")
+        :param pack_test_runs: bool, if True, the documents of the completed test runs are packed into a single
+                                     archive file per test run (default: 'TEST_REPORT_PACK' or True)
+        :param pack_cache_size: int, number of (memory mapped) test run archives kept open
+                                     (default: 'TEST_REPORT_PACK_CACHE_SIZE' or 16)
+        :param kwargs:
+        """
+        TestReportDatabase.__init__(self, db_name=db_name, **kwargs)
+
+        # File system based reporting needs to create
+        # a db_name'd root directory for test results
+        makedirs(self.get_test_results_path(), exist_ok=True)
+
+        # Archives of the (completed) test runs, most recently used last
+        self._pack_test_runs: bool = pack_test_runs
+        self._pack_cache_size: int = pack_cache_size
+        self._packs: OrderedDict = OrderedDict()
+        self._packs_lock: RLock = RLock()
+
+        self._logs: str = normpath(f"{self.get_test_results_path()}{sep}{self.LOG_NAME}")
         makedirs(self._logs, exist_ok=True)
 
+        # The test run catalog holds one JSON file per test run
+        self._catalog: str = normpath(f"{self.get_test_results_path()}{sep}{TEST_RUN_CATALOG}")
+        makedirs(self._catalog, exist_ok=True)
+        self._catalog_lock: RLock = RLock()
+
+        # The rollups of the completed test runs are held as one JSON file (of rollup rows) per test run
+        self._rollups: str = normpath(f"{self.get_test_results_path()}{sep}{TEST_RUN_ROLLUPS}")
+        makedirs(self._rollups, exist_ok=True)
+
+        # The blob store holds the (big) documents of the test runs, as '<blob_id[:2]>/<blob_id>.json[.gz|.zst]'
+        # files, each with a '<blob_id>.refs' directory of (empty) files named after the test runs referencing it;
+        # each test run moreover lists the blobs it references, as (empty) files of its own 'test_run_blobs' directory.
+        # The referencing of the blobs is serialised with their release by a '.lock' file of each subdirectory.
+        self._blobs: str = normpath(f"{self.get_test_results_path()}{sep}{TEST_RUN_BLOBS}")
+        makedirs(self._blobs, exist_ok=True)
+        self._blobs_lock: RLock = RLock()
+
         creation_log_file: str = f"{self._logs}{sep}creation.json"
         if not exists(creation_log_file):
             time_created: str = datetime.now().strftime("%Y-%b-%d_%Hhr%M")
@@ -397,14 +2212,350 @@ class FileReportDatabase(TestReportDatabase):
         """
         report.delete()
 
-    def get_available_reports(self) -> List[str]:
+    def packs_test_runs(self) -> bool:
+        """
+        :return: bool, True if the documents of the completed test runs are packed into their archive
+        """
+        return self._pack_test_runs
+
+    def get_packed_test_run(self, test_run_id: str) -> Optional[PackedTestRun]:
+        """
+        :param test_run_id: str, test run identifier
+        :return: Optional[PackedTestRun], (cached) archive of the test run; None if not packed
+        """
+        pack_path: str = f"{self.get_test_results_path()}{sep}{test_run_id}{sep}{TEST_RUN_PACK}"
+        try:
+            status = stat(pack_path)
+        except FileNotFoundError:
+            self.discard_packed_test_run(test_run_id)
+            return None
+        with self._packs_lock:
+            pack: Optional[PackedTestRun] = self._packs.get(test_run_id, None)
+            if pack is not None and pack.file_id == (status.st_ino, status.st_size, status.st_mtime_ns):
+                self._packs.move_to_end(test_run_id)
+                return pack
+            try:
+                pack = PackedTestRun(pack_path)
+            except (OSError, ValueError, TestReportDatabaseException) as exc:
+                logger.warning(f"Archive of test run '{test_run_id}' cannot be read in: {str(exc)}?")
+                return None
+            # archives are only unmapped once no longer used, e.g. by documents being streamed
+            self._packs[test_run_id] = pack
+            self._packs.move_to_end(test_run_id)
+            while len(self._packs) > self._pack_cache_size:
+                self._packs.popitem(last=False)
+            return pack
+
+    def discard_packed_test_run(self, test_run_id: str):
+        """
+        :param test_run_id: str, identifier of a test run, whose (cached) archive is no longer used
+        """
+        with self._packs_lock:
+            self._packs.pop(test_run_id, None)
+
+    def _get_catalog_entry_path(self, test_run_id: str) -> str:
+        return f"{self._catalog}{sep}{test_run_id}.json"
+
+    def update_test_run(self, test_run_id: str, **fields):
+        """
+        Updates (creating as needed) the test run catalog entry of a test run,
+        i.e. its JSON file in the catalog directory, replaced atomically.
+
+        :param test_run_id: str, test run identifier
+        :param fields: catalog entry fields to be set, e.g. 'state', 'completed' (timestamp) or 'counts'
+        """
+        entry_path: str = self._get_catalog_entry_path(test_run_id)
+        with self._catalog_lock:
+            entry: Dict = self.get_test_run(test_run_id) or {"test_run_id": test_run_id}
+            entry.update(fields)
+            entry["updated"] = datetime.utcnow().isoformat()
+            try:
+                with open(f"{entry_path}.tmp", mode='wb') as entry_file:
+                    entry_file.write(orjson.dumps(entry))
+                replace(f"{entry_path}.tmp", entry_path)
+            except OSError as ose:
+                logger.warning(f"Test run catalog entry '{entry_path}' cannot be written out: {str(ose)}?")
+
+    def get_test_run(self, test_run_id: str) -> Optional[Dict]:
+        """
+        :param test_run_id: str, test run identifier
+        :return: Optional[Dict], test run catalog entry of the test run; None if unknown
+        """
+        try:
+            with open(self._get_catalog_entry_path(test_run_id), mode='rb') as entry_file:
+                return orjson.loads(entry_file.read())
+        except FileNotFoundError:
+            return None
+        except (OSError, orjson.JSONDecodeError) as exc:
+            logger.warning(f"Test run catalog entry of '{test_run_id}' cannot be read in: {str(exc)}?")
+            return None
+
+    def list_test_runs(self, state: Optional[str] = None) -> List[Dict]:
+        """
+        :param state: Optional[str], state of the listed test runs (default: None, i.e. all the test runs)
+        :return: List[Dict], test run catalog entries, sorted by test run identifier
+        """
+        entries: List[Dict] = list()
+        for entry_file_name in sorted(listdir(self._catalog)):
+            if not entry_file_name.endswith(".json"):
+                continue
+            entry: Optional[Dict] = self.get_test_run(entry_file_name[:-len(".json")])
+            if entry and (state is None or entry.get("state", None) == state):
+                entries.append(entry)
+        return entries
+
+    def remove_test_run(self, test_run_id: str):
+        """
+        :param test_run_id: str, identifier of a (deleted) test run, removed from the test run catalog
+        """
+        with self._catalog_lock:
+            try:
+                remove(self._get_catalog_entry_path(test_run_id))
+            except FileNotFoundError:
+                pass
+            except OSError as ose:
+                logger.warning(f"Test run catalog entry of '{test_run_id}' cannot be removed: {str(ose)}?")
+
+    def save_rollups(self, test_run_id: str, completed: str, rollups: List[Dict]):
+        """
+        Replaces the rollup rows of a (completed) test run, i.e. its JSON file in the rollups directory.
+
+        :param test_run_id: str, test run identifier
+        :param completed: str, completion time (ISO format timestamp) of the test run
+        :param rollups: List[Dict], rollup rows of the test run, with the ROLLUP_KEY_FIELDS and ROLLUP_STATISTICS_FIELDS
+        """
+        rollups_path: str = f"{self._rollups}{sep}{test_run_id}.json"
+        rows: List[Dict] = [dict(row, test_run_id=test_run_id, completed=completed) for row in rollups]
+        try:
+            with open(f"{rollups_path}.tmp", mode='wb') as rollups_file:
+                rollups_file.write(orjson.dumps(rows))
+            replace(f"{rollups_path}.tmp", rollups_path)
+        except OSError as ose:
+            logger.warning(f"Test run rollups '{rollups_path}' cannot be written out: {str(ose)}?")
+
+    def delete_rollups(self, test_run_id: str):
+        """
+        :param test_run_id: str, identifier of a (deleted) test run, whose rollup rows are removed
+        """
+        try:
+            remove(f"{self._rollups}{sep}{test_run_id}.json")
+        except FileNotFoundError:
+            pass
+        except OSError as ose:
+            logger.warning(f"Test run rollups of '{test_run_id}' cannot be removed: {str(ose)}?")
+
+    def get_rollups(
+            self,
+            component: Optional[str] = None,
+            ara_id: Optional[str] = None,
+            kp_id: Optional[str] = None,
+            unit_test: Optional[str] = None,
+            since: Optional[str] = None,
+            until: Optional[str] = None
+    ) -> List[Dict]:
+        """
+        Retrieves the rollup rows of the completed test runs, matching all the given criteria.
+
+        :param component: Optional[str], Translator component of the resources: 'ARA' or 'KP' (default: any)
+        :param ara_id: Optional[str], identifier of the ARA (default: any, including none)
+        :param kp_id: Optional[str], identifier of the (direct, or ARA embedded) KP (default: any)
+        :param unit_test: Optional[str], unit test (category), e.g. 'by_subject' (default: any)
+        :param since: Optional[str], earliest completion time (ISO format timestamp) of the test runs (default: none)
+        :param until: Optional[str], latest completion time (ISO format timestamp) of the test runs (default: none)
+        :return: List[Dict], rollup rows (with their 'test_run_id' and 'completed' time), sorted by completion time
+        """
+        filters: Dict[str, str] = self._get_rollup_filters(component, ara_id, kp_id, unit_test)
+        rows: List[Dict] = list()
+        for rollups_file_name in listdir(self._rollups):
+            if not rollups_file_name.endswith(".json"):
+                continue
+            try:
+                with open(f"{self._rollups}{sep}{rollups_file_name}", mode='rb') as rollups_file:
+                    rollups: List[Dict] = orjson.loads(rollups_file.read())
+            except (OSError, orjson.JSONDecodeError) as exc:
+                logger.warning(f"Test run rollups '{rollups_file_name}' cannot be read in: {str(exc)}?")
+                continue
+            rows.extend([
+                row for row in rollups
+                if all([row.get(field, None) == value for field, value in filters.items()]) and
+                (since is None or row["completed"] >= since) and (until is None or row["completed"] <= until)
+            ])
+        return sorted(rows, key=lambda row: (row["completed"], row["test_run_id"]))
+
+    def _get_blob_path(self, blob_id: str) -> str:
+        """
+        :param blob_id: str, content address of a document in the blob store
+        :return: str, path of the files of the blob (without their suffix)
+        """
+        return f"{self._blobs}{sep}{blob_id[:2]}{sep}{blob_id}"
+
+    @contextmanager
+    def _lock_blob(self, blob_id: str) -> Generator:
+        """
+        Context manager of the exclusive lock of a blob, held across processes (i.e. the test runs, their
+        pytest-xdist workers and the reaper) with an advisory lock of the (never deleted) lock file shared
+        by the blobs of its subdirectory; only held across the threads of this process, if not available.
+
+        :param blob_id: str, content address of a document in the blob store
+        :return: Generator, yielding once the blob is locked
+        """
+        blob_directory: str = f"{self._blobs}{sep}{blob_id[:2]}"
+        makedirs(blob_directory, exist_ok=True)
+        with open(f"{blob_directory}{sep}.lock", mode='ab') as lock_file:
+            if fcntl is None:
+                with self._blobs_lock:
+                    yield
+            else:
+                # each open file (description) is locked on its own, thus also across the threads of this process
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    def find_blob_file(self, blob_id: str) -> Tuple[Optional[str], Optional[str]]:
+        """
+        :param blob_id: str, content address of a document in the blob store
+        :return: Tuple[Optional[str], Optional[str]], path and compression of the file of the blob;
+                                                      None path if the blob is not in the blob store.
+        """
+        blob_path: str = self._get_blob_path(blob_id)
+        if exists(f"{blob_path}.json"):
+            return f"{blob_path}.json", None
+        for compression, suffix in COMPRESSION_SUFFIXES.items():
+            if exists(f"{blob_path}.json{suffix}"):
+                return f"{blob_path}.json{suffix}", compression
+        return None, None
+
+    def put_blob(self, test_run_id: str, data: bytes) -> str:
         """
-        :return: list of identifiers of available reports.
+        Saves a big document in the content-addressed blob store, unless already there (i.e. saved by any test
+        run), then adds the test run to the references of the blob.
+
+        :param test_run_id: str, identifier of the test run referencing the document
+        :param data: bytes, (uncompressed JSON text) bytes of the document
+        :return: str, content address of the document in the blob store (see get_blob_id())
+        """
+        blob_id: str = get_blob_id(data)
+
+        def write_blob(blob_file: str):
+            with open(f"{blob_file}.{test_run_id}.tmp", mode='wb') as datafile:
+                datafile.write(compress_document(data, self.get_compression()))
+            replace(f"{blob_file}.{test_run_id}.tmp", blob_file)
+
+        self._reference_blob(test_run_id, blob_id, write_blob)
+        return blob_id
+
+    def put_blob_file(self, test_run_id: str, datafile: IO) -> str:
+        """
+        Saves a big document read from a binary file in the content-addressed blob store, like put_blob(),
+        yet in constant memory: the document is first written out (compressed) to a temporary file, while
+        computing its content address.
+
+        :param test_run_id: str, identifier of the test run referencing the document
+        :param datafile: IO, binary file of the (uncompressed JSON text) bytes of the document, read up to its end
+        :return: str, content address of the document in the blob store (see get_blob_id())
+        """
+        digest = sha256()
+        temp_file = NamedTemporaryFile(mode='wb', suffix=".tmp", dir=self._blobs, delete=False)
+        try:
+            with temp_file:
+                with open_compressed(temp_file, self.get_compression()) as compressed_file:
+                    for chunk in iter(lambda: datafile.read(DEFAULT_STREAM_CHUNK_SIZE), b""):
+                        digest.update(chunk)
+                        compressed_file.write(chunk)
+            blob_id: str = digest.hexdigest()
+            self._reference_blob(test_run_id, blob_id, lambda blob_file: replace(temp_file.name, blob_file))
+        finally:
+            if exists(temp_file.name):
+                remove(temp_file.name)
+        return blob_id
+
+    def _reference_blob(self, test_run_id: str, blob_id: str, write_blob: Callable[[str], None]):
+        """
+        Adds a test run to the references of a blob, then writes out the blob, unless already in the blob store.
+
+        :param test_run_id: str, identifier of the test run referencing the blob
+        :param blob_id: str, content address of the blob
+        :param write_blob: Callable[[str], None], writing out the (missing) blob atomically, as the given file
+                           (i.e. replacing it by a complete temporary file), since read without lock
+        """
+        blob_path: str = self._get_blob_path(blob_id)
+
+        test_run_blobs: str = f"{self.get_test_results_path()}{sep}{test_run_id}{sep}{TEST_RUN_BLOBS}"
+        makedirs(test_run_blobs, exist_ok=True)
+        open(f"{test_run_blobs}{sep}{blob_id}", mode='w').close()
+
+        # the blob is referenced, then checked for (and written out, if missing), under the lock of the blob:
+        # otherwise, the reaper may delete a blob (file) no longer referenced in between
+        with self._lock_blob(blob_id):
+            makedirs(f"{blob_path}.refs", exist_ok=True)
+            open(f"{blob_path}.refs{sep}{test_run_id}", mode='w').close()
+            blob_file, _ = self.find_blob_file(blob_id)
+            if not blob_file:
+                compression: Optional[str] = self.get_compression()
+                write_blob(f"{blob_path}.json{COMPRESSION_SUFFIXES[compression] if compression else ''}")
+
+    def open_blob(self, blob_id: str, decompress: bool = True) -> Optional[IO]:
         """
+        :param blob_id: str, content address of a document in the blob store
+        :param decompress: bool, if False, the bytes of a compressed document are read as stored (default: True)
+        :return: Optional[IO], binary file of the document (seekable, unless decompressed); None if not in the store
+        """
+        blob_file, compression = self.find_blob_file(blob_id)
+        if not blob_file:
+            return None
+        return open_decompressed(blob_file, compression if decompress else None)
+
+    def get_blob_compression(self, blob_id: str) -> Optional[str]:
+        """
+        :param blob_id: str, content address of a document in the blob store
+        :return: Optional[str], compression of the stored document: 'gzip', 'zstd' or None (also if not in the store)
+        """
+        _, compression = self.find_blob_file(blob_id)
+        return compression
+
+    def release_blobs(self, test_run_id: str) -> List[str]:
+        """
+        Removes a (deleted) test run from the references of the blobs of the blob store,
+        then deletes the blobs which are no longer referenced by any test run.
+
+        :param test_run_id: str, identifier of the test run
+        :return: List[str], content addresses of the blobs deleted
+        """
+        test_run_blobs: str = f"{self.get_test_results_path()}{sep}{test_run_id}{sep}{TEST_RUN_BLOBS}"
+        if not exists(test_run_blobs):
+            return list()
+        deleted: List[str] = list()
+        for blob_id in listdir(test_run_blobs):
+            blob_path: str = self._get_blob_path(blob_id)
+            # serialised with the (re-)referencing of the blob by put_blob()
+            with self._lock_blob(blob_id):
+                try:
+                    remove(f"{blob_path}.refs{sep}{test_run_id}")
+                except FileNotFoundError:
+                    pass
+                try:
+                    # only succeeds if no other test run references the blob
+                    rmdir(f"{blob_path}.refs")
+                except FileNotFoundError:
+                    pass
+                except OSError:
+                    continue
+                blob_file, _ = self.find_blob_file(blob_id)
+                if blob_file:
+                    remove(blob_file)
+            deleted.append(blob_id)
+        if deleted:
+            logger.debug(f"Deleted {len(deleted)} blobs no longer referenced once test run '{test_run_id}' deleted")
+        return deleted
+
+    def _find_completed_test_runs(self) -> List[str]:
         test_results_directory = self.get_test_results_path()
         test_run_list: List[str] = [
             identifier for identifier in listdir(test_results_directory)
-            if self.get_test_report(identifier).exists_document("test_run_summary.json")
+            if identifier not in [self.LOG_NAME, TEST_RUN_CATALOG, TEST_RUN_ROLLUPS, TEST_RUN_BLOBS] and
+            self.get_test_report(identifier).exists_document("test_run_summary.json")
         ]
         return test_run_list
 
@@ -426,11 +2577,51 @@ class FileReportDatabase(TestReportDatabase):
         return logs
 
 
+_gridfs_upload_executor: Optional[ThreadPoolExecutor] = None
+
+
+def get_gridfs_upload_executor() -> ThreadPoolExecutor:
+    """
+    :return: ThreadPoolExecutor, shared pool of threads pipelining the GridFS uploads of big documents
+    """
+    global _gridfs_upload_executor
+    if _gridfs_upload_executor is None:
+        _gridfs_upload_executor = ThreadPoolExecutor(
+            max_workers=DEFAULT_GRIDFS_UPLOAD_THREADS, thread_name_prefix="gridfs-upload"
+        )
+    return _gridfs_upload_executor
+
+
 class MongoTestReport(TestReport):
 
-    def __init__(self, identifier: str, database: TestReportDatabase, mongo_db: Database):
+    def __init__(
+            self,
+            identifier: str,
+            database: TestReportDatabase,
+            mongo_db: Database,
+            write_batch_size: int = DEFAULT_WRITE_BATCH_SIZE,
+            write_flush_interval: float = DEFAULT_WRITE_FLUSH_INTERVAL,
+            writer_threads: int = DEFAULT_WRITER_THREADS,
+            writer_queue_size: int = DEFAULT_WRITER_QUEUE_SIZE
+    ):
+        """
+        MongoTestReport constructor.
 
-        TestReport.__init__(self, identifier=identifier, database=database)
+        :param identifier: report identifier (perhaps a timestamp?)
+        :param database: TestReportDatabase to which the report belongs
+        :param mongo_db: Database, MongoDb database handle
+        :param write_batch_size: int, number of pending documents triggering a bulk write (1 means no buffering)
+        :param write_flush_interval: float, age (seconds) of the oldest pending document triggering a bulk write
+        :param writer_threads: int, number of background writer threads (0 means synchronous writes)
+        :param writer_queue_size: int, maximum number of documents queued for writing, per writer thread
+        """
+        TestReport.__init__(
+            self,
+            identifier=identifier,
+            database=database,
+            writer_threads=writer_threads,
+            writer_queue_size=writer_queue_size
+        )
 
         # remember the MongoDb database handle associated with this MongoTestReport
         self._db: Database = mongo_db
@@ -442,44 +2633,94 @@ class MongoTestReport(TestReport):
         # 'identifier' tagged collection for test results
         self._collection: Optional[Collection] = self._db[identifier]
 
+        self._write_batch_size: int = write_batch_size
+        self._write_flush_interval: float = write_flush_interval
+
+        # Documents - or pending GridFS uploads of big documents - not yet written, indexed by document key
+        self._pending_writes: Dict[str, Union[Dict, Future]] = dict()
+
+        # GridFS uploads of big documents saved again before being written out
+        self._superseded_uploads: List[Future] = list()
+
+        self._oldest_pending_write: Optional[float] = None
+
+        # the pending writes are shared by the background writer thread(s) and the readers flushing them
+        self._pending_writes_lock: RLock = RLock()
+
     def exists_document(self, document_key: str) -> bool:
+        if self.is_deleted():
+            return False
+        self.flush()
         return self._collection.find_one(filter={'document_key': document_key}) is not None
 
+    def list_documents(self) -> Iterable[Tuple[str, bool]]:
+        """
+        :return: Iterable[Tuple[str, bool]], key of each document of the test run (streamed from a cursor),
+                                             with a flag set for the big documents, i.e. in GridFS or the blob store
+        """
+        if self.is_deleted():
+            return
+        self.flush()
+        for document in self._collection.find(
+                filter=dict(), projection={'document_key': True, 'gridfs_uid': True, 'blob': True, '_id': False}
+        ):
+            if 'document_key' in document:
+                yield document['document_key'], 'gridfs_uid' in document or 'blob' in document
+
+    def _discard_pending_writes(self):
+        """
+        Discard the pending writes, waiting for their GridFS uploads to be done (before their GridFS is dropped).
+        """
+        self._stop_writers(discard=True)
+        with self._pending_writes_lock:
+            for write in list(self._pending_writes.values()) + self._superseded_uploads:
+                if isinstance(write, Future):
+                    write.exception()
+            self._pending_writes = dict()
+            self._superseded_uploads = list()
+            self._oldest_pending_write = None
+
     def delete(self, ignore_errors: bool = False) -> bool:
         """
         Delete internal representation of the MongoTestReport.
         :return: bool, True is successful
         """
+        self._discard_pending_writes()
+        if not TestReport.delete(self, ignore_errors=ignore_errors):
+            return False
+        self._collection = None
+        return True
+
+    def purge(self) -> bool:
+        """
+        Physically removes all the documents of the (deleted) MongoTestReport.
+        :return: bool, True is successful
+        """
         try:
             # MongoTestReport deletion is a bit more complex
             # given that we have stored "big" documents in GridFS,
             # not in MongoDb itself. Thus, we also need to purge
             # the GridFS database of the associated GridFS collections.
             test_run_id = self.get_identifier()
-            gridfs_files = f"{test_run_id}.files"
-            gridfs_chunks = f"{test_run_id}.chunks"
-            # we briefly sleep to yield to the system
-            # to allow the MongoDb task to complete
-            self._db.drop_collection(gridfs_files)
-            sleep(1)
-            self._db.drop_collection(gridfs_chunks)
-            sleep(1)
+
+            # the (big) documents of the test run, in the shared blob store, are only deleted once unreferenced
+            self.get_database().release_blobs(test_run_id)
+            self._db.drop_collection(f"{test_run_id}.files")
+            self._db.drop_collection(f"{test_run_id}.chunks")
             self._db.drop_collection(test_run_id)
-            TestReport.delete(self)
-            self._collection = None
-        except Exception as exc:
+            database = self.get_database()
+            if isinstance(database, MongoReportDatabase):
+                database.discard_document_key_index(test_run_id)
+        except PyMongoError as exc:
             logger.warning(
-                f"MongoTestReport.delete():  could not delete '{str(self.get_root_path())}' report path: {str(exc)}"
+                f"MongoTestReport.purge():  could not delete test run '{self.get_identifier()}': {str(exc)}"
             )
-            if ignore_errors:
-                return True
-            else:
-                return False
+            return False
 
         # Signal success if no exception is thrown above...
         return True
 
-    def save_json_document(
+    def _write_json_document(
             self,
             document_type: str,
             document: Dict,
@@ -487,7 +2728,8 @@ class MongoTestReport(TestReport):
             is_big: bool = False
     ):
         """
-        Saves an indexed document either to a test report database or the filing system.
+        Writes out an indexed document to the (wrapped MongoDb) TestReportDatabase.
+        The document is buffered, for a later bulk write (see _flush_writes()).
 
         :param document_type: Dict, Python object to persist as a JSON document.
         :param document: Dict, Python object to persist as a JSON document.
@@ -497,17 +2739,151 @@ class MongoTestReport(TestReport):
         # Persist index test run result JSON document suitably indexed by
         # the document_key, into the (wrapped MongoDb) TestReportDatabase
         document['document_key'] = document_key
+        write: Union[Dict, Future] = document
         if is_big:
-            # Save this large document with GridFS
-            gridfs_uid = self._gridfs.put(dumps(obj=document, cls=ReportJsonEncoder), encoding="utf8")
-            # we save large documents in GridFS dereferenced by a proxy document in the main database
-            proxy_document = {
-                'document_key': document_key,
-                'gridfs_uid': gridfs_uid
-            }
-            self._collection.insert_one(proxy_document)
-        else:
-            self._collection.insert_one(document)
+            # Save this large document with GridFS, in the background: its proxy
+            # document, in the main database, is only written once it is uploaded
+            write = get_gridfs_upload_executor().submit(self._put_gridfs_document, document)
+
+        with self._pending_writes_lock:
+            # A document saved again, before being written out, replaces the pending one
+            previous_write: Optional[Union[Dict, Future]] = self._pending_writes.pop(document_key, None)
+            if isinstance(previous_write, Future):
+                self._superseded_uploads.append(previous_write)
+            self._pending_writes[document_key] = write
+
+            if self._oldest_pending_write is None:
+                self._oldest_pending_write = monotonic()
+            if len(self._pending_writes) >= self._write_batch_size or \
+                    monotonic() - self._oldest_pending_write >= self._write_flush_interval:
+                self._flush_writes()
+
+    def _put_gridfs_document(self, document: Dict) -> Dict:
+        """
+        Uploads a (big) document to GridFS, compressed if so configured for the TestReportDatabase.
+
+        :param document: Dict, Python object to persist as a JSON document.
+        :return: Dict, fields of the proxy document of the GridFS file (or blob), in the main database
+        """
+        database = self.get_database()
+        if database.uses_blob_store():
+            # the document is saved (once) in the shared blob store, only pointed to by the test run
+            return {'blob': database.put_blob(self.get_identifier(), dump_report_json(document, pretty=False))}
+        compression: Optional[str] = database.get_compression()
+        data: bytes = compress_document(dump_report_json(document, pretty=False), compression)
+        if not compression:
+            return {'gridfs_uid': self._gridfs.put(data)}
+        return {'gridfs_uid': self._gridfs.put(data, compression=compression), 'compression': compression}
+
+    def _flush_writes(self):
+        """
+        Writes out the pending documents of the MongoTestReport, in a single unordered bulk write.
+
+        :raises TestReportDatabaseException: if any pending document could not be written out
+        """
+        with self._pending_writes_lock:
+            if not (self._pending_writes or self._superseded_uploads):
+                return
+            pending_writes: Dict[str, Union[Dict, Future]] = self._pending_writes
+            superseded_uploads: List[Future] = self._superseded_uploads
+            self._pending_writes = dict()
+            self._superseded_uploads = list()
+            self._oldest_pending_write = None
+            self._bulk_write(pending_writes, superseded_uploads)
+
+    def _bulk_write(self, pending_writes: Dict[str, Union[Dict, Future]], superseded_uploads: List[Future]):
+        """
+        Writes out the pending documents, under the pending writes lock. Documents which could not be written out
+        are pending again, to be retried by the next bulk write, unless their GridFS upload failed (i.e. they are lost).
+
+        :param pending_writes: Dict[str, Union[Dict, Future]], documents (or their GridFS uploads) to write out
+        :param superseded_uploads: List[Future], GridFS uploads of documents replaced before being written out
+        :raises TestReportDatabaseException: if any pending document could not be written out
+        """
+        # GridFS files of big documents replaced by the bulk write, to be deleted once dereferenced
+        obsolete_gridfs_uids: List = list()
+
+        # documents not written out, either pending again or lost, and the (last) error
+        unwritten_writes: Dict[str, Union[Dict, Future]] = dict()
+        lost_document_keys: List[str] = list()
+        error: Optional[Exception] = None
+
+        requests: List[ReplaceOne] = list()
+        document_keys: List[str] = list()
+        for document_key, write in pending_writes.items():
+            document: Dict = write
+            if isinstance(write, Future):
+                try:
+                    # we save large documents in GridFS dereferenced by a proxy document in the main database
+                    document = {'document_key': document_key, **write.result()}
+                except (PyMongoError, OSError) as exc:
+                    logger.warning(f"Big document '{document_key}' could not be uploaded to GridFS: {str(exc)}?")
+                    lost_document_keys.append(document_key)
+                    error = exc
+                    continue
+            # Documents are replaced if already present, so that a test run (shard)
+            # may be run again, i.e. by a distributed test run worker, after a failure
+            requests.append(ReplaceOne(filter={'document_key': document_key}, replacement=document, upsert=True))
+            document_keys.append(document_key)
+
+        for upload in superseded_uploads:
+            if not upload.exception() and 'gridfs_uid' in upload.result():
+                obsolete_gridfs_uids.append(upload.result()['gridfs_uid'])
+
+        if requests:
+            try:
+                # the first write of a test run creates its collection, which is then indexed by document key
+                database = self.get_database()
+                if isinstance(database, MongoReportDatabase):
+                    database.ensure_document_key_index(self._collection)
+
+                previous_gridfs_uids: Dict[str, Any] = {
+                    previous_document['document_key']: previous_document['gridfs_uid']
+                    for previous_document in self._collection.find(
+                        filter={
+                            'document_key': {'$in': document_keys},
+                            'gridfs_uid': {'$exists': True}
+                        },
+                        projection={'document_key': True, 'gridfs_uid': True}
+                    )
+                }
+                failed_requests: Set[int] = set()
+                try:
+                    self._collection.bulk_write(requests, ordered=False)
+                except BulkWriteError as bwe:
+                    failed_requests = {write_error['index'] for write_error in bwe.details.get('writeErrors', [])}
+                    logger.warning(
+                        f"MongoTestReport.flush(): {len(failed_requests)} of {len(requests)} " +
+                        f"documents of test run '{self.get_identifier()}' could not be written: {str(bwe)}?"
+                    )
+                    error = bwe
+                for index, document_key in enumerate(document_keys):
+                    if index in failed_requests:
+                        unwritten_writes[document_key] = pending_writes[document_key]
+                    elif document_key in previous_gridfs_uids:
+                        # the GridFS file of a replaced big document is no longer referenced
+                        obsolete_gridfs_uids.append(previous_gridfs_uids[document_key])
+            except (PyMongoError, InvalidDocument) as exc:
+                logger.warning(
+                    f"MongoTestReport.flush(): {len(requests)} documents " +
+                    f"of test run '{self.get_identifier()}' could not be written: {str(exc)}?"
+                )
+                unwritten_writes.update({document_key: pending_writes[document_key] for document_key in document_keys})
+                error = exc
+
+        for gridfs_uid in obsolete_gridfs_uids:
+            self._gridfs.delete(gridfs_uid)
+
+        if unwritten_writes:
+            # retried by the next bulk write (no document was saved meanwhile, under the pending writes lock)
+            self._pending_writes.update(unwritten_writes)
+            self._oldest_pending_write = monotonic()
+        if unwritten_writes or lost_document_keys:
+            raise TestReportDatabaseException(
+                f"{len(unwritten_writes) + len(lost_document_keys)} document(s) of test run " +
+                f"'{self.get_identifier()}' could not be written out: " +
+                ", ".join(list(unwritten_writes) + lost_document_keys) + "?"
+            ) from error
 
     def retrieve_document(self, document_type: str, document_key: str) -> Optional[Dict]:
         """
@@ -518,42 +2894,153 @@ class MongoTestReport(TestReport):
         :return: Dict, JSON document retrieved.
         """
         assert document_key
+        if self.is_deleted():
+            return None
         assert self._collection is not None
+        self.flush()
         document: Optional[Dict] = self._collection.find_one(
             filter={'document_key': document_key}, projection={'_id': False}
         )
         return document
 
-    def stream_document(self, document_type: str, document_key: str) -> Generator:
+    def retrieve_document_projection(self, document_type: str, document_key: str, path: List[str]) -> Optional[Any]:
+        """
+        Retrieves the projection of a single report type of document, with a (native) MongoDb projection.
+
+        :param document_type: str, name of report type simply used for informative error reporting.
+        :param document_key: str, the key ('path') of the document being requested.
+        :param path: List[str], keys of the path of the projected part of the document (empty for the whole document)
+        :return: Optional[Any], projected part of the JSON document; None if not available
+        """
+        if not path or any(["." in key or key.startswith("$") for key in path]):
+            # keys not expressible as (dotted) MongoDb field paths
+            return TestReport.retrieve_document_projection(self, document_type, document_key, path)
+        assert document_key
+        if self.is_deleted():
+            return None
+        self.flush()
+        try:
+            document: Optional[Dict] = self._collection.find_one(
+                filter={'document_key': document_key}, projection={".".join(path): True, '_id': False}
+            )
+        except PyMongoError as pme:
+            logger.warning(f"{document_type} '{document_key}' is not (yet) accessible: {str(pme)}?")
+            return None
+        return project_document(document, path)
+
+    def retrieve_document_keys(self, document_type: str, document_key: str, path: List[str]) -> Optional[List[str]]:
         """
-        Retrieves a single report type of document, corresponding to a specified document key
+        Retrieves the keys of the projection of a single report type of document, with a MongoDb aggregation
+        only returning the (field) keys of the projected part of the document.
 
         :param document_type: str, name of report type simply used for informative error reporting.
         :param document_key: str, the key ('path') of the document being requested.
-        :return: Generator, generator of streamed JSON document text
+        :param path: List[str], keys of the path of the projected part of the document (empty for the whole document)
+        :return: Optional[List[str]], keys of the projected part of the JSON document; None if not available
+                                      (or not a JSON object)
+        """
+        if any(["." in key or key.startswith("$") for key in path]):
+            return TestReport.retrieve_document_keys(self, document_type, document_key, path)
+        assert document_key
+        if self.is_deleted():
+            return None
+        self.flush()
+        field: str = f"${'.'.join(path)}" if path else "$$ROOT"
+        try:
+            result: Optional[Dict] = next(
+                self._collection.aggregate([
+                    {"$match": {'document_key': document_key}},
+                    {"$limit": 1},
+                    {
+                        "$project": {
+                            '_id': False,
+                            "keys": {
+                                "$cond": [
+                                    {"$eq": [{"$type": field}, "object"]},
+                                    {"$map": {"input": {"$objectToArray": field}, "in": "$$this.k"}},
+                                    None
+                                ]
+                            }
+                        }
+                    }
+                ]),
+                None
+            )
+        except PyMongoError as pme:
+            logger.warning(f"{document_type} '{document_key}' is not (yet) accessible: {str(pme)}?")
+            return None
+        if not result or result.get("keys", None) is None:
+            return None
+        return [key for key in result["keys"] if path or key != "_id"]
+
+    def _get_gridfs_document_proxy(self, document_key: str) -> Optional[Dict]:
+        """
+        :param document_key: str, the key ('path') of the document being requested.
+        :return: Optional[Dict], proxy document of the GridFS file (or blob) of a (big) document;
+                                 None if not (yet) accessible
         """
+        if self.is_deleted():
+            return None
+        self.flush()
+
         # For reasons of file size scalability, we assume that the document was large and stored in GridFS
         document_proxy: Optional[Dict] = self._collection.find_one({'document_key': document_key})
-        if document_proxy:
-            gridfs_uid = document_proxy["gridfs_uid"]
-            try:
-                with self._gridfs.get(gridfs_uid) as datafile:
-                    yield datafile.readline().decode(encoding="utf8")
-            except OSError as ose:
-                logger.warning(f"{document_type} '{document_key}' is not (yet) accessible: {str(ose)}?")
+        if document_proxy and ("gridfs_uid" in document_proxy or "blob" in document_proxy):
+            return document_proxy
+        return None
 
-    def open_logger(self):
-        # raise NotImplementedError("Implement me!")
-        pass
+    def open_document(self, document_type: str, document_key: str, decompress: bool = True) -> Optional[IO]:
+        """
+        Opens the stored (JSON text) bytes of a single report type of document, corresponding to a specified
+        document key, e.g. for streaming a big document. The caller is responsible for closing the file.
 
-    def write_logger(self, line: str):
-        # raise NotImplementedError("Implement me!")
-        pass
+        :param document_type: str, name of report type simply used for informative error reporting.
+        :param document_key: str, the key ('path') of the document being requested.
+        :param decompress: bool, if False, the bytes of a compressed document are read as stored (default: True)
+        :return: Optional[IO], binary (GridFS) file of the document (seekable, unless decompressed);
+                               None if not (yet) accessible
+        """
+        document_proxy: Optional[Dict] = self._get_gridfs_document_proxy(document_key)
+        if not document_proxy:
+            return None
+        try:
+            if "blob" in document_proxy:
+                return self.get_database().open_blob(document_proxy["blob"], decompress=decompress)
 
-    def close_logger(self):
-        # raise NotImplementedError("Implement me!")
-        pass
+            # GridOut files read (and seek) their chunks lazily
+            datafile: IO = self._gridfs.get(document_proxy["gridfs_uid"])
+            compression: Optional[str] = document_proxy.get("compression", None)
+            return open_decompressed(datafile, compression) if decompress and compression else datafile
+        except (PyMongoError, OSError) as exc:
+            logger.warning(f"{document_type} '{document_key}' is not (yet) accessible: {str(exc)}?")
+            return None
+
+    def get_document_compression(self, document_type: str, document_key: str) -> Optional[str]:
+        """
+        :param document_type: str, name of report type simply used for informative error reporting.
+        :param document_key: str, the key ('path') of the document being requested.
+        :return: Optional[str], compression of the stored document: 'gzip', 'zstd' or None (also if not accessible)
+        """
+        document_proxy: Optional[Dict] = self._get_gridfs_document_proxy(document_key)
+        if not document_proxy:
+            return None
+        if "blob" in document_proxy:
+            return self.get_database().get_blob_compression(document_proxy["blob"])
+        return document_proxy.get("compression", None)
 
+    def get_document_size(self, document_type: str, document_key: str) -> Optional[int]:
+        """
+        :param document_type: str, name of report type simply used for informative error reporting.
+        :param document_key: str, the key ('path') of the document being requested.
+        :return: Optional[int], size (in bytes, compressed if so stored) of the stored document;
+                                None if the document is not (yet) accessible
+        """
+        datafile: Optional[IO] = self.open_document(document_type, document_key, decompress=False)
+        if datafile is None:
+            return None
+        with datafile:
+            # the GridFS file length is known from its metadata, without reading any chunk
+            return datafile.length
 
 class MongoReportDatabase(TestReportDatabase):
 
@@ -566,6 +3053,8 @@ class MongoReportDatabase(TestReportDatabase):
             user: str = environ.get('MONGO_INITDB_ROOT_USERNAME', "root"),
             password: str = environ.get('MONGO_INITDB_ROOT_PASSWORD', "example"),
             host: str = environ.get('MONGO_INITDB_HOST', "localhost"),
+            write_batch_size: int = DEFAULT_WRITE_BATCH_SIZE,
+            write_flush_interval: float = DEFAULT_WRITE_FLUSH_INTERVAL,
             **kwargs
     ):
         """
@@ -575,6 +3064,10 @@ class MongoReportDatabase(TestReportDatabase):
         :param password:  str, MongoDb password (default: 'MONGO_INITDB_ROOT_PASSWORD' or "example")
         :param host:  str, MongoDb host (default: "mongo" if inside the SRI Testing docker container else "localhost")
         :param db_name:  str, name of database (default: "sri_testing")
+        :param write_batch_size: int, number of test report documents buffered for bulk writing
+                                      (default: 'MONGO_WRITE_BATCH_SIZE' or 100; 1 means no buffering)
+        :param write_flush_interval: float, maximum age (seconds) of buffered test report documents
+                                            (default: 'MONGO_WRITE_FLUSH_INTERVAL' or 5.0)
         :param kwargs:
 
         :raises MongoReportException
@@ -602,6 +3095,30 @@ class MongoReportDatabase(TestReportDatabase):
 
         self._mongo_db: Database = self._db_client[self._db_name]
 
+        self._write_batch_size: int = write_batch_size
+        self._write_flush_interval: float = write_flush_interval
+
+        # Test run catalog, with one document per test run, keyed by test run identifier
+        self._catalog: Collection = self._mongo_db[TEST_RUN_CATALOG]
+        self._catalog.create_index([("state", ASCENDING), ("test_run_id", ASCENDING)])
+
+        # Rollups of the completed test runs, with one document per unit test of each resource of a test run
+        self._rollups: Collection = self._mongo_db[TEST_RUN_ROLLUPS]
+        self._rollups.create_index(
+            [(field, ASCENDING) for field in ["kp_id", "component", "ara_id", "unit_test", "completed"]]
+        )
+        self._rollups.create_index([("test_run_id", ASCENDING)])
+
+        # Blob store, with one document per blob, keyed by content address, holding its GridFS file identifier,
+        # its compression and the set of test runs referencing it (the blobs are held in their own GridFS bucket)
+        self._blobs: Collection = self._mongo_db[TEST_RUN_BLOBS]
+        self._blobs.create_index([("refs", ASCENDING)])
+        self._blobs_gridfs: GridFS = GridFS(self._mongo_db, collection=TEST_RUN_BLOBS)
+
+        # Names of the test run collections known to have their unique 'document_key' index
+        self._indexed_collections: Set[str] = set()
+        self._indexed_collections_lock: RLock = RLock()
+
         if self.LOG_NAME not in self._mongo_db.list_collection_names():
             time_created: str = datetime.now().strftime("%Y-%b-%d_%Hhr%M")
             self._logs: Collection = self._mongo_db[self.LOG_NAME]
@@ -610,6 +3127,12 @@ class MongoReportDatabase(TestReportDatabase):
         else:
             self._logs: Collection = self._mongo_db[self.LOG_NAME]
 
+    def get_mongo_db(self) -> Database:
+        """
+        :return: Database, the wrapped MongoDb database (e.g. for the test run job queue of distributed test runs)
+        """
+        return self._mongo_db
+
     def list_databases(self) -> List[str]:
         return [name for name in self._db_client.list_database_names() if name not in ['admin', 'config', 'local']]
 
@@ -623,7 +3146,13 @@ class MongoReportDatabase(TestReportDatabase):
         :param identifier: str, test run identifier for the report
         :return: wrapped test report
         """
-        report = MongoTestReport(identifier=identifier, database=self, mongo_db=self._mongo_db)
+        report = MongoTestReport(
+            identifier=identifier,
+            database=self,
+            mongo_db=self._mongo_db,
+            write_batch_size=self._write_batch_size,
+            write_flush_interval=self._write_flush_interval
+        )
         return report
 
     @staticmethod
@@ -634,43 +3163,990 @@ class MongoReportDatabase(TestReportDatabase):
         assert isinstance(report, MongoTestReport)
         report.delete()
 
-    def get_available_reports(self) -> List[str]:
+    def _get_test_run_collection_names(self) -> List[str]:
         """
-        :return: list of identifiers of available reports.
+        :return: List[str], names of the test run collections, i.e. test run identifiers (complete or not)
         """
-        non_system_collection_filter: Dict = {"name": {"$regex": rf"^(?!system\.|{self.LOG_NAME}|fs\..*|test_.*)"}}
-        completed_test_runs: List[str] = list()
-        for test_run_id in self._mongo_db.list_collection_names(filter=non_system_collection_filter):
-            test_run_reports: Collection = self._mongo_db.get_collection(test_run_id)
-            documents = [
-                document
-                for document in test_run_reports.find(
-                    filter={'document_key': "test_run_summary"},
-                    projection={'_id': True}
-                ).limit(1)
-            ]
-            if documents:
-                completed_test_runs.append(test_run_id)
-        return completed_test_runs
+        non_system_collection_filter: Dict = {
+            "name": {"$regex": rf"^(?!system\.|{self.LOG_NAME}|fs\..*|test_.*|.*\.files$|.*\.chunks$)"}
+        }
+        return self._mongo_db.list_collection_names(filter=non_system_collection_filter)
 
-    def get_report_logs(self) -> List[Dict]:
+    def _remove_duplicate_documents(self, collection: Collection) -> int:
         """
-        :return: Dict, report database log (as a Python dictionary)
+        Removes the older duplicates - and their GridFS files, if any - of documents saved more than once under
+        the same document key (i.e. as possible before test run collections were indexed by document key).
+
+        :param collection: Collection, test run collection
+        :return: int, number of duplicate documents removed
         """
-        logs: List[Dict] = [doc for doc in self._logs.find()]
-        return logs
+        gridfs: GridFS = GridFS(self._mongo_db, collection=collection.name)
+        removed: int = 0
+        for duplicates in collection.aggregate(
+            [
+                {"$match": {"document_key": {"$exists": True}}},
+                {"$sort": {"_id": ASCENDING}},
+                {"$group": {"_id": "$document_key", "ids": {"$push": "$_id"}, "count": {"$sum": 1}}},
+                {"$match": {"count": {"$gt": 1}}}
+            ],
+            allowDiskUse=True
+        ):
+            # ObjectIds increase over time: the last document saved is kept
+            obsolete_ids: List = duplicates["ids"][:-1]
+            for document in collection.find(
+                filter={"_id": {"$in": obsolete_ids}, "gridfs_uid": {"$exists": True}},
+                projection={"gridfs_uid": True}
+            ):
+                gridfs.delete(document["gridfs_uid"])
+            removed += collection.delete_many(filter={"_id": {"$in": obsolete_ids}}).deleted_count
+        return removed
 
+    def ensure_document_key_index(self, collection: Collection) -> bool:
+        """
+        Creates - unless already known to exist - the unique 'document_key' index of a test run collection.
 
-####################################################################
-# Here we globally configure and bind a singleton TestReportDatabase
-####################################################################
+        :param collection: Collection, test run collection
+        :return: bool, True if the collection is indexed
+        """
+        with self._indexed_collections_lock:
+            if collection.name in self._indexed_collections:
+                return True
+            try:
+                try:
+                    collection.create_index([("document_key", ASCENDING)], unique=True, name=DOCUMENT_KEY_INDEX)
+                except DuplicateKeyError:
+                    removed: int = self._remove_duplicate_documents(collection)
+                    logger.warning(
+                        f"Removed {removed} duplicate documents from test run collection '{collection.name}'"
+                    )
+                    collection.create_index([("document_key", ASCENDING)], unique=True, name=DOCUMENT_KEY_INDEX)
+            except PyMongoError as exc:
+                logger.warning(
+                    f"Test run collection '{collection.name}' could not be indexed by document key: {str(exc)}?"
+                )
+                return False
+            self._indexed_collections.add(collection.name)
+            return True
+
+    def discard_document_key_index(self, name: str):
+        """
+        :param name: str, name of a (dropped) test run collection, no longer known to be indexed
+        """
+        with self._indexed_collections_lock:
+            self._indexed_collections.discard(name)
+
+    def update_test_run(self, test_run_id: str, **fields):
+        """
+        Atomically updates (upserting as needed) the test run catalog document of a test run.
+
+        :param test_run_id: str, test run identifier
+        :param fields: catalog entry fields to be set, e.g. 'state', 'completed' (timestamp) or 'counts'
+        """
+        fields.update({"test_run_id": test_run_id, "updated": datetime.utcnow().isoformat()})
+        self._catalog.update_one(filter={"_id": test_run_id}, update={"$set": fields}, upsert=True)
+
+    def get_test_run(self, test_run_id: str) -> Optional[Dict]:
+        """
+        :param test_run_id: str, test run identifier
+        :return: Optional[Dict], test run catalog entry of the test run; None if unknown
+        """
+        return self._catalog.find_one(filter={"_id": test_run_id}, projection={"_id": False})
+
+    def list_test_runs(self, state: Optional[str] = None) -> List[Dict]:
+        """
+        :param state: Optional[str], state of the listed test runs (default: None, i.e. all the test runs)
+        :return: List[Dict], test run catalog entries, sorted by test run identifier
+        """
+        return list(
+            self._catalog.find(
+                filter={"state": state} if state else dict(),
+                projection={"_id": False}
+            ).sort("test_run_id", ASCENDING)
+        )
+
+    def remove_test_run(self, test_run_id: str):
+        """
+        :param test_run_id: str, identifier of a (deleted) test run, removed from the test run catalog
+        """
+        self._catalog.delete_one(filter={"_id": test_run_id})
+
+    def save_rollups(self, test_run_id: str, completed: str, rollups: List[Dict]):
+        """
+        Replaces the rollup documents of a (completed) test run.
+
+        :param test_run_id: str, test run identifier
+        :param completed: str, completion time (ISO format timestamp) of the test run
+        :param rollups: List[Dict], rollup rows of the test run, with the ROLLUP_KEY_FIELDS and ROLLUP_STATISTICS_FIELDS
+        """
+        self._rollups.delete_many(filter={"test_run_id": test_run_id})
+        if rollups:
+            self._rollups.insert_many(
+                [dict(row, test_run_id=test_run_id, completed=completed) for row in rollups], ordered=False
+            )
+
+    def delete_rollups(self, test_run_id: str):
+        """
+        :param test_run_id: str, identifier of a (deleted) test run, whose rollup documents are removed
+        """
+        self._rollups.delete_many(filter={"test_run_id": test_run_id})
+
+    def get_rollups(
+            self,
+            component: Optional[str] = None,
+            ara_id: Optional[str] = None,
+            kp_id: Optional[str] = None,
+            unit_test: Optional[str] = None,
+            since: Optional[str] = None,
+            until: Optional[str] = None
+    ) -> List[Dict]:
+        """
+        Retrieves (in one query) the rollup documents of the completed test runs, matching all the given criteria.
+
+        :param component: Optional[str], Translator component of the resources: 'ARA' or 'KP' (default: any)
+        :param ara_id: Optional[str], identifier of the ARA (default: any, including none)
+        :param kp_id: Optional[str], identifier of the (direct, or ARA embedded) KP (default: any)
+        :param unit_test: Optional[str], unit test (category), e.g. 'by_subject' (default: any)
+        :param since: Optional[str], earliest completion time (ISO format timestamp) of the test runs (default: none)
+        :param until: Optional[str], latest completion time (ISO format timestamp) of the test runs (default: none)
+        :return: List[Dict], rollup rows (with their 'test_run_id' and 'completed' time), sorted by completion time
+        """
+        query: Dict = self._get_rollup_filters(component, ara_id, kp_id, unit_test)
+        if since is not None or until is not None:
+            query["completed"] = dict()
+            if since is not None:
+                query["completed"]["$gte"] = since
+            if until is not None:
+                query["completed"]["$lte"] = until
+        return list(
+            self._rollups.find(filter=query, projection={"_id": False}).sort(
+                [("completed", ASCENDING), ("test_run_id", ASCENDING)]
+            )
+        )
+
+    def put_blob(self, test_run_id: str, data: bytes) -> str:
+        """
+        Saves a big document in the content-addressed blob store, unless already there (i.e. saved by any test
+        run), then adds the test run to the references of the blob.
+
+        :param test_run_id: str, identifier of the test run referencing the document
+        :param data: bytes, (uncompressed JSON text) bytes of the document
+        :return: str, content address of the document in the blob store (see get_blob_id())
+        """
+        blob_id: str = get_blob_id(data)
+        if self._blobs.update_one({"_id": blob_id}, {"$addToSet": {"refs": test_run_id}}).matched_count:
+            # already saved, now (also) referenced by the test run
+            return blob_id
+        compression: Optional[str] = self.get_compression()
+        gridfs_uid = self._blobs_gridfs.put(compress_document(data, compression))
+        try:
+            self._blobs.insert_one(
+                {"_id": blob_id, "gridfs_uid": gridfs_uid, "compression": compression, "refs": [test_run_id]}
+            )
+        except DuplicateKeyError:
+            # concurrently saved by another test run (or pytest-xdist worker)
+            self._blobs_gridfs.delete(gridfs_uid)
+            self._blobs.update_one({"_id": blob_id}, {"$addToSet": {"refs": test_run_id}})
+        return blob_id
+
+    def open_blob(self, blob_id: str, decompress: bool = True) -> Optional[IO]:
+        """
+        :param blob_id: str, content address of a document in the blob store
+        :param decompress: bool, if False, the bytes of a compressed document are read as stored (default: True)
+        :return: Optional[IO], binary file of the document (seekable, unless decompressed); None if not in the store
+        """
+        blob: Optional[Dict] = self._blobs.find_one({"_id": blob_id}, projection={"refs": False})
+        if not blob:
+            return None
+        datafile: IO = self._blobs_gridfs.get(blob["gridfs_uid"])
+        compression: Optional[str] = blob.get("compression", None)
+        return open_decompressed(datafile, compression) if decompress and compression else datafile
+
+    def get_blob_compression(self, blob_id: str) -> Optional[str]:
+        """
+        :param blob_id: str, content address of a document in the blob store
+        :return: Optional[str], compression of the stored document: 'gzip', 'zstd' or None (also if not in the store)
+        """
+        blob: Optional[Dict] = self._blobs.find_one({"_id": blob_id}, projection={"compression": True})
+        return blob.get("compression", None) if blob else None
+
+    def release_blobs(self, test_run_id: str) -> List[str]:
+        """
+        Removes a (deleted) test run from the references of the blobs of the blob store,
+        then deletes the blobs which are no longer referenced by any test run.
+
+        :param test_run_id: str, identifier of the test run
+        :return: List[str], content addresses of the blobs deleted
+        """
+        blob_ids: List[str] = self._blobs.distinct("_id", {"refs": test_run_id})
+        if not blob_ids:
+            return list()
+        self._blobs.update_many({"refs": test_run_id}, {"$pull": {"refs": test_run_id}})
+        deleted: List[str] = list()
+        for blob in self._blobs.find({"_id": {"$in": blob_ids}, "refs": {"$size": 0}}, projection={"gridfs_uid": True}):
+            # (unless referenced again meanwhile)
+            if self._blobs.delete_one({"_id": blob["_id"], "refs": {"$size": 0}}).deleted_count:
+                self._blobs_gridfs.delete(blob["gridfs_uid"])
+                deleted.append(blob["_id"])
+        if deleted:
+            logger.debug(f"Deleted {len(deleted)} blobs no longer referenced once test run '{test_run_id}' deleted")
+        return deleted
+
+    def migrate(self):
+        """
+        Indexes by document key the test run collections created by earlier
+        releases, then adds their completed test runs to the test run catalog.
+        """
+        for test_run_id in self._get_test_run_collection_names():
+            self.ensure_document_key_index(self._mongo_db.get_collection(test_run_id))
+        TestReportDatabase.migrate(self)
+
+    def _find_completed_test_runs(self) -> List[str]:
+        completed_test_runs: List[str] = list()
+        for test_run_id in self._get_test_run_collection_names():
+            test_run_reports: Collection = self._mongo_db.get_collection(test_run_id)
+            documents = [
+                document
+                for document in test_run_reports.find(
+                    filter={'document_key': "test_run_summary"},
+                    projection={'_id': True}
+                ).limit(1)
+            ]
+            if documents:
+                completed_test_runs.append(test_run_id)
+        return completed_test_runs
+
+    def get_report_logs(self) -> List[Dict]:
+        """
+        :return: Dict, report database log (as a Python dictionary)
+        """
+        logs: List[Dict] = [doc for doc in self._logs.find()]
+        return logs
+
+
+class SqliteBlobFile(RawIOBase):
+    """
+    Read-only (seekable) binary file of the BLOB value of a column of a SqliteReportDatabase table row,
+    read chunk by chunk (with the SQLite substr() function), i.e. without holding a big document in memory.
+    """
+    def __init__(self, database: "SqliteReportDatabase", table: str, column: str, rowid: int):
+        """
+        SqliteBlobFile constructor.
+
+        :param database: SqliteReportDatabase, database holding the table
+        :param table: str, name of the table
+        :param column: str, name of the BLOB column
+        :param rowid: int, SQLite rowid of the table row
+        """
+        RawIOBase.__init__(self)
+        self._database: SqliteReportDatabase = database
+        self._query: str = f"SELECT substr({column}, ?, ?) FROM {table} WHERE rowid = ?"
+        self._rowid: int = rowid
+        self._position: int = 0
+        row = database.get_connection().execute(
+            f"SELECT length({column}) FROM {table} WHERE rowid = ?", (rowid,)
+        ).fetchone()
+        self._length: int = row[0] if row and row[0] else 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = SEEK_SET) -> int:
+        if whence == SEEK_CUR:
+            offset += self._position
+        elif whence == SEEK_END:
+            offset += self._length
+        if offset < 0:
+            raise ValueError(f"Negative seek position {offset}")
+        self._position = offset
+        return self._position
+
+    def _read_chunk(self, size: int) -> bytes:
+        size = min(size, self._length - self._position)
+        if size <= 0:
+            return b""
+        # SQLite substr() offsets are 1-based
+        row = self._database.get_connection().execute(self._query, (self._position + 1, size, self._rowid)).fetchone()
+        chunk: bytes = row[0] if row and row[0] else b""
+        self._position += len(chunk)
+        return chunk
+
+    def readinto(self, buffer) -> int:
+        chunk: bytes = self._read_chunk(len(buffer))
+        buffer[:len(chunk)] = chunk
+        return len(chunk)
+
+    def readall(self) -> bytes:
+        # read in one go, rather than in default buffer size chunks
+        return self._read_chunk(self._length - self._position)
+
+
+class SqliteTestReport(TestReport):
+
+    def __init__(
+            self,
+            identifier: str,
+            database: TestReportDatabase,
+            writer_threads: int = DEFAULT_WRITER_THREADS,
+            writer_queue_size: int = DEFAULT_WRITER_QUEUE_SIZE
+    ):
+        TestReport.__init__(
+            self,
+            identifier=identifier,
+            database=database,
+            writer_threads=writer_threads,
+            writer_queue_size=writer_queue_size
+        )
+        assert isinstance(database, SqliteReportDatabase)
+        self._db: SqliteReportDatabase = database
+
+    def exists_document(self, document_key: str) -> bool:
+        if self.is_deleted():
+            return False
+        self.flush()
+        return self._db.get_connection().execute(
+            "SELECT 1 FROM documents WHERE test_run_id = ? AND document_key = ?",
+            (self.get_identifier(), document_key)
+        ).fetchone() is not None
+
+    def list_documents(self) -> Iterable[Tuple[str, bool]]:
+        """
+        :return: Iterable[Tuple[str, bool]], key of each document of the test run, with a flag
+                                             set for the big documents, i.e. compressed or in the blob store
+        """
+        if self.is_deleted():
+            return
+        self.flush()
+        rows: List[Tuple[str, int]] = self._db.get_connection().execute(
+            "SELECT document_key, compression IS NOT NULL OR blob_id IS NOT NULL FROM documents " +
+            "WHERE test_run_id = ? ORDER BY document_key",
+            (self.get_identifier(),)
+        ).fetchall()
+        for document_key, is_big in rows:
+            yield document_key, bool(is_big)
+
+    def purge(self) -> bool:
+        """
+        Physically removes all the documents of the (deleted) SqliteTestReport.
+        :return: bool, True is successful
+        """
+        try:
+            # the (big) documents of the test run, in the shared blob store, are only deleted once unreferenced
+            self._db.release_blobs(self.get_identifier())
+            with self._db.transaction() as connection:
+                connection.execute("DELETE FROM documents WHERE test_run_id = ?", (self.get_identifier(),))
+        except sqlite3.Error as exc:
+            logger.warning(
+                f"SqliteTestReport.purge():  could not delete test run '{self.get_identifier()}': {str(exc)}"
+            )
+            return False
+
+        # Signal success if no exception is thrown above...
+        return True
+
+    def _write_json_document(
+            self,
+            document_type: str,
+            document: Dict,
+            document_key: str,
+            is_big: bool = False
+    ):
+        """
+        Writes out an indexed document to the (wrapped SQLite) TestReportDatabase, i.e. as a row of its
+        'documents' table, atomically replacing any version of the document written out earlier.
+
+        :param document_type: Dict, Python object to persist as a JSON document.
+        :param document: Dict, Python object to persist as a JSON document.
+        :param document_key: str, indexing path for the document being saved.
+        :param is_big: bool, if True, flags that the JSON file is expected to require special handling due to its size.
+        """
+        # for consistency relative to MongoTestReports, we add the document key to the document
+        document["document_key"] = document_key
+
+        data: Optional[bytes] = None
+        compression: Optional[str] = None
+        blob_id: Optional[str] = None
+        try:
+            if is_big and self._db.uses_blob_store():
+                # the document is saved (once) in the shared blob store, only pointed to by the test run
+                blob_id = self._db.put_blob(self.get_identifier(), dump_report_json(document, pretty=False))
+            elif is_big and self._db.get_compression():
+                compression = self._db.get_compression()
+                data = compress_document(dump_report_json(document, pretty=False), compression)
+            else:
+                data = dump_report_json(document)
+            self._db.get_connection().execute(
+                "INSERT OR REPLACE INTO documents (test_run_id, document_key, document, compression, blob_id) " +
+                "VALUES (?, ?, ?, ?, ?)",
+                (self.get_identifier(), document_key, data, compression, blob_id)
+            )
+        except sqlite3.Error as exc:
+            logger.warning(f"{document_type} '{document_key}' cannot be written out: {str(exc)}?")
+
+    def _find_document(self, document_key: str) -> Optional[Tuple[int, Optional[str], Optional[str]]]:
+        """
+        :param document_key: str, the key ('path') of the document being requested.
+        :return: Optional[Tuple[int, Optional[str], Optional[str]]], rowid, compression and blob store content
+                                                                     address (if a big document saved in the blob
+                                                                     store) of the document; None if not (yet)
+                                                                     written out.
+        """
+        if self.is_deleted():
+            return None
+        self.flush()
+        return self._db.get_connection().execute(
+            "SELECT rowid, compression, blob_id FROM documents WHERE test_run_id = ? AND document_key = ?",
+            (self.get_identifier(), document_key)
+        ).fetchone()
+
+    def retrieve_document(self, document_type: str, document_key: str) -> Optional[Dict]:
+        """
+        Retrieves a single report type of document, corresponding to a specified document key.
+
+        :param document_type: str, name of report type simply used for informative error reporting.
+        :param document_key: str, the key ('path') of the document being requested.
+        :return: Dict, JSON document retrieved.
+        """
+        assert document_key
+        try:
+            row = self._find_document(document_key)
+            if not row:
+                return None
+            datafile: Optional[IO] = self._open_row(row)
+            if datafile is None:
+                return None
+            with datafile:
+                contents: bytes = datafile.read()
+            return orjson.loads(contents) if contents else None
+        except (sqlite3.Error, OSError, EOFError, orjson.JSONDecodeError) as exc:
+            logger.warning(f"{document_type} '{document_key}' is not (yet) accessible: {str(exc)}?")
+            return None
+
+    @staticmethod
+    def _get_json_path(path: List[str]) -> Optional[str]:
+        """
+        :param path: List[str], keys of the path of the projected part of a document
+        :return: Optional[str], SQLite JSON path of the projected part; None if not expressible as such
+        """
+        if any(['"' in key for key in path]):
+            return None
+        return "$" + "".join([f'."{key}"' for key in path])
+
+    def retrieve_document_projection(self, document_type: str, document_key: str, path: List[str]) -> Optional[Any]:
+        """
+        Retrieves the projection of a single report type of document, extracted (in place) by the SQLite JSON
+        functions, unless the document is compressed (or a big document saved in the blob store).
+
+        :param document_type: str, name of report type simply used for informative error reporting.
+        :param document_key: str, the key ('path') of the document being requested.
+        :param path: List[str], keys of the path of the projected part of the document (empty for the whole document)
+        :return: Optional[Any], projected part of the JSON document; None if not available
+        """
+        assert document_key
+        json_path: Optional[str] = self._get_json_path(path)
+        try:
+            row = self._find_document(document_key)
+            if not row:
+                return None
+            rowid, compression, blob_id = row
+            if not path or json_path is None or compression or blob_id:
+                return TestReport.retrieve_document_projection(self, document_type, document_key, path)
+            json_type, value = self._db.get_connection().execute(
+                "SELECT json_type(CAST(document AS TEXT), ?), json_extract(CAST(document AS TEXT), ?) " +
+                "FROM documents WHERE rowid = ?",
+                (json_path, json_path, rowid)
+            ).fetchone()
+        except sqlite3.Error as exc:
+            logger.warning(f"{document_type} '{document_key}' is not (yet) accessible: {str(exc)}?")
+            return None
+        if json_type in ["object", "array"]:
+            return orjson.loads(value)
+        if json_type in ["true", "false"]:
+            return json_type == "true"
+        return value
+
+    def retrieve_document_keys(self, document_type: str, document_key: str, path: List[str]) -> Optional[List[str]]:
+        """
+        Retrieves the keys of the projection of a single report type of document, iterated (in place) by the
+        SQLite JSON functions, unless the document is compressed (or a big document saved in the blob store).
+
+        :param document_type: str, name of report type simply used for informative error reporting.
+        :param document_key: str, the key ('path') of the document being requested.
+        :param path: List[str], keys of the path of the projected part of the document (empty for the whole document)
+        :return: Optional[List[str]], keys of the projected part of the JSON document; None if not available
+                                      (or not a JSON object)
+        """
+        assert document_key
+        json_path: Optional[str] = self._get_json_path(path)
+        try:
+            row = self._find_document(document_key)
+            if not row:
+                return None
+            rowid, compression, blob_id = row
+            if json_path is None or compression or blob_id:
+                return TestReport.retrieve_document_keys(self, document_type, document_key, path)
+            connection: sqlite3.Connection = self._db.get_connection()
+            json_type: Optional[Tuple] = connection.execute(
+                "SELECT json_type(CAST(document AS TEXT), ?) FROM documents WHERE rowid = ?", (json_path, rowid)
+            ).fetchone()
+            if not json_type or json_type[0] != "object":
+                return None
+            return [
+                str(key) for (key,) in connection.execute(
+                    "SELECT json_each.key FROM documents, json_each(CAST(documents.document AS TEXT), ?) " +
+                    "WHERE documents.rowid = ?",
+                    (json_path, rowid)
+                )
+            ]
+        except sqlite3.Error as exc:
+            logger.warning(f"{document_type} '{document_key}' is not (yet) accessible: {str(exc)}?")
+            return None
+
+    def _open_row(self, row: Tuple[int, Optional[str], Optional[str]], decompress: bool = True) -> Optional[IO]:
+        """
+        :param row: Tuple[int, Optional[str], Optional[str]], document row (see _find_document())
+        :param decompress: bool, if False, the bytes of a compressed document are read as stored (default: True)
+        :return: Optional[IO], binary file of the document (seekable, unless decompressed); None if not accessible
+        """
+        rowid, compression, blob_id = row
+        if blob_id:
+            return self._db.open_blob(blob_id, decompress=decompress)
+        datafile: IO = SqliteBlobFile(self._db, table="documents", column="document", rowid=rowid)
+        return open_decompressed(datafile, compression) if decompress and compression else datafile
+
+    def open_document(self, document_type: str, document_key: str, decompress: bool = True) -> Optional[IO]:
+        """
+        Opens the stored (JSON text) bytes of a single report type of document, corresponding to a specified
+        document key, e.g. for streaming a big document. The caller is responsible for closing the file.
+
+        :param document_type: str, name of report type simply used for informative error reporting.
+        :param document_key: str, the key ('path') of the document being requested.
+        :param decompress: bool, if False, the bytes of a compressed document are read as stored (default: True)
+        :return: Optional[IO], binary file of the document (seekable, unless decompressed); None if not accessible
+        """
+        try:
+            row = self._find_document(document_key)
+            if not row:
+                logger.warning(f"{document_type} '{document_key}' is not (yet) accessible?")
+                return None
+            return self._open_row(row, decompress=decompress)
+        except sqlite3.Error as exc:
+            logger.warning(f"{document_type} '{document_key}' is not (yet) accessible: {str(exc)}?")
+            return None
+
+    def get_document_compression(self, document_type: str, document_key: str) -> Optional[str]:
+        """
+        :param document_type: str, name of report type simply used for informative error reporting.
+        :param document_key: str, the key ('path') of the document being requested.
+        :return: Optional[str], compression of the stored document: 'gzip', 'zstd' or None (also if not accessible)
+        """
+        row = self._find_document(document_key)
+        if not row:
+            return None
+        _, compression, blob_id = row
+        if blob_id:
+            return self._db.get_blob_compression(blob_id)
+        return compression
+
+class SqliteReportDatabase(TestReportDatabase):
+    """
+    Wrapper class for an embedded SQLite database-based repository for storing and retrieving SRI Testing
+    test results, i.e. for single node deployments not running a MongoDb instance. The database - a single
+    file in the test results directory - is in Write-Ahead Logging (WAL) mode: its readers do not block its
+    (one at a time) writers, nor conversely, be they threads or processes (e.g. pytest-xdist workers).
+    """
+    def __init__(self, db_name: Optional[str] = None, timeout: float = DEFAULT_SQLITE_TIMEOUT, **kwargs):
+        """
+        SqliteReportDatabase constructor.
+
+        :param db_name: str, name of database (default: "sri_testing")
+        :param timeout: float, time (seconds) waited for the write lock (default: 'SQLITE_BUSY_TIMEOUT' or 30.0)
+        :param kwargs:
+
+        :raises TestReportDatabaseException
+        """
+        TestReportDatabase.__init__(self, db_name=db_name, **kwargs)
+
+        makedirs(self.get_test_results_path(), exist_ok=True)
+        self._database_file: str = normpath(f"{self.get_test_results_path()}{sep}{SQLITE_DATABASE_FILE}")
+        self._timeout: float = timeout
+
+        # SQLite connections are not shared across threads: each thread opens its own, as needed. Connections
+        # opened before the database was dropped are (closed then) reopened, since of an earlier 'generation'.
+        self._local: local = local()
+        self._generation: int = 0
+
+        try:
+            with self.transaction() as connection:
+                # Documents of the test runs, indexed by test run and document key: big documents
+                # saved in the blob store only have the content address of their blob ('blob_id')
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS documents (" +
+                    "test_run_id TEXT NOT NULL, document_key TEXT NOT NULL, " +
+                    "document BLOB, compression TEXT, blob_id TEXT, " +
+                    "PRIMARY KEY (test_run_id, document_key))"
+                )
+                connection.execute("CREATE INDEX IF NOT EXISTS documents_by_key ON documents (document_key)")
+
+                # Test run catalog, with one (JSON) entry per test run, keyed by test run identifier
+                connection.execute(
+                    f"CREATE TABLE IF NOT EXISTS {TEST_RUN_CATALOG} (" +
+                    "test_run_id TEXT PRIMARY KEY, state TEXT, entry BLOB NOT NULL)"
+                )
+                connection.execute(
+                    f"CREATE INDEX IF NOT EXISTS {TEST_RUN_CATALOG}_by_state " +
+                    f"ON {TEST_RUN_CATALOG} (state, test_run_id)"
+                )
+
+                # Rollups of the completed test runs, with one row per unit test of each resource of a test run
+                connection.execute(
+                    f"CREATE TABLE IF NOT EXISTS {TEST_RUN_ROLLUPS} (" +
+                    "test_run_id TEXT NOT NULL, completed TEXT NOT NULL, " +
+                    "component TEXT NOT NULL, ara_id TEXT, kp_id TEXT NOT NULL, unit_test TEXT NOT NULL, " +
+                    "passed INTEGER, failed INTEGER, skipped INTEGER, latency_count INTEGER, " +
+                    "latency_mean_ms REAL, latency_min_ms INTEGER, latency_max_ms INTEGER)"
+                )
+                connection.execute(
+                    f"CREATE INDEX IF NOT EXISTS {TEST_RUN_ROLLUPS}_by_resource " +
+                    f"ON {TEST_RUN_ROLLUPS} (kp_id, component, ara_id, unit_test, completed)"
+                )
+                connection.execute(
+                    f"CREATE INDEX IF NOT EXISTS {TEST_RUN_ROLLUPS}_by_test_run ON {TEST_RUN_ROLLUPS} (test_run_id)"
+                )
+
+                # Blob store, with one row per blob, keyed by content address, and the test runs referencing it
+                connection.execute(
+                    f"CREATE TABLE IF NOT EXISTS {TEST_RUN_BLOBS} (" +
+                    "blob_id TEXT PRIMARY KEY, data BLOB NOT NULL, compression TEXT)"
+                )
+                connection.execute(
+                    f"CREATE TABLE IF NOT EXISTS {TEST_RUN_BLOBS}_refs (" +
+                    "blob_id TEXT NOT NULL, test_run_id TEXT NOT NULL, PRIMARY KEY (blob_id, test_run_id))"
+                )
+                connection.execute(
+                    f"CREATE INDEX IF NOT EXISTS {TEST_RUN_BLOBS}_refs_by_test_run " +
+                    f"ON {TEST_RUN_BLOBS}_refs (test_run_id)"
+                )
+
+                connection.execute(f"CREATE TABLE IF NOT EXISTS {self.LOG_NAME} (log BLOB NOT NULL)")
+                if connection.execute(f"SELECT 1 FROM {self.LOG_NAME} LIMIT 1").fetchone() is None:
+                    time_created: str = datetime.now().strftime("%Y-%b-%d_%Hhr%M")
+                    # this should create the log once
+                    connection.execute(
+                        f"INSERT INTO {self.LOG_NAME} (log) VALUES (?)",
+                        (orjson.dumps({"time_created": time_created}),)
+                    )
+        except sqlite3.Error as exc:
+            err_msg = f"SqliteReportDatabase '{self._database_file}' cannot be opened: {str(exc)}"
+            logger.error(err_msg)
+            raise TestReportDatabaseException(err_msg)
+
+    def get_connection(self) -> sqlite3.Connection:
+        """
+        :return: sqlite3.Connection, (autocommit) connection of the current thread to the SQLite database
+        """
+        connection: Optional[sqlite3.Connection] = getattr(self._local, "connection", None)
+        if connection is not None and self._local.generation != self._generation:
+            connection.close()
+            connection = None
+        if connection is None:
+            connection = sqlite3.connect(
+                self._database_file, timeout=self._timeout, isolation_level=None, check_same_thread=False
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            # durable as of the next WAL checkpoint, without a 'fsync' at each commit
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+            self._local.generation = self._generation
+        return connection
+
+    @contextmanager
+    def transaction(self) -> Generator:
+        """
+        Context manager of a write transaction, committed on exit, rolled back on exceptions.
+
+        :return: Generator, yielding the sqlite3.Connection of the current thread
+        """
+        connection: sqlite3.Connection = self.get_connection()
+        # the write lock is acquired upfront, so that the transaction is not aborted by a concurrent writer
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield connection
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+
+    def list_databases(self) -> List[str]:
+        # SqliteReportDatabase 'databases' a.k.a. 'db_name' folders are also under the ONEHOP_TEST_DIRECTORY
+        return [
+            identifier for identifier in listdir(ONEHOP_TEST_DIRECTORY)
+            if exists(f"{ONEHOP_TEST_DIRECTORY}{sep}{identifier}{sep}{SQLITE_DATABASE_FILE}")
+        ]
+
+    def drop_database(self):
+        connection: Optional[sqlite3.Connection] = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+        self._generation += 1
+        for suffix in ["", "-wal", "-shm"]:
+            if exists(f"{self._database_file}{suffix}"):
+                remove(f"{self._database_file}{suffix}")
+        try:
+            # unless the directory is shared, e.g. with a FileReportDatabase
+            rmdir(self.get_test_results_path())
+        except OSError:
+            pass
+
+    def get_test_report(self, identifier: str) -> TestReport:
+        """
+        :param identifier: str, test run identifier for the report
+        :return: wrapped test report
+        """
+        report = SqliteTestReport(identifier=identifier, database=self)
+        return report
+
+    @staticmethod
+    def delete_test_report(report: TestReport):
+        """
+        :param report: TestReport to be deleted (should be an instance of SqliteTestReport)
+        """
+        assert isinstance(report, SqliteTestReport)
+        report.delete()
+
+    def update_test_run(self, test_run_id: str, **fields):
+        """
+        Atomically updates (creating as needed) the test run catalog entry of a test run.
+
+        :param test_run_id: str, test run identifier
+        :param fields: catalog entry fields to be set, e.g. 'state', 'completed' (timestamp) or 'counts'
+        """
+        with self.transaction() as connection:
+            entry: Dict = self.get_test_run(test_run_id) or {"test_run_id": test_run_id}
+            entry.update(fields)
+            entry["updated"] = datetime.utcnow().isoformat()
+            connection.execute(
+                f"INSERT OR REPLACE INTO {TEST_RUN_CATALOG} (test_run_id, state, entry) VALUES (?, ?, ?)",
+                (test_run_id, entry.get("state", None), orjson.dumps(entry))
+            )
+
+    def get_test_run(self, test_run_id: str) -> Optional[Dict]:
+        """
+        :param test_run_id: str, test run identifier
+        :return: Optional[Dict], test run catalog entry of the test run; None if unknown
+        """
+        row = self.get_connection().execute(
+            f"SELECT entry FROM {TEST_RUN_CATALOG} WHERE test_run_id = ?", (test_run_id,)
+        ).fetchone()
+        return orjson.loads(row[0]) if row else None
+
+    def list_test_runs(self, state: Optional[str] = None) -> List[Dict]:
+        """
+        :param state: Optional[str], state of the listed test runs (default: None, i.e. all the test runs)
+        :return: List[Dict], test run catalog entries, sorted by test run identifier
+        """
+        if state:
+            rows = self.get_connection().execute(
+                f"SELECT entry FROM {TEST_RUN_CATALOG} WHERE state = ? ORDER BY test_run_id", (state,)
+            )
+        else:
+            rows = self.get_connection().execute(f"SELECT entry FROM {TEST_RUN_CATALOG} ORDER BY test_run_id")
+        return [orjson.loads(row[0]) for row in rows]
+
+    def remove_test_run(self, test_run_id: str):
+        """
+        :param test_run_id: str, identifier of a (deleted) test run, removed from the test run catalog
+        """
+        self.get_connection().execute(f"DELETE FROM {TEST_RUN_CATALOG} WHERE test_run_id = ?", (test_run_id,))
+
+    def save_rollups(self, test_run_id: str, completed: str, rollups: List[Dict]):
+        """
+        Atomically replaces the rollup rows of a (completed) test run.
+
+        :param test_run_id: str, test run identifier
+        :param completed: str, completion time (ISO format timestamp) of the test run
+        :param rollups: List[Dict], rollup rows of the test run, with the ROLLUP_KEY_FIELDS and ROLLUP_STATISTICS_FIELDS
+        """
+        fields: List[str] = ["test_run_id", "completed"] + ROLLUP_KEY_FIELDS + ROLLUP_STATISTICS_FIELDS
+        with self.transaction() as connection:
+            connection.execute(f"DELETE FROM {TEST_RUN_ROLLUPS} WHERE test_run_id = ?", (test_run_id,))
+            connection.executemany(
+                f"INSERT INTO {TEST_RUN_ROLLUPS} ({', '.join(fields)}) VALUES ({', '.join(['?'] * len(fields))})",
+                [
+                    (test_run_id, completed) + tuple([row.get(field, None) for field in fields[2:]])
+                    for row in rollups
+                ]
+            )
+
+    def delete_rollups(self, test_run_id: str):
+        """
+        :param test_run_id: str, identifier of a (deleted) test run, whose rollup rows are removed
+        """
+        self.get_connection().execute(f"DELETE FROM {TEST_RUN_ROLLUPS} WHERE test_run_id = ?", (test_run_id,))
+
+    def get_rollups(
+            self,
+            component: Optional[str] = None,
+            ara_id: Optional[str] = None,
+            kp_id: Optional[str] = None,
+            unit_test: Optional[str] = None,
+            since: Optional[str] = None,
+            until: Optional[str] = None
+    ) -> List[Dict]:
+        """
+        Retrieves (in one query) the rollup rows of the completed test runs, matching all the given criteria.
+
+        :param component: Optional[str], Translator component of the resources: 'ARA' or 'KP' (default: any)
+        :param ara_id: Optional[str], identifier of the ARA (default: any, including none)
+        :param kp_id: Optional[str], identifier of the (direct, or ARA embedded) KP (default: any)
+        :param unit_test: Optional[str], unit test (category), e.g. 'by_subject' (default: any)
+        :param since: Optional[str], earliest completion time (ISO format timestamp) of the test runs (default: none)
+        :param until: Optional[str], latest completion time (ISO format timestamp) of the test runs (default: none)
+        :return: List[Dict], rollup rows (with their 'test_run_id' and 'completed' time), sorted by completion time
+        """
+        filters: Dict[str, str] = self._get_rollup_filters(component, ara_id, kp_id, unit_test)
+        conditions: List[str] = [f"{field} = ?" for field in filters]
+        parameters: List[str] = list(filters.values())
+        if since is not None:
+            conditions.append("completed >= ?")
+            parameters.append(since)
+        if until is not None:
+            conditions.append("completed <= ?")
+            parameters.append(until)
+        cursor: sqlite3.Cursor = self.get_connection().execute(
+            f"SELECT * FROM {TEST_RUN_ROLLUPS}" +
+            (f" WHERE {' AND '.join(conditions)}" if conditions else "") +
+            " ORDER BY completed, test_run_id",
+            parameters
+        )
+        fields: List[str] = [column[0] for column in cursor.description]
+        return [dict(zip(fields, row)) for row in cursor]
+
+    def put_blob(self, test_run_id: str, data: bytes) -> str:
+        """
+        Saves a big document in the content-addressed blob store, unless already there (i.e. saved by any test
+        run), then adds the test run to the references of the blob.
+
+        :param test_run_id: str, identifier of the test run referencing the document
+        :param data: bytes, (uncompressed JSON text) bytes of the document
+        :return: str, content address of the document in the blob store (see get_blob_id())
+        """
+        blob_id: str = get_blob_id(data)
+        compression: Optional[str] = self.get_compression()
+        query: str = f"SELECT 1 FROM {TEST_RUN_BLOBS} WHERE blob_id = ?"
+
+        # the document is compressed before, rather than while holding the write lock
+        compressed: Optional[bytes] = None
+        if self.get_connection().execute(query, (blob_id,)).fetchone() is None:
+            compressed = compress_document(data, compression)
+
+        with self.transaction() as connection:
+            connection.execute(
+                f"INSERT OR IGNORE INTO {TEST_RUN_BLOBS}_refs (blob_id, test_run_id) VALUES (?, ?)",
+                (blob_id, test_run_id)
+            )
+            if connection.execute(query, (blob_id,)).fetchone() is None:
+                # (unless deleted meanwhile, i.e. as no longer referenced by another test run)
+                connection.execute(
+                    f"INSERT INTO {TEST_RUN_BLOBS} (blob_id, data, compression) VALUES (?, ?, ?)",
+                    (
+                        blob_id,
+                        compressed if compressed is not None else compress_document(data, compression),
+                        compression
+                    )
+                )
+        return blob_id
+
+    def open_blob(self, blob_id: str, decompress: bool = True) -> Optional[IO]:
+        """
+        :param blob_id: str, content address of a document in the blob store
+        :param decompress: bool, if False, the bytes of a compressed document are read as stored (default: True)
+        :return: Optional[IO], binary file of the document (seekable, unless decompressed); None if not in the store
+        """
+        row = self.get_connection().execute(
+            f"SELECT rowid, compression FROM {TEST_RUN_BLOBS} WHERE blob_id = ?", (blob_id,)
+        ).fetchone()
+        if not row:
+            return None
+        rowid, compression = row
+        datafile: IO = SqliteBlobFile(self, table=TEST_RUN_BLOBS, column="data", rowid=rowid)
+        return open_decompressed(datafile, compression) if decompress and compression else datafile
+
+    def get_blob_compression(self, blob_id: str) -> Optional[str]:
+        """
+        :param blob_id: str, content address of a document in the blob store
+        :return: Optional[str], compression of the stored document: 'gzip', 'zstd' or None (also if not in the store)
+        """
+        row = self.get_connection().execute(
+            f"SELECT compression FROM {TEST_RUN_BLOBS} WHERE blob_id = ?", (blob_id,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def release_blobs(self, test_run_id: str) -> List[str]:
+        """
+        Removes a (deleted) test run from the references of the blobs of the blob store,
+        then deletes the blobs which are no longer referenced by any test run.
+
+        :param test_run_id: str, identifier of the test run
+        :return: List[str], content addresses of the blobs deleted
+        """
+        deleted: List[str] = list()
+        with self.transaction() as connection:
+            blob_ids: List[str] = [
+                row[0] for row in connection.execute(
+                    f"SELECT blob_id FROM {TEST_RUN_BLOBS}_refs WHERE test_run_id = ?", (test_run_id,)
+                )
+            ]
+            connection.execute(f"DELETE FROM {TEST_RUN_BLOBS}_refs WHERE test_run_id = ?", (test_run_id,))
+            for blob_id in blob_ids:
+                if connection.execute(
+                        f"SELECT 1 FROM {TEST_RUN_BLOBS}_refs WHERE blob_id = ? LIMIT 1", (blob_id,)
+                ).fetchone() is None:
+                    connection.execute(f"DELETE FROM {TEST_RUN_BLOBS} WHERE blob_id = ?", (blob_id,))
+                    deleted.append(blob_id)
+        if deleted:
+            logger.debug(f"Deleted {len(deleted)} blobs no longer referenced once test run '{test_run_id}' deleted")
+        return deleted
+
+    def _find_completed_test_runs(self) -> List[str]:
+        return [
+            row[0] for row in self.get_connection().execute(
+                "SELECT DISTINCT test_run_id FROM documents WHERE document_key = 'test_run_summary'"
+            )
+        ]
+
+    def get_report_logs(self) -> List[Dict]:
+        """
+        :return: Dict, report database log (as a Python dictionary)
+        """
+        return [
+            orjson.loads(row[0])
+            for row in self.get_connection().execute(f"SELECT log FROM {self.LOG_NAME} ORDER BY rowid")
+        ]
+
+
+####################################################################
+# Here we globally configure and bind a singleton TestReportDatabase
+####################################################################
 _test_report_database: Optional[TestReportDatabase] = None
 
+# Kind of TestReportDatabase: 'mongo' (the default, else 'file' if no Mongodb instance is running), 'sqlite' or 'file'
+TEST_REPORT_DATABASE = environ.get('TEST_REPORT_DATABASE', "mongo").lower()
+
 
 def get_test_report_database(use_file_database_as_default: bool = False) -> TestReportDatabase:
     global _test_report_database
     if not _test_report_database:
-        if not use_file_database_as_default:
+        if TEST_REPORT_DATABASE == "sqlite":
+            _test_report_database = SqliteReportDatabase()
+            print("Using SqliteReportDatabase!", file=stderr)
+        elif TEST_REPORT_DATABASE != "file" and not use_file_database_as_default:
             try:
                 # TODO: we only use 'default' MongoDb connection settings here. Needs to be parameterized...
                 _test_report_database = MongoReportDatabase()
@@ -0,0 +1,186 @@
+"""
+Streaming sink of One Hop unit test results.
+
+Rather than compiling all the unit test results of a test run in memory, for saving at the
+end of the Pytest session, each unit test result is aggregated as soon as the unit test is done
+(i.e. from the 'pytest_runtest_logreport' hook): the TRAPI I/O documents of failed unit tests are
+directly saved, as are the edge details (resp. resource summaries) of each test edge (resp. KP or
+ARA embedded KP) as soon as all of its (collected) unit tests are done, after which they are released.
+
+Only the test run summary - and whatever edge details and resource summaries are still incomplete,
+i.e. when the unit tests of a test edge or resource are distributed across pytest-xdist workers -
+remain to be saved by the final commit() of the test run, at the end of the Pytest session.
+
+While the test run is in progress, a live (partial) test run summary - with the unit test counts of
+each resource, the overall progress and the latest failing unit tests - is also periodically saved
+(see translator.sri.testing.report_aggregator.get_live_summary_key), for monitoring of the test run.
+"""
+from typing import Optional, Dict, List, Tuple
+from os import environ
+from time import monotonic
+
+from translator.sri.testing.onehops_test_runner import parse_unit_test_name, strip_xdist_group
+from translator.sri.testing.report_aggregator import ReportAggregator
+
+import logging
+logger = logging.getLogger(__name__)
+
+# Minimum interval (in seconds) between successive saves of the live test run summary
+DEFAULT_LIVE_SUMMARY_INTERVAL = float(environ.get('LIVE_SUMMARY_INTERVAL', 10.0))
+
+
+class StreamingResultSink:
+    """
+    Sink of One Hop unit test results, persisting them to a test run report as they are done.
+    """
+    def __init__(
+            self,
+            test_run,
+            unit_test_keys: List[str],
+            unit_test_ids: Optional[List[str]] = None,
+            live_summary_key: Optional[str] = None,
+            live_summary_interval: float = DEFAULT_LIVE_SUMMARY_INTERVAL,
+            shard_id: Optional[str] = None
+    ):
+        """
+        StreamingResultSink constructor.
+
+        :param test_run: OneHopTestHarness (or TestReport), test run to which the results are saved.
+        :param unit_test_keys: List[str], full Pytest unit test labels (i.e. node ids) of the collected unit tests
+        :param unit_test_ids: Optional[List[str]], known unit test identifiers (e.g. 'by_subject'), for sanity checking
+        :param live_summary_key: Optional[str], document key of the live test run summary; None if not saved
+        :param live_summary_interval: float, minimum interval (in seconds) between saves of the live test run summary
+        :param shard_id: Optional[str], identifier of the shard of a distributed test run (if applicable)
+        """
+        self._test_run = test_run
+        self._unit_test_ids: Optional[List[str]] = unit_test_ids
+
+        self._live_summary_key: Optional[str] = live_summary_key
+        self._live_summary_interval: float = live_summary_interval
+        self._live_summary_saved: Optional[float] = None
+        self._shard_id: Optional[str] = shard_id
+        self._no_of_unit_tests: int = len(unit_test_keys)
+        self._no_of_unit_tests_done: int = 0
+
+        self.report: ReportAggregator = ReportAggregator(test_run=test_run)
+
+        # Number of pending unit tests, of each test edge and of each (ARA embedded) KP resource
+        self._pending_edge_tests: Dict[str, int] = dict()
+        self._pending_resource_tests: Dict[Tuple[str, Optional[str], str], int] = dict()
+        for unit_test_key in unit_test_keys:
+            component, ara_id, kp_id, _, _, edge_details_key = parse_unit_test_name(unit_test_key)
+            self._pending_edge_tests[edge_details_key] = self._pending_edge_tests.get(edge_details_key, 0) + 1
+            resource: Tuple[str, Optional[str], str] = (component, ara_id, kp_id)
+            self._pending_resource_tests[resource] = self._pending_resource_tests.get(resource, 0) + 1
+
+        # the live summary is saved right away, for monitoring to see the test run as started
+        self.save_live_summary()
+
+    def add_unit_test_result(self, unit_test_key: str, status: str, rb: Dict, duration_ms: Optional[float] = None):
+        """
+        Aggregate the result of one unit test, saving the edge details and
+        resource summary of its test edge and resource, once these are complete.
+
+        :param unit_test_key: str, full Pytest unit test label (its xdist group suffix, if any, is stripped)
+        :param status: str, unit test outcome ('passed', 'failed' or 'skipped')
+        :param rb: Dict, Pytest-harvest results bag of the unit test
+        :param duration_ms: Optional[float], duration of the unit test (milliseconds)
+        """
+        # sanity check: clean up MS Windoze EOL characters, when present in results_bag keys
+        rb = {key.strip("\r\n"): value for key, value in rb.items()}
+
+        # the unit tests are reported with the node ids of their pytest-xdist ('--dist loadgroup') groups
+        unit_test_key = strip_xdist_group(unit_test_key)
+
+        # clean up the name for safe file system usage
+        component, ara_id, kp_id, edge_num, test_id, edge_details_key = parse_unit_test_name(
+            unit_test_key=unit_test_key
+        )
+
+        # Sanity check: unknown unit test identifiers are likely a logical bug in SRI Testing?
+        assert self._unit_test_ids is None or test_id in self._unit_test_ids, f"Invalid test_id '{str(test_id)}'"
+
+        self.report.add_unit_test_result(
+            unit_test_key=unit_test_key,
+            component=component,
+            ara_id=ara_id,
+            kp_id=kp_id,
+            edge_num=edge_num,
+            test_id=test_id,
+            edge_details_key=edge_details_key,
+            status=status,
+            rb=rb,
+            duration_ms=duration_ms
+        )
+
+        if edge_details_key in self._pending_edge_tests:
+            self._pending_edge_tests[edge_details_key] -= 1
+            if self._pending_edge_tests[edge_details_key] <= 0:
+                del self._pending_edge_tests[edge_details_key]
+                self.report.flush_case_details(self._test_run, edge_details_key)
+
+        resource: Tuple[str, Optional[str], str] = (component, ara_id, kp_id)
+        if resource in self._pending_resource_tests:
+            self._pending_resource_tests[resource] -= 1
+            if self._pending_resource_tests[resource] <= 0:
+                del self._pending_resource_tests[resource]
+                self.report.flush_resource_summary(self._test_run, component, ara_id, kp_id)
+
+        self._no_of_unit_tests_done += 1
+        if monotonic() - self._live_summary_saved >= self._live_summary_interval:
+            self.save_live_summary()
+
+    def save_live_summary(self):
+        """
+        Save the live (partial) test run summary of the unit tests done so far, if a live summary key was given.
+        """
+        self._live_summary_saved = monotonic()
+        if not self._live_summary_key:
+            return
+        self._test_run.save_json_document(
+            document_type="Live Test Run Summary",
+            document=self.report.get_live_summary(
+                no_of_unit_tests=self._no_of_unit_tests,
+                no_of_unit_tests_done=self._no_of_unit_tests_done,
+                shard_id=self._shard_id
+            ),
+            document_key=self._live_summary_key
+        )
+
+    def carry_forward(self, component: str, resource_id: str, summary: Dict):
+        """
+        Add the test run summary entry of a resource carried forward from a previous test run.
+
+        :param component: str, Translator component of the resource: 'ARA' or 'KP'
+        :param resource_id: str, ARA or KP resource identifier
+        :param summary: Dict, test run summary entry of the resource
+        """
+        self.report.carry_forward(component, resource_id, summary)
+
+    def get_partial_results(self) -> Dict:
+        """
+        Writes out the documents already saved (but possibly still buffered) by the test run report,
+        then returns the results not yet saved, i.e. for merging by the pytest-xdist controller.
+
+        :return: Dict, results not yet saved, for merging into another ReportAggregator
+        """
+        # the final live summary of a pytest-xdist worker covers all of its unit tests
+        self.save_live_summary()
+        self._test_run.flush()
+        return self.report.get_partial_results()
+
+    def commit(self, summary_key: str = "test_run_summary"):
+        """
+        Save the remaining (incomplete) edge details and resource summaries, then the test run summary.
+
+        :param summary_key: str, document key of the saved test run summary (default: "test_run_summary")
+        """
+        if self._pending_edge_tests:
+            logger.debug(f"commit(): {len(self._pending_edge_tests)} test edges have unit tests not run here.")
+        self.report.save(self._test_run, summary_key=summary_key)
+
+    def close(self):
+        """
+        Stops the background writers of the test run report, once all the saved documents are written out.
+        """
+        self._test_run.close()
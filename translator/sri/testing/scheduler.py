@@ -0,0 +1,142 @@
+"""
+Endpoint-aware scheduling of the One Hop unit tests.
+
+Pytest runs the parametrized unit tests in their collection order, thus all the unit tests of a given
+KP (then ARA) hit its endpoint back-to-back, while the other endpoints sit idle. Here, the unit tests
+are rather interleaved round-robin across their endpoint urls, with the endpoints expected to take the
+longest - estimated from their unit test latencies in a previous test run - started first (i.e. the
+'longest processing time first' heuristic, which keeps down the makespan of the test run).
+
+When the unit tests are distributed across pytest-xdist workers ('--dist loadgroup'), the unit tests
+of each endpoint are moreover split into as many xdist groups as the concurrency allowed for that
+endpoint, each group being run by a single worker: an endpoint never sees more concurrent requests.
+As pytest-xdist appends the group names to the node ids of the unit tests, these names are derived from
+(a digest of) the endpoint urls, without any '/' or '@' character.
+The unit tests of a given test edge always fall in the same group, so that the worker running them
+may save the edge details as soon as they are done (see translator.sri.testing.result_sink).
+"""
+from typing import Optional, Dict, List, Tuple, Any
+from hashlib import sha1
+
+import logging
+logger = logging.getLogger(__name__)
+
+DEFAULT_ENDPOINT_CONCURRENCY = 1
+
+# Latency (in seconds) assumed for a unit test of an endpoint without latency history
+DEFAULT_UNIT_TEST_LATENCY = 1.0
+
+
+def parse_endpoint_concurrency(specifications: Optional[List[str]]) -> Dict[str, int]:
+    """
+    Parse endpoint-specific concurrency limits.
+
+    :param specifications: Optional[List[str]], list of 'url=concurrency' strings
+    :return: Dict[str, int], concurrency limits indexed by endpoint url
+    :raises ValueError: if a specification is malformed or its concurrency is not a positive integer
+    """
+    endpoint_concurrency: Dict[str, int] = dict()
+    if not specifications:
+        return endpoint_concurrency
+    for specification in specifications:
+        # urls may themselves contain '=' characters, the concurrency being the last part
+        url, _, concurrency = specification.rpartition("=")
+        if not (url and concurrency.isdigit() and int(concurrency) > 0):
+            raise ValueError(f"Invalid endpoint concurrency '{specification}': should be 'url=<positive integer>'")
+        endpoint_concurrency[url] = int(concurrency)
+    return endpoint_concurrency
+
+
+def get_endpoint_group(url: str, partition: Optional[int] = None) -> str:
+    """
+    :param url: str, endpoint url
+    :param partition: Optional[int], partition of the unit tests of the endpoint (None if not partitioned)
+    :return: str, (slash free) name of the xdist group of the unit tests of the endpoint (partition)
+    """
+    group: str = f"endpoint-{sha1(url.encode('utf-8')).hexdigest()[:16]}"
+    return group if partition is None else f"{group}-{partition}"
+
+
+def _count_unit_tests(summary: Dict) -> int:
+    return sum([sum(statistics.values()) for statistics in summary.get('results', dict()).values()])
+
+
+def get_endpoint_latencies(test_run_summary: Optional[Dict]) -> Dict[str, float]:
+    """
+    Extract the mean unit test latency of each endpoint tested in a test run.
+
+    :param test_run_summary: Optional[Dict], test run summary of a (previous) test run
+    :return: Dict[str, float], mean unit test latency (in seconds), indexed by endpoint url
+    """
+    durations: Dict[str, int] = dict()
+    counts: Dict[str, int] = dict()
+    if not test_run_summary:
+        return dict()
+    for component, resources in test_run_summary.items():
+        if not isinstance(resources, dict):
+            # e.g. the 'document_key'
+            continue
+        for resource in resources.values():
+            url: Optional[str] = resource.get('url', None)
+            if not url:
+                continue
+            kp_summaries: List[Dict] = list(resource['kps'].values()) if 'kps' in resource else [resource]
+            for kp_summary in kp_summaries:
+                if 'duration_ms' not in kp_summary:
+                    # test run predating the recording of unit test latencies
+                    continue
+                durations[url] = durations.get(url, 0) + kp_summary['duration_ms']
+                counts[url] = counts.get(url, 0) + _count_unit_tests(kp_summary)
+    return {url: durations[url] / (1000.0 * counts[url]) for url in durations if counts[url]}
+
+
+def schedule_unit_tests(
+        unit_tests: List[Tuple[Any, str, int]],
+        latencies: Optional[Dict[str, float]] = None,
+        endpoint_concurrency: Optional[Dict[str, int]] = None,
+        default_concurrency: int = DEFAULT_ENDPOINT_CONCURRENCY
+) -> List[Tuple[Any, str]]:
+    """
+    Order unit tests round-robin across their endpoints, longest expected endpoint first,
+    and assign them to (xdist) groups enforcing the concurrency limit of each endpoint.
+
+    :param unit_tests: List[Tuple[Any, str, int]], unit tests (i.e. Pytest items), with their endpoint url
+                                                   and test edge number (partitioning them into groups)
+    :param latencies: Optional[Dict[str, float]], mean unit test latency history (in seconds) of the endpoints
+    :param endpoint_concurrency: Optional[Dict[str, int]], endpoint-specific concurrency limits, indexed by url
+    :param default_concurrency: int, concurrency limit of other endpoints (default: DEFAULT_ENDPOINT_CONCURRENCY)
+    :return: List[Tuple[Any, str]], scheduled unit tests, each with its group name
+    """
+    latencies = latencies if latencies else dict()
+    endpoint_concurrency = endpoint_concurrency if endpoint_concurrency else dict()
+
+    # Unit tests (with their edge number) of each endpoint, in their original order
+    endpoints: Dict[str, List[Tuple[Any, int]]] = dict()
+    for unit_test, url, edge_num in unit_tests:
+        endpoints.setdefault(url, list()).append((unit_test, edge_num))
+
+    # Endpoints without history are assumed to perform like the average known endpoint
+    default_latency: float = \
+        sum(latencies.values()) / len(latencies) if latencies else DEFAULT_UNIT_TEST_LATENCY
+
+    # Longest processing time first, with ties broken by url, for a deterministic
+    # schedule (as needed by pytest-xdist, whose workers all collect the unit tests)
+    schedule: List[str] = sorted(
+        endpoints.keys(),
+        key=lambda endpoint: (-len(endpoints[endpoint]) * latencies.get(endpoint, default_latency), endpoint)
+    )
+    logger.debug(f"schedule_unit_tests(): endpoint schedule: {schedule}")
+
+    scheduled: List[Tuple[Any, str]] = list()
+    position: int = 0
+    while schedule:
+        for url in schedule:
+            if position < len(endpoints[url]):
+                unit_test, edge_num = endpoints[url][position]
+                concurrency: int = max(1, endpoint_concurrency.get(url, default_concurrency))
+                group: str = get_endpoint_group(url, None if concurrency == 1 else edge_num % concurrency)
+                scheduled.append((unit_test, group))
+        position += 1
+        schedule = [url for url in schedule if position < len(endpoints[url])]
+
+    return scheduled